@@ -0,0 +1,239 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI__Batch - Run NDJSON operations against one context
+#
+# One JSON object per line, e.g.
+#   {"op": "create" , "type": "bug", "title": "Crash on save", "ref": "crash"}
+#   {"op": "link"   , "source": "$crash", "verb": "blocks", "target": "Task-1"}
+#   {"op": "update" , "label": "$crash", "status": "confirmed"}
+#   {"op": "comment", "label": "$crash", "text": "Seen on v0.3"}
+#   {"op": "unlink" , "source": "$crash", "target": "Task-1"}
+#   {"op": "delete" , "label": "Bug-7"}
+# A "ref" on a create names the new node; "$<ref>" in a later label field
+# resolves to its label. Each operation yields one result dict.
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import json
+
+from typing                                                                     import Iterable, Iterator
+
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from issues_fs_cli.cli.CLI__Batch__Repository                                   import CLI__Batch__Repository
+from issues_fs_cli.cli.CLI__Context                                             import CLI__Context
+from issues_fs_cli.cli.CLI__Label_Parser                                        import CLI__Label_Parser
+from issues_fs.schemas.graph.Schema__Link__Create__Request                      import Schema__Link__Create__Request
+from issues_fs.schemas.graph.Schema__Node__Create__Request                      import Schema__Node__Create__Request
+from issues_fs.schemas.graph.Schema__Node__Update__Request                      import Schema__Node__Update__Request
+from issues_fs.schemas.graph.Safe_Str__Graph_Types                              import Safe_Str__Link_Verb, Safe_Str__Node_Type
+from issues_fs.schemas.issues.Schema__Comment                                   import Schema__Comment__Create__Request
+
+
+BATCH__REF_PREFIX  = '$'
+BATCH__FLUSH_EVERY = 100                                                         # Operations between writes to disk
+BATCH__OPERATIONS  = ('create', 'update', 'delete', 'link', 'unlink', 'comment')
+
+
+class CLI__Batch__Error(Exception):                                              # Per-operation failure (reported, not raised)
+    pass
+
+
+class CLI__Batch(Type_Safe):                                                     # NDJSON batch executor
+    context       : CLI__Context = None                                          # Context over a CLI__Batch__Repository
+    refs          : dict                                                         # ref → label
+    touched       : list                                                         # (node_type, label) pairs to re-index
+    stop_on_error : bool         = False                                         # Stop at the first failed operation
+    flush_every   : int          = BATCH__FLUSH_EVERY                            # 0: only flush at the end
+    succeeded     : int
+    failed        : int
+
+    @classmethod
+    def from_context(cls, context: CLI__Context, **kwargs) -> 'CLI__Batch':      # Wrap a context's storage
+        repository = CLI__Batch__Repository.wrap(context.repository)
+        batch      = cls(context = CLI__Context(repository = repository), **kwargs)
+        batch.context.index        = context.index                               # Keep write-through on loaded indexes
+        batch.context.search_index = context.search_index
+        return batch
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Execution
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def run(self, lines: Iterable[str]) -> Iterator[dict]:                       # One result per non-blank line
+        try:
+            for line_number, line in enumerate(lines, start=1):
+                if not line.strip():
+                    continue
+                result = self.execute_line(line_number, line)
+                if self.flush_every and (self.succeeded + self.failed) % self.flush_every == 0:
+                    self.flush()
+                yield result
+                if result['success'] is False and self.stop_on_error:
+                    break
+        finally:
+            self.flush()
+
+    def flush(self) -> None:                                                     # Pending nodes + indexes to disk
+        self.context.repository.flush()
+        self.context.index_updated(*self.touched)
+        self.touched = []
+
+    def execute_line(self, line_number: int, line: str) -> dict:                 # Parse + execute, never raises
+        result = {'line': line_number}
+        try:
+            operation = json.loads(line)
+        except ValueError as error:
+            return self.failure(result, f'Invalid JSON: {error}')
+        if not isinstance(operation, dict):
+            return self.failure(result, 'Operation must be a JSON object')
+
+        result['op'] = operation.get('op')
+        if operation.get('ref'):
+            result['ref'] = operation['ref']
+        self.context.repository.begin()
+        try:
+            result.update(self.execute(operation))
+        except Exception as error:                                               # CLI__Batch__Error or invalid values
+            self.context.repository.rollback()                                   # No half-applied op reaches the next flush
+            return self.failure(result, str(error))
+        result['success'] = True
+        self.succeeded   += 1
+        return result
+
+    def failure(self, result: dict, error: str) -> dict:
+        result.update(success = False, error = error)
+        self.failed += 1
+        return result
+
+    def execute(self, operation: dict) -> dict:                                  # Dispatch to op__<name>
+        name = operation.get('op')
+        if name not in BATCH__OPERATIONS:
+            raise CLI__Batch__Error(f"Unknown op: {name!r} (expected one of: {', '.join(BATCH__OPERATIONS)})")
+        return getattr(self, f'op__{name}')(operation)
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Operations
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def op__create(self, operation: dict) -> dict:
+        node_type = self.required(operation, 'type')
+        try:
+            safe_node_type = Safe_Str__Node_Type(str(node_type).lower())
+        except Exception:
+            raise CLI__Batch__Error(f"Invalid node type: {node_type}")
+
+        properties = dict(operation.get('properties') or {})
+        if operation.get('priority'):
+            properties['priority'] = operation['priority']
+
+        request  = Schema__Node__Create__Request(node_type   = safe_node_type                    ,
+                                                 title       = self.required(operation, 'title') ,
+                                                 description = operation.get('description', '')  ,
+                                                 status      = operation.get('status') or ''     ,
+                                                 tags        = self.tags(operation) or []        ,
+                                                 properties  = properties                        )
+        response = self.check(self.context.node_service.create_node(request))
+        label    = str(response.node.label)
+        if operation.get('ref'):
+            self.refs[operation['ref']] = label
+        self.touched.append((response.node.node_type, response.node.label))
+        return {'label': label}
+
+    def op__update(self, operation: dict) -> dict:
+        node_type, node_label = self.parse_label(operation, 'label')
+
+        properties = dict(operation.get('properties') or {})
+        if operation.get('priority'):
+            properties['priority'] = operation['priority']
+
+        request = Schema__Node__Update__Request(title       = operation.get('title')          ,
+                                                description = operation.get('description')    ,
+                                                status      = operation.get('status')         ,
+                                                tags        = self.tags(operation)            ,
+                                                properties  = properties if properties else None)
+        self.check(self.context.node_service.update_node(node_type = node_type  ,
+                                                         label     = node_label ,
+                                                         request   = request    ))
+        self.touched.append((node_type, node_label))
+        return {'label': str(node_label)}
+
+    def op__delete(self, operation: dict) -> dict:
+        node_type, node_label = self.parse_label(operation, 'label')
+        self.check(self.context.node_service.delete_node(node_type = node_type  ,
+                                                         label     = node_label ))
+        self.touched.append((node_type, node_label))
+        return {'label': str(node_label)}
+
+    def op__link(self, operation: dict) -> dict:
+        source_type, source_label = self.parse_label(operation, 'source')
+        target_type, target_label = self.parse_label(operation, 'target')
+        verb                      = self.required(operation, 'verb')
+        try:
+            safe_verb = Safe_Str__Link_Verb(str(verb).lower())
+        except Exception:
+            raise CLI__Batch__Error(f"Invalid link verb: {verb}")
+
+        request = Schema__Link__Create__Request(verb = safe_verb, target_label = target_label)
+        self.check(self.context.link_service.create_link(source_type  = source_type  ,
+                                                         source_label = source_label ,
+                                                         request      = request      ))
+        self.touched.extend([(source_type, source_label), (target_type, target_label)])
+        return {'source': str(source_label), 'verb': str(safe_verb), 'target': str(target_label)}
+
+    def op__unlink(self, operation: dict) -> dict:
+        source_type, source_label = self.parse_label(operation, 'source')
+        target_type, target_label = self.parse_label(operation, 'target')
+        self.check(self.context.link_service.delete_link(source_type  = source_type  ,
+                                                         source_label = source_label ,
+                                                         target_label = target_label ))
+        self.touched.extend([(source_type, source_label), (target_type, target_label)])
+        return {'source': str(source_label), 'target': str(target_label)}
+
+    def op__comment(self, operation: dict) -> dict:
+        node_type, node_label = self.parse_label(operation, 'label')
+        request  = Schema__Comment__Create__Request(author = operation.get('author') or 'cli-user' ,
+                                                    text   = self.required(operation, 'text')    )
+        response = self.check(self.context.comments_service.create_comment(node_type = node_type  ,
+                                                                           label     = node_label ,
+                                                                           request   = request    ))
+        self.touched.append((node_type, node_label))
+        return {'label': str(node_label), 'comment_id': str(response.comment.id)}
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Helpers
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    @staticmethod
+    def required(operation: dict, field: str):                                   # Field value or error
+        value = operation.get(field)
+        if value is None or value == '':
+            raise CLI__Batch__Error(f"Missing field: {field}")
+        return value
+
+    @staticmethod
+    def check(response):                                                         # Service response or error
+        if response.success is False:
+            raise CLI__Batch__Error(response.message or 'Operation failed')
+        return response
+
+    @staticmethod
+    def tags(operation: dict):                                                   # List or comma-separated string
+        tags = operation.get('tags')
+        if tags is None:
+            return None
+        if isinstance(tags, str):
+            return [t.strip() for t in tags.split(',') if t.strip()]
+        return [str(t) for t in tags]
+
+    def resolve(self, value: str) -> str:                                        # "$ref" → label created earlier
+        if value.startswith(BATCH__REF_PREFIX):
+            ref = value[len(BATCH__REF_PREFIX):]
+            if ref not in self.refs:
+                raise CLI__Batch__Error(f"Unknown ref: {value}")
+            return self.refs[ref]
+        return value
+
+    def parse_label(self, operation: dict, field: str):                          # (Safe_Str__Node_Type, Safe_Str__Node_Label)
+        label                 = self.resolve(str(self.required(operation, field)))
+        node_type, node_label = CLI__Label_Parser.parse(label)
+        if node_type is None:
+            raise CLI__Batch__Error(f"Invalid {field} label: {label}. Expected format: Type-123")
+        return node_type, node_label
@@ -0,0 +1,200 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI__Batch__Repository - Graph__Repository with deferred writes
+#
+# Node__Service rewrites the per-type index and the global index (and re-reads
+# the type configs) on every create/delete, and every link rewrites both of its
+# nodes. During a batch, nodes and indexes stay parsed in memory and flush()
+# writes each changed file once. Without this, linking 500 nodes to one parent
+# re-parses and re-serialises that parent's growing links list 500 times.
+# The batch calls flush() every few operations and always at the end.
+#
+# Services change the cached objects in place, so an operation that fails
+# half-way could leave its edits in memory for the next flush. begin() marks
+# the start of each operation and keeps a copy of every pending (unsaved)
+# object the first time the operation touches it (a shallow copy of its fields
+# and containers, so a hub node with many links stays cheap to copy);
+# rollback() puts those contents back and drops everything else the operation
+# cached or created.
+# ═══════════════════════════════════════════════════════════════════════════════
+
+from typing                                                                     import List
+
+from issues_fs.issues.graph_services.Graph__Repository                          import Graph__Repository
+from issues_fs.schemas.graph.Schema__Global__Index                              import Schema__Global__Index
+from issues_fs.schemas.graph.Schema__Link__Type                                 import Schema__Link__Type
+from issues_fs.schemas.graph.Schema__Node                                       import Schema__Node
+from issues_fs.schemas.graph.Schema__Node__Type                                 import Schema__Node__Type
+from issues_fs.schemas.graph.Schema__Type__Index                                import Schema__Type__Index
+
+
+class CLI__Batch__Repository(Graph__Repository):                                 # Repository for `issues-fs batch`
+    type_indexes : dict                                                          # node_type → Schema__Type__Index
+    dirty_types  : set                                                           # node_types with unsaved index
+    global_index : Schema__Global__Index = None                                  # Pending global index
+    node_types   : list                  = None                                  # Cached node type config
+    link_types   : list                  = None                                  # Cached link type config
+    nodes        : dict                                                          # (node_type, label) → Schema__Node
+    dirty_nodes  : set                                                           # Keys of nodes with unsaved changes
+    checkpoint   : dict                                                          # Pending keys when the current op began
+    snapshots    : dict                                                          # (kind, key) → (object, captured state) before the op
+
+    @classmethod
+    def wrap(cls, repository: Graph__Repository) -> 'CLI__Batch__Repository':   # Same storage, deferred indexes
+        return cls(memory_fs = repository.memory_fs, path_handler = repository.path_handler)
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Deferred Index Operations
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def type_index_load(self, node_type) -> Schema__Type__Index:                 # Loaded once, then kept in memory
+        key = str(node_type)
+        if key not in self.type_indexes:
+            self.type_indexes[key] = super().type_index_load(node_type)
+        self.snapshot('type', key, self.type_indexes[key], key in self.dirty_types)
+        return self.type_indexes[key]
+
+    def type_index_save(self, index: Schema__Type__Index) -> bool:               # Deferred until flush()
+        key                    = str(index.node_type)
+        self.snapshot('type', key, self.type_indexes.get(key), key in self.dirty_types)
+        self.type_indexes[key] = index
+        self.dirty_types.add(key)
+        return True
+
+    def global_index_load(self) -> Schema__Global__Index:
+        if self.global_index is not None:
+            self.snapshot('global', None, self.global_index, True)
+            return self.global_index
+        return super().global_index_load()
+
+    def global_index_save(self, index: Schema__Global__Index) -> bool:           # Deferred until flush()
+        self.snapshot('global', None, self.global_index, self.global_index is not None)
+        self.global_index = index
+        return True
+
+    def flush(self) -> int:                                                      # Write pending files, return count
+        written = 0
+        for key in sorted(self.dirty_nodes):
+            if super().node_save(self.nodes[key]):
+                written += 1
+        self.dirty_nodes = set()
+        for key in sorted(self.dirty_types):
+            super().type_index_save(self.type_indexes[key])
+            written += 1
+        self.dirty_types = set()
+        if self.global_index is not None:
+            super().global_index_save(self.global_index)
+            self.global_index = None
+            written += 1
+        return written
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Per-Operation Undo
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def begin(self) -> None:                                                     # Before each batch operation
+        self.checkpoint = {'nodes' : set(self.dirty_nodes)         ,
+                           'types' : set(self.dirty_types)         ,
+                           'global': self.global_index is not None }
+        self.snapshots  = {}
+
+    def snapshot(self, kind: str, key, value, pending: bool) -> None:            # First touch of a pending object in this op
+        if pending and value is not None and (kind, key) not in self.snapshots:
+            self.snapshots[(kind, key)] = (value, {name: self.capture(item) for name, item in vars(value).items()})
+
+    def rollback(self) -> None:                                                  # After a failed op: pending state as at begin()
+        checkpoint = self.checkpoint or {'nodes': set(), 'types': set(), 'global': False}
+        nodes      = {key: self.nodes[key] for key in checkpoint['nodes'] if key in self.nodes}
+        types      = {key: self.type_indexes[key] for key in checkpoint['types'] if key in self.type_indexes}
+        for (kind, key), (value, state) in self.snapshots.items():
+            for name, captured in state.items():
+                vars(value)[name] = self.restore(captured)
+            if kind == 'node':
+                nodes[key] = value
+            elif kind == 'type':
+                types[key] = value
+            else:
+                self.global_index = value
+        self.nodes        = nodes                                                # Clean entries are re-read from storage
+        self.dirty_nodes  = set(nodes)
+        self.type_indexes = types
+        self.dirty_types  = set(types)
+        if not checkpoint['global']:
+            self.global_index = None
+        self.begin()
+
+    @staticmethod
+    def capture(value) -> tuple:                                                 # (container, contents): copied, not re-validated
+        if isinstance(value, dict):
+            return value, [(k, CLI__Batch__Repository.capture(v)) for k, v in dict.items(value)]
+        if isinstance(value, list):
+            return value, [CLI__Batch__Repository.capture(v) for v in value]
+        return value, None                                                       # Scalars and schemas: replaced, not edited
+
+    @staticmethod
+    def restore(captured: tuple):                                                # Same container objects, old contents
+        value, contents = captured
+        if isinstance(value, dict):
+            dict.clear (value)
+            dict.update(value, [(k, CLI__Batch__Repository.restore(c)) for k, c in contents])
+        elif isinstance(value, list):
+            list.clear (value)
+            list.extend(value, [CLI__Batch__Repository.restore(c) for c in contents])
+        return value
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Cached Nodes
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def node_load(self, node_type, label) -> Schema__Node:                       # Parsed once per batch
+        key = (str(node_type), str(label))
+        if key not in self.nodes:
+            node = super().node_load(node_type, label)
+            if node is None:
+                return None
+            self.nodes[key] = node
+        self.snapshot('node', key, self.nodes[key], key in self.dirty_nodes)     # Callers change it in place
+        return self.nodes[key]
+
+    def node_save(self, node: Schema__Node) -> bool:                             # Deferred until flush()
+        if not node.label:
+            return False
+        key             = (str(node.node_type), str(node.label))
+        self.snapshot('node', key, self.nodes.get(key), key in self.dirty_nodes)
+        self.nodes[key] = node
+        self.dirty_nodes.add(key)
+        return True
+
+    def node_exists(self, node_type, label) -> bool:                             # Includes nodes not yet flushed
+        if (str(node_type), str(label)) in self.nodes:
+            return True
+        return super().node_exists(node_type, label)
+
+    def node_delete(self, node_type, label) -> bool:
+        key     = (str(node_type), str(label))
+        self.snapshot('node', key, self.nodes.get(key), key in self.dirty_nodes)
+        pending = key in self.dirty_nodes
+        self.nodes.pop(key, None)
+        self.dirty_nodes.discard(key)
+        return super().node_delete(node_type, label) or pending
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Cached Type Config
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def node_types_load(self) -> List[Schema__Node__Type]:
+        if self.node_types is None:
+            self.node_types = super().node_types_load()
+        return self.node_types
+
+    def node_types_save(self, types: List[Schema__Node__Type]) -> bool:
+        self.node_types = None
+        return super().node_types_save(types)
+
+    def link_types_load(self) -> List[Schema__Link__Type]:
+        if self.link_types is None:
+            self.link_types = super().link_types_load()
+        return self.link_types
+
+    def link_types_save(self, types: List[Schema__Link__Type]) -> bool:
+        self.link_types = None
+        return super().link_types_save(types)
@@ -0,0 +1,337 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI__Commands - Bodies of the node commands, shared by every front end
+#
+# show, list, create, update, link, comment and comments run here once: the
+# typer commands (cli__show.py, cli__list.py, ...) call these methods after
+# parsing their options, CLI__Fast_Path calls them straight from argv for
+# --for-agent calls, and CLI__Session from JSON-RPC params. Each method
+# reports its own errors through CLI__Output and returns False when the
+# command failed; the caller turns that into an exit code (or an RPC error).
+#
+# Front-end concerns stay with the front ends: --repos and --watch in the
+# typer commands, argv parsing in CLI__Fast_Path. No typer import here, so the
+# fast path can use this module without paying for it.
+# ═══════════════════════════════════════════════════════════════════════════════
+
+from typing                                                                     import Optional, Tuple
+
+from issues_fs_cli.cli.CLI__Context                                             import CLI__Context
+from issues_fs_cli.cli.CLI__Index                                               import CLI__Index
+from issues_fs_cli.cli.CLI__Label_Parser                                        import CLI__Label_Parser
+from issues_fs_cli.cli.CLI__Node__Fields                                        import CLI__Node__Fields
+from issues_fs_cli.cli.CLI__Node__Filter                                        import CLI__Node__Filter
+from issues_fs_cli.cli.CLI__Node__Sort                                          import CLI__Node__Sort
+from issues_fs_cli.cli.CLI__Output                                              import CLI__Output
+from issues_fs.schemas.graph.Schema__Link__Create__Request                      import Schema__Link__Create__Request
+from issues_fs.schemas.graph.Schema__Node__Create__Request                      import Schema__Node__Create__Request
+from issues_fs.schemas.graph.Schema__Node__Update__Request                      import Schema__Node__Update__Request
+from issues_fs.schemas.graph.Safe_Str__Graph_Types                              import Safe_Str__Link_Verb, Safe_Str__Node_Label, Safe_Str__Node_Type
+from issues_fs.schemas.issues.Schema__Comment                                   import Schema__Comment__Create__Request
+
+
+class CLI__Commands:                                                             # Command bodies: options in, output + success out
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Shared Option Parsing
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    @staticmethod
+    def parse_label(label: str, for_agent: bool, kind: str = 'label format') -> Optional[Tuple[str, str]]:   # None after reporting
+        node_type, node_label = CLI__Label_Parser.parse(label)
+        if node_type is None:
+            CLI__Output.error(f"Invalid {kind}: {label}. Expected format: Type-123", for_agent)
+            return None
+        return node_type, node_label
+
+    @staticmethod
+    def parse_node_type(node_type: str, for_agent: bool) -> Optional[Safe_Str__Node_Type]:   # None after reporting
+        try:
+            return Safe_Str__Node_Type(node_type.lower())
+        except Exception:
+            CLI__Output.error(f"Invalid node type: {node_type}", for_agent)
+            return None
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Read Commands
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    @staticmethod
+    def show(context   : CLI__Context                 ,                          # Node, or its graph with --depth
+             label     : str                          ,
+             depth     : int                  = 0     ,
+             output    : str                  = 'table',
+             for_agent : bool                 = False ,
+             index     : Optional[CLI__Index] = None  ) -> bool:                 # None: loaded when the graph needs it
+        parsed = CLI__Commands.parse_label(label, for_agent)
+        if parsed is None:
+            return False
+        node_type, node_label = parsed
+
+        if depth > 0:
+            from issues_fs_cli.cli.CLI__Graph import CLI__Graph                  # Only graph views pay for it
+            graph    = CLI__Graph(index = index or context.load_index())         # Reverse edges come from the index
+            response = graph.node_graph(label = node_label ,
+                                        depth = depth      )
+            if response.success is False:
+                CLI__Output.error(response.message, for_agent)
+                return False
+            CLI__Output.render_graph(response                  ,
+                                     format    = output        ,
+                                     for_agent = for_agent     )
+            return True
+
+        node = context.node_service.get_node(node_type = node_type  ,
+                                             label     = node_label )
+        if node is None:
+            CLI__Output.error(f"Node not found: {node_label}", for_agent)
+            return False
+        CLI__Output.render_node(node                       ,
+                                format    = output         ,
+                                for_agent = for_agent      )
+        return True
+
+    @staticmethod
+    def list_query(node_type : Optional[str] = None ,                            # Parsed list options; None after reporting
+                   status    : Optional[str] = None ,
+                   priority  : Optional[str] = None ,
+                   tags      : Optional[str] = None ,
+                   sort      : Optional[str] = None ,
+                   limit     : Optional[int] = None ,
+                   offset    : int           = 0    ,
+                   cursor    : Optional[str] = None ,
+                   fields    : Optional[str] = None ,
+                   for_agent : bool          = False) -> Optional[dict]:
+        safe_node_type = None
+        if node_type:
+            safe_node_type = CLI__Commands.parse_node_type(node_type, for_agent)
+            if safe_node_type is None:
+                return None
+
+        tag_list    = [t.strip() for t in tags.split(',') if t.strip()] if tags else []
+        node_filter = CLI__Node__Filter(node_type = str(safe_node_type) if safe_node_type else None ,
+                                        status    = status                                          ,
+                                        priority  = priority                                        ,
+                                        tags      = tag_list                                        )
+        try:
+            order      = CLI__Node__Sort  .from_spec(sort  )
+            projection = CLI__Node__Fields.from_spec(fields)
+            if cursor:
+                order.after(cursor)                                              # Bad token: fail before any work
+        except ValueError as e:
+            CLI__Output.error(str(e), for_agent)
+            return None
+
+        return {'node_filter': node_filter                                                  ,
+                'projection' : projection                                                   ,
+                'paging'     : dict(order = order, limit = limit, offset = offset, cursor = cursor),
+                'paged'      : bool(order.fields or limit or offset or cursor)               }
+
+    @staticmethod
+    def list_render(index     : CLI__Index ,                                     # One render of a parsed list query
+                    query     : dict       ,
+                    output    : str        ,
+                    for_agent : bool       ) -> bool:
+        node_filter, projection, paging = query['node_filter'], query['projection'], query['paging']
+        streamed = output == "ndjson" and not query['paged']                     # Straight from the index, as matched
+
+        if projection.names:                                                     # --fields: tuple rows, no schemas
+            if streamed:
+                entries, total, next_cursor = index.select(node_filter), None, None
+            else:
+                entries, total, next_cursor = index.page(node_filter, **paging)
+            CLI__Output.render_rows(projection, projection.rows(entries), total,
+                                    format = output, for_agent = for_agent, next_cursor = next_cursor)
+            return True
+
+        if output == "ndjson":                                                   # Stream entries, no response schema
+            entries = index.select(node_filter) if streamed else index.page(node_filter, **paging)[0]
+            CLI__Output.render_ndjson(CLI__Index.summary_json(entry) for entry in entries)
+            return True
+
+        response, next_cursor = index.list_page(node_filter, **paging)           # Schemas only for the rows shown
+        if response.success is False:
+            CLI__Output.error(response.message, for_agent)
+            return False
+        CLI__Output.render_list(response                    ,
+                                format      = output        ,
+                                for_agent   = for_agent     ,
+                                next_cursor = next_cursor   )
+        return True
+
+    @staticmethod
+    def list(context   : CLI__Context          ,                                 # Filters, sorting and paging on the index
+             node_type : Optional[str] = None  ,
+             status    : Optional[str] = None  ,
+             priority  : Optional[str] = None  ,
+             tags      : Optional[str] = None  ,
+             jobs      : Optional[int] = None  ,
+             sort      : Optional[str] = None  ,
+             limit     : Optional[int] = None  ,
+             offset    : int           = 0     ,
+             cursor    : Optional[str] = None  ,
+             fields    : Optional[str] = None  ,
+             output    : str           = 'table',
+             for_agent : bool          = False ) -> bool:
+        query = CLI__Commands.list_query(node_type, status, priority, tags, sort, limit, offset, cursor, fields, for_agent)
+        if query is None:
+            return False
+        index = context.load_index(jobs = jobs)                                  # Filters run on the index, no node file is read
+        return CLI__Commands.list_render(index, query, output, for_agent)
+
+    @staticmethod
+    def comments(context   : CLI__Context  ,                                     # Comments on one node
+                 label     : str           ,
+                 output    : str  = 'table',
+                 for_agent : bool = False  ) -> bool:
+        parsed = CLI__Commands.parse_label(label, for_agent)
+        if parsed is None:
+            return False
+        node_type, node_label = parsed
+        response = context.comments_service.list_comments(node_type = node_type  ,
+                                                          label     = node_label )
+        if response.success is False:
+            CLI__Output.error(response.message, for_agent)
+            return False
+        CLI__Output.render_comments_list(response                ,
+                                         format    = output      ,
+                                         for_agent = for_agent   )
+        return True
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Write Commands (write through to the loaded indexes)
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    @staticmethod
+    def create(context     : CLI__Context           ,                            # New node of a type
+               node_type   : str                    ,
+               title       : str                    ,
+               description : str            = ''    ,
+               status      : Optional[str]  = None  ,
+               priority    : Optional[str]  = None  ,
+               tags        : Optional[str]  = None  ,
+               output      : str            = 'table',
+               for_agent   : bool           = False ) -> bool:
+        properties = {'priority': priority} if priority else {}
+        tag_list   = [t.strip() for t in tags.split(',')] if tags else []
+
+        safe_node_type = CLI__Commands.parse_node_type(node_type, for_agent)
+        if safe_node_type is None:
+            return False
+
+        request  = Schema__Node__Create__Request(node_type   = safe_node_type ,
+                                                 title       = title          ,
+                                                 description = description    ,
+                                                 status      = status or ''   ,
+                                                 tags        = tag_list       ,
+                                                 properties  = properties     )
+        response = context.node_service.create_node(request)
+        if response.success is False:
+            CLI__Output.error(response.message, for_agent)
+            return False
+
+        context.index_updated((safe_node_type, response.node.label))             # Write-through to loaded indexes
+        CLI__Output.render_create_response(response                ,
+                                           format    = output      ,
+                                           for_agent = for_agent   )
+        return True
+
+    @staticmethod
+    def update(context     : CLI__Context           ,                            # Change fields of a node
+               label       : str                    ,
+               title       : Optional[str]  = None  ,
+               description : Optional[str]  = None  ,
+               status      : Optional[str]  = None  ,
+               priority    : Optional[str]  = None  ,
+               tags        : Optional[str]  = None  ,
+               output      : str            = 'table',
+               for_agent   : bool           = False ) -> bool:
+        parsed = CLI__Commands.parse_label(label, for_agent)
+        if parsed is None:
+            return False
+        node_type, node_label = parsed
+
+        properties = {'priority': priority} if priority else None
+        tag_list   = [t.strip() for t in tags.split(',')] if tags else None
+        request    = Schema__Node__Update__Request(title       = title       ,
+                                                   description = description ,
+                                                   status      = status      ,
+                                                   tags        = tag_list    ,
+                                                   properties  = properties  )
+        response   = context.node_service.update_node(node_type = node_type  ,
+                                                      label     = node_label ,
+                                                      request   = request    )
+        if response.success is False:
+            CLI__Output.error(response.message, for_agent)
+            return False
+
+        context.index_updated((node_type, node_label))                           # Write-through to loaded indexes
+        CLI__Output.render_update_response(response                ,
+                                           format    = output      ,
+                                           for_agent = for_agent   )
+        return True
+
+    @staticmethod
+    def link(context   : CLI__Context  ,                                         # Link two nodes (stored on both ends)
+             source    : str           ,
+             verb      : str           ,
+             target    : str           ,
+             output    : str  = 'table',
+             for_agent : bool = False  ) -> bool:
+        parsed = CLI__Commands.parse_label(source, for_agent, kind = 'source label')
+        if parsed is None:
+            return False
+        source_type, source_label = parsed
+
+        try:
+            safe_verb = Safe_Str__Link_Verb(verb.lower())
+        except Exception:
+            CLI__Output.error(f"Invalid link verb: {verb}", for_agent)
+            return False
+        try:
+            safe_target = Safe_Str__Node_Label(target)
+        except Exception:
+            CLI__Output.error(f"Invalid target label: {target}", for_agent)
+            return False
+
+        request  = Schema__Link__Create__Request(verb         = safe_verb   ,
+                                                 target_label = safe_target )
+        response = context.link_service.create_link(source_type  = source_type  ,
+                                                    source_label = source_label ,
+                                                    request      = request      )
+        if response.success is False:
+            CLI__Output.error(response.message, for_agent)
+            return False
+
+        context.index_updated((source_type, source_label),                      # Both ends store the link
+                              CLI__Label_Parser.parse(str(safe_target)))
+        CLI__Output.render_link_response(response                ,
+                                         format    = output      ,
+                                         for_agent = for_agent   )
+        return True
+
+    @staticmethod
+    def comment(context   : CLI__Context           ,                             # Add a comment to a node
+                label     : str                    ,
+                text      : str                    ,
+                author    : Optional[str] = 'cli-user',
+                output    : str           = 'table',
+                for_agent : bool          = False  ) -> bool:
+        parsed = CLI__Commands.parse_label(label, for_agent)
+        if parsed is None:
+            return False
+        node_type, node_label = parsed
+
+        request  = Schema__Comment__Create__Request(author = author ,
+                                                    text   = text   )
+        response = context.comments_service.create_comment(node_type = node_type  ,
+                                                           label     = node_label ,
+                                                           request   = request    )
+        if response.success is False:
+            CLI__Output.error(response.message, for_agent)
+            return False
+
+        context.index_updated((node_type, node_label))                           # Comment text is searchable
+        CLI__Output.render_comment_response(response                ,
+                                            format    = output      ,
+                                            for_agent = for_agent   )
+        return True
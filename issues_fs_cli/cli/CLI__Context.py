@@ -5,12 +5,17 @@
 import os
 
 from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
-from issues_fs.issues.graph_services.Graph__Repository__Factory                 import Graph__Repository__Factory
 from issues_fs.issues.graph_services.Graph__Repository                          import Graph__Repository
 from issues_fs.issues.graph_services.Node__Service                              import Node__Service
 from issues_fs.issues.graph_services.Link__Service                              import Link__Service
 from issues_fs.issues.graph_services.Comments__Service                          import Comments__Service
 from issues_fs.issues.graph_services.Type__Service                              import Type__Service
+from issues_fs_cli.cli.CLI__Index                                               import CLI__Index, INDEX__READ_JOBS
+from issues_fs_cli.cli.CLI__Pack__Storage                                       import CLI__Pack__Storage
+from issues_fs_cli.cli.CLI__Search__Index                                       import CLI__Search__Index
+
+
+WARM_CONTEXTS = {}                                                               # root_path → context held by `issues-fs serve`
 
 
 class CLI__Context(Type_Safe):                                                   # CLI runtime context
@@ -20,12 +25,22 @@ class CLI__Context(Type_Safe):
     comments_service : Comments__Service  = None                                 # Comment operations
     type_service     : Type__Service      = None                                 # Type operations
     root_path        : str                = None                                 # Discovered .issues/ path
+    index            : CLI__Index         = None                                 # Label/summary index (loaded on demand)
+    index_fresh      : bool               = False                                # Index already refreshed for this command
+    search_index     : CLI__Search__Index = None                                 # Full-text index (loaded on demand)
+    search_fresh     : bool               = False
+    pack_stamp       : list               = None                                 # Pack file the repository was opened with
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         if self.repository is None:
             self.root_path  = self.discover_issues_root()
-            self.repository = Graph__Repository__Factory.create_local_disk(root_path = self.root_path)
+            self.pack_stamp = CLI__Pack__Storage.stamp(self.root_path)
+            warm            = WARM_CONTEXTS.get(self.root_path)
+            if warm is not None and warm.pack_stamp == self.pack_stamp:          # Running inside the daemon
+                self.reuse(warm)
+                return
+            self.repository = CLI__Pack__Storage.create_repository(self.root_path)  # Pack-aware (if packed)
 
         self.node_service     = Node__Service    (repository = self.repository)
         self.link_service     = Link__Service    (repository = self.repository)
@@ -48,3 +63,40 @@ class CLI__Context(Type_Safe):
                     "or run this command from within an Issues-FS repository."
                 )
             current = parent
+
+    def reuse(self, warm: 'CLI__Context') -> None:                               # Share a warm context's state
+        self.repository       = warm.repository
+        self.node_service     = warm.node_service
+        self.link_service     = warm.link_service
+        self.comments_service = warm.comments_service
+        self.type_service     = warm.type_service
+        self.index            = warm.index
+        self.index_fresh      = warm.index_fresh
+        self.search_index     = warm.search_index
+        self.search_fresh     = warm.search_fresh
+
+    def load_index(self, jobs: int = None) -> CLI__Index:                        # Index, refreshed against storage
+        if self.index is None:
+            self.index = CLI__Index(repository = self.repository)
+        self.index.jobs = jobs or INDEX__READ_JOBS                               # Reset per command (warm daemon)
+        if self.index_fresh is False:                                            # Once per command; edits write through
+            self.index.refresh()
+            self.index_fresh = True
+        return self.index
+
+    def load_search_index(self, jobs: int = None) -> CLI__Search__Index:         # Search index, refreshed against storage
+        if self.search_index is None:
+            self.search_index = CLI__Search__Index(repository = self.repository)
+            warm              = WARM_CONTEXTS.get(self.root_path)
+            if warm is not None and warm.repository is self.repository:          # Inside the daemon: keep it for later requests
+                warm.search_index = self.search_index
+        self.search_index.jobs = jobs or INDEX__READ_JOBS
+        if self.search_fresh is False:
+            self.search_index.refresh()
+            self.search_fresh = True
+        return self.search_index
+
+    def index_updated(self, *node_refs) -> None:                                 # Write-through after edits
+        for index in (self.index, self.search_index):                            # (node_type, label) pairs
+            if index is not None:
+                index.refresh_nodes(list(node_refs))
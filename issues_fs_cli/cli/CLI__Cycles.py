@@ -0,0 +1,154 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI__Cycles - Link cycles over the whole repository (`issues-fs check cycles`)
+#
+# The link graph is loaded once from the label index, then split into strongly
+# connected components with an iterative Tarjan (explicit stack, no recursion
+# limit), linear in nodes + edges. Every component with more than one node, or
+# a node linking to itself, holds at least one cycle; the shortest cycle
+# through its first node is reported with its verbs.
+#
+# Edges point from a node to what it waits on / refers to, whichever side the
+# link is stored on: "X depends-on Y", "Y dependency-of X" and "X blocked-by Y"
+# (= "Y blocks X") are all X → Y. So a chain mixing blocks and depends-on is
+# only a cycle when the dependencies really go round. Either verb of a link
+# type can be asked for, and cycles are reported with the verb asked for:
+# walked in its direction when every step allows it, otherwise with the steps
+# that read backwards marked as reversed.
+# ═══════════════════════════════════════════════════════════════════════════════
+
+from collections                                                                import deque
+from typing                                                                     import Dict, List, Tuple
+
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from issues_fs_cli.cli.CLI__Dependencies                                        import DEPENDENCY__PREREQUISITE_FIRST
+from issues_fs_cli.cli.CLI__Index                                               import CLI__Index
+
+
+CYCLES__VERBS = ['blocks', 'depends-on']                                         # Checked when no --verbs are given
+
+
+class CLI__Cycles(Type_Safe):                                                    # Strongly connected components of links
+    index    : CLI__Index                                                        # Refreshed label index
+    verbs    : list                                                              # Link verbs to check (default CYCLES__VERBS)
+    inverses : dict                                                              # verb → inverse verb (link type config)
+    edges    : dict = None                                                       # label → {label: (verb, along)} (built on demand)
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Graph
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def directions(self) -> Dict[str, Tuple[bool, str, bool]]:                   # stored verb → (reversed?, verb shown, shown along the edge?)
+        directions = {}
+        for verb in self.verbs or CYCLES__VERBS:
+            inverse = self.inverses.get(verb)
+            if inverse == verb:
+                raise ValueError(f"'{verb}' is symmetric: every link would be a cycle")
+            reverse = verb in DEPENDENCY__PREREQUISITE_FIRST                     # "X blocks Y": the edge is Y → X
+            directions[verb] = (reverse, verb, not reverse)
+            if inverse:
+                directions[inverse] = (not reverse, verb, not reverse)
+        return directions
+
+    def build(self) -> 'CLI__Cycles':                                            # O(nodes + edges), once
+        if self.edges is not None:
+            return self
+        directions = self.directions()
+        self.index.build_adjacency()
+        nodes      = self.index.by_label
+        self.edges = {label: {} for label in nodes}
+        for label, entry in nodes.items():
+            for verb, target in entry['links']:
+                direction = directions.get(verb)
+                if direction is None or target not in nodes:
+                    continue
+                reverse, shown, along = direction
+                source, target = (target, label) if reverse else (label, target)
+                self.edges[source].setdefault(target, (shown, along))            # Both stored sides: one edge
+        return self
+
+    def edge_count(self) -> int:
+        return sum(len(targets) for targets in self.build().edges.values())
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Strongly Connected Components
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def components(self) -> List[List[str]]:                                     # Iterative Tarjan, every SCC
+        edges    = self.build().edges
+        order    = {}                                                            # label → discovery index
+        low      = {}
+        on_stack = set()
+        stack    = []
+        result   = []
+        for root in edges:
+            if root in order:
+                continue
+            work = [(root, iter(edges[root]))]                                   # (node, remaining neighbours)
+            order[root] = low[root] = len(order)
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                node, neighbours = work[-1]
+                for target in neighbours:
+                    if target not in order:                                      # Descend (what recursion would do)
+                        order[target] = low[target] = len(order)
+                        stack.append(target)
+                        on_stack.add(target)
+                        work.append((target, iter(edges[target])))
+                        break
+                    if target in on_stack:
+                        low[node] = min(low[node], order[target])
+                else:                                                            # All neighbours done: return to parent
+                    work.pop()
+                    if work:
+                        parent      = work[-1][0]
+                        low[parent] = min(low[parent], low[node])
+                    if low[node] == order[node]:                                 # node is the root of a component
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        result.append(component[::-1])
+        return result
+
+    def cycles(self) -> List[dict]:                                              # One entry per cyclic component, index order
+        edges    = self.build().edges
+        position = {label: i for i, label in enumerate(edges)}
+        cyclic   = [sorted(component, key=position.get) for component in self.components()
+                    if len(component) > 1 or component[0] in edges[component[0]]]   # Single node needs a self-link
+        found    = []
+        for component in sorted(cyclic, key=lambda c: position[c[0]]):
+            start         = component[0]
+            labels, steps = self.shortest_cycle(start, set(component))
+            if steps and not any(along for _, along in steps):                   # e.g. only blocks: walk it as asked
+                labels, steps = labels[::-1], [(verb, True) for verb, _ in steps[::-1]]
+            found.append({'size' : len(component) ,
+                          'nodes': component      ,
+                          'cycle': {'nodes'   : labels                               ,
+                                    'verbs'   : [verb for verb, _ in steps]          ,
+                                    'reversed': [not along for _, along in steps]    }})   # nodes[i+1] <verb> nodes[i]
+        return found
+
+    def shortest_cycle(self, start: str, members: set) -> Tuple[List[str], List[tuple]]:   # BFS back to start inside the SCC
+        edges    = self.edges
+        previous = {}
+        queue    = deque([start])
+        while queue:
+            label = queue.popleft()
+            for target, verb in edges[label].items():
+                if target not in members:
+                    continue
+                if target == start:                                              # Closed the loop
+                    labels, verbs = [start], [verb]
+                    while label != start:
+                        labels.insert(1, label)
+                        label, via = previous[label]
+                        verbs.insert(0, via)
+                    return labels + [start], verbs
+                if target not in previous:
+                    previous[target] = (label, verb)
+                    queue.append(target)
+        return [start], []                                                       # Unreachable for a real SCC
@@ -0,0 +1,135 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI__Daemon - Long-lived `issues-fs serve` process with warm contexts
+#
+# Keeps one CLI__Context per .issues/ root (repository, services and loaded
+# label index) and runs forwarded command lines against it in-process.
+# Requests are handled one at a time: commands chdir and capture stdout/stderr,
+# which are process-wide, and sequential handling keeps storage writes ordered.
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import io
+import json
+import os
+import socket
+import socketserver
+import stat
+import traceback
+
+import typer
+
+from contextlib                                                                 import redirect_stdout, redirect_stderr
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from issues_fs_cli.cli.CLI__Context                                             import CLI__Context, WARM_CONTEXTS
+from issues_fs_cli.cli.CLI__Daemon__Client                                      import CLI__Daemon__Client
+from issues_fs_cli.cli.cli__main                                                import app
+
+
+class CLI__Daemon__Handler(socketserver.StreamRequestHandler):                  # One JSON request/response per connection
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line.strip():                                                     # Liveness probe (is_running)
+            return
+        try:
+            response = self.server.daemon.handle_request(json.loads(line))
+        except ValueError as error:
+            response = {'exit_code': 1, 'stdout': '', 'stderr': f'Error: invalid daemon request: {error}\n'}
+        try:
+            self.wfile.write(json.dumps(response).encode())
+        except BrokenPipeError:                                                  # Client went away
+            pass
+
+
+class CLI__Daemon(Type_Safe):                                                    # Warm command server
+    socket_path : str                                                            # Unix domain socket to listen on
+    server      : object = None                                                  # socketserver.UnixStreamServer
+    command     : object = None                                                  # Root click group (built once)
+    requests    : int                                                            # Requests served so far
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Lifecycle
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def start(self) -> 'CLI__Daemon':                                            # Bind socket (does not block)
+        if self.is_running():
+            raise RuntimeError(f"An issues-fs daemon is already listening on {self.socket_path}")
+
+        folder = os.path.dirname(self.socket_path) or '.'
+        os.makedirs(folder, mode=0o700, exist_ok=True)
+        folder_stat = os.lstat(folder)
+        if stat.S_ISDIR(folder_stat.st_mode) and folder_stat.st_uid == os.getuid():
+            os.chmod(folder, stat.S_IMODE(folder_stat.st_mode) & 0o700)          # Our folder: make it private
+        if not CLI__Daemon__Client.private_folder(folder):                       # Pre-created by someone else, or a symlink
+            raise RuntimeError(f"Refusing to serve from {folder}: it must be a directory owned by you with mode 0700")
+        if os.path.exists(self.socket_path):                                     # Stale socket from a crashed daemon
+            os.remove(self.socket_path)
+
+        self.command       = typer.main.get_command(app)
+        self.server        = socketserver.UnixStreamServer(self.socket_path, CLI__Daemon__Handler)
+        self.server.daemon = self
+        os.chmod(self.socket_path, 0o600)                                        # Owner only: commands write to disk
+        return self
+
+    def serve_forever(self) -> None:                                             # Block until stop() or Ctrl-C
+        try:
+            self.server.serve_forever()
+        finally:
+            self.stop()
+
+    def stop(self) -> None:                                                      # Close and remove the socket
+        if self.server is not None:
+            self.server.server_close()
+            self.server = None
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+    def is_running(self) -> bool:                                                # Is another daemon answering?
+        if not os.path.exists(self.socket_path):
+            return False
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.socket_path)
+            return True
+        except OSError:
+            return False
+        finally:
+            probe.close()
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Request Handling
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def handle_request(self, request: dict) -> dict:                             # Run one forwarded command line
+        stdout    = io.StringIO()
+        stderr    = io.StringIO()
+        exit_code = 0
+        original  = os.getcwd()
+        try:
+            os.chdir(request.get('cwd') or original)
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                self.warm_context()
+                try:
+                    self.command.main(args = request.get('argv') or [], prog_name = 'issues-fs', standalone_mode = True)
+                except SystemExit as exit:
+                    exit_code = exit.code if isinstance(exit.code, int) else (0 if exit.code is None else 1)
+        except Exception:                                                        # Never let a command kill the daemon
+            stderr.write(traceback.format_exc())
+            exit_code = 1
+        finally:
+            os.chdir(original)
+            self.requests += 1
+
+        return {'exit_code': exit_code, 'stdout': stdout.getvalue(), 'stderr': stderr.getvalue()}
+
+    def warm_context(self) -> CLI__Context:                                      # Warm context for the request's cwd
+        try:
+            context = CLI__Context()                                             # Reuses a registered context if any
+        except FileNotFoundError:                                                # Command reports it (or it's `init`)
+            return None
+        warm = WARM_CONTEXTS.get(context.root_path)
+        if warm is None or warm.pack_stamp != context.pack_stamp:                # New root, or (re)packed since
+            warm = WARM_CONTEXTS[context.root_path] = context
+        warm.index_fresh  = False                                                # Pick up edits made outside the daemon
+        warm.search_fresh = False
+        warm.load_index()
+        return warm
@@ -0,0 +1,121 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI__Daemon__Client - Forward a command line to a running `issues-fs serve`
+#
+# Imported by cli__entry on every call, so it only uses the standard library and
+# costs a couple of lstat() calls when no daemon is running. Any failure to
+# connect falls back to in-process execution (forward() returns None).
+#
+# Commands that read stdin or stream to stdout (a '-' path) must stay in
+# DAEMON__LOCAL_COMMANDS: the daemon has neither the caller's stdin nor a
+# binary stdout. test_CLI__Daemon checks every LAZY_COMMANDS entry for this.
+#
+# Without XDG_RUNTIME_DIR the socket lives under a predictable $TMPDIR path, so
+# nothing is forwarded unless the socket and its folder belong to this user,
+# the folder is private (no group/other access) and neither is a symlink:
+# otherwise another local user could plant a socket there, read every command
+# line sent to it and answer with output of their choosing.
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import json
+import os
+import stat
+import sys
+
+from typing                                                                     import List, Optional
+from issues_fs_cli.cli.CLI__Profiler                                            import PROFILE__ENV
+
+
+DAEMON__SOCKET_NAME     = 'issues-fs.sock'
+DAEMON__ENV_SOCKET      = 'ISSUES_FS_SOCKET'                                     # Explicit socket path
+DAEMON__ENV_DISABLE     = 'ISSUES_FS_NO_DAEMON'                                  # Set to 1 to never forward
+DAEMON__CONNECT_TIMEOUT = 1.0                                                    # Seconds; request itself has no timeout
+DAEMON__LOCAL_COMMANDS  = {'serve', 'batch', 'session', 'import', 'export'}      # Always run in-process (stdin readers, streamed export)
+
+
+class CLI__Daemon__Client:                                                       # Thin client for the warm daemon
+
+    @staticmethod
+    def socket_path() -> str:                                                    # Per-user socket location
+        override = os.environ.get(DAEMON__ENV_SOCKET)
+        if override:
+            return override
+        runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+        if not runtime_dir:
+            runtime_dir = os.path.join(os.environ.get('TMPDIR', '/tmp'), f'issues-fs-{os.getuid()}')
+        return os.path.join(runtime_dir, DAEMON__SOCKET_NAME)
+
+    @staticmethod
+    def private_folder(folder: str) -> bool:                                     # Ours, a real directory, mode 0700 or tighter
+        try:
+            folder_stat = os.lstat(folder or '.')
+        except OSError:
+            return False
+        return (stat.S_ISDIR(folder_stat.st_mode)            and                 # lstat: a symlink is not a directory
+                folder_stat.st_uid == os.getuid()            and
+                stat.S_IMODE(folder_stat.st_mode) & 0o077 == 0)
+
+    @staticmethod
+    def trusted(path: str) -> bool:                                              # Safe to send this user's commands to?
+        if not CLI__Daemon__Client.private_folder(os.path.dirname(path)):
+            return False
+        try:
+            socket_stat = os.lstat(path)
+        except OSError:                                                          # No daemon
+            return False
+        return stat.S_ISSOCK(socket_stat.st_mode) and socket_stat.st_uid == os.getuid()
+
+    @staticmethod
+    def forwardable(argv: List[str]) -> bool:                                    # Can this call run in the daemon?
+        if not argv or argv[0].startswith('-'):                                  # Root help / completion options
+            return False
+        if argv[0] in DAEMON__LOCAL_COMMANDS:
+            return False
+        if argv[0] == 'delete' and not {'--force', '-f'} & set(argv):            # Confirmation prompt needs this terminal
+            return False
+        if {'--watch', '-w'} & set(argv):                                        # Long-running, redraws this terminal
+            return False
+        return True
+
+    @staticmethod
+    def forward(argv: List[str]) -> Optional[int]:                               # Exit code, or None to run locally
+        if os.environ.get(DAEMON__ENV_DISABLE) or os.environ.get(PROFILE__ENV):    # Profiles measure an in-process run
+            return None
+        if not CLI__Daemon__Client.forwardable(argv):
+            return None
+        path = CLI__Daemon__Client.socket_path()
+        if not CLI__Daemon__Client.trusted(path):                                # No daemon, or not one of ours
+            return None
+
+        import socket                                                            # Only paid when a daemon may be up
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            client.settimeout(DAEMON__CONNECT_TIMEOUT)
+            client.connect(path)
+        except OSError:                                                          # Stale socket or daemon busy starting
+            client.close()
+            return None
+
+        try:
+            client.settimeout(None)
+            request = {'argv': list(argv), 'cwd': os.getcwd()}
+            client.sendall(json.dumps(request).encode() + b'\n')
+            client.shutdown(socket.SHUT_WR)
+            response = json.loads(CLI__Daemon__Client.read_all(client) or b'{}')
+        except (OSError, ValueError) as error:                                   # Daemon died mid-request: don't re-run
+            sys.stderr.write(f"Error: issues-fs daemon at {path} failed: {error}\n")
+            return 1
+        finally:
+            client.close()
+
+        sys.stdout.write(response.get('stdout', ''))
+        sys.stderr.write(response.get('stderr', ''))
+        return response.get('exit_code', 1)
+
+    @staticmethod
+    def read_all(client) -> bytes:                                               # Read until the daemon closes
+        chunks = []
+        while True:
+            chunk = client.recv(65536)
+            if not chunk:
+                return b''.join(chunks)
+            chunks.append(chunk)
@@ -0,0 +1,150 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI__Dependencies - Dependency DAG, topological order and critical paths
+#
+# Built once per instance from the links in the label index. "A blocks B" and
+# "B depends-on A" both mean A must be finished before B (their inverses,
+# blocked-by and dependency-of, are the same edges seen from the other node),
+# so every pair collapses to one prerequisite → dependent edge. Nodes with a
+# done status are left out unless include_done is set: a finished prerequisite
+# no longer blocks anything.
+#
+# Everything is linear in nodes + edges: ancestors by DFS, order by Kahn's
+# algorithm, and the longest chain ending at each node by one pass over that
+# order. Chain lengths are memoised, so later queries in the same invocation
+# (other labels, or --all after a label) reuse what is already computed.
+# ═══════════════════════════════════════════════════════════════════════════════
+
+from collections                                                                import deque
+from typing                                                                     import List, Optional, Tuple
+
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from issues_fs_cli.cli.CLI__Index                                               import CLI__Index
+
+
+DEPENDENCY__PREREQUISITE_FIRST = {'blocks'    , 'dependency-of'}                 # source must finish before target
+DEPENDENCY__DEPENDENT_FIRST    = {'depends-on', 'blocked-by'   }                 # target must finish before source
+DEPENDENCY__DONE               = {'done', 'closed', 'resolved', 'released', 'cancelled', 'archived'}
+
+
+class CLI__Dependencies(Type_Safe):                                              # Dependency analysis over the index
+    index         : CLI__Index                                                   # Refreshed label index
+    include_done  : bool = False                                                 # Keep finished nodes in the graph
+    prerequisites : dict = None                                                  # label → {prerequisite label: True}
+    dependents    : dict = None                                                  # label → {dependent label: True}
+    position      : dict = None                                                  # label → index order (stable ties)
+    chains        : dict                                                         # label → (chain length, previous label)
+    paths         : dict                                                         # label → critical_path() result
+    cyclic        : set                                                          # Labels on or after a dependency cycle
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Graph
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def build(self) -> 'CLI__Dependencies':                                      # O(nodes + edges), once
+        if self.prerequisites is not None:
+            return self
+        self.index.build_adjacency()
+        nodes              = {label: entry for label, entry in self.index.by_label.items() if self.is_included(entry)}
+        self.position      = {label: i  for i, label in enumerate(nodes)}
+        self.prerequisites = {label: {} for label in nodes}
+        self.dependents    = {label: {} for label in nodes}
+        for label, entry in nodes.items():
+            for verb, target in entry['links']:
+                if target not in nodes or target == label:
+                    continue
+                if verb in DEPENDENCY__PREREQUISITE_FIRST:
+                    self.add_edge(label, target)
+                elif verb in DEPENDENCY__DEPENDENT_FIRST:
+                    self.add_edge(target, label)
+        return self
+
+    def add_edge(self, prerequisite: str, dependent: str) -> None:               # Dicts: ordered and de-duplicated
+        self.prerequisites[dependent][prerequisite] = True
+        self.dependents[prerequisite][dependent]    = True
+
+    def is_included(self, entry: dict) -> bool:
+        return self.include_done or entry['status'] not in DEPENDENCY__DONE
+
+    def contains(self, label: str) -> bool:
+        return label in self.build().prerequisites
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Traversal
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def ancestors(self, label: str) -> set:                                      # Label and everything it waits on
+        self.build()
+        seen  = {label}
+        stack = [label]
+        while stack:
+            for prerequisite in self.prerequisites[stack.pop()]:
+                if prerequisite not in seen:
+                    seen.add(prerequisite)
+                    stack.append(prerequisite)
+        return seen
+
+    def topological_order(self, labels: Optional[set] = None) -> Tuple[List[str], List[str]]:   # (ordered, left in cycles)
+        self.build()
+        ordered   = list(self.prerequisites) if labels is None else sorted(labels, key=self.position.get)
+        labels    = self.prerequisites.keys() if labels is None else labels
+        in_degree = {label: sum(1 for p in self.prerequisites[label] if p in labels) for label in ordered}
+        queue     = deque(label for label in ordered if in_degree[label] == 0)
+        result    = []
+        while queue:
+            label = queue.popleft()
+            result.append(label)
+            for dependent in self.dependents[label]:
+                if dependent in in_degree:
+                    in_degree[dependent] -= 1
+                    if in_degree[dependent] == 0:
+                        queue.append(dependent)
+        done = set(result)
+        return result, [label for label in ordered if label not in done]
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Critical Paths
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def compute_chains(self, order: List[str]) -> None:                          # Longest chain ending at each label
+        for label in order:
+            if label in self.chains:                                             # Memoised by an earlier query
+                continue
+            best = (1, None)
+            for prerequisite in self.prerequisites[label]:
+                length = self.chains[prerequisite][0] + 1
+                if length > best[0]:
+                    best = (length, prerequisite)
+            self.chains[label] = best
+
+    def chain(self, label: str) -> List[str]:                                    # First prerequisite → label
+        chain = []
+        while label is not None:
+            chain.append(label)
+            label = self.chains[label][1]
+        return chain[::-1]
+
+    def critical_path(self, label: str) -> dict:                                 # Longest chain to label + blocking set
+        if label not in self.paths:
+            order, cyclic = self.topological_order(self.ancestors(label))
+            self.cyclic.update(cyclic)
+            self.compute_chains(order)
+            self.paths[label] = {'target'  : label                                             ,
+                                 'chain'   : self.chain(label) if label in self.chains else [] ,
+                                 'blocking': [l for l in order if l != label]                  ,   # In a valid work order
+                                 'cyclic'  : cyclic                                            }
+        return self.paths[label]
+
+    def critical_path_all(self) -> dict:                                         # Longest chain in the whole graph
+        order, cyclic = self.topological_order()
+        self.cyclic.update(cyclic)
+        self.compute_chains(order)
+        end = None
+        for label in order:
+            if end is None or self.chains[label][0] > self.chains[end][0]:
+                end = label
+        return {'target'  : None                                                    ,
+                'chain'   : self.chain(end) if end else []                          ,
+                'blocking': []                                                      ,
+                'nodes'   : len(order) + len(cyclic)                                ,
+                'edges'   : sum(len(p) for p in self.prerequisites.values())       ,
+                'cyclic'  : cyclic                                                  }
@@ -0,0 +1,138 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI__Export - Stream nodes, with their links and comments, to a file
+#
+# The label index picks and orders the nodes (no file is read to filter), then
+# each node file is read, written out and dropped before the next one, so the
+# memory held is the index plus one node, whatever the repository size. Nodes
+# are exported as stored (links and comments live inside issue.json).
+#
+# Formats:  json     {"nodes":[ one node per line ],"total":N}
+#           ndjson   one node per line
+#           markdown one section per node
+# Any format can be gzip-compressed on the way out.
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import gzip
+import io
+import json
+import sys
+
+from contextlib                                                                 import contextmanager
+from typing                                                                     import Callable, Iterator, Optional, TextIO
+
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from issues_fs.issues.graph_services.Graph__Repository                          import Graph__Repository
+from issues_fs.issues.graph_services.Node__Service                              import Node__Service
+from issues_fs.schemas.graph.Safe_Str__Graph_Types                              import Safe_Str__Node_Type, Safe_Str__Node_Label
+from issues_fs_cli.cli.CLI__Index                                               import CLI__Index, FILE_NAME__ISSUE_JSON
+from issues_fs_cli.cli.CLI__Node__Filter                                        import CLI__Node__Filter
+
+
+EXPORT__FORMATS = ('json', 'ndjson', 'markdown')
+EXPORT__STDOUT  = '-'
+
+
+class CLI__Export(Type_Safe):                                                    # Streaming node exporter
+    repository : Graph__Repository = None
+    index      : CLI__Index        = None                                        # Refreshed label index
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Reading
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def nodes(self, node_filter: CLI__Node__Filter = None) -> Iterator[dict]:    # Full node data, one at a time
+        for entry in self.index.select(node_filter or CLI__Node__Filter()):
+            node = self.read_node(entry)
+            if node is not None:
+                yield node
+
+    def read_node(self, entry: dict) -> Optional[dict]:                          # Stored node data for an index entry
+        content = self.repository.storage_fs.file__str(f"{entry['path']}/{FILE_NAME__ISSUE_JSON}")
+        if content:
+            try:
+                data = json.loads(content)
+            except ValueError:
+                data = None
+            if isinstance(data, dict) and data.get('label') == entry['label']:
+                return data
+        node = Node__Service(repository = self.repository).get_node(             # Node from a .issues file
+            node_type = Safe_Str__Node_Type (entry['node_type']) ,
+            label     = Safe_Str__Node_Label(entry['label'])     )
+        return node.json() if node else None
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Writing
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def export(self, out: TextIO, format: str = 'json', node_filter: CLI__Node__Filter = None) -> int:
+        writers = {'json'    : self.write_json     ,                             # Returns the number of nodes written
+                   'ndjson'  : self.write_ndjson   ,
+                   'markdown': self.write_markdown }
+        if format not in writers:
+            raise ValueError(f"Unknown export format: {format} (expected {', '.join(EXPORT__FORMATS)})")
+        return writers[format](out.write, self.nodes(node_filter))
+
+    @staticmethod
+    def write_json(write: Callable, nodes: Iterator[dict]) -> int:               # One JSON document, written as it goes
+        write('{"nodes":[')
+        count = 0
+        for node in nodes:
+            write((',\n' if count else '\n') + json.dumps(node, separators=(',', ':')))
+            count += 1
+        write(f'\n],"total":{count}}}\n')
+        return count
+
+    @staticmethod
+    def write_ndjson(write: Callable, nodes: Iterator[dict]) -> int:
+        count = 0
+        for node in nodes:
+            write(json.dumps(node, separators=(',', ':')) + '\n')
+            count += 1
+        return count
+
+    @staticmethod
+    def write_markdown(write: Callable, nodes: Iterator[dict]) -> int:           # Same layout as `show -o markdown`
+        count = 0
+        for node in nodes:
+            write(('\n---\n\n' if count else '') + CLI__Export.node_markdown(node))
+            count += 1
+        return count
+
+    @staticmethod
+    def node_markdown(node: dict) -> str:
+        properties = node.get('properties') or {}
+        lines      = [f"# {node.get('label')}: {node.get('title') or ''}", '',
+                      f"**Type:** {node.get('node_type') or ''}  "               ,
+                      f"**Status:** {node.get('status') or ''}  "                ]
+        if properties.get('priority'):
+            lines.append(f"**Priority:** {properties['priority']}  ")
+        if node.get('tags'):
+            lines.append(f"**Tags:** {', '.join(str(t) for t in node['tags'])}  ")
+        if str(node.get('description') or '').strip():
+            lines.extend(['', str(node['description'])])
+        if node.get('links'):
+            lines.extend(['', '## Links', ''])
+            lines.extend(f"- **{link.get('verb')}** → {link.get('target_label')}" for link in node['links'])
+        if properties.get('comments'):
+            lines.extend(['', '## Comments', ''])
+            lines.extend(f"- **{comment.get('author') or 'unknown'}:** {comment.get('text') or ''}"
+                         for comment in properties['comments'])
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    @contextmanager
+    def open_output(path: str = EXPORT__STDOUT, compress: bool = False) -> Iterator[TextIO]:
+        if path == EXPORT__STDOUT:                                               # Text stream for stdout or a file
+            if compress is False:
+                yield sys.stdout
+                return
+            with gzip.GzipFile(fileobj=sys.stdout.buffer, mode='wb') as raw:
+                with io.TextIOWrapper(raw, encoding='utf-8') as out:
+                    yield out
+            return
+        if compress:
+            with gzip.open(path, 'wt', encoding='utf-8') as out:
+                yield out
+        else:
+            with open(path, 'w', encoding='utf-8') as out:
+                yield out
@@ -0,0 +1,117 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI__Fast_Path - Run hot `--for-agent` calls without typer/click
+#
+# Agents call show/list/create/update/link/comment(s) thousands of times, and
+# importing typer, building the click command and parsing options costs a
+# noticeable slice of each call. For those commands, when --for-agent is given,
+# argv is matched against FAST_PATH__COMMANDS here and the parsed options go
+# straight to CLI__Commands, the same command bodies the typer commands run.
+#
+# Anything not recognised (another command, --help, an unknown or malformed
+# option, --repos, --watch, a missing argument) returns None and the call goes
+# through typer as usual, which also reports usage errors. The option tables
+# mirror the typer signatures; test_CLI__Fast_Path keeps both in sync.
+#
+# Only the standard library is imported until a call is matched.
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import os
+
+from typing                                                                     import List, Optional, Tuple
+from issues_fs_cli.cli.CLI__Profiler                                            import PROFILE__ENV
+
+
+FAST_PATH__ENV_DISABLE = 'ISSUES_FS_NO_FAST_PATH'                                # Set to 1: always go through typer
+FAST_PATH__TRIGGER     = '--for-agent'                                           # Only agent calls take the fast path
+FAST_PATH__OUTPUT      = (('--output', '-o'), 'output', str)
+FAST_PATH__MINIMUMS    = {'jobs': 1, 'limit': 1, 'offset': 0}                    # min= of the typer int options
+
+FAST_PATH__COMMANDS = {                                                          # command → (positionals, options)
+    'show'    : (('label',)                       , [(('--depth'      , '-D'), 'depth'      , int),
+                                                     FAST_PATH__OUTPUT                              ]),
+    'list'    : ((),                                [(('--type'       , '-t'), 'node_type'  , str),
+                                                     (('--status'     , '-s'), 'status'     , str),
+                                                     (('--priority'   , '-p'), 'priority'   , str),
+                                                     (('--tags'       ,     ), 'tags'       , str),
+                                                     (('--jobs'       , '-j'), 'jobs'       , int),
+                                                     (('--sort'       ,     ), 'sort'       , str),
+                                                     (('--limit'      , '-n'), 'limit'      , int),
+                                                     (('--offset'     ,     ), 'offset'     , int),
+                                                     (('--cursor'     ,     ), 'cursor'     , str),
+                                                     (('--fields'     ,     ), 'fields'     , str),
+                                                     FAST_PATH__OUTPUT                              ]),
+    'create'  : (('node_type', 'title')           , [(('--description', '-d'), 'description', str),
+                                                     (('--status'     , '-s'), 'status'     , str),
+                                                     (('--priority'   , '-p'), 'priority'   , str),
+                                                     (('--tags'       , '-t'), 'tags'       , str),
+                                                     FAST_PATH__OUTPUT                              ]),
+    'update'  : (('label',)                       , [(('--title'      , '-T'), 'title'      , str),
+                                                     (('--description', '-d'), 'description', str),
+                                                     (('--status'     , '-s'), 'status'     , str),
+                                                     (('--priority'   , '-p'), 'priority'   , str),
+                                                     (('--tags'       , '-t'), 'tags'       , str),
+                                                     FAST_PATH__OUTPUT                              ]),
+    'link'    : (('source', 'verb', 'target')     , [FAST_PATH__OUTPUT                              ]),
+    'comment' : (('label', 'text')                , [(('--author'     , '-a'), 'author'     , str),
+                                                     FAST_PATH__OUTPUT                              ]),
+    'comments': (('label',)                       , [FAST_PATH__OUTPUT                              ]),
+}
+
+
+class CLI__Fast_Path:                                                            # argv → CLI__Commands, no typer
+
+    @staticmethod
+    def parse(argv: List[str]) -> Optional[Tuple[str, dict]]:                    # (command, kwargs), or None for typer
+        if not argv or argv[0] not in FAST_PATH__COMMANDS or FAST_PATH__TRIGGER not in argv:
+            return None
+        positionals, options = FAST_PATH__COMMANDS[argv[0]]
+        by_flag = {flag: (name, kind) for flags, name, kind in options for flag in flags}
+        kwargs  = {}
+        values  = []
+        args    = iter(argv[1:])
+        for arg in args:
+            if arg == FAST_PATH__TRIGGER:
+                continue
+            if not arg.startswith('-') or arg == '-':
+                values.append(arg)
+                continue
+            flag, equals, value = arg.partition('=')
+            if flag not in by_flag or (equals and not flag.startswith('--')):    # Unknown, or -x=... (click keeps the '=')
+                return None
+            if not equals:
+                value = next(args, None)
+                if value is None:
+                    return None
+            name, kind = by_flag[flag]
+            if kind is int:
+                try:
+                    value = int(value)
+                except ValueError:
+                    return None
+                if value < FAST_PATH__MINIMUMS.get(name, value):                 # min= as in typer
+                    return None
+            kwargs[name] = value                                                 # Repeated option: last one wins, as in click
+        if len(values) != len(positionals):
+            return None
+        kwargs.update(zip(positionals, values))
+        return argv[0], kwargs
+
+    @staticmethod
+    def run(argv: List[str]) -> Optional[int]:                                   # Exit code, or None to run through typer
+        if os.environ.get(FAST_PATH__ENV_DISABLE) or os.environ.get(PROFILE__ENV):   # Profiles measure the typer path
+            return None
+        parsed = CLI__Fast_Path.parse(argv)
+        if parsed is None:
+            return None
+        command, kwargs = parsed
+        from issues_fs_cli.cli.CLI__Commands import CLI__Commands                # Only paid once a call is matched
+        from issues_fs_cli.cli.CLI__Context  import CLI__Context
+        from issues_fs_cli.cli.CLI__Output   import CLI__Output
+        try:
+            context = CLI__Context()
+        except FileNotFoundError as e:
+            CLI__Output.error(str(e), True)
+            return 1
+        handler = getattr(CLI__Commands, command)
+        return 0 if handler(context, for_agent = True, **kwargs) is not False else 1
+
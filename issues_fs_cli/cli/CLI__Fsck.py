@@ -0,0 +1,257 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI__Fsck - Consistency check of node files, links and indexes
+#
+# Every node file is read and validated against Schema__Node: that is the
+# expensive part (all CPU), so on local disk it runs on a process pool, one
+# task per node type (large types split into chunks). Each worker opens the
+# repository itself, pack included, so only paths and results cross processes.
+# The cross-checks then run once, in memory, over what the workers returned:
+#
+#   node-file       : unreadable/invalid file, label vs folder/type/node_index
+#   duplicate-label : the same label in more than one file
+#   dangling-link   : link to a label that does not exist
+#   one-sided-link  : link whose inverse is missing on the target
+#   type-index      : data/{type}/_index.json count or next_index out of date
+#   global-index    : _index.json totals out of date
+#   label-index     : .cache/index.json entry differs from its unchanged file
+#
+# --repair regenerates the three indexes from the node files; problems in the
+# node files themselves are reported only, never rewritten.
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import json
+import os
+
+from concurrent.futures                                                         import ProcessPoolExecutor
+from typing                                                                     import Dict, List, Optional, Tuple
+
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from osbot_utils.type_safe.primitives.domains.identifiers.safe_int.Timestamp_Now import Timestamp_Now
+from osbot_utils.type_safe.primitives.core.Safe_UInt                            import Safe_UInt
+from memory_fs.storage_fs.providers.Storage_FS__Local_Disk                      import Storage_FS__Local_Disk
+from issues_fs.issues.graph_services.Graph__Repository                          import Graph__Repository
+from issues_fs.issues.graph_services.Node__Service                              import Node__Service
+from issues_fs.issues.issues_file.Issues_File__Loader__Service                  import Issues_File__Loader__Service
+from issues_fs.schemas.graph.Schema__Node                                       import Schema__Node
+from issues_fs.schemas.graph.Schema__Type__Index                                import Schema__Type__Index
+from issues_fs_cli.cli.CLI__Index                                               import CLI__Index, FILE_EXT__ISSUES
+from issues_fs_cli.cli.CLI__Pack__Storage                                       import CLI__Pack__Storage
+
+
+FSCK__JOBS         = os.cpu_count() or 1                                         # Validation is CPU bound: one process per core
+FSCK__CHUNK_SIZE   = 2000                                                        # Files per process-pool task
+FSCK__PARALLEL_MIN = 1000                                                        # Fewer files: validate in-process (no pool)
+FSCK__REPAIRABLE   = ('type-index', 'global-index', 'label-index')               # Regenerated by --repair
+
+
+def fsck_validate(root_path: str, paths: List[str]) -> List[tuple]:              # Process-pool task: validate_file() per path
+    storage = CLI__Pack__Storage.create_repository(root_path).storage_fs
+    index   = CLI__Index()                                                       # entry_from_data() only
+    return [CLI__Fsck.validate_file(index, path, storage.file__str(path)) for path in paths]
+
+
+class CLI__Fsck(Type_Safe):                                                      # Repository consistency check
+    repository : Graph__Repository                                               # Storage layer being checked
+    index      : CLI__Index                                                      # Label index as saved (not refreshed)
+    jobs       : int  = FSCK__JOBS                                               # Worker processes
+    problems   : list                                                            # {check, path, label, message}
+    nodes      : dict                                                            # path → entries validated from the file
+    repaired   : list                                                            # Checks fixed by repair()
+
+    def run(self) -> dict:                                                       # Every check, in order
+        fingerprints = self.index.scan_fingerprints()
+        paths        = sorted(fingerprints)
+        for path, entries, problems in self.validate(paths):
+            self.nodes[path] = entries
+            self.problems.extend(problems)
+        labels = self.check_labels()
+        self.check_links(labels)
+        counts = self.check_type_indexes()
+        self.check_global_index(counts)
+        self.check_label_index(fingerprints)
+        return self.stats()
+
+    def stats(self) -> dict:
+        return {'files'   : len(self.nodes)                                        ,
+                'nodes'   : sum(len(entries) for entries in self.nodes.values())   ,
+                'problems': len(self.problems)                                     ,
+                'repaired': self.repaired                                          }
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Node Files
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def validate(self, paths: List[str]) -> List[tuple]:                         # (path, entries, problems) per path, in order
+        storage = self.repository.storage_fs
+        if self.jobs <= 1 or len(paths) < FSCK__PARALLEL_MIN or isinstance(storage, Storage_FS__Local_Disk) is False:
+            return [self.validate_file(self.index, path, storage.file__str(path)) for path in paths]
+        tasks   = self.tasks(paths)
+        results = []
+        with ProcessPoolExecutor(max_workers = min(self.jobs, len(tasks))) as pool:
+            for chunk in pool.map(fsck_validate, [str(storage.root_path)] * len(tasks), tasks):
+                results.extend(chunk)
+        return sorted(results, key=lambda result: result[0])
+
+    @staticmethod
+    def tasks(paths: List[str]) -> List[List[str]]:                              # One task per type, large types chunked
+        by_type = {}
+        for path in paths:
+            parts = path.split('/')
+            by_type.setdefault(parts[1] if parts[0] == 'data' and len(parts) > 2 else parts[0], []).append(path)
+        tasks = [group[i:i + FSCK__CHUNK_SIZE] for group in by_type.values()
+                                               for i in range(0, len(group), FSCK__CHUNK_SIZE)]
+        return sorted(tasks, key=len, reverse=True)                              # Biggest first: even finish times
+
+    @staticmethod
+    def validate_file(index: CLI__Index, path: str, content: Optional[str]) -> Tuple[str, List[dict], List[dict]]:
+        problems = []
+        problem  = lambda message, label='': problems.append({'check': 'node-file', 'path': path, 'label': label, 'message': message})
+        if not content:
+            problem('Empty or unreadable file')
+            return path, [], problems
+
+        if path.endswith(FILE_EXT__ISSUES):                                      # Many nodes; the parser reports per line
+            result = Issues_File__Loader__Service().load_content(content, path)
+            for error in result.errors:
+                problem(f'line {error.line_number}: {error.message}')
+            return path, [index.entry_from_data(node.json(), path) for node in result.nodes], problems
+
+        try:
+            data = json.loads(content)
+        except ValueError as e:
+            problem(f'Invalid JSON: {e}')
+            return path, [], problems
+        if not isinstance(data, dict):
+            problem('Not a JSON object')
+            return path, [], problems
+
+        entry  = index.entry_from_data(data, path)
+        label  = entry['label']
+        folder = entry['path'].rsplit('/', 1)[-1]
+        try:
+            Schema__Node.from_json(data)
+        except Exception as e:                                                   # Type_Safe raises ValueError/TypeError
+            problem(f'Invalid node: {e}', label)
+        if data.get('label') != folder:
+            problem(f'Label {data.get("label")!r} does not match folder {folder!r}', label)
+        prefix, _, number = label.rpartition('-')
+        if prefix.lower() != entry['node_type']:
+            problem(f'Label {label} does not match node_type {entry["node_type"]!r}', label)
+        if number.isdigit() and int(number) != entry['node_index']:
+            problem(f'Label {label} does not match node_index {entry["node_index"]!r}', label)
+        return path, [entry], problems
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Cross-checks
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def add(self, check: str, path: str, label: str, message: str) -> None:
+        self.problems.append({'check': check, 'path': path, 'label': label, 'message': message})
+
+    def check_labels(self) -> Dict[str, Tuple[str, dict]]:                       # label → (file, entry) it is read from
+        labels = {}
+        paths  = {}
+        for path, entries in self.nodes.items():
+            for entry in entries:
+                if entry['node_type']:
+                    labels.setdefault(entry['label'], (path, entry))
+                    paths.setdefault(entry['label'], []).append(path)
+        for label, found in paths.items():
+            if len(found) > 1:
+                self.add('duplicate-label', found[0], label, f'{label} is in {len(found)} files: {", ".join(found)}')
+        return labels
+
+    def check_links(self, labels: Dict[str, Tuple[str, dict]]) -> None:          # Targets exist and link back
+        inverses = {str(t.verb): str(t.inverse_verb) for t in self.repository.link_types_load()}
+        links    = {label: {(verb, target) for verb, target in entry['links']} for label, (_, entry) in labels.items()}
+        for label, (path, entry) in labels.items():
+            for verb, target in entry['links']:
+                if target not in labels:
+                    self.add('dangling-link', path, label, f'{label} {verb} {target}: no such node')
+                elif verb in inverses and (inverses[verb], label) not in links[target]:
+                    self.add('one-sided-link', path, label,
+                             f'{label} {verb} {target}, but {target} has no {inverses[verb]} {label}')
+
+    def expected_counts(self) -> Dict[str, Tuple[int, int]]:                     # node_type → (count, next_index) from the files
+        counts = {}
+        for path, entries in self.nodes.items():
+            if path.endswith(FILE_EXT__ISSUES):                                  # .issues nodes are not in the type indexes
+                continue
+            for entry in entries:
+                count, next_index          = counts.get(entry['node_type'], (0, 1))
+                counts[entry['node_type']] = (count + 1, max(next_index, int(entry['node_index'] or 0) + 1))
+        return counts
+
+    def check_type_indexes(self) -> Dict[str, Tuple[int, int]]:                  # Stored counts vs expected_counts()
+        counts     = self.expected_counts()
+        node_types = [str(nt.name) for nt in self.repository.node_types_load()]
+        for node_type in sorted(set(node_types) | set(counts)):
+            if node_type not in node_types:
+                self.add('node-file', '', node_type, f'{counts[node_type][0]} nodes of unknown type {node_type!r}')
+                continue
+            path              = str(self.repository.path_handler.path_for_type_index(node_type))
+            count, next_index = counts.get(node_type, (0, 1))
+            data              = self.read_json(path)
+            if data is None:
+                if count:
+                    self.add('type-index', path, node_type, f'Missing or unreadable ({count} nodes)')
+                continue
+            if data.get('count') != count:
+                self.add('type-index', path, node_type, f'count is {data.get("count")}, {count} nodes found')
+            if not isinstance(data.get('next_index'), int) or data['next_index'] < next_index:
+                self.add('type-index', path, node_type, f'next_index is {data.get("next_index")}, must be at least {next_index}')
+        return counts
+
+    def check_global_index(self, counts: Dict[str, Tuple[int, int]]) -> None:    # Totals match the type counts
+        path = str(self.repository.path_handler.path_for_global_index())
+        data = self.read_json(path)
+        if data is None:
+            self.add('global-index', path, '', 'Missing or unreadable')
+            return
+        node_types = [str(nt.name) for nt in self.repository.node_types_load()]
+        total      = sum(counts.get(node_type, (0, 1))[0] for node_type in node_types)
+        if data.get('total_nodes') != total:
+            self.add('global-index', path, '', f'total_nodes is {data.get("total_nodes")}, {total} nodes found')
+        stored = {item.get('node_type'): item.get('count') for item in data.get('type_counts') or [] if isinstance(item, dict)}
+        for node_type in node_types:
+            count = counts.get(node_type, (0, 1))[0]
+            if stored.get(node_type, 0) != count:
+                self.add('global-index', path, node_type, f'{node_type} count is {stored.get(node_type)}, {count} nodes found')
+
+    def check_label_index(self, fingerprints: dict) -> None:                     # Entries of unchanged files match them
+        self.index.load()
+        for path, info in self.index.files.items():
+            if path in self.nodes and info.get('fingerprint') == fingerprints.get(path) and info.get('nodes') != self.nodes[path]:
+                self.add('label-index', path, '', 'Index entry differs from the file (file changed, fingerprint did not)')
+
+    def read_json(self, path: str) -> Optional[dict]:                            # Raw index file (schemas hide corruption)
+        storage = self.repository.storage_fs
+        if storage.file__exists(path) is False:
+            return None
+        try:
+            data = json.loads(storage.file__str(path) or '')
+        except ValueError:
+            return None
+        return data if isinstance(data, dict) else None
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Repair
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def repair(self) -> dict:                                                    # Regenerate indexes from the node files
+        counts = self.expected_counts()
+        now    = Timestamp_Now()
+        for nt in self.repository.node_types_load():                             # Written from scratch: may be corrupt
+            count, next_index = counts.get(str(nt.name), (0, 1))
+            stored            = (self.read_json(str(self.repository.path_handler.path_for_type_index(nt.name))) or {}).get('next_index')
+            if isinstance(stored, int) and stored > next_index:                  # Never hand out a deleted node's label again
+                next_index = stored
+            self.repository.type_index_save(Schema__Type__Index(node_type    = nt.name              ,
+                                                                next_index   = Safe_UInt(next_index),
+                                                                count        = Safe_UInt(count)     ,
+                                                                last_updated = now                  ))
+        Node__Service(repository = self.repository).update_global_index()
+        self.index.rebuild()
+        self.repaired = sorted({p['check'] for p in self.problems if p['check'] in FSCK__REPAIRABLE})
+        self.problems = [p for p in self.problems if p['check'] not in FSCK__REPAIRABLE]
+        return self.stats()
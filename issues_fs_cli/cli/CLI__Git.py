@@ -0,0 +1,88 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI__Git - What changed under .issues/ since a commit, from git itself
+#
+# Used by CLI__Index to refresh in O(changes) instead of walking every file.
+# One `git status --porcelain=v2 --branch` call gives both HEAD and the paths
+# that differ from it (modified, deleted, untracked, and ignored, which git
+# cannot vouch for); when HEAD moved since the index was saved, one
+# `git diff --name-only` adds the paths the new commits touched. Paths are
+# returned relative to the .issues/ folder.
+#
+# Stdlib only. Any failure (no git binary, not a checkout, unknown commit,
+# timeout) returns None, and callers fall back to a full scan.
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import os
+import subprocess
+
+from typing                                                                     import List, Optional
+
+
+GIT__ENV_OFF       = 'ISSUES_FS_NO_GIT'                                          # Set to 1: never ask git (full scans)
+GIT__TIMEOUT       = 30                                                          # Seconds per git call
+GIT__STATUS_FIELDS = {'1': 8, '2': 9, 'u': 10, '?': 1, '!': 1}                   # porcelain v2 kind → spaces before the path
+
+
+class CLI__Git:                                                                  # Thin wrapper over the git CLI
+
+    @staticmethod
+    def enabled() -> bool:
+        return os.environ.get(GIT__ENV_OFF, '') in ('', '0', 'false', 'no', 'off')
+
+    @staticmethod
+    def top_level(path: str) -> Optional[str]:                                   # Enclosing work tree (no subprocess)
+        current = os.path.realpath(path)
+        while True:
+            if os.path.exists(os.path.join(current, '.git')):                    # Folder, or file for worktrees/submodules
+                return current
+            parent = os.path.dirname(current)
+            if parent == current:
+                return None
+            current = parent
+
+    @staticmethod
+    def run(root_path: str, *args: str) -> Optional[str]:                        # stdout, or None on any failure
+        try:
+            result = subprocess.run(['git', '-C', root_path, *args], capture_output=True, timeout=GIT__TIMEOUT)
+        except (OSError, subprocess.SubprocessError):
+            return None
+        if result.returncode != 0:
+            return None
+        return result.stdout.decode('utf-8', errors='surrogateescape')
+
+    @staticmethod
+    def status(root_path: str) -> Optional[dict]:                                # {head, dirty: [paths under root_path]}
+        top = CLI__Git.top_level(root_path) if CLI__Git.enabled() else None
+        if top is None:
+            return None
+        output = CLI__Git.run(root_path, 'status', '--porcelain=v2', '--branch', '-z',
+                              '--untracked-files=all', '--ignored=matching', '--no-renames', '--', '.')
+        if output is None:
+            return None
+        folder = os.path.relpath(os.path.realpath(root_path), top).replace(os.sep, '/')
+        prefix = '' if folder == '.' else folder + '/'                           # porcelain paths are relative to the top
+        head   = None
+        dirty  = set()
+        items  = iter(output.split('\0'))
+        for item in items:
+            kind = item[:1]
+            if item.startswith('# branch.oid '):
+                head = item[len('# branch.oid '):]
+            elif kind in GIT__STATUS_FIELDS:                                     # changed, renamed, unmerged, untracked, ignored
+                path = item.split(' ', GIT__STATUS_FIELDS[kind])[-1]
+                dirty.add(path)
+                if kind == '2':                                                  # Rename source follows as its own item
+                    dirty.add(next(items, ''))
+        if head is None or head == '(initial)':                                  # No commit to compare against yet
+            return None
+        return {'head' : head                                                                         ,
+                'dirty': sorted(path[len(prefix):] for path in dirty if path.startswith(prefix))}
+
+    @staticmethod
+    def changed_paths(root_path: str, since: str, head: str) -> Optional[List[str]]:   # Touched by the commits since..head
+        if since == head:
+            return []
+        output = CLI__Git.run(root_path, 'diff', '--name-only', '-z', '--no-renames', '--relative', since, head, '--', '.')
+        if output is None:                                                       # e.g. commit gone after a rebase + gc
+            return None
+        return [path for path in output.split('\0') if path]
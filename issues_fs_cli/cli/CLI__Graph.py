@@ -0,0 +1,204 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI__Graph - Graph traversal over the label index
+# Same traversal as Node__Service.get_node_graph(), but neighbours come from the
+# index (outgoing links + reverse edges), so the cost is O(neighbourhood)
+# instead of a full scan of every node per visited node.
+#
+# Path queries (`issues-fs path`) run over a forward/reverse adjacency built
+# once from the index entries: a bidirectional BFS for the shortest path, and
+# Yen's algorithm on top of it for the k shortest simple paths. Edges follow
+# the links as stored (Link__Service stores both directions, e.g. "blocks" on
+# one node and "blocked-by" on the other), optionally restricted to some verbs.
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import heapq
+
+from typing                                                                     import List, Optional, Tuple
+
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from issues_fs.schemas.graph.Schema__Graph__Link                                import Schema__Graph__Link
+from issues_fs.schemas.graph.Schema__Graph__Node                                import Schema__Graph__Node
+from issues_fs.schemas.graph.Schema__Graph__Response                            import Schema__Graph__Response
+from issues_fs_cli.cli.CLI__Index                                               import CLI__Index
+
+
+GRAPH__MAX_DEPTH = 10                                                            # Node__Service caps at 3 (full scans)
+GRAPH__MAX_PATHS = 100                                                           # Upper bound for k in k_shortest_paths()
+
+
+class CLI__Graph(Type_Safe):                                                     # Index-backed graph queries
+    index     : CLI__Index                                                       # Refreshed label index
+    via       : list                                                             # Verbs paths may follow (empty: all)
+    links_out : dict = None                                                      # label → [(verb, target)] (built on demand)
+    links_in  : dict = None                                                      # label → [(verb, source)]
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Neighbourhood Traversal
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def node_graph(self, label: str, depth: int = 1) -> Schema__Graph__Response:   # Drop-in for get_node_graph()
+        depth = max(0, min(depth, GRAPH__MAX_DEPTH))
+        root  = self.index.entry(label)
+        if root is None:
+            return Schema__Graph__Response(success = False                   ,
+                                           root    = label                   ,
+                                           nodes   = []                      ,
+                                           links   = []                      ,
+                                           depth   = depth                   ,
+                                           message = f'Node not found: {label}')
+
+        nodes = []
+        links = []
+        self.traverse(root, depth, set(), nodes, links)
+
+        return Schema__Graph__Response(success = True  ,
+                                       root    = label ,
+                                       nodes   = nodes ,
+                                       links   = links ,
+                                       depth   = depth )
+
+    def traverse(self                ,                                           # Depth-first, same order as Node__Service
+                 entry   : dict      ,
+                 depth   : int       ,
+                 visited : set       ,
+                 nodes   : list      ,
+                 links   : list
+            ) -> None:
+        label = entry['label']
+        if label in visited or depth < 0:
+            return
+
+        visited.add(label)
+        nodes.append(Schema__Graph__Node(label     = label              ,
+                                         title     = entry['title']     ,
+                                         node_type = entry['node_type'] ,
+                                         status    = entry['status']    ))
+        if depth == 0:
+            return
+
+        for verb, target_label in entry['links']:                                # Outgoing links
+            if target_label and target_label not in visited:
+                target = self.index.entry(target_label)
+                if target:
+                    links.append(Schema__Graph__Link(source = label, target = target_label, link_type = verb))
+                    self.traverse(target, depth - 1, visited, nodes, links)
+
+        for source_label, verb in list(self.index.incoming_links(label).items()):   # Incoming links (reverse edges)
+            if source_label not in visited:
+                source = self.index.entry(source_label)
+                if source:
+                    links.append(Schema__Graph__Link(source = source_label, target = label, link_type = verb))
+                    self.traverse(source, depth - 1, visited, nodes, links)
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Paths
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def build_links(self) -> None:                                               # O(nodes + edges), once per instance
+        if self.links_out is not None:
+            return
+        self.index.build_adjacency()
+        nodes          = self.index.by_label
+        verbs          = set(self.via)
+        self.links_out = {}
+        self.links_in  = {}
+        for label, entry in nodes.items():
+            for verb, target in entry['links']:
+                if target == label or target not in nodes or (verbs and verb not in verbs):
+                    continue
+                self.links_out.setdefault(label , []).append((verb, target))
+                self.links_in .setdefault(target, []).append((verb, label ))
+
+    def shortest_path(self                                     ,                 # (labels, verbs) or None
+                      source       : str                       ,
+                      target       : str                       ,
+                      max_hops     : Optional[int] = None      ,
+                      banned_nodes : set           = frozenset(),                # Labels the path may not visit
+                      banned_edges : set           = frozenset()                 # (source, verb, target) it may not use
+                 ) -> Optional[Tuple[tuple, tuple]]:
+        self.build_links()
+        if source == target:
+            return (source,), ()
+        forward   = {source: None}                                               # label → (previous label, verb, hops)
+        backward  = {target: None}                                               # label → (next label, verb, hops)
+        frontiers = ([source], [target])
+        hops      = 0
+        while frontiers[0] and frontiers[1] and (max_hops is None or hops < max_hops):
+            go_forward = len(frontiers[0]) <= len(frontiers[1])                  # Expand the smaller side, one level
+            seen, other, frontier, links = ((forward , backward, frontiers[0], self.links_out) if go_forward else
+                                            (backward, forward , frontiers[1], self.links_in ))
+            depth         = (seen[frontier[0]] or (None, None, 0))[2] + 1
+            next_frontier = []
+            meetings      = []
+            hops         += 1
+            for label in frontier:
+                for verb, neighbour in links.get(label, ()):
+                    edge = (label, verb, neighbour) if go_forward else (neighbour, verb, label)
+                    if neighbour in seen or neighbour in banned_nodes or edge in banned_edges:
+                        continue
+                    seen[neighbour] = (label, verb, depth)
+                    next_frontier.append(neighbour)
+                    if neighbour in other:
+                        meetings.append(neighbour)
+            if meetings:                                                         # Shortest: closest to the other side
+                meeting = min(meetings, key=lambda m: (other[m] or (None, None, 0))[2])
+                return self.join_path(meeting, forward, backward)
+            frontiers = (next_frontier, frontiers[1]) if go_forward else (frontiers[0], next_frontier)
+        return None
+
+    @staticmethod
+    def join_path(meeting: str, forward: dict, backward: dict) -> Tuple[tuple, tuple]:
+        labels, verbs = [meeting], []
+        label         = meeting
+        while forward[label] is not None:                                        # Walk back to the source
+            label, verb, _ = forward[label]
+            labels.insert(0, label)
+            verbs .insert(0, verb )
+        label = meeting
+        while backward[label] is not None:                                       # Walk on to the target
+            label, verb, _ = backward[label]
+            labels.append(label)
+            verbs .append(verb )
+        return tuple(labels), tuple(verbs)
+
+    def k_shortest_paths(self                          ,                         # Yen's algorithm, simple paths, by length
+                         source   : str                ,
+                         target   : str                ,
+                         k        : int           = 1  ,
+                         max_hops : Optional[int] = None
+                    ) -> List[Tuple[tuple, tuple]]:
+        first = self.shortest_path(source, target, max_hops)
+        if first is None:
+            return []
+        found      = [first]
+        candidates = []                                                          # heap of (hops, labels, verbs)
+        known      = {first}
+        while len(found) < min(k, GRAPH__MAX_PATHS):
+            labels, verbs = found[-1]
+            for i in range(len(labels) - 1):                                     # Deviate at every node of the last path
+                root_labels, root_verbs = labels[:i + 1], verbs[:i]
+                banned_edges = {(p_labels[i], p_verbs[i], p_labels[i + 1]) for p_labels, p_verbs in found
+                                if p_labels[:i + 1] == root_labels and p_verbs[:i] == root_verbs}
+                spur = self.shortest_path(labels[i], target                                        ,
+                                          max_hops     = None if max_hops is None else max_hops - i,
+                                          banned_nodes = set(root_labels[:-1])                     ,
+                                          banned_edges = banned_edges                              )
+                if spur is None:
+                    continue
+                path = (root_labels + spur[0][1:], root_verbs + spur[1])
+                if path not in known:
+                    known.add(path)
+                    heapq.heappush(candidates, (len(path[1]), path[0], path[1]))
+            if not candidates:
+                break
+            _, path_labels, path_verbs = heapq.heappop(candidates)
+            found.append((path_labels, path_verbs))
+        return found
+
+    @staticmethod
+    def path_json(path: Tuple[tuple, tuple]) -> dict:                            # {hops, nodes, links}
+        labels, verbs = path
+        return {'hops' : len(verbs)                                                       ,
+                'nodes': list(labels)                                                     ,
+                'links': [{'source': labels[i], 'verb': verb, 'target': labels[i + 1]}
+                          for i, verb in enumerate(verbs)]                                }
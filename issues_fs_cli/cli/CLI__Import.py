@@ -0,0 +1,245 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI__Import - Restore nodes from an `issues-fs export` file in bulk
+#
+# Reads the export formats back (json {"nodes":[...]}, a bare JSON array, or
+# NDJSON; gzip detected from the magic bytes) as a stream, one node at a time.
+# Nodes are written as stored, so labels, links and comments survive as-is.
+# Writes go out in batches over a thread pool; each batch is indexed from the
+# data already in memory (one stat per file, no re-read). The per-type and
+# global indexes that Node__Service rewrites on every create are rebuilt once,
+# at the end, from the label index. --dry-run validates without writing.
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import gzip
+import io
+import json
+import os
+import re
+import sys
+
+from concurrent.futures                                                         import ThreadPoolExecutor
+from contextlib                                                                 import contextmanager
+from typing                                                                     import Iterable, Iterator, List, Optional, TextIO
+
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from osbot_utils.type_safe.primitives.domains.identifiers.safe_int.Timestamp_Now import Timestamp_Now
+from osbot_utils.type_safe.primitives.core.Safe_UInt                            import Safe_UInt
+from memory_fs.storage_fs.providers.Storage_FS__Local_Disk                      import Storage_FS__Local_Disk
+from issues_fs.issues.graph_services.Graph__Repository                          import Graph__Repository
+from issues_fs.issues.graph_services.Node__Service                              import Node__Service
+from issues_fs_cli.cli.CLI__Index                                               import CLI__Index, FILE_EXT__ISSUES, FILE_NAME__ISSUE_JSON, INDEX__READ_JOBS
+from issues_fs_cli.cli.CLI__Label_Parser                                        import CLI__Label_Parser
+from issues_fs_cli.cli.CLI__Pack__Storage                                       import CLI__Pack__Storage
+
+
+IMPORT__BATCH_SIZE = 500                                                         # Nodes written per thread-pool round
+IMPORT__CHUNK_SIZE = 1 << 16                                                     # Characters read per refill
+IMPORT__DOCUMENT   = re.compile(r'\{\s*"nodes"\s*:\s*\[')                        # Start of an export json document
+IMPORT__GZIP_MAGIC = b'\x1f\x8b'
+
+
+class CLI__Import__Error(Exception):                                             # Input that cannot be parsed at all
+    pass
+
+
+class CLI__Import(Type_Safe):                                                    # Bulk node importer
+    repository : Graph__Repository = None
+    index      : CLI__Index        = None                                        # Refreshed label index (existing labels)
+    overwrite  : bool              = False                                       # Replace nodes whose label exists
+    dry_run    : bool              = False                                       # Validate only
+    jobs       : int               = INDEX__READ_JOBS                            # Parallel file writes
+    batch_size : int               = IMPORT__BATCH_SIZE
+    imported   : int
+    skipped    : int                                                             # Existing labels (without --overwrite)
+    errors     : list                                                            # [position, label, message] per rejected node
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Import
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def run(self, nodes: Iterable[dict]) -> dict:                                # Validate + write every node, then reindex
+        node_types = {str(nt.name) for nt in self.repository.node_types_load()}
+        seen       = set()
+        batch      = []
+        with ThreadPoolExecutor(max_workers = max(1, self.jobs)) as pool:
+            try:
+                for position, node in enumerate(nodes, start=1):
+                    error = self.validate(node, node_types)
+                    if error:
+                        self.errors.append([position, node.get('label') if isinstance(node, dict) else None, error])
+                        continue
+                    label = node['label']
+                    if label in seen:
+                        self.errors.append([position, label, f'Duplicate label in input: {label}'])
+                        continue
+                    seen.add(label)
+                    if self.overwrite is False and self.index.entry(label) is not None:
+                        self.skipped += 1
+                        continue
+                    batch.append(node)
+                    if len(batch) >= self.batch_size:
+                        self.write_batch(pool, batch)
+                        batch = []
+            finally:                                                             # Unreadable input: keep what was read
+                self.write_batch(pool, batch)
+                if self.dry_run is False and self.imported:
+                    self.rebuild_indexes()
+        return self.stats()
+
+    def stats(self) -> dict:
+        return {'imported': self.imported    ,
+                'skipped' : self.skipped     ,
+                'failed'  : len(self.errors) ,
+                'dry_run' : self.dry_run     }
+
+    def validate(self, node, node_types: set) -> Optional[str]:                  # Why a node cannot be imported (None: ok)
+        if not isinstance(node, dict):
+            return 'Node must be a JSON object'
+        label      = node.get('label')
+        node_type  = node.get('node_type')
+        safe_label = CLI__Label_Parser.parse_label(label) if isinstance(label, str) else None
+        if safe_label is None or str(safe_label) != label:                       # Would be rewritten on the way in
+            return f'Invalid label: {label!r}'
+        if node_type not in node_types:
+            return f'Unknown node type: {node_type!r}'
+        if str(CLI__Label_Parser.parse_type(label)) != node_type:
+            return f'Label {label} does not match node type {node_type}'
+        if not isinstance(node.get('title'), str) or not node['title'].strip():
+            return 'Title is required'
+        if not isinstance(node.get('node_index', 0), int):
+            return f"Invalid node_index: {node.get('node_index')!r}"
+        for field, kind in (('links', list), ('tags', list), ('properties', dict)):
+            if node.get(field) is not None and not isinstance(node[field], kind):
+                return f'Invalid {field}: expected a {kind.__name__}'
+        return None
+
+    def write_batch(self, pool: ThreadPoolExecutor, nodes: List[dict]) -> None:  # Files in parallel, then index entries
+        if not nodes:
+            return
+        if self.dry_run:
+            self.imported += len(nodes)
+            return
+        paths   = [self.node_path(node) for node in nodes]
+        storage = self.repository.storage_fs
+        if isinstance(storage, CLI__Pack__Storage) and storage.removed.intersection(paths):
+            storage.removed.difference_update(paths)                             # Loose copies are back: un-remove once
+            storage.save_removed()
+        contents = [json.dumps(node, indent=2).encode('utf-8') for node in nodes]   # Same layout as Graph__Repository.node_save
+        list(pool.map(self.write_file, paths, contents))
+        for path, node in zip(paths, nodes):
+            self.index.index_file(path, self.index.fingerprint(path), [self.index.entry_from_data(node, path)])
+        self.imported += len(nodes)
+
+    def write_file(self, path: str, content: bytes) -> None:                     # Thread-safe single write
+        storage = self.repository.storage_fs
+        if isinstance(storage, Storage_FS__Local_Disk) is False:
+            storage.file__save(path, content)
+            return
+        full_path = os.path.join(str(storage.root_path), path)                   # Direct write: no per-call type checks
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, 'wb') as f:
+            f.write(content)
+
+    @staticmethod
+    def node_path(node: dict) -> str:                                            # Same as path_for_issue_json()
+        return f"data/{node['node_type']}/{node['label']}/{FILE_NAME__ISSUE_JSON}"
+
+    def rebuild_indexes(self) -> None:                                           # Type indexes + global index, once
+        counts     = {}
+        next_index = {}
+        for path, info in self.index.files.items():
+            if path.endswith(FILE_EXT__ISSUES):                                  # .issues nodes are not in the type indexes
+                continue
+            for entry in info['nodes']:
+                node_type             = entry['node_type']
+                counts[node_type]     = counts.get(node_type, 0) + 1
+                next_index[node_type] = max(next_index.get(node_type, 1), int(entry['node_index'] or 0) + 1)
+        now = Timestamp_Now()
+        for node_type in sorted(counts):
+            type_index              = self.repository.type_index_load(node_type)
+            type_index.count        = Safe_UInt(counts[node_type])
+            type_index.next_index   = Safe_UInt(max(int(type_index.next_index), next_index[node_type]))
+            type_index.last_updated = now
+            self.repository.type_index_save(type_index)
+        Node__Service(repository = self.repository).update_global_index()
+        self.index.save()
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Reading
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    @staticmethod
+    @contextmanager
+    def open_input(path: str = '-') -> Iterator[TextIO]:                         # Text stream, gunzipped when needed
+        source = sys.stdin.buffer if path == '-' else open(path, 'rb')
+        raw    = source if hasattr(source, 'peek') else io.BufferedReader(source)
+        if raw.peek(2)[:2] == IMPORT__GZIP_MAGIC:
+            raw = gzip.GzipFile(fileobj=raw, mode='rb')
+        stream = io.TextIOWrapper(raw, encoding='utf-8')
+        try:
+            yield stream
+        finally:
+            stream.detach()                                                      # Never close stdin
+            if path != '-':
+                source.close()
+
+    @staticmethod
+    def read_nodes(stream: TextIO, chunk_size: int = IMPORT__CHUNK_SIZE) -> Iterator[dict]:   # One object at a time, any export format
+        decoder = json.JSONDecoder()
+        buffer  = ''
+        pos     = 0
+        at_eof  = False
+
+        def skip(chars: str) -> Optional[str]:                                   # Next char not in chars (None at EOF)
+            nonlocal buffer, pos, at_eof
+            while True:
+                while pos < len(buffer) and buffer[pos] in chars:
+                    pos += 1
+                if pos < len(buffer):
+                    return buffer[pos]
+                if at_eof:
+                    return None
+                refill()
+
+        def refill() -> None:
+            nonlocal buffer, pos, at_eof
+            chunk  = stream.read(chunk_size)
+            at_eof = chunk == ''
+            buffer = buffer[pos:] + chunk
+            pos    = 0
+
+        def decode():
+            nonlocal pos
+            while True:
+                try:
+                    value, pos = decoder.raw_decode(buffer, pos)
+                    return value
+                except ValueError as error:
+                    if at_eof:
+                        raise CLI__Import__Error(f'Invalid JSON: {error}')
+                    refill()
+
+        first = skip(' \t\r\n')
+        if first is None:
+            return
+        in_array = first == '['
+        if first == '{':                                                         # Export document, or NDJSON
+            while len(buffer) - pos < 64 and at_eof is False:
+                refill()
+            match = IMPORT__DOCUMENT.match(buffer, pos)
+            if match:
+                pos, in_array = match.end(), True
+        elif in_array:
+            pos += 1
+        else:
+            raise CLI__Import__Error(f'Expected a JSON object or array, got {first!r}')
+
+        while True:
+            char = skip(' \t\r\n,' if in_array else ' \t\r\n')
+            if char is None:
+                if in_array:
+                    raise CLI__Import__Error('Unexpected end of input (unterminated nodes array)')
+                return
+            if in_array and char == ']':                                         # Anything after the array is ignored
+                return
+            yield decode()
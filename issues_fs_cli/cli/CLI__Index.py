@@ -0,0 +1,520 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI__Index - Persistent label/summary index over the node files in .issues/
+#
+# Stored at .issues/.cache/index.json (the .cache folder git-ignores itself).
+# Each indexed file keeps a fingerprint, so a refresh only re-reads the files
+# that changed since the last run:
+#   - local disk : (mtime_ns, size) from a single directory walk (no reads)
+#   - packed     : ('pack', pack stamp, offset) from the pack's name table
+#   - other      : sha1 of the file content (memory, sqlite, zip backends)
+#
+# On local disk inside a git checkout the index also records the HEAD commit
+# and the paths git reported as dirty when it was saved. The next refresh then
+# asks git what changed since (CLI__Git: one status call, plus one diff when
+# HEAD moved) and fingerprints only those paths, so a `git pull` touching a few
+# files costs O(changes) instead of a walk of the whole tree. Without git, or
+# when git cannot answer, refresh falls back to the full walk.
+#
+# Label lookups and the reverse-edge (incoming link) map are derived from the
+# entries in memory and kept in step as individual files are re-indexed.
+#
+# Files that need (re)reading are fetched on a thread pool (`jobs` workers),
+# since a cold build on a network filesystem is bound by per-file latency.
+# Parsing stays on the calling thread (it holds the GIL anyway) and results
+# are applied in sorted path order, so the index is the same for any `jobs`.
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import hashlib
+import heapq
+import json
+import os
+
+from concurrent.futures                                                         import ThreadPoolExecutor
+from typing                                                                     import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from memory_fs.storage_fs.providers.Storage_FS__Local_Disk                      import Storage_FS__Local_Disk
+from issues_fs.issues.graph_services.Graph__Repository                          import Graph__Repository, SKIP_LABELS
+from issues_fs_cli.cli.CLI__Git                                                 import CLI__Git
+from issues_fs_cli.cli.CLI__Node__Filter                                        import CLI__Node__Filter
+from issues_fs_cli.cli.CLI__Node__Sort                                          import CLI__Node__Sort
+from issues_fs_cli.cli.CLI__Pack__Storage                                       import CLI__Pack__Storage, PACK__FOLDER
+from issues_fs.issues.issues_file.Issues_File__Loader__Service                  import Issues_File__Loader__Service
+from issues_fs.schemas.graph.Schema__Node__List__Response                       import Schema__Node__List__Response
+from issues_fs.schemas.graph.Schema__Node__Summary                              import Schema__Node__Summary
+
+
+INDEX__FOLDER         = '.cache'                                                 # Relative to the storage root (.issues/)
+INDEX__PATH           = f'{INDEX__FOLDER}/index.json'
+INDEX__GITIGNORE      = f'{INDEX__FOLDER}/.gitignore'
+INDEX__VERSION        = 1                                                        # Bump when the entry layout changes
+FILE_NAME__ISSUE_JSON = 'issue.json'
+FILE_EXT__ISSUES      = '.issues'
+SKIP_FOLDERS          = {INDEX__FOLDER, PACK__FOLDER, '.git'}                    # Never walked
+INDEX__READ_JOBS      = min(32, (os.cpu_count() or 1) + 4)                       # Same default as ThreadPoolExecutor
+INDEX__PARALLEL_MIN   = 16                                                       # Fewer files: read serially (no pool)
+
+
+class CLI__Index(Type_Safe):                                                     # Persistent node summary index
+    repository : Graph__Repository = None                                        # Storage layer being indexed
+    files      : dict                                                            # file path → {fingerprint, nodes}
+    loaded     : bool              = False                                       # Index file has been read
+    dirty      : bool              = False                                       # In-memory state differs from disk
+    by_label   : dict              = None                                        # label → entry (built on demand)
+    incoming   : dict              = None                                        # target label → {source label: verb}
+    jobs       : int               = INDEX__READ_JOBS                            # Reader threads for refresh()
+    git        : dict              = None                                        # {head, dirty} the files were indexed at
+    summarised : dict              = None                                        # id(entry) → (entry, summary) from the last query
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Persistence
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def load(self) -> 'CLI__Index':                                              # Read index file (if any)
+        self.files  = {}
+        self.loaded = True
+        self.reset_adjacency()
+        index_path  = self.index_path()
+        content     = self.storage_fs().file__str(index_path) if self.storage_fs().file__exists(index_path) else None
+        if not content:
+            return self
+        try:
+            data = json.loads(content)
+        except ValueError:                                                       # Corrupt index, rebuilt on refresh
+            return self
+        if data.get('version') == self.index_version():
+            self.load_data(data)
+        return self
+
+    def load_data(self, data: dict) -> None:                                     # Index file content → memory
+        self.files = data.get('files') or {}
+        self.git   = data.get('git')
+
+    def index_data(self) -> dict:                                                # Memory → index file content
+        return {'version': self.index_version(), 'files': self.files, 'git': self.git}
+
+    def index_path(self) -> str:
+        return INDEX__PATH
+
+    def index_version(self) -> int:
+        return INDEX__VERSION
+
+    def save(self) -> bool:                                                      # Write index file if it changed
+        if self.dirty is False:
+            return True
+        storage = self.storage_fs()
+        if storage.file__exists(INDEX__GITIGNORE) is False:                      # Keep the cache out of git
+            storage.file__save(INDEX__GITIGNORE, b'*\n')
+        content = json.dumps(self.index_data(), separators=(',', ':'))
+        result  = storage.file__save(self.index_path(), content.encode('utf-8'))
+        if result:
+            self.dirty = False
+        return result
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Refresh
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def refresh(self) -> 'CLI__Index':                                           # Bring index up to date with storage
+        if self.loaded is False:
+            self.load()
+
+        status       = self.git_status()
+        fingerprints = self.scan_fingerprints__git(status) if status else None   # Only what git says may have changed
+        if fingerprints is None:                                                 # Every file (None: removed)
+            fingerprints = dict.fromkeys(self.files)
+            fingerprints.update(self.scan_fingerprints())
+        changed      = [p for p, f in fingerprints.items() if f is None and p in self.files]   # Files removed since last run
+
+        for path in changed:
+            self.remove_file(path)
+
+        to_read = sorted(path for path, fingerprint in fingerprints.items()      # Files added or changed
+                         if fingerprint is not None and self.files.get(path, {}).get('fingerprint') != fingerprint)
+        for path, nodes in zip(to_read, self.read_files(to_read, fingerprints)):
+            self.index_file(path, fingerprints[path], nodes)
+            changed.append(path)
+
+        if any(path.endswith(FILE_EXT__ISSUES) for path in changed):             # Repository caches parsed .issues files
+            self.repository.issues_files_invalidate_cache()                      # (stale in a long-lived daemon)
+
+        if status != self.git:                                                   # Up to date as of this commit + dirty set
+            self.git   = status
+            self.dirty = True
+        self.save()
+        return self
+
+    def rebuild(self) -> 'CLI__Index':                                           # Drop everything and re-index
+        self.files  = {}
+        self.git    = None
+        self.loaded = True
+        self.dirty  = True
+        self.reset_adjacency()
+        return self.refresh()
+
+    def refresh_nodes(self, node_refs: list) -> 'CLI__Index':                    # Write-through for (node_type, label) pairs
+        if self.loaded is False:                                                 # Nothing in memory: next refresh() catches up
+            return self
+        for node_type, label in node_refs:
+            if not node_type or not label:
+                continue
+            path        = str(self.repository.path_handler.path_for_issue_json(node_type, label))
+            fingerprint = self.fingerprint(path)
+            if fingerprint is None:
+                self.remove_file(path)
+            elif self.files.get(path, {}).get('fingerprint') != fingerprint:
+                self.index_file(path, fingerprint)
+        self.save()
+        return self
+
+    def refresh_paths(self, paths: Iterable[str]) -> 'CLI__Index':               # Re-index changed paths (not saved)
+        if self.loaded is False:
+            return self.refresh()
+        candidates = set()
+        for path in paths:
+            candidates.add(path)
+            if path not in self.files:                                           # A removed folder: everything under it
+                candidates.update(p for p in self.files if p.startswith(f'{path}/'))
+        for path in sorted(candidates):
+            if path not in self.files and not self.is_indexable(path):
+                continue
+            fingerprint = self.fingerprint(path)
+            if fingerprint is None:
+                self.remove_file(path)
+            elif self.files.get(path, {}).get('fingerprint') != fingerprint:
+                self.index_file(path, fingerprint)
+        if any(path.endswith(FILE_EXT__ISSUES) for path in candidates):
+            self.repository.issues_files_invalidate_cache()
+        return self
+
+    def index_file(self, path: str, fingerprint, nodes: List[dict] = None) -> None:   # (Re)index a single file
+        previous         = self.files.get(path)
+        self.files[path] = {'fingerprint': fingerprint                                        ,
+                            'nodes'      : self.read_nodes(path) if nodes is None else nodes }
+        self.dirty       = True
+        self.update_adjacency(previous, self.files[path])
+
+    def remove_file(self, path: str) -> None:                                    # Forget a file and its nodes
+        previous = self.files.pop(path, None)
+        if previous is not None:
+            self.dirty = True
+            self.update_adjacency(previous, None)
+
+    def read_files(self, paths: List[str], fingerprints: dict = None) -> List[List[dict]]:   # Nodes per path, in order
+        fingerprints = fingerprints or {}
+        packed       = [p for p in paths if self.is_packed(fingerprints.get(p))]
+        loose        = [p for p in paths if not self.is_packed(fingerprints.get(p))]
+        nodes        = dict(zip(loose, self.read_loose(loose)))
+        for path in packed:                                                      # Memory copies: no pool, no syscalls
+            nodes[path] = self.parse_nodes(path, self.read_packed(path))
+        return [nodes[path] for path in paths]
+
+    def read_loose(self, paths: List[str]) -> List[List[dict]]:                  # read_nodes() per path, in order
+        if self.jobs <= 1 or len(paths) < INDEX__PARALLEL_MIN:
+            return [self.read_nodes(path) for path in paths]
+        with ThreadPoolExecutor(max_workers = min(self.jobs, len(paths))) as pool:
+            contents = list(pool.map(self.read_content, paths))                  # I/O overlaps across threads
+        return [self.parse_nodes(path, content) for path, content in zip(paths, contents)]
+
+    def read_nodes(self, path: str) -> List[dict]:                               # Read + parse file into index entries
+        return self.parse_nodes(path, self.read_content(path))
+
+    def read_content(self, path: str) -> Optional[str]:                          # Raw file content (thread-safe)
+        return self.storage_fs().file__str(path)
+
+    def read_packed(self, path: str) -> Optional[str]:                           # Content straight from the pack mapping
+        content = self.storage_fs().packed(path)
+        return content.decode('utf-8') if content is not None else None
+
+    def parse_nodes(self, path: str, content: Optional[str]) -> List[dict]:      # File content → index entries
+        if not content:
+            return []
+
+        if path.endswith(FILE_EXT__ISSUES):                                      # .issues file: many nodes per file
+            result = Issues_File__Loader__Service().load_content(content, path)
+            return [self.entry_from_data(node.json(), path) for node in result.nodes]
+
+        try:
+            data = json.loads(content)
+        except ValueError:                                                       # Unreadable file, skipped on listing
+            return []
+        if not isinstance(data, dict):
+            return []
+        return [self.entry_from_data(data, path)]
+
+    def entry_from_data(self, data: dict, path: str) -> dict:                    # Keep only the fields the CLI queries
+        properties = data.get('properties') or {}
+        folder     = path.rsplit('/', 1)[0]
+        return {'path'      : folder                                              ,
+                'label'     : data.get('label') or folder.rsplit('/', 1)[-1]       ,
+                'node_type' : data.get('node_type')  or ''                        ,
+                'node_index': data.get('node_index') or 0                         ,
+                'title'     : data.get('title')      or ''                        ,
+                'status'    : data.get('status')     or ''                        ,
+                'priority'  : str(properties.get('priority') or '')               ,
+                'tags'      : [str(t) for t in data.get('tags') or []]            ,
+                'links'     : [[link.get('verb') or '', link.get('target_label') or '']
+                               for link in data.get('links') or []]               }
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Fingerprints
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def scan_fingerprints(self) -> Dict[str, object]:                            # path → fingerprint for indexable files
+        storage = self.storage_fs()
+        if isinstance(storage, CLI__Pack__Storage):                              # Packed paths, then loose files over them
+            fingerprints = {name: storage.packed_fingerprint(name) for name in storage.pack.names()
+                            if name not in storage.removed and self.is_indexable(name)}
+            fingerprints.update(self.scan_fingerprints__local_disk(str(storage.root_path)))
+            return fingerprints
+        if isinstance(storage, Storage_FS__Local_Disk):
+            return self.scan_fingerprints__local_disk(str(storage.root_path))
+
+        fingerprints = {}
+        for path in storage.files__paths():
+            path = str(path)
+            if self.is_indexable(path):
+                fingerprints[path] = self.fingerprint(path)
+        return fingerprints
+
+    def scan_fingerprints__local_disk(self, root_path: str) -> Dict[str, object]:   # One walk, stat only
+        fingerprints = {}
+        pending      = ['']
+        while pending:
+            folder = pending.pop()
+            try:
+                entries = list(os.scandir(os.path.join(root_path, folder) if folder else root_path))
+            except OSError:                                                      # Folder vanished mid-walk
+                continue
+            for entry in entries:
+                path = f'{folder}/{entry.name}' if folder else entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_FOLDERS:
+                        pending.append(path)
+                elif self.is_indexable(path):
+                    stat               = entry.stat()
+                    fingerprints[path] = [stat.st_mtime_ns, stat.st_size]
+        return fingerprints
+
+    def git_status(self) -> Optional[dict]:                                      # {head, dirty} (None: no usable git)
+        storage = self.storage_fs()
+        if isinstance(storage, Storage_FS__Local_Disk) is False:
+            return None
+        status = CLI__Git.status(str(storage.root_path))
+        if status:                                                               # Our own cache is always "dirty" (ignored)
+            status['dirty'] = [path for path in status['dirty'] if not path.startswith(f'{INDEX__FOLDER}/')]
+        return status
+
+    def scan_fingerprints__git(self, status: dict) -> Optional[Dict[str, object]]:   # path → fingerprint (None: removed)
+        if not self.git or not self.files:                                       # Never indexed at a known commit
+            return None
+        changed = CLI__Git.changed_paths(str(self.storage_fs().root_path), self.git['head'], status['head'])
+        if changed is None:
+            return None
+        paths = set(changed) | set(self.git['dirty']) | set(status['dirty'])     # Dirty then, or now, or committed since
+        if any(path.startswith(f'{PACK__FOLDER}/') for path in paths):           # Pack rewritten: every packed path may differ
+            return None
+        return {path: self.fingerprint(path) for path in paths
+                if self.is_indexable(path) and path.split('/', 1)[0] not in SKIP_FOLDERS}
+
+    @staticmethod
+    def is_packed(fingerprint) -> bool:                                          # Fingerprint of a file read from the pack
+        return isinstance(fingerprint, list) and len(fingerprint) > 0 and fingerprint[0] == 'pack'
+
+    def fingerprint(self, path: str):                                            # Fingerprint of one file (None if missing)
+        storage = self.storage_fs()
+        if isinstance(storage, Storage_FS__Local_Disk):
+            try:
+                stat = os.stat(os.path.join(str(storage.root_path), path))
+            except OSError:                                                      # No loose file: maybe packed
+                return storage.packed_fingerprint(path) if isinstance(storage, CLI__Pack__Storage) else None
+            return [stat.st_mtime_ns, stat.st_size]
+        if storage.file__exists(path) is False:
+            return None
+        return hashlib.sha1(storage.file__bytes(path) or b'').hexdigest()
+
+    @staticmethod
+    def is_indexable(path: str) -> bool:                                         # Same rules as nodes_list_all()
+        if path.startswith(f'{INDEX__FOLDER}/'):
+            return False
+        if path.endswith(FILE_EXT__ISSUES):
+            return True
+        if path.endswith(f'/{FILE_NAME__ISSUE_JSON}') is False:                  # Root issue.json is not a node
+            return False
+        label = path.rsplit('/', 2)[-2]
+        return label not in SKIP_LABELS
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Queries
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def entries(self, node_type: Optional[str] = None) -> Iterator[dict]:        # Entries in list_nodes() order
+        json_paths   = sorted(p for p in self.files if p.endswith(FILE_EXT__ISSUES) is False)
+        issues_paths = sorted(p for p in self.files if p.endswith(FILE_EXT__ISSUES))
+        seen_labels  = set()
+        ordered      = []
+
+        for path in json_paths + issues_paths:                                   # JSON nodes take precedence
+            for entry in self.files[path]['nodes']:
+                if entry['label'] in seen_labels or not entry['node_type']:
+                    continue
+                seen_labels.add(entry['label'])
+                ordered.append(entry)
+
+        type_filter = str(node_type) if node_type else None
+        ordered.sort(key=lambda e: e['node_type'])                               # Stable: keeps path order per type
+        for entry in ordered:
+            if type_filter is None or entry['node_type'] == type_filter:
+                yield entry
+
+    def entry(self, label: str) -> Optional[dict]:                               # Lookup by label
+        self.build_adjacency()
+        return self.by_label.get(str(label))
+
+    def incoming_links(self, label: str) -> Dict[str, str]:                      # {source label: verb} pointing at label
+        self.build_adjacency()
+        return self.incoming.get(str(label), {})
+
+    def select(self, node_filter: CLI__Node__Filter) -> Iterator[dict]:          # Entries matching a filter (no file reads)
+        for entry in self.entries(node_filter.node_type):
+            if node_filter.matches(entry):
+                yield entry
+
+    def summaries(self, node_type: Optional[str] = None, node_filter: CLI__Node__Filter = None) -> List[Schema__Node__Summary]:
+        node_filter = node_filter or CLI__Node__Filter(node_type = str(node_type) if node_type else None)
+        return self.summaries_of(self.select(node_filter))
+
+    def summaries_of(self, entries: Iterable[dict]) -> List[Schema__Node__Summary]:
+        previous = self.summarised or {}                                         # Unchanged entries keep their dict, so a
+        current  = {}                                                            # repeated query (--watch, daemon) only
+        for entry in entries:                                                    # builds schemas for re-indexed files
+            cached = previous.get(id(entry))
+            current[id(entry)] = cached if cached and cached[0] is entry else (entry, self.summary(entry))
+        self.summarised = current
+        return [summary for _, summary in current.values()]
+
+    def page(self, node_filter : CLI__Node__Filter      ,                        # (entries, total matches, next cursor)
+                   order       : CLI__Node__Sort = None ,
+                   limit       : int             = None ,
+                   offset      : int             = 0    ,
+                   cursor      : str             = None ) -> Tuple[List[dict], int, Optional[str]]:
+        order   = order or CLI__Node__Sort()
+        after   = order.after(cursor) if cursor else None                        # ValueError for a bad token
+        counts  = [0, 0]                                                         # [matches, matches after the cursor]
+        def candidates():
+            for entry in self.select(node_filter):
+                counts[0] += 1
+                if after is not None and order.entry_key(entry) <= after:
+                    continue
+                counts[1] += 1
+                yield entry
+        if limit is None and not order.fields and after is None:                 # Already in default order
+            entries = list(candidates())[offset:]
+        elif limit is None:
+            entries = sorted(candidates(), key=order.entry_key)[offset:]
+        else:                                                                    # Bounded heap: O(n log k), k = offset + limit
+            entries = heapq.nsmallest(offset + limit, candidates(), key=order.entry_key)[offset:]
+        more = limit is not None and counts[1] > offset + len(entries)
+        return entries, counts[0], order.cursor(entries[-1]) if more and entries else None
+
+    def list_page(self, node_filter: CLI__Node__Filter, **paging) -> Tuple[Schema__Node__List__Response, Optional[str]]:
+        entries, total, next_cursor = self.page(node_filter, **paging)
+        response = Schema__Node__List__Response(success = True                       ,
+                                                nodes   = self.summaries_of(entries) ,
+                                                total   = total                      )
+        return response, next_cursor
+
+    def list_nodes(self, node_type  : Optional[str]     = None ,                 # Drop-in for Node__Service.list_nodes()
+                         node_filter: CLI__Node__Filter = None
+                    ) -> Schema__Node__List__Response:
+        summaries = self.summaries(node_type, node_filter)
+        return Schema__Node__List__Response(success = True           ,
+                                            nodes   = summaries      ,
+                                            total   = len(summaries) )
+
+    @staticmethod
+    def summary(entry: dict) -> Schema__Node__Summary:                           # Index entry → service schema
+        return Schema__Node__Summary(label     = entry['label']     ,
+                                     node_type = entry['node_type'] ,
+                                     title     = entry['title']     ,
+                                     status    = entry['status']    )
+
+    @staticmethod
+    def summary_json(entry: dict) -> dict:                                       # Same as summary(entry).json(), no schema
+        return {'label'    : entry['label']     ,
+                'node_type': entry['node_type'] ,
+                'title'    : entry['title']     ,
+                'status'   : entry['status']    }
+
+    def stats(self) -> dict:                                                     # Counts for 'index status'
+        type_counts = {}
+        for entry in self.entries():
+            type_counts[entry['node_type']] = type_counts.get(entry['node_type'], 0) + 1
+        return {'files'      : len(self.files)               ,
+                'nodes'      : sum(type_counts.values())     ,
+                'type_counts': dict(sorted(type_counts.items())),
+                'index_path' : INDEX__PATH                   }
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Adjacency (label map + reverse edges)
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def reset_adjacency(self) -> None:                                           # Rebuilt on next lookup
+        self.by_label = None
+        self.incoming = None
+
+    def build_adjacency(self) -> None:                                           # O(nodes + edges), in memory only
+        if self.by_label is not None:
+            return
+        self.by_label = {}
+        self.incoming = {}
+        for entry in self.entries():
+            self.by_label[entry['label']] = entry
+            self.add_edges(entry)
+
+    def update_adjacency(self, previous: Optional[dict], current: Optional[dict]) -> None:
+        if self.by_label is None:                                                # Not built yet, nothing to maintain
+            return
+        old_nodes = (previous or {}).get('nodes', [])
+        new_nodes = (current  or {}).get('nodes', [])
+        if len(old_nodes) > 1 or len(new_nodes) > 1:                             # .issues files: precedence rules, rebuild lazily
+            self.reset_adjacency()
+            return
+        for entry in old_nodes:
+            if not entry['node_type']:                                           # Never part of the adjacency
+                continue
+            if self.by_label.get(entry['label']) is not entry:                   # Was shadowed by another file
+                self.reset_adjacency()
+                return
+            del self.by_label[entry['label']]
+            self.remove_edges(entry)
+        for entry in new_nodes:
+            if not entry['node_type']:
+                continue
+            if entry['label'] in self.by_label:                                  # Label clash with another file
+                self.reset_adjacency()
+                return
+            self.by_label[entry['label']] = entry
+            self.add_edges(entry)
+
+    def add_edges(self, entry: dict) -> None:                                    # First link per source wins (as in Node__Service)
+        source = entry['label']
+        for verb, target in entry['links']:
+            if target and target != source:
+                self.incoming.setdefault(target, {}).setdefault(source, verb)
+
+    def remove_edges(self, entry: dict) -> None:
+        source = entry['label']
+        for _, target in entry['links']:
+            sources = self.incoming.get(target)
+            if sources is not None:
+                sources.pop(source, None)
+                if not sources:
+                    del self.incoming[target]
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Helpers
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def storage_fs(self):                                                        # Underlying Storage_FS
+        return self.repository.storage_fs
@@ -0,0 +1,56 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI__Lazy_Group - Typer group that imports a command module only when used
+#
+# Subclasses set `lazy_commands` to {name: (module, attribute, short help)}.
+# The attribute is either a command function or a typer.Typer sub-app.
+# Help listings are rendered from lightweight stubs, so `issues-fs --help`
+# imports no command module (and none of the issues_fs services behind them).
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import importlib
+
+import typer
+
+from typing                                                                     import Dict, Tuple
+from typer.core                                                                 import TyperCommand, TyperGroup
+
+
+class CLI__Lazy_Group(TyperGroup):                                               # Group with on-demand command loading
+    lazy_commands : Dict[str, Tuple[str, str, str]] = {}                         # name → (module, attribute, short help)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.loaded_commands = {}                                                # name → real click command
+        self.listing         = False                                             # True while rendering --help
+        for name, (_, _, short_help) in self.lazy_commands.items():              # Stubs keep help + typo suggestions working
+            self.commands.setdefault(name, TyperCommand(name = name, help = short_help))
+
+    def list_commands(self, ctx) -> list:
+        return list(self.commands)                                               # Registration order, not alphabetical
+
+    def get_command(self, ctx, cmd_name: str):
+        if cmd_name not in self.lazy_commands or self.listing:
+            return super().get_command(ctx, cmd_name)
+        if cmd_name not in self.loaded_commands:
+            self.loaded_commands[cmd_name] = self.load_command(cmd_name)
+        return self.loaded_commands[cmd_name]
+
+    def format_help(self, ctx, formatter) -> None:                               # Listing uses stubs only
+        self.listing = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self.listing = False
+
+    def load_command(self, cmd_name: str):                                       # Import module, build click command
+        module_name, attribute, short_help = self.lazy_commands[cmd_name]
+        target = getattr(importlib.import_module(module_name), attribute)
+
+        if isinstance(target, typer.Typer):                                      # Sub-app (types, link-types, ...)
+            group      = typer.main.get_group(target)
+            group.name = cmd_name
+            return group
+
+        wrapper = typer.Typer(add_completion = False)
+        wrapper.command(cmd_name, help = short_help)(target)
+        return typer.main.get_command(wrapper)
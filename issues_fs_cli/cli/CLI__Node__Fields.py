@@ -0,0 +1,68 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI__Node__Fields - Field projection for `list --fields label,status,...`
+#
+# Rows are plain tuples taken straight from label index entries, in the order
+# the fields were asked for: no node file is read and no Schema__Node__Summary
+# is built (each one validates every Safe_Str value it is given). Table, JSON
+# and NDJSON output render the same rows; JSON keys are the field names used
+# in the default output (`node_type`, not `type`).
+# ═══════════════════════════════════════════════════════════════════════════════
+
+from typing                                                                     import Iterable, Iterator
+
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+
+
+FIELDS__COLUMNS = {                                                              # field → (table header, column width)
+    'label'     : ('Label'   , 15),
+    'node_type' : ('Type'    , 12),
+    'node_index': ('Index'   ,  6),
+    'status'    : ('Status'  , 15),
+    'priority'  : ('Priority', 9 ),
+    'tags'      : ('Tags'    , 24),
+    'links'     : ('Links'   , 30),
+    'title'     : ('Title'   , 50),
+}
+FIELDS__ALIASES = {'type': 'node_type', 'index': 'node_index'}                   # Same names as --sort
+
+
+class CLI__Node__Fields(Type_Safe):                                              # Projection of index entries to rows
+    names : list                                                                 # Field names, output order (empty: no projection)
+
+    @classmethod
+    def from_spec(cls, spec: str) -> 'CLI__Node__Fields':                        # "label,status,title"
+        names = []
+        for name in (spec or '').split(','):
+            name = name.strip().lower()
+            name = FIELDS__ALIASES.get(name, name)
+            if not name:
+                continue
+            if name not in FIELDS__COLUMNS:
+                raise ValueError(f"Invalid field: {name} (expected {', '.join(FIELDS__COLUMNS)})")
+            if name not in names:
+                names.append(name)
+        return cls(names = names)
+
+    def row(self, entry: dict) -> tuple:                                         # Only the requested values
+        return tuple(self.value(entry, name) for name in self.names)
+
+    def rows(self, entries: Iterable[dict]) -> Iterator[tuple]:
+        return map(self.row, entries)
+
+    def row_json(self, row: tuple) -> dict:
+        return dict(zip(self.names, row))
+
+    @staticmethod
+    def value(entry: dict, name: str):                                           # JSON-ready value of one field
+        if name == 'tags':
+            return list(entry['tags'])
+        if name == 'links':
+            return [{'verb': verb, 'target_label': target} for verb, target in entry['links']]
+        return entry[name]
+
+    @staticmethod
+    def cell(value, width: int) -> str:                                          # Table text, cut to the column width
+        if isinstance(value, list):
+            value = ', '.join(f"{item['verb']} {item['target_label']}" if isinstance(item, dict) else item
+                              for item in value)
+        return str(value)[:width]
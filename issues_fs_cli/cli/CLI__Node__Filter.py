@@ -0,0 +1,47 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI__Node__Filter - Filter spec for `list`, evaluated against index entries
+#
+# Every field the filter can test (type, status, priority, tags) is stored in
+# the label index, so matching never reads or deserialises a node file.
+# Unset fields match everything; all given tags must be present.
+# from_query() reads the same predicates from "status:open AND priority:P0".
+# ═══════════════════════════════════════════════════════════════════════════════
+
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+
+
+FILTER__QUERY_FIELDS = {'type': 'node_type', 'status': 'status', 'priority': 'priority', 'tag': 'tags', 'tags': 'tags'}
+
+
+class CLI__Node__Filter(Type_Safe):                                              # Predicates pushed down to the index
+    node_type : str  = None                                                      # Exact node type (e.g. "bug")
+    status    : str  = None                                                      # Exact status
+    priority  : str  = None                                                      # Priority property (case-insensitive)
+    tags      : list                                                             # Tags that must all be present
+
+    def matches(self, entry: dict) -> bool:                                      # Index entry passes every predicate
+        if self.node_type and entry['node_type'] != self.node_type:
+            return False
+        if self.status and entry['status'] != self.status:
+            return False
+        if self.priority and entry['priority'].lower() != self.priority.lower():
+            return False
+        if self.tags and not set(self.tags).issubset(entry['tags']):
+            return False
+        return True
+
+    @classmethod
+    def from_query(cls, query: str) -> 'CLI__Node__Filter':                      # "field:value AND field:value"
+        values = {'tags': []}
+        for term in query.split():
+            if term.upper() == 'AND':
+                continue
+            field, _, value = term.partition(':')
+            name            = FILTER__QUERY_FIELDS.get(field.lower())
+            if name is None or not value:
+                raise ValueError(f"Invalid query term: {term} (expected type:, status:, priority: or tag:<value>)")
+            if name == 'tags':
+                values['tags'].extend(t for t in value.split(',') if t)
+            else:
+                values[name] = value.lower() if name == 'node_type' else value
+        return cls(**values)
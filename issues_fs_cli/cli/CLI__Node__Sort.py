@@ -0,0 +1,116 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI__Node__Sort - Sort spec and paging cursors for `list`, over index entries
+#
+# "--sort priority,-title": fields in order, "-" for descending. Every field is
+# stored in the label index, so ordering never reads a node file. Nodes with
+# no value for a field sort last either way, and ties are broken by type then
+# path (the order `list` prints without --sort), so the order is total and
+# stable across calls.
+#
+# A cursor is the sort key of the last row shown (plus the sort spec, so it
+# cannot be replayed against another order), base64url-encoded. The next page
+# is every row whose key is greater: nodes added or removed meanwhile do not
+# shift it the way an offset would.
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import base64
+import functools
+import json
+import re
+
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+
+
+SORT__FIELDS   = ('label', 'type', 'status', 'priority', 'title')
+SORT__PRIORITY = re.compile(r'^[pP](\d+)$')                                      # P0 < P1 < ... < P10, then other values
+
+
+@functools.total_ordering
+class Sort__Descending:                                                          # Inverts the order of one key component
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+
+class CLI__Node__Sort(Type_Safe):                                                # Ordering pushed down to the index
+    fields : list                                                                # [field, descending] pairs (empty: default order)
+
+    @classmethod
+    def from_spec(cls, spec: str) -> 'CLI__Node__Sort':                          # "priority,-title"
+        fields = []
+        for name in (spec or '').split(','):
+            name       = name.strip().lower()
+            descending = name.startswith('-')
+            name       = name.lstrip('+-')
+            if not name:
+                continue
+            if name not in SORT__FIELDS:
+                raise ValueError(f"Invalid sort field: {name} (expected {', '.join(SORT__FIELDS)})")
+            fields.append([name, descending])
+        return cls(fields = fields)
+
+    def spec(self) -> str:
+        return ','.join(f"{'-' if descending else ''}{name}" for name, descending in self.fields)
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Keys
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    @staticmethod
+    def value(entry: dict, name: str):                                           # JSON-safe field value (None: missing)
+        if name == 'label':
+            return [entry['node_type'], entry['node_index'], entry['label']]      # Bug-2 before Bug-10
+        if name == 'type':
+            return entry['node_type']
+        if name == 'title':
+            return entry['title'].casefold() or None
+        return entry[name] or None
+
+    def raw(self, entry: dict) -> list:                                          # Values the key (and a cursor) is built from
+        return [self.value(entry, name) for name, _ in self.fields] + [[entry['node_type'], entry['path'], entry['label']]]
+
+    def key(self, raw: list) -> tuple:                                           # Comparable key from raw values
+        key = []
+        for (name, descending), value in zip(self.fields, raw):
+            if value is None:
+                key.append((1, None))                                            # Missing: last in both directions
+                continue
+            if name == 'priority':
+                match = SORT__PRIORITY.match(value)
+                value = (0, int(match.group(1)), '') if match else (1, 0, value.lower())
+            elif isinstance(value, list):
+                value = tuple(value)
+            key.append((0, Sort__Descending(value) if descending else value))
+        key.append(tuple(raw[-1]))                                               # Tie-break: default list order
+        return tuple(key)
+
+    def entry_key(self, entry: dict) -> tuple:
+        return self.key(self.raw(entry))
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Cursors
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def cursor(self, entry: dict) -> str:                                        # Opaque token: "after this entry"
+        data = json.dumps({'sort': self.spec(), 'after': self.raw(entry)}, separators=(',', ':'))
+        return base64.urlsafe_b64encode(data.encode()).decode().rstrip('=')
+
+    def after(self, cursor: str) -> tuple:                                       # Key a cursor points after
+        try:
+            data = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+            raw  = data['after']
+            if data['sort'] != self.spec() or len(raw) != len(self.fields) + 1:
+                raise ValueError('sort changed')
+            for (name, _), value in zip(self.fields, raw):
+                if value is not None and not isinstance(value, list if name == 'label' else str):
+                    raise ValueError(f'bad {name} value')
+            return self.key(raw)
+        except (ValueError, TypeError, KeyError, AttributeError) as error:
+            raise ValueError(f"Invalid cursor for --sort '{self.spec()}' ({error})") from None
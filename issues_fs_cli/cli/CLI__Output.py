@@ -2,11 +2,15 @@
 # CLI__Output - Render service responses for terminal or agent consumption
 # ═══════════════════════════════════════════════════════════════════════════════
 
+import difflib
 import json
+import os
 import sys
+import time
 
-from typing                                                                     import List
+from typing                                                                     import Iterable, List
 
+from issues_fs_cli.cli.CLI__Node__Fields                                        import CLI__Node__Fields, FIELDS__COLUMNS
 from issues_fs.schemas.graph.Schema__Node                                       import Schema__Node
 from issues_fs.schemas.graph.Schema__Node__Create__Response                     import Schema__Node__Create__Response
 from issues_fs.schemas.graph.Schema__Node__Update__Response                     import Schema__Node__Update__Response
@@ -40,6 +44,19 @@ class CLI__Output:
     def success(message: str) -> None:                                           # Print success message
         sys.stdout.write(f"{message}\n")
 
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Streaming (NDJSON)
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    @staticmethod
+    def render_ndjson(items: Iterable[dict]) -> int:                             # One compact object per line, as produced
+        write = sys.stdout.write
+        count = 0
+        for item in items:
+            write(json.dumps(item, separators=(',', ':')) + '\n')
+            count += 1
+        return count
+
     # ═══════════════════════════════════════════════════════════════════════════════
     # Node Rendering
     # ═══════════════════════════════════════════════════════════════════════════════
@@ -100,19 +117,28 @@ class CLI__Output:
     # ═══════════════════════════════════════════════════════════════════════════════
 
     @staticmethod
-    def render_list(response  : Schema__Node__List__Response ,                   # Render node list
-                    format    : str  = "table"               ,
-                    for_agent : bool = False                  ) -> None:
+    def render_list(response    : Schema__Node__List__Response ,                 # Render node list
+                    format      : str  = "table"               ,
+                    for_agent   : bool = False                 ,
+                    next_cursor : str  = None                  ) -> None:        # Set when there is a next page
+        if format == "ndjson":
+            CLI__Output.render_ndjson(node.json() for node in response.nodes)
+            return
+
         if for_agent or format == "json":
-            print(json.dumps(response.json(), indent=2))
+            data = response.json()
+            if next_cursor:
+                data['next_cursor'] = next_cursor
+            print(json.dumps(data, indent=2))
             return
 
         if format == "table":
-            CLI__Output.render_list_table(response)
+            CLI__Output.render_list_table(response, next_cursor)
             return
 
     @staticmethod
-    def render_list_table(response: Schema__Node__List__Response) -> None:       # Render list as table
+    def render_list_table(response    : Schema__Node__List__Response ,           # Render list as table
+                          next_cursor : str = None                   ) -> None:
         if response.total == 0:
             print("No issues found.")
             return
@@ -125,7 +151,173 @@ class CLI__Output:
             title = str(node.title)[:50] if node.title else ""
             print(f"{str(node.label):<15} {str(node.node_type):<12} {str(node.status):<15} {title}")
 
-        print(f"\nTotal: {response.total}")
+        if len(response.nodes) < response.total:                                 # One page of the matches
+            print(f"\nShowing {len(response.nodes)} of {response.total}")
+        else:
+            print(f"\nTotal: {response.total}")
+        if next_cursor:
+            print(f"Next page: --cursor {next_cursor}")
+
+    @staticmethod
+    def render_rows(fields      : CLI__Node__Fields ,                            # Render projected rows (list --fields)
+                    rows        : Iterable[tuple]   ,
+                    total       : int               ,
+                    format      : str  = "table"    ,
+                    for_agent   : bool = False      ,
+                    next_cursor : str  = None       ) -> None:
+        if format == "ndjson":
+            CLI__Output.render_ndjson(map(fields.row_json, rows))
+            return
+
+        if for_agent or format == "json":                                        # Same envelope as render_list
+            data = {'success': True, 'total': total, 'message': '', 'nodes': list(map(fields.row_json, rows))}
+            if next_cursor:
+                data['next_cursor'] = next_cursor
+            print(json.dumps(data, indent=2))
+            return
+
+        if format == "table":
+            CLI__Output.render_rows_table(fields, rows, total, next_cursor)
+            return
+
+    @staticmethod
+    def render_rows_table(fields      : CLI__Node__Fields ,                      # Columns in --fields order
+                          rows        : Iterable[tuple]   ,
+                          total       : int               ,
+                          next_cursor : str = None        ) -> None:
+        if total == 0:
+            print("No issues found.")
+            return
+
+        widths = [FIELDS__COLUMNS[name][1] for name in fields.names]
+        last   = len(widths) - 1
+        header = ' '.join(f"{FIELDS__COLUMNS[name][0]:<{width}}" if i < last else FIELDS__COLUMNS[name][0]
+                          for i, (name, width) in enumerate(zip(fields.names, widths)))
+        print(header)
+        print("─" * len(header))
+
+        shown = 0
+        for row in rows:
+            print(' '.join(f"{fields.cell(value, width):<{width}}" if i < last else fields.cell(value, width)
+                           for i, (value, width) in enumerate(zip(row, widths))))
+            shown += 1
+
+        if shown < total:                                                        # One page of the matches
+            print(f"\nShowing {shown} of {total}")
+        else:
+            print(f"\nTotal: {total}")
+        if next_cursor:
+            print(f"Next page: --cursor {next_cursor}")
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Watch Rendering (--watch)
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    @staticmethod
+    def render_watch(lines     : List[str]       ,                               # One captured render
+                     previous  : List[str] = None,                               # Last render shown (None: first)
+                     diff      : bool      = True) -> None:                      # False: raw output (json formats)
+        if diff is False:
+            sys.stdout.write(''.join(f"{line}\n" for line in lines))
+            sys.stdout.flush()
+            return
+
+        color = sys.stdout.isatty() and not os.environ.get('NO_COLOR')
+        mark  = lambda sign, line, code: f"\033[{code}m{sign} {line}\033[0m" if color else f"{sign} {line}"
+        out   = []
+        if sys.stdout.isatty():
+            out.append("\033[H\033[2J")                                         # Redraw in place
+        elif previous is not None:
+            out.append("\n")
+        if previous is None:
+            out.extend(f"  {line}\n" for line in lines)
+        else:
+            for tag, i1, i2, j1, j2 in difflib.SequenceMatcher(None, previous, lines, autojunk=False).get_opcodes():
+                if tag == 'equal':
+                    out.extend(f"  {line}\n" for line in lines[j1:j2])
+                    continue
+                out.extend(mark('-', line, '31') + "\n" for line in previous[i1:i2])
+                out.extend(mark('+', line, '32') + "\n" for line in lines[j1:j2])
+        out.append(f"\n── {time.strftime('%H:%M:%S')} · watching for changes (Ctrl-C to stop)\n")
+        sys.stdout.write(''.join(out))
+        sys.stdout.flush()
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Federated Rendering (--repos)
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    @staticmethod
+    def render_federated_list(rows      : Iterable[dict]  ,                      # Summaries with 'root', streamed
+                              format    : str  = "table"  ,
+                              for_agent : bool = False    ) -> int:
+        if format == "ndjson":
+            return CLI__Output.render_ndjson(rows)
+
+        if for_agent or format == "json":
+            nodes = list(rows)
+            print(json.dumps({'success': True, 'nodes': nodes, 'total': len(nodes)}, indent=2))
+            return len(nodes)
+
+        total = 0
+        for row in rows:                                                         # Table rows print as roots finish
+            if total == 0:
+                header = f"{'Repo':<24} {'Label':<15} {'Type':<12} {'Status':<15} {'Title'}"
+                print(header)
+                print("─" * len(header))
+            title  = str(row['title'])[:50] if row['title'] else ""
+            print(f"{row['root'][-24:]:<24} {row['label']:<15} {row['node_type']:<12} {row['status']:<15} {title}")
+            total += 1
+        print(f"\nTotal: {total}" if total else "No issues found.")
+        return total
+
+    @staticmethod
+    def render_federated_nodes(nodes     : Iterable[dict]  ,                     # Full nodes with 'root'
+                               format    : str  = "table"  ,
+                               for_agent : bool = False    ) -> int:
+        nodes = list(nodes)
+        if for_agent or format == "json":
+            print(json.dumps({'success': True, 'nodes': nodes, 'total': len(nodes)}, indent=2))
+            return len(nodes)
+
+        for index, data in enumerate(nodes):
+            if index:
+                print()
+            print(f"── {data['root']} ──")
+            node = Schema__Node.from_json({k: v for k, v in data.items() if k != 'root'})
+            if format == "markdown":
+                CLI__Output.render_node_markdown(node)
+            else:
+                CLI__Output.render_node_table(node)
+        return len(nodes)
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Search Rendering
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    @staticmethod
+    def render_search_results(query     : str            ,                      # Ranked summaries with 'score'
+                              rows      : List[dict]     ,
+                              format    : str  = "table" ,
+                              for_agent : bool = False   ) -> None:
+        if format == "ndjson":
+            CLI__Output.render_ndjson(rows)
+            return
+
+        if for_agent or format == "json":
+            print(json.dumps({'success': True, 'query': query, 'results': rows, 'total': len(rows)}, indent=2))
+            return
+
+        if not rows:
+            print("No matches found.")
+            return
+
+        header = f"{'Score':>7} {'Label':<15} {'Type':<12} {'Status':<15} {'Title'}"
+        print(header)
+        print("─" * len(header))
+        for row in rows:
+            title = str(row['title'])[:50] if row['title'] else ""
+            print(f"{row['score']:>7.2f} {row['label']:<15} {row['node_type']:<12} {row['status']:<15} {title}")
+        print(f"\nTotal: {len(rows)}")
 
     # ═══════════════════════════════════════════════════════════════════════════════
     # Create Response Rendering
@@ -200,6 +392,89 @@ class CLI__Output:
                 for link in response.links:
                     print(f"  {link.source} ──{link.link_type}──▶ {link.target}")
 
+    @staticmethod
+    def render_paths(source    : str            ,                                # {hops, nodes, links} per path
+                     target    : str            ,
+                     paths     : List[dict]     ,
+                     format    : str  = "table" ,
+                     for_agent : bool = False   ) -> None:
+        if for_agent or format == "json":
+            print(json.dumps({'success': True, 'from': source, 'to': target, 'paths': paths, 'total': len(paths)}, indent=2))
+            return
+
+        for number, path in enumerate(paths, start=1):
+            steps = [path['nodes'][0]] + [f"──{link['verb']}──▶ {link['target']}" for link in path['links']]
+            print(f"{number:>3}. ({path['hops']} hops) {' '.join(steps)}")
+
+    @staticmethod
+    def render_critical_paths(results   : List[dict]     ,                       # {target, chain, blocking, cyclic}
+                              format    : str  = "table" ,
+                              for_agent : bool = False   ) -> None:
+        if for_agent or format == "json":
+            print(json.dumps({'success': True, 'results': results}, indent=2))
+            return
+
+        for number, result in enumerate(results):
+            if number:
+                print()
+            target = result['target'] or 'all nodes'
+            length = len(result['chain'])
+            print(f"Critical path to {target} ({length} {'node' if length == 1 else 'nodes'})\n")
+            for step, node in enumerate(result['chain'], start=1):
+                title = str(node['title'])[:50] if node['title'] else ""
+                print(f"{step:>3}. {node['label']:<15} {node['node_type']:<12} {node['status']:<15} {title}")
+            if result['target']:
+                labels = ', '.join(node['label'] for node in result['blocking'])
+                count  = len(result['blocking'])
+                print(f"\nBlocked by {count} open {'node' if count == 1 else 'nodes'}{': ' + labels if labels else ''}")
+            else:
+                print(f"\n{result['nodes']} nodes, {result['edges']} dependency edges")
+            if result['cyclic']:
+                print(f"Skipped (dependency cycle): {', '.join(result['cyclic'])}")
+
+    @staticmethod
+    def render_cycles(cycles    : List[dict]     ,                               # {size, nodes, cycle: {nodes, verbs}}
+                      nodes     : int            ,
+                      edges     : int            ,
+                      format    : str  = "table" ,
+                      for_agent : bool = False   ) -> None:
+        if for_agent or format == "json":
+            print(json.dumps({'success': not cycles, 'cycles': cycles, 'total': len(cycles),
+                              'nodes': nodes, 'edges': edges}, indent=2))
+            return
+
+        if not cycles:
+            CLI__Output.success(f"No cycles ({nodes} nodes, {edges} edges checked)")
+            return
+        print(f"Found {len(cycles)} {'cycle' if len(cycles) == 1 else 'cycles'} ({nodes} nodes, {edges} edges checked)\n")
+        for number, found in enumerate(cycles, start=1):
+            labels = found['cycle']['nodes']
+            steps  = ''.join(f" <--{verb}-- {label}" if backwards else f" --{verb}--> {label}"
+                             for verb, backwards, label in zip(found['cycle']['verbs'], found['cycle']['reversed'], labels[1:]))
+            print(f"{number:>3}. {labels[0]}{steps}")
+            if found['size'] > len(labels) - 1:
+                print(f"     {found['size']} nodes in the same cycle group: {', '.join(found['nodes'])}")
+
+    @staticmethod
+    def render_fsck(stats     : dict           ,                                 # {files, nodes, problems, repaired}
+                    problems  : List[dict]     ,                                 # {check, path, label, message}
+                    format    : str  = "table" ,
+                    for_agent : bool = False   ) -> None:
+        if for_agent or format == "json":
+            print(json.dumps({'success': not problems, **stats, 'problems': problems}, indent=2))
+            return
+
+        for problem in problems:
+            where = problem['label'] or problem['path']
+            print(f"{problem['check']:<16} {where:<20} {problem['message']}")
+        if stats['repaired']:
+            CLI__Output.success(f"Repaired: {', '.join(stats['repaired'])}")
+        summary = f"{stats['files']} files, {stats['nodes']} nodes checked"
+        if problems:
+            print(f"\n{len(problems)} {'problem' if len(problems) == 1 else 'problems'} ({summary})")
+        else:
+            CLI__Output.success(f"No problems ({summary})")
+
     # ═══════════════════════════════════════════════════════════════════════════════
     # Link Rendering
     # ═══════════════════════════════════════════════════════════════════════════════
@@ -231,6 +506,10 @@ class CLI__Output:
     def render_links_list(response  : Schema__Link__List__Response ,             # Render links list
                           format    : str  = "table"               ,
                           for_agent : bool = False                 ) -> None:
+        if format == "ndjson":
+            CLI__Output.render_ndjson(link.json() for link in response.links)
+            return
+
         if for_agent or format == "json":
             print(json.dumps(response.json(), indent=2))
             return
@@ -265,6 +544,10 @@ class CLI__Output:
     def render_comments_list(response  : Schema__Comment__List__Response ,       # Render comments list
                              format    : str  = "table"                  ,
                              for_agent : bool = False                    ) -> None:
+        if format == "ndjson":
+            CLI__Output.render_ndjson(comment.json() for comment in response.comments)
+            return
+
         if for_agent or format == "json":
             print(json.dumps(response.json(), indent=2))
             return
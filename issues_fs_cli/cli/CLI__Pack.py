@@ -0,0 +1,139 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI__Pack - Read-only pack file of node files (`issues-fs pack`), read via mmap
+#
+# One file holds the content of many issue.json files, keyed by their storage
+# path, with an on-disk hash table so a lookup reads a few bytes of the mapping
+# and no per-file syscalls. Layout (little-endian):
+#
+#   header  : magic(8) count(u32) buckets(u32) table_offset(u64) names_offset(u64)
+#   data    : file contents, back to back
+#   names   : paths in sorted order, '\n'-joined (utf-8)
+#   table   : count x (name_offset u64, name_len u32, data_offset u64, data_len u32)
+#   buckets : buckets x u32 (table index + 1, 0 = empty), crc32(path), linear probing
+#
+# Packs are written to a temp file and renamed into place, so readers never see
+# a partial pack. Stdlib only.
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import mmap
+import os
+import struct
+import zlib
+
+from typing                                                                     import Iterable, List, Optional, Tuple
+
+
+PACK__MAGIC   = b'IFSPACK1'
+PACK__HEADER  = struct.Struct('<8sIIQQ')
+PACK__ENTRY   = struct.Struct('<QIQI')
+PACK__BUCKET  = struct.Struct('<I')
+
+
+class CLI__Pack:                                                                 # Memory-mapped pack reader
+
+    def __init__(self, path: str):
+        self.path    = path
+        self.file    = open(path, 'rb')
+        self.data    = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count, self.buckets, self.table_offset, self.names_offset = PACK__HEADER.unpack_from(self.data, 0)
+        if magic != PACK__MAGIC:
+            self.close()
+            raise ValueError(f"Not an issues-fs pack file: {path}")
+        self.buckets_offset = self.table_offset + self.count * PACK__ENTRY.size
+        stat                = os.fstat(self.file.fileno())
+        self.stamp          = [stat.st_mtime_ns, stat.st_size]                   # Identifies this pack (fingerprints)
+
+    @classmethod
+    def open(cls, path: str) -> Optional['CLI__Pack']:                           # None when there is no pack
+        if os.path.isfile(path) is False:
+            return None
+        return cls(path)
+
+    def close(self) -> None:
+        self.data.close()
+        self.file.close()
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Lookups
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def find(self, name: str) -> Optional[Tuple[int, int]]:                      # (data offset, length), O(1)
+        if self.count == 0:
+            return None
+        key    = name.encode('utf-8')
+        bucket = zlib.crc32(key) % self.buckets
+        while True:
+            (slot,) = PACK__BUCKET.unpack_from(self.data, self.buckets_offset + bucket * PACK__BUCKET.size)
+            if slot == 0:
+                return None
+            name_offset, name_len, data_offset, data_len = PACK__ENTRY.unpack_from(
+                self.data, self.table_offset + (slot - 1) * PACK__ENTRY.size)
+            if self.data[name_offset:name_offset + name_len] == key:
+                return data_offset, data_len
+            bucket = (bucket + 1) % self.buckets
+
+    def get(self, name: str) -> Optional[bytes]:                                 # File content, or None
+        location = self.find(name)
+        if location is None:
+            return None
+        offset, length = location
+        return self.data[offset:offset + length]
+
+    def __contains__(self, name: str) -> bool:
+        return self.find(name) is not None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def names(self) -> List[str]:                                                # Every path, sorted
+        if self.count == 0:
+            return []
+        return self.data[self.names_offset:self.table_offset].decode('utf-8').split('\n')
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Writing
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    @staticmethod
+    def write(path: str, files: Iterable[Tuple[str, bytes]]) -> int:             # Atomically (re)write a pack, return count
+        files   = sorted(files)
+        count   = len(files)
+        buckets = max(1, count * 2)                                              # Load factor <= 0.5
+        temp    = f'{path}.tmp'
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(temp, 'wb') as f:
+            f.write(b'\0' * PACK__HEADER.size)                                   # Header written last
+            locations = []
+            offset    = PACK__HEADER.size
+            for _, content in files:
+                f.write(content)
+                locations.append((offset, len(content)))
+                offset += len(content)
+
+            names_offset = offset
+            entries      = []
+            for i, (name, _) in enumerate(files):
+                key = name.encode('utf-8')
+                if i:
+                    f.write(b'\n')
+                    offset += 1
+                f.write(key)
+                entries.append((offset, len(key), *locations[i]))
+                offset += len(key)
+
+            table_offset = offset
+            for entry in entries:
+                f.write(PACK__ENTRY.pack(*entry))
+
+            slots = [0] * buckets
+            for i, (name, _) in enumerate(files):
+                bucket = zlib.crc32(name.encode('utf-8')) % buckets
+                while slots[bucket]:
+                    bucket = (bucket + 1) % buckets
+                slots[bucket] = i + 1
+            f.write(struct.pack(f'<{buckets}I', *slots))
+
+            f.seek(0)
+            f.write(PACK__HEADER.pack(PACK__MAGIC, count, buckets, table_offset, names_offset))
+        os.replace(temp, path)
+        return count
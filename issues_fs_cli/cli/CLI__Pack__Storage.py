@@ -0,0 +1,181 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI__Pack__Storage - Local disk storage overlaid on a pack file
+#
+# Reads go to the loose file when there is one and fall back to the pack
+# (.issues/.pack/nodes.pack), so nodes written after `issues-fs pack` simply
+# shadow their packed copy, as loose objects do in git. Deleting a packed path
+# records it in .pack/removed (one path per line) until the next pack drops it.
+# Writes always go to loose files; the pack itself is never modified in place.
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import os
+
+from typing                                                                     import List, Optional
+
+from memory_fs.Memory_FS                                                        import Memory_FS
+from memory_fs.storage_fs.providers.Storage_FS__Local_Disk                      import Storage_FS__Local_Disk
+from issues_fs.issues.graph_services.Graph__Repository                          import Graph__Repository, SKIP_LABELS
+from issues_fs.issues.graph_services.Graph__Repository__Factory                 import Graph__Repository__Factory
+from issues_fs.issues.storage.Path__Handler__Graph_Node                         import Path__Handler__Graph_Node
+from issues_fs_cli.cli.CLI__Pack                                                import CLI__Pack
+
+
+PACK__FOLDER  = '.pack'                                                          # Relative to the storage root (.issues/)
+PACK__PATH    = f'{PACK__FOLDER}/nodes.pack'
+PACK__REMOVED = f'{PACK__FOLDER}/removed'
+PACK__FILE    = 'issue.json'                                                     # Node files; config and indexes stay loose
+
+
+class CLI__Pack__Storage(Storage_FS__Local_Disk):                                # Loose files over a read-only pack
+    pack    : CLI__Pack = None
+    removed : set                                                                # Packed paths deleted since packing
+
+    @classmethod
+    def create_repository(cls, root_path: str) -> Graph__Repository:            # Pack-aware when a pack exists
+        pack = CLI__Pack.open(os.path.join(root_path, PACK__PATH))
+        if pack is None:                                                         # Plain local disk, as before
+            return Graph__Repository__Factory.create_local_disk(root_path = root_path)
+        storage              = cls(root_path = root_path, pack = pack)
+        storage.removed      = storage.load_removed()
+        memory_fs            = Memory_FS()
+        memory_fs.storage_fs = storage
+        return Graph__Repository(memory_fs    = memory_fs                   ,
+                                 path_handler = Path__Handler__Graph_Node() )
+
+    @staticmethod
+    def stamp(root_path: str) -> Optional[list]:                                 # Changes whenever the pack is rewritten
+        try:
+            stat = os.stat(os.path.join(root_path, PACK__PATH))
+        except OSError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Pack / Unpack
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    @classmethod
+    def pack_repository(cls, root_path: str, keep_loose: bool = False) -> dict: # Loose + packed nodes → new pack
+        storage = cls.create_repository(root_path).storage_fs
+        names   = [str(p) for p in storage.files__paths() if cls.is_packable(str(p))]
+        files   = [(name, storage.file__bytes(name)) for name in names]
+        loose   = [name for name in names if os.path.isfile(storage.full_path(name))]
+        count   = CLI__Pack.write(os.path.join(root_path, PACK__PATH), files)
+
+        if os.path.isfile(os.path.join(root_path, PACK__REMOVED)):               # Deletions are now baked in
+            os.remove(os.path.join(root_path, PACK__REMOVED))
+        if keep_loose is False:                                                  # Only after the pack is in place
+            for name in loose:
+                os.remove(os.path.join(root_path, name))
+            cls.prune_folders(root_path, loose)
+        if isinstance(storage, CLI__Pack__Storage):
+            storage.pack.close()
+        return {'nodes'     : count                                                 ,
+                'loose'     : 0 if keep_loose else len(loose)                       ,
+                'pack_path' : PACK__PATH                                            ,
+                'pack_bytes': os.path.getsize(os.path.join(root_path, PACK__PATH))  }
+
+    @classmethod
+    def unpack_repository(cls, root_path: str) -> int:                           # Packed nodes → loose files, drop the pack
+        storage = cls.create_repository(root_path).storage_fs
+        if isinstance(storage, CLI__Pack__Storage) is False:
+            return 0
+        written = 0
+        for name in storage.pack.names():
+            if name not in storage.removed and os.path.isfile(storage.full_path(name)) is False:
+                storage.file__save(name, storage.pack.get(name))
+                written += 1
+        storage.pack.close()
+        for path in (PACK__PATH, PACK__REMOVED):
+            if os.path.isfile(os.path.join(root_path, path)):
+                os.remove(os.path.join(root_path, path))
+        cls.prune_folders(root_path, [PACK__PATH])
+        return written
+
+    @staticmethod
+    def is_packable(path: str) -> bool:                                          # Node issue.json files only
+        if path.startswith(f'{PACK__FOLDER}/') or path.startswith('.cache/'):
+            return False
+        if path.endswith(f'/{PACK__FILE}') is False:
+            return False
+        return path.rsplit('/', 2)[-2] not in SKIP_LABELS
+
+    @staticmethod
+    def prune_folders(root_path: str, names: List[str]) -> None:                 # Remove folders left empty
+        folders = {os.path.dirname(name) for name in names}
+        for folder in sorted(folders, key=len, reverse=True):
+            while folder:
+                try:
+                    os.rmdir(os.path.join(root_path, folder))
+                except OSError:                                                  # Not empty (or already gone)
+                    break
+                folder = os.path.dirname(folder)
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Storage_FS
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def file__bytes(self, path) -> Optional[bytes]:                              # One open() attempt, then the mapping
+        try:
+            with open(self.full_path(path), 'rb') as f:
+                return f.read()
+        except (FileNotFoundError, NotADirectoryError, IsADirectoryError):
+            return self.packed(path)
+
+    def file__str(self, path) -> Optional[str]:
+        content = self.file__bytes(path)
+        return content.decode('utf-8') if content is not None else None
+
+    def file__exists(self, path) -> bool:
+        return os.path.isfile(self.full_path(path)) or self.packed_exists(path)
+
+    def file__save(self, path, data: bytes) -> bool:                             # Loose file shadows the packed one
+        result = super().file__save(path, data)
+        if result and str(path) in self.removed:
+            self.removed.discard(str(path))
+            self.save_removed()
+        return result
+
+    def file__delete(self, path) -> bool:
+        deleted = os.path.isfile(self.full_path(path)) and super().file__delete(path)
+        if self.packed_exists(path):
+            self.removed.add(str(path))
+            self.save_removed()
+            deleted = True
+        return deleted
+
+    def files__paths(self) -> List[str]:
+        paths = set(str(p) for p in super().files__paths())
+        paths.update(name for name in self.pack.names() if name not in self.removed)
+        return sorted(paths)
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Pack Access
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def packed(self, path) -> Optional[bytes]:                                   # Packed content, unless removed
+        if str(path) in self.removed:
+            return None
+        return self.pack.get(str(path))
+
+    def packed_exists(self, path) -> bool:
+        return str(path) not in self.removed and str(path) in self.pack
+
+    def packed_fingerprint(self, path) -> Optional[list]:                        # Stable until the pack is rewritten
+        if str(path) in self.removed:
+            return None
+        location = self.pack.find(str(path))
+        if location is None:
+            return None
+        return ['pack', *self.pack.stamp, location[0]]
+
+    def load_removed(self) -> set:
+        try:
+            with open(self.full_path(PACK__REMOVED)) as f:
+                return set(line.rstrip('\n') for line in f if line.strip())
+        except OSError:
+            return set()
+
+    def save_removed(self) -> None:
+        content = ''.join(f'{path}\n' for path in sorted(self.removed))
+        super().file__save(PACK__REMOVED, content.encode('utf-8'))
@@ -0,0 +1,198 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI__Profiler - Per-phase timing for `issues-fs --profile <command>`
+#
+# Spans come from wrapping the methods listed in PROFILE__TARGETS for the
+# duration of one command (and restoring them afterwards), so nothing in the
+# command path is instrumented, or even imported, when profiling is off.
+# Output, by --profile-output / ISSUES_FS_PROFILE:
+#   (none) or "1" : span tree with total time and call counts, on stderr
+#   *.prof/pstats : cProfile stats (python -m pstats, snakeviz)
+#   other paths   : Chrome trace JSON (chrome://tracing, Perfetto)
+# A span that is re-entered (e.g. Type_Safe.json on nested objects) is only
+# timed at its outermost call.
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import importlib
+import json
+import os
+import sys
+import threading
+import time
+
+from typing                                                                     import Optional
+
+
+PROFILE__ENV         = 'ISSUES_FS_PROFILE'
+PROFILE__ENV_ON      = {'1', 'true', 'yes', 'on'}                                # Values meaning "summary on stderr"
+PROFILE__ENV_OFF     = {'', '0', 'false', 'no', 'off'}
+PROFILE__PSTATS_EXTS = ('.prof', '.pstats')                                      # Any other output path: Chrome trace
+PROFILE__TARGETS     = [                                                         # (module, class, methods or 'prefix*')
+    ('issues_fs_cli.cli.CLI__Lazy_Group'                , 'CLI__Lazy_Group'   , ['load_command'                            ]),
+    ('issues_fs_cli.cli.CLI__Context'                   , 'CLI__Context'      , ['__init__', 'discover_issues_root', 'load_index']),
+    ('issues_fs_cli.cli.CLI__Index'                     , 'CLI__Index'        , ['load', 'git_status', 'scan_fingerprints*', 'read_files', 'save', 'refresh_nodes']),
+    ('issues_fs_cli.cli.CLI__Search__Index'             , 'CLI__Search__Index', ['build_docs', 'search'                    ]),
+    ('issues_fs_cli.cli.CLI__Output'                    , 'CLI__Output'       , ['render*'                                 ]),
+    ('issues_fs.issues.graph_services.Graph__Repository', 'Graph__Repository' , ['node_load', 'node_save', 'node_delete', 'node_exists',
+                                                                                 'nodes_list_all', 'type_index_load', 'type_index_save',
+                                                                                 'global_index_load', 'global_index_save']),
+    ('issues_fs.issues.graph_services.Node__Service'    , 'Node__Service'     , ['create_node', 'get_node', 'update_node', 'delete_node',
+                                                                                 'list_nodes', 'get_node_graph']),
+    ('issues_fs.issues.graph_services.Link__Service'    , 'Link__Service'     , ['create_link', 'delete_link', 'list_links']),
+    ('osbot_utils.type_safe.Type_Safe'                  , 'Type_Safe'         , ['from_json', 'json'                       ])]
+
+
+class CLI__Profiler:                                                             # Span recorder for one command
+
+    def __init__(self, name: str, output: Optional[str] = None):
+        self.name     = name                                                     # Command being profiled
+        self.output   = output                                                   # None: summary on stderr
+        self.spans    = []                                                       # (path tuple, start, end, thread id)
+        self.stacks   = {}                                                       # thread id → open span names
+        self.patched  = []                                                       # (class, attribute, original)
+        self.cprofile = None
+        self.started  = 0.0
+
+    @classmethod
+    def from_options(cls, name: str, profile: bool, output: Optional[str]) -> Optional['CLI__Profiler']:
+        if output:                                                               # --profile-output implies --profile
+            return cls(name, output)
+        if profile:
+            return cls(name)
+        value = os.environ.get(PROFILE__ENV, '').strip()
+        if value.lower() in PROFILE__ENV_OFF:
+            return None
+        return cls(name, None if value.lower() in PROFILE__ENV_ON else value)
+
+    def __enter__(self) -> 'CLI__Profiler':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:                                       # Report even when the command fails
+        self.stop()
+        self.report()
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Recording
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def start(self) -> None:
+        self.started = time.perf_counter()
+        self.stacks[threading.get_ident()] = [self.name]
+        if self.output and self.output.endswith(PROFILE__PSTATS_EXTS):
+            import cProfile
+            self.cprofile = cProfile.Profile()
+        start = time.perf_counter()
+        self.instrument()                                                        # Imports the modules the command would
+        self.spans.append(((self.name, 'imports'), start, time.perf_counter(), threading.get_ident()))
+        if self.cprofile:
+            self.cprofile.enable()
+
+    def stop(self) -> None:
+        if self.cprofile:
+            self.cprofile.disable()
+        self.restore()
+        self.spans.append(((self.name,), self.started, time.perf_counter(), threading.get_ident()))
+
+    def instrument(self) -> None:                                                # Wrap every target method
+        for module_name, class_name, methods in PROFILE__TARGETS:
+            target = getattr(importlib.import_module(module_name), class_name)
+            for attribute in self.attributes(target, methods):
+                original = target.__dict__[attribute]
+                self.patched.append((target, attribute, original))
+                setattr(target, attribute, self.wrap(original, f'{class_name}.{attribute}'))
+
+    def restore(self) -> None:
+        for target, attribute, original in reversed(self.patched):
+            setattr(target, attribute, original)
+        self.patched = []
+
+    @staticmethod
+    def attributes(target, methods: list) -> list:                               # Expand 'prefix*', own methods only
+        names = []
+        for method in methods:
+            if method.endswith('*'):
+                names.extend(sorted(n for n in target.__dict__ if n.startswith(method[:-1])))
+            elif method in target.__dict__:
+                names.append(method)
+        return names
+
+    def wrap(self, original, span_name: str):                                    # Same kind (static/class/plain)
+        if isinstance(original, staticmethod):
+            return staticmethod(self.timed(original.__func__, span_name))
+        if isinstance(original, classmethod):
+            return classmethod(self.timed(original.__func__, span_name))
+        return self.timed(original, span_name)
+
+    def timed(self, function, span_name: str):
+        profiler = self
+
+        def timed_call(*args, **kwargs):
+            stack = profiler.stacks.setdefault(threading.get_ident(), [profiler.name])
+            if span_name in stack:                                               # Re-entered: outer span covers it
+                return function(*args, **kwargs)
+            stack.append(span_name)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                profiler.spans.append((tuple(stack), start, time.perf_counter(), threading.get_ident()))
+                stack.pop()
+
+        timed_call.__name__     = getattr(function, '__name__', span_name)
+        timed_call.__qualname__ = getattr(function, '__qualname__', span_name)
+        timed_call.__wrapped__  = function
+        return timed_call
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Reporting
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def report(self) -> None:
+        if self.output is None:
+            sys.stderr.write(self.summary())
+            return
+        if self.cprofile:
+            self.cprofile.dump_stats(self.output)
+        else:
+            with open(self.output, 'w') as f:
+                json.dump(self.chrome_trace(), f)
+        sys.stderr.write(f"Profile written to {self.output}\n")
+
+    def tree(self) -> list:                                                      # [(path, total seconds, calls)] in call order
+        totals = {}
+        for path, start, end, _ in self.spans:
+            total, calls    = totals.get(path, (0.0, 0))
+            totals[path]    = (total + end - start, calls + 1)
+        first_seen = {}
+        for index, (path, *_) in enumerate(sorted(self.spans, key=lambda s: s[1])):
+            first_seen.setdefault(path, index)
+
+        def sort_key(path):                                                      # Parents before children, then call order
+            return tuple(first_seen[path[:i + 1]] if path[:i + 1] in first_seen else -1 for i in range(len(path)))
+        return [(path, *totals[path]) for path in sorted(totals, key=sort_key)]
+
+    def summary(self) -> str:                                                    # Compact span tree for stderr
+        rows  = self.tree()
+        total = rows[0][1] if rows else 0.0
+        other = total - sum(seconds for path, seconds, _ in rows if len(path) == 2)
+        lines = [f"profile: issues-fs {self.name} ({total * 1000:.1f} ms)"]
+        for path, seconds, calls in rows[1:]:
+            lines.append(self.summary_line(seconds, total, f'{calls}x', '  ' * (len(path) - 2) + path[-1]))
+        lines.append(self.summary_line(other, total, '', '(other: parsing, service logic, output)'))
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def summary_line(seconds: float, total: float, calls: str, name: str) -> str:
+        share = seconds / total * 100 if total else 0.0
+        return f"  {seconds * 1000:>9.1f} ms {share:>5.1f}% {calls:>7}  {name}"
+
+    def chrome_trace(self) -> dict:                                              # Trace Event Format, complete events
+        pid = os.getpid()
+        return {'traceEvents': [{'name': path[-1]                              ,
+                                 'ph'  : 'X'                                   ,
+                                 'ts'  : round((start - self.started) * 1e6, 1),
+                                 'dur' : round((end   - start       ) * 1e6, 1),
+                                 'pid' : pid                                   ,
+                                 'tid' : thread_id                             }
+                                for path, start, end, thread_id in sorted(self.spans, key=lambda s: s[1])],
+                'displayTimeUnit': 'ms'}
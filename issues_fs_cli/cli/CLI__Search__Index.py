@@ -0,0 +1,229 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI__Search__Index - Persistent inverted index for `issues-fs search`
+#
+# Stored at .issues/.cache/search.json next to the label index, and kept up to
+# date the same way: per-file fingerprints, so a refresh only re-tokenises the
+# node files that changed (see CLI__Index). Each node is one document over its
+# title, tags, description and comment texts. A posting is one compact string,
+# term → {doc id: "<weighted tf>|<positions>"}: ranking only parses the tf, and
+# positions are decoded for phrase queries alone (JSON strings load far faster
+# than nested int lists). Every entry keeps its own term list, so a changed or
+# deleted node can be unposted without a scan.
+#
+# Queries: words ("login timeout", all must match), phrases ("\"login page\""),
+# prefixes ("auth*"). Matches are ranked with BM25 over the whole document,
+# with occurrences in the title weighted up (SEARCH__TITLE_BOOST).
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import bisect
+import math
+import re
+
+from typing                                                                     import Dict, List, Optional, Tuple
+
+from issues_fs_cli.cli.CLI__Index                                               import CLI__Index, INDEX__FOLDER
+from issues_fs_cli.cli.CLI__Node__Filter                                        import CLI__Node__Filter
+
+
+SEARCH__PATH        = f'{INDEX__FOLDER}/search.json'
+SEARCH__VERSION     = 1                                                          # Bump when tokenising/layout changes
+SEARCH__K1          = 1.2                                                        # BM25 term frequency saturation
+SEARCH__B           = 0.75                                                       # BM25 length normalisation
+SEARCH__PREFIX_MAX  = 256                                                        # Terms a prefix query expands to
+SEARCH__TITLE_BOOST = 2.0                                                        # A title occurrence counts this much
+SEARCH__TOKEN       = re.compile(r'\w+')
+SEARCH__QUERY       = re.compile(r'"([^"]*)"?|(\S+)')                            # "quoted phrase" or bare word
+
+
+class CLI__Search__Index(CLI__Index):                                            # Full-text index over node files
+    postings       : dict                                                        # term → {doc id: "tf|p1,p2,..."}
+    next_doc       : int   = 1                                                   # Doc ids are never reused
+    docs           : dict  = None                                                # doc id → entry (built on demand)
+    vocabulary     : list  = None                                                # Sorted terms, for prefix queries
+    average_length : float = 0.0
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Persistence
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def load_data(self, data: dict) -> None:
+        super().load_data(data)
+        self.postings = data.get('postings') or {}
+        self.next_doc = data.get('next_doc') or 1
+
+    def index_data(self) -> dict:
+        return {**super().index_data(), 'postings': self.postings, 'next_doc': self.next_doc}
+
+    def index_path(self) -> str:
+        return SEARCH__PATH
+
+    def index_version(self) -> int:
+        return SEARCH__VERSION
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Documents
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def entry_from_data(self, data: dict, path: str) -> dict:                    # Label entry + token positions
+        entry      = super().entry_from_data(data, path)
+        properties = data.get('properties') or {}
+        comments   = properties.get('comments') or []
+        fields     = [entry['title']                    ,
+                      ' '.join(entry['tags'])           ,
+                      data.get('description') or ''     ,
+                      *[str(c.get('text') or '') for c in comments if isinstance(c, dict)]]
+        positions  = {}
+        position   = 0
+        title_end  = None
+        for text in fields:
+            for token in self.tokenize(text):
+                positions.setdefault(token, []).append(position)
+                position += 1
+            if title_end is None:
+                title_end = position                                             # Title tokens: positions below this
+            position += 1                                                        # Phrases never span two fields
+        del entry['links']
+        entry['title_end'] = title_end
+        entry['length']    = sum(len(p) for p in positions.values())
+        entry['positions'] = positions                                           # Moved into postings when indexed
+        return entry
+
+    def update_adjacency(self, previous: Optional[dict], current: Optional[dict]) -> None:   # Keep postings in step
+        for entry in (previous or {}).get('nodes', []):
+            self.remove_postings(entry)
+        for entry in (current or {}).get('nodes', []):
+            self.add_postings(entry)
+        self.docs       = None
+        self.vocabulary = None
+
+    def reset_adjacency(self) -> None:                                           # Postings are rebuilt with the entries
+        super().reset_adjacency()
+        self.postings   = {}
+        self.docs       = None
+        self.vocabulary = None
+
+    def add_postings(self, entry: dict) -> None:
+        positions = entry.pop('positions', None) or {}
+        if not entry['node_type']:                                               # Not a node, never searchable
+            return
+        doc            = str(self.next_doc)
+        self.next_doc += 1
+        entry['doc']   = doc
+        entry['terms'] = ' '.join(sorted(positions))                             # One string: cheap to load
+        title_end      = entry['title_end']
+        for term, where in positions.items():
+            frequency = sum(SEARCH__TITLE_BOOST if position < title_end else 1 for position in where)
+            self.postings.setdefault(term, {})[doc] = f"{frequency:g}|{','.join(map(str, where))}"
+
+    def remove_postings(self, entry: dict) -> None:
+        doc = entry.get('doc')
+        if doc is None:
+            return
+        for term in (entry.get('terms') or '').split():
+            docs = self.postings.get(term)
+            if docs is not None:
+                docs.pop(doc, None)
+                if not docs:
+                    del self.postings[term]
+
+    def build_docs(self) -> None:                                                # Visible docs (label precedence as in list)
+        if self.docs is not None:
+            return
+        self.docs           = {entry['doc']: entry for entry in self.entries() if 'doc' in entry}
+        total               = sum(entry['length'] for entry in self.docs.values())
+        self.average_length = total / len(self.docs) if self.docs else 0.0
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Queries
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def search(self, query       : str                      ,                   # [(entry, score)], best first
+                     node_filter : CLI__Node__Filter = None ,
+                     limit       : int               = None
+                ) -> List[Tuple[dict, float]]:
+        clauses = self.parse_query(query)
+        if not clauses:
+            return []
+        self.build_docs()
+        hits       = [self.clause_hits(clause) for clause in clauses]
+        candidates = set.intersection(*[set(h) for h in hits]) if hits else set()
+        results    = []
+        for doc in candidates:
+            entry = self.docs.get(doc)
+            if entry is None or (node_filter and not node_filter.matches(entry)):
+                continue
+            results.append((entry, round(sum(self.bm25(h, doc, entry['length']) for h in hits), 4)))
+        results.sort(key=lambda r: (-r[1], r[0]['node_type'], r[0]['node_index'], r[0]['label']))
+        return results[:limit] if limit else results
+
+    def clause_hits(self, clause: tuple) -> Dict[str, float]:                    # doc id → weighted term frequency
+        kind, value = clause
+        if kind == 'term':
+            return {doc: self.frequency(posting) for doc, posting in self.postings.get(value, {}).items()}
+        if kind == 'prefix':
+            hits = {}
+            for term in self.expand_prefix(value):
+                for doc, posting in self.postings[term].items():
+                    hits[doc] = hits.get(doc, 0) + self.frequency(posting)
+            return hits
+        return self.phrase_hits(value)
+
+    def phrase_hits(self, terms: List[str]) -> Dict[str, float]:                 # Consecutive positions, in order
+        postings = [self.postings.get(term) or {} for term in terms]
+        rarest   = min(postings, key=len)
+        hits     = {}
+        for doc in rarest:
+            if not all(doc in p for p in postings):
+                continue
+            following = [set(self.positions(p[doc])) for p in postings[1:]]
+            starts    = [start for start in self.positions(postings[0][doc])
+                         if all(start + i + 1 in where for i, where in enumerate(following))]
+            if starts:
+                title_end = self.docs[doc]['title_end'] if doc in self.docs else 0
+                hits[doc] = sum(SEARCH__TITLE_BOOST if start < title_end else 1 for start in starts)
+        return hits
+
+    @staticmethod
+    def frequency(posting: str) -> float:                                        # "tf|positions" → tf
+        return float(posting[:posting.index('|')])
+
+    @staticmethod
+    def positions(posting: str) -> List[int]:                                    # "tf|positions" → positions
+        return [int(p) for p in posting[posting.index('|') + 1:].split(',')]
+
+    def expand_prefix(self, prefix: str) -> List[str]:                           # Vocabulary terms starting with prefix
+        if self.vocabulary is None:
+            self.vocabulary = sorted(self.postings)
+        terms = []
+        for term in self.vocabulary[bisect.bisect_left(self.vocabulary, prefix):]:
+            if not term.startswith(prefix) or len(terms) == SEARCH__PREFIX_MAX:
+                break
+            terms.append(term)
+        return terms
+
+    def bm25(self, hits: Dict[str, float], doc: str, length: int) -> float:        # One clause's contribution
+        frequency = hits[doc]
+        idf       = math.log(1 + (len(self.docs) - len(hits) + 0.5) / (len(hits) + 0.5))
+        norm      = SEARCH__K1 * (1 - SEARCH__B + SEARCH__B * length / (self.average_length or 1))
+        return idf * frequency * (SEARCH__K1 + 1) / (frequency + norm)
+
+    @staticmethod
+    def parse_query(query: str) -> List[tuple]:                                  # [('term'|'prefix'|'phrase', value)]
+        clauses = []
+        for phrase, word in SEARCH__QUERY.findall(query or ''):
+            if word and word.endswith('*'):
+                tokens = CLI__Search__Index.tokenize(word.rstrip('*'))
+                clauses.extend(('term', token) for token in tokens[:-1])
+                if tokens:
+                    clauses.append(('prefix', tokens[-1]))
+                continue
+            tokens = CLI__Search__Index.tokenize(phrase or word)
+            if len(tokens) == 1:
+                clauses.append(('term', tokens[0]))
+            elif tokens:                                                         # Quoted, or e.g. "null-pointer"
+                clauses.append(('phrase', tokens))
+        return clauses
+
+    @staticmethod
+    def tokenize(text: str) -> List[str]:                                        # Lower-cased word tokens
+        return SEARCH__TOKEN.findall(str(text).lower())
@@ -0,0 +1,173 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI__Session - Line-delimited JSON-RPC 2.0 over stdin/stdout (`issues-fs session`)
+#
+# One request per line, one response per line, e.g.
+#   → {"jsonrpc": "2.0", "id": 1, "method": "node.get", "params": {"label": "Bug-1"}}
+#   ← {"jsonrpc": "2.0", "id": 1, "result": {"node_id": "...", "label": "Bug-1", ...}}
+# A result is exactly what the matching command prints with --for-agent, as it
+# runs the CLI__Commands bodies against one CLI__Context kept for the whole
+# session. A failed command becomes an error with SESSION__ERROR_COMMAND and
+# the command's message. Requests without an id are notifications (no
+# response); a JSON array is a batch, answered with an array.
+#
+# Edits made by other processes are picked up before each call: on Linux the
+# inotify watcher reports the changed paths and only those are re-indexed,
+# otherwise the index is refreshed against storage as the daemon does.
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import contextlib
+import io
+import json
+
+from typing                                                                     import Iterable, Iterator, Optional
+
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from issues_fs_cli.cli.CLI__Commands                                            import CLI__Commands
+from issues_fs_cli.cli.CLI__Context                                             import CLI__Context
+from issues_fs_cli.cli.CLI__Fast_Path                                           import FAST_PATH__COMMANDS, FAST_PATH__MINIMUMS
+from issues_fs_cli.cli.CLI__Watch                                               import CLI__Watch, CLI__Watch__Inotify
+
+
+SESSION__ERROR_PARSE    = -32700                                                 # JSON-RPC 2.0 reserved codes
+SESSION__ERROR_REQUEST  = -32600
+SESSION__ERROR_METHOD   = -32601
+SESSION__ERROR_PARAMS   = -32602
+SESSION__ERROR_INTERNAL = -32603
+SESSION__ERROR_COMMAND  = -32000                                                 # The command itself failed (e.g. not found)
+
+SESSION__METHODS = {                                                             # method → (command, param renames, fixed kwargs)
+    'node.get'        : ('show'    , {}                    , {}          ),
+    'node.list'       : ('list'    , {'type': 'node_type'} , {}          ),
+    'node.create'     : ('create'  , {'type': 'node_type'} , {}          ),
+    'node.update'     : ('update'  , {}                    , {}          ),
+    'link.create'     : ('link'    , {}                    , {}          ),
+    'comments.list'   : ('comments', {}                    , {}          ),
+    'comments.create' : ('comment' , {}                    , {}          ),
+    'graph.get'       : ('show'    , {}                    , {'depth': 1}),
+}
+
+
+class CLI__Session__Error(Exception):                                            # Reported as a JSON-RPC error object
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+
+
+class CLI__Session(Type_Safe):                                                   # JSON-RPC dispatcher on a warm context
+    context  : CLI__Context = None
+    watcher  : object       = None                                               # CLI__Watch__Inotify (None: refresh per call)
+    requests : int                                                               # Calls handled so far
+
+    def start(self) -> 'CLI__Session':                                           # Load the index once, start watching
+        self.context.load_index()
+        watcher = CLI__Watch.watcher(self.context.repository)
+        if isinstance(watcher, CLI__Watch__Inotify):
+            self.watcher = watcher
+        else:
+            watcher.close()                                                      # Polling scans everything: no gain
+        return self
+
+    def close(self) -> None:
+        if self.watcher is not None:
+            self.watcher.close()
+            self.watcher = None
+        if self.context.index is not None:
+            self.context.index.save()                                            # refresh_paths() does not save
+
+    def run(self, lines: Iterable[str]) -> Iterator[str]:                        # One response line per request line
+        try:
+            for line in lines:
+                if not line.strip():
+                    continue
+                response = self.handle_line(line)
+                if response is not None:
+                    yield json.dumps(response)
+        finally:
+            self.close()
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Requests
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def handle_line(self, line: str):                                            # Response (dict / list), None if nothing to send
+        try:
+            message = json.loads(line)
+        except ValueError as error:
+            return self.error(None, SESSION__ERROR_PARSE, f'Parse error: {error}')
+        if isinstance(message, list):                                            # Batch
+            if not message:
+                return self.error(None, SESSION__ERROR_REQUEST, 'Invalid request: empty batch')
+            responses = [response for response in map(self.handle, message) if response is not None]
+            return responses or None
+        return self.handle(message)
+
+    def handle(self, request) -> Optional[dict]:                                 # One request object
+        request_id = request.get('id') if isinstance(request, dict) else None
+        try:
+            if not isinstance(request, dict) or request.get('jsonrpc') != '2.0' or not isinstance(request.get('method'), str):
+                raise CLI__Session__Error(SESSION__ERROR_REQUEST, 'Invalid request: expected {"jsonrpc": "2.0", "method": ...}')
+            result = self.call(request['method'], request.get('params', {}))
+        except CLI__Session__Error as error:
+            response = self.error(request_id, error.code, str(error))
+        except Exception as error:                                               # Never let one call end the session
+            response = self.error(request_id, SESSION__ERROR_INTERNAL, f'{type(error).__name__}: {error}')
+        else:
+            response = {'jsonrpc': '2.0', 'id': request_id, 'result': result}
+        finally:
+            self.requests += 1
+        if isinstance(request, dict) and 'id' not in request:                    # Notification
+            return None
+        return response
+
+    def call(self, method: str, params) -> object:                               # --for-agent JSON of the command
+        if method not in SESSION__METHODS:
+            raise CLI__Session__Error(SESSION__ERROR_METHOD, f'Method not found: {method}')
+        if not isinstance(params, dict):
+            raise CLI__Session__Error(SESSION__ERROR_PARAMS, 'Invalid params: expected an object of named params')
+        command, renames, fixed = SESSION__METHODS[method]
+        kwargs = dict(fixed)
+        for name, value in params.items():
+            if name in ('tags', 'fields') and isinstance(value, list):           # Commands take comma-separated lists
+                value = ','.join(value)
+            kwargs[renames.get(name, name)] = value
+        self.check_params(command, kwargs)
+        kwargs['output'] = 'json'
+
+        self.sync()
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            succeeded = getattr(CLI__Commands, command)(self.context, for_agent = True, **kwargs)
+        output = json.loads(stdout.getvalue())
+        if succeeded is False:
+            raise CLI__Session__Error(SESSION__ERROR_COMMAND, output.get('error', 'Command failed'))
+        return output
+
+    @staticmethod
+    def check_params(command: str, kwargs: dict) -> None:                        # Names and types from the fast path table
+        positionals, options = FAST_PATH__COMMANDS[command]
+        kinds   = dict.fromkeys(positionals, str)
+        kinds.update((name, kind) for _, name, kind in options if name != 'output')   # Always json here
+        unknown = sorted(set(kwargs) - set(kinds))
+        missing = [name for name in positionals if name not in kwargs]
+        wrong   = sorted(name for name, value in kwargs.items()
+                         if name in kinds and value is not None and
+                            (not isinstance(value, kinds[name]) or isinstance(value, bool) or
+                             value < FAST_PATH__MINIMUMS.get(name, value)))
+        for problem, names in (('unknown', unknown), ('missing', missing), ('wrong type or range for', wrong)):
+            if names:
+                raise CLI__Session__Error(SESSION__ERROR_PARAMS, f"Invalid params: {problem} {', '.join(names)}")
+
+    def sync(self) -> None:                                                      # Pick up edits made outside the session
+        if self.watcher is None:                                                 # As the daemon: refresh per call
+            self.context.index_fresh = False
+            self.context.load_index()
+            return
+        paths = self.watcher.wait(timeout = 0, debounce = 0)
+        if paths is None:                                                        # Events were lost
+            self.context.index.refresh()
+        elif paths:
+            self.context.index.refresh_paths(paths)
+
+    @staticmethod
+    def error(request_id, code: int, message: str) -> dict:
+        return {'jsonrpc': '2.0', 'id': request_id, 'error': {'code': code, 'message': message}}
@@ -0,0 +1,209 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI__Watch - Re-render a command's output whenever node files change (--watch)
+#
+# Changes come from inotify on Linux (through ctypes, no extra dependency): one
+# watch per folder under .issues/, so a write to a node file is reported by
+# path as soon as it is closed. Everywhere else, or when the watch limit is
+# reached, a poller compares (mtime, size) fingerprints instead. Either way the
+# caller gets the set of changed paths, re-indexes only those files, and the
+# output is re-rendered and diffed against the previous render.
+#
+# Events are collected for WATCH__DEBOUNCE seconds after the first one, so an
+# editor's write + rename, or a batch of links, costs a single re-render.
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import contextlib
+import ctypes
+import ctypes.util
+import io
+import os
+import select
+import struct
+import sys
+import time
+
+from typing                                                                     import Callable, List, Optional, Set
+
+from memory_fs.storage_fs.providers.Storage_FS__Local_Disk                      import Storage_FS__Local_Disk
+from issues_fs.issues.graph_services.Graph__Repository                          import Graph__Repository
+from issues_fs_cli.cli.CLI__Index                                               import CLI__Index, SKIP_FOLDERS
+from issues_fs_cli.cli.CLI__Output                                              import CLI__Output
+
+
+WATCH__DEBOUNCE      = 0.03                                                      # Seconds to let a burst of writes settle
+WATCH__POLL_INTERVAL = 0.1                                                       # Seconds between scans (polling fallback)
+
+IN_CLOSE_WRITE = 0x00000008                                                      # <sys/inotify.h>
+IN_MOVED_FROM  = 0x00000040
+IN_MOVED_TO    = 0x00000080
+IN_CREATE      = 0x00000100
+IN_DELETE      = 0x00000200
+IN_Q_OVERFLOW  = 0x00004000
+IN_IGNORED     = 0x00008000
+IN_ONLYDIR     = 0x01000000
+IN_ISDIR       = 0x40000000
+IN_NONBLOCK    = 0o4000
+IN_CLOEXEC     = 0o2000000
+IN_EVENT       = struct.Struct('iIII')                                           # wd, mask, cookie, name length
+WATCH__MASK    = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_ONLYDIR
+
+
+class CLI__Watch__Inotify:                                                       # Linux: kernel reports changed paths
+    def __init__(self, root_path: str):
+        self.root_path = root_path
+        self.folders   = {}                                                      # watch descriptor → folder (relative)
+        self.libc      = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self.fd        = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        try:
+            self.add_tree('')
+        except OSError:                                                          # e.g. ENOSPC: max_user_watches reached
+            self.close()
+            raise
+
+    def add_tree(self, folder: str) -> Set[str]:                                 # Watch folder + subfolders; files found in them
+        files   = set()
+        pending = [folder]
+        while pending:
+            folder = pending.pop()
+            full   = os.path.join(self.root_path, folder) if folder else self.root_path
+            wd     = self.libc.inotify_add_watch(self.fd, os.fsencode(full), WATCH__MASK)
+            if wd < 0:
+                error = ctypes.get_errno()
+                if not os.path.isdir(full):                                      # Vanished before we got to it
+                    continue
+                raise OSError(error, f'inotify_add_watch failed: {full}')
+            self.folders[wd] = folder
+            try:
+                entries = list(os.scandir(full))                                 # After the watch: nothing slips through
+            except OSError:
+                continue
+            for entry in entries:
+                path = f'{folder}/{entry.name}' if folder else entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_FOLDERS:
+                        pending.append(path)
+                else:
+                    files.add(path)
+        return files
+
+    def wait(self, timeout  : Optional[float] = None           ,                 # Changed paths (None: lost events, rescan)
+                   debounce : float           = WATCH__DEBOUNCE) -> Optional[Set[str]]:
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return set()
+        paths    = set()
+        deadline = time.monotonic() + debounce
+        while True:
+            try:
+                data = os.read(self.fd, 1 << 16)
+            except BlockingIOError:
+                data = b''
+            if self.read_events(data, paths) is False:
+                return None
+            if data:                                                             # Drain what is queued first
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([self.fd], [], [], remaining)[0]:
+                return paths
+
+    def read_events(self, data: bytes, paths: Set[str]) -> bool:                 # Decode events into paths (False: overflow)
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = IN_EVENT.unpack_from(data, offset)
+            name    = os.fsdecode(data[offset + IN_EVENT.size : offset + IN_EVENT.size + length].rstrip(b'\0'))
+            offset += IN_EVENT.size + length
+            if mask & IN_Q_OVERFLOW:
+                return False
+            if mask & IN_IGNORED:                                                # Folder gone, watch dropped by the kernel
+                self.folders.pop(wd, None)
+                continue
+            folder = self.folders.get(wd)
+            if folder is None or not name:
+                continue
+            path = f'{folder}/{name}' if folder else name
+            if mask & IN_ISDIR:
+                if name in SKIP_FOLDERS:
+                    continue
+                if mask & (IN_CREATE | IN_MOVED_TO):                             # New node folder: watch it, take its files
+                    paths.update(self.add_tree(path))
+                else:
+                    paths.add(path)                                              # Removed folder: index drops what was in it
+            else:
+                paths.add(path)
+        return True
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class CLI__Watch__Poll:                                                          # Fallback: compare fingerprints
+    def __init__(self, repository: Graph__Repository):
+        self.scanner      = CLI__Index(repository = repository)                  # scan_fingerprints() only
+        self.fingerprints = self.scanner.scan_fingerprints()
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[Set[str]]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            time.sleep(WATCH__POLL_INTERVAL)
+            current = self.scanner.scan_fingerprints()
+            changed = {path for path in set(current) | set(self.fingerprints)
+                       if current.get(path) != self.fingerprints.get(path)}
+            self.fingerprints = current
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self) -> None:
+        pass
+
+
+class CLI__Watch:                                                                # Render, wait for changes, re-render
+
+    @staticmethod
+    def watcher(repository: Graph__Repository):                                  # inotify when possible, else polling
+        storage = repository.storage_fs
+        if sys.platform.startswith('linux') and isinstance(storage, Storage_FS__Local_Disk):
+            try:
+                return CLI__Watch__Inotify(str(storage.root_path))
+            except (OSError, AttributeError):                                    # No inotify symbols, or watch limit
+                pass
+        return CLI__Watch__Poll(repository)
+
+    @staticmethod
+    def capture(render: Callable[[], None]) -> List[str]:                        # Output lines of one render
+        buffer = io.StringIO()
+        with contextlib.redirect_stdout(buffer):
+            render()
+        return buffer.getvalue().splitlines()
+
+    @staticmethod
+    def run(repository : Graph__Repository          ,                           # Until Ctrl-C (or `renders` outputs)
+            render     : Callable[[], None]          ,
+            index      : Optional[CLI__Index] = None ,                           # Re-indexed from the changed paths
+            diff       : bool                 = True ,                           # Table output: mark changed lines
+            renders    : int                  = 0    ) -> None:
+        watcher  = CLI__Watch.watcher(repository)
+        previous = CLI__Watch.capture(render)
+        count    = 1
+        CLI__Output.render_watch(previous, diff = diff)
+        try:
+            while renders == 0 or count < renders:
+                paths = watcher.wait()
+                if paths == set():
+                    continue
+                if index is not None and paths is None:                          # Events were lost: full refresh
+                    index.refresh()
+                elif index is not None:
+                    index.refresh_paths(paths)
+                lines = CLI__Watch.capture(render)
+                if lines == previous:                                            # Changed files outside this view
+                    continue
+                CLI__Output.render_watch(lines, previous, diff = diff)
+                previous = lines
+                count   += 1
+        except KeyboardInterrupt:
+            pass
+        finally:
+            watcher.close()
+            if index is not None:
+                index.save()                                                     # Once, not per event
@@ -0,0 +1,117 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI__Workspace - Federated queries across many .issues/ roots (--repos)
+#
+# --repos takes a glob (e.g. 'services/*') or a manifest file with one glob per
+# line ('#' comments, paths relative to the manifest). Each match is a folder
+# containing .issues/ (or the .issues/ folder itself).
+# Roots are queried on a process pool, each worker opening its own repository
+# and label index, and results are yielded root by root in manifest order, as
+# soon as each root is done. Every result carries the root it came from.
+# A root that fails is reported in `errors` and does not stop the others.
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import glob
+import os
+
+from concurrent.futures                                                         import ProcessPoolExecutor
+from typing                                                                     import Iterator
+
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from issues_fs.issues.graph_services.Node__Service                              import Node__Service
+from issues_fs_cli.cli.CLI__Index                                               import CLI__Index
+from issues_fs_cli.cli.CLI__Label_Parser                                        import CLI__Label_Parser
+from issues_fs_cli.cli.CLI__Node__Filter                                        import CLI__Node__Filter
+from issues_fs_cli.cli.CLI__Pack__Storage                                       import CLI__Pack__Storage
+
+
+WORKSPACE__ISSUES_FOLDER = '.issues'
+WORKSPACE__JOBS          = os.cpu_count() or 1                                   # Worker processes
+
+
+class CLI__Workspace(Type_Safe):                                                 # Set of .issues/ roots
+    roots  : list                                                                # Absolute .issues/ paths
+    base   : str  = None                                                         # Folder root names are relative to
+    jobs   : int  = WORKSPACE__JOBS
+    errors : list                                                                # (root name, message) per failed root
+
+    @classmethod
+    def from_spec(cls, spec: str, jobs: int = None) -> 'CLI__Workspace':         # Glob or manifest file → workspace
+        base = os.getcwd()
+        if os.path.isfile(spec):                                                 # Manifest: one glob per line
+            with open(spec) as f:
+                patterns = [line.strip() for line in f if line.strip() and not line.strip().startswith('#')]
+            folder = os.path.dirname(os.path.abspath(spec))
+        else:
+            patterns = [spec]
+            folder   = base
+
+        roots = []
+        for pattern in patterns:
+            for match in sorted(glob.glob(os.path.join(folder, os.path.expanduser(pattern)), recursive=True)):
+                root = cls.issues_root(match)
+                if root and root not in roots:
+                    roots.append(root)
+        if not roots:
+            raise FileNotFoundError(f"No .issues/ directories matched: {spec}")
+        return cls(roots = roots, base = base, jobs = jobs or WORKSPACE__JOBS)
+
+    @staticmethod
+    def issues_root(path: str):                                                  # .issues/ folder for a match, or None
+        path = os.path.realpath(path)
+        if os.path.basename(path) == WORKSPACE__ISSUES_FOLDER and os.path.isdir(path):
+            return path
+        candidate = os.path.join(path, WORKSPACE__ISSUES_FOLDER)
+        return candidate if os.path.isdir(candidate) else None
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Queries
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def list_nodes(self, node_filter: CLI__Node__Filter) -> Iterator[dict]:      # Index summaries + 'root'
+        yield from self.fan_out(CLI__Workspace.list_root, node_filter.json())
+
+    def find_nodes(self, label: str) -> Iterator[dict]:                          # Full node JSON + 'root', per match
+        yield from self.fan_out(CLI__Workspace.show_root, label)
+
+    def fan_out(self, function, argument) -> Iterator[dict]:                     # Run a worker per root, in root order
+        tasks = [(root, self.root_name(root), argument) for root in self.roots]
+        if self.jobs <= 1 or len(tasks) == 1:
+            results = (function(*task) for task in tasks)
+            yield from self.collect(results)
+            return
+        with ProcessPoolExecutor(max_workers = min(self.jobs, len(tasks))) as pool:
+            yield from self.collect(pool.map(function, *zip(*tasks)))           # map() keeps root order
+
+    def collect(self, results) -> Iterator[dict]:
+        for rows, error in results:
+            if error:
+                self.errors.append(error)
+            yield from rows
+
+    def root_name(self, root: str) -> str:                                       # Repo folder, relative to base
+        return os.path.relpath(os.path.dirname(root), self.base or os.getcwd())
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Workers (run in the pool, one root each)
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    @staticmethod
+    def list_root(root: str, name: str, filter_data: dict) -> tuple:             # ([rows], error)
+        try:
+            index = CLI__Index(repository = CLI__Pack__Storage.create_repository(root)).refresh()
+            rows  = [dict(CLI__Index.summary_json(entry), root = name)
+                     for entry in index.select(CLI__Node__Filter.from_json(filter_data))]
+            return rows, None
+        except Exception as error:
+            return [], (name, str(error))
+
+    @staticmethod
+    def show_root(root: str, name: str, label: str) -> tuple:                    # ([node json], error)
+        try:
+            node_type, node_label = CLI__Label_Parser.parse(label)
+            repository            = CLI__Pack__Storage.create_repository(root)
+            node                  = Node__Service(repository = repository).get_node(node_type = node_type  ,
+                                                                                    label     = node_label )
+            return ([dict(node.json(), root = name)] if node else []), None
+        except Exception as error:
+            return [], (name, str(error))
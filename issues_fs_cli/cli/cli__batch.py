@@ -0,0 +1,37 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI Batch Command - Execute NDJSON operations from stdin in one process
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import json
+import sys
+import typer
+
+from typing                                                                     import Optional
+
+from issues_fs_cli.cli.CLI__Batch                                               import CLI__Batch, BATCH__FLUSH_EVERY
+from issues_fs_cli.cli.CLI__Context                                             import CLI__Context
+from issues_fs_cli.cli.CLI__Output                                              import CLI__Output
+
+
+def batch(input_file    : Optional[str] = typer.Option(None              , "--file", "-f"    , help="Read operations from a file instead of stdin"             ),
+          stop_on_error : bool          = typer.Option(False             , "--stop-on-error" , help="Stop at the first failed operation"                       ),
+          flush_every   : int           = typer.Option(BATCH__FLUSH_EVERY, "--flush-every"   , help="Write changes to disk every N operations (0: only at end)")
+     ) -> None:                                                                  # Run NDJSON operations, stream NDJSON results
+    try:
+        context = CLI__Context()
+    except FileNotFoundError as e:
+        CLI__Output.error(str(e), for_agent=True)
+        raise typer.Exit(code=1)
+
+    runner = CLI__Batch.from_context(context, stop_on_error = stop_on_error, flush_every = flush_every)
+    source = open(input_file, encoding='utf-8') if input_file else sys.stdin
+    try:
+        for result in runner.run(source):
+            sys.stdout.write(json.dumps(result) + '\n')
+            sys.stdout.flush()                                                   # Callers can consume results as they arrive
+    finally:
+        if input_file:
+            source.close()
+
+    if runner.failed:
+        raise typer.Exit(code=1)
@@ -0,0 +1,52 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI Check Commands - Repository-wide consistency checks
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import typer
+
+from typing                                                                     import List, Optional
+from issues_fs_cli.cli.CLI__Context                                             import CLI__Context
+from issues_fs_cli.cli.CLI__Cycles                                              import CLI__Cycles
+from issues_fs_cli.cli.CLI__Output                                              import CLI__Output
+
+
+check_app = typer.Typer(name            = "check"                               ,
+                        help            = "Check the repository for problems"   ,
+                        no_args_is_help = True                                  )
+
+
+@check_app.command("cycles")
+def check_cycles(verbs     : Optional[List[str]] = typer.Option(None   , "--verbs"        , help="Link verbs to check (repeatable; default: blocks, depends-on)"),
+                 output    : str                 = typer.Option("table", "--output", "-o" , help="Output format (table, json)"                                  ),
+                 for_agent : bool                = typer.Option(False  , "--for-agent"    , help="Agent-optimized output"                                       )
+            ) -> None:                                                           # Every link cycle, exit 1 if any
+    try:
+        context = CLI__Context()
+    except FileNotFoundError as e:
+        CLI__Output.error(str(e), for_agent)
+        raise typer.Exit(code=1)
+
+    verbs    = [verb.strip() for value in verbs or [] for verb in value.split(',') if verb.strip()]
+    inverses = {}                                                                # Both ways: either verb may be stored or asked
+    for link_type in context.repository.link_types_load():
+        inverses[str(link_type.verb        )] = str(link_type.inverse_verb)
+        inverses[str(link_type.inverse_verb)] = str(link_type.verb        )
+    unknown  = [verb for verb in verbs if verb not in inverses]
+    if unknown:
+        CLI__Output.error(f"Unknown link verb: {', '.join(unknown)} (see `issues-fs link-types list`)", for_agent)
+        raise typer.Exit(code=1)
+
+    checker = CLI__Cycles(index = context.load_index(), verbs = verbs, inverses = inverses)
+    try:
+        cycles = checker.cycles()
+    except ValueError as e:
+        CLI__Output.error(str(e), for_agent)
+        raise typer.Exit(code=1)
+
+    CLI__Output.render_cycles(cycles                          ,
+                              nodes     = len(checker.edges)  ,
+                              edges     = checker.edge_count(),
+                              format    = output              ,
+                              for_agent = for_agent           )
+    if cycles:
+        raise typer.Exit(code=1)
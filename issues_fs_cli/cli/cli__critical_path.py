@@ -0,0 +1,50 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI Critical Path Command - Longest blocks/depends-on chain and blocking set
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import typer
+
+from typing                                                                     import List, Optional
+from issues_fs_cli.cli.CLI__Context                                             import CLI__Context
+from issues_fs_cli.cli.CLI__Dependencies                                        import CLI__Dependencies
+from issues_fs_cli.cli.CLI__Index                                               import CLI__Index
+from issues_fs_cli.cli.CLI__Output                                              import CLI__Output
+
+
+def critical_path(labels       : Optional[List[str]] = typer.Argument(None                  , help="Target labels (e.g. Feature-5)"          ),
+                  all_nodes    : bool                = typer.Option(False  , "--all"        , help="Longest chain in the whole repository"   ),
+                  include_done : bool                = typer.Option(False  , "--include-done", help="Keep finished nodes in the chains"      ),
+                  output       : str                 = typer.Option("table", "--output", "-o", help="Output format (table, json)"            ),
+                  for_agent    : bool                = typer.Option(False  , "--for-agent"  , help="Agent-optimized output"                  )
+             ) -> None:                                                          # Critical path(s) over blocks/depends-on
+    if not labels and not all_nodes:
+        CLI__Output.error("Give one or more labels, or --all", for_agent)
+        raise typer.Exit(code=1)
+
+    try:
+        context = CLI__Context()
+    except FileNotFoundError as e:
+        CLI__Output.error(str(e), for_agent)
+        raise typer.Exit(code=1)
+
+    index        = context.load_index()
+    dependencies = CLI__Dependencies(index = index, include_done = include_done)
+    results      = []
+    for label in labels or []:                                                   # Shared graph and memoised chains
+        entry = index.entry(label)
+        if entry is None:
+            CLI__Output.error(f"Node not found: {label}", for_agent)
+            raise typer.Exit(code=1)
+        if dependencies.contains(label) is False:
+            CLI__Output.error(f"{label} is {entry['status']} (use --include-done to analyse it)", for_agent)
+            raise typer.Exit(code=1)
+        results.append(dependencies.critical_path(label))
+    if all_nodes:
+        results.append(dependencies.critical_path_all())
+
+    summaries = lambda found: [CLI__Index.summary_json(index.entry(l)) for l in found]
+    rows      = [dict(result, chain = summaries(result['chain']), blocking = summaries(result['blocking']))
+                 for result in results]
+    CLI__Output.render_critical_paths(rows                   ,
+                                      format    = output     ,
+                                      for_agent = for_agent  )
@@ -39,6 +39,8 @@ def delete(label     : str  = typer.Argument(..., help="Node label (e.g. Task-23
         CLI__Output.error(response.message, for_agent)
         raise typer.Exit(code=1)
 
+    context.index_updated((node_type, node_label))                               # Drops its edges from the reverse index
+
     CLI__Output.render_delete_response(response                ,
                                        format    = output      ,
                                        for_agent = for_agent   )
@@ -0,0 +1,27 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI Entry - `issues-fs` console script
+#
+# Forwards the call to a running `issues-fs serve` daemon when there is one,
+# before typer or any issues_fs module is imported. Otherwise runs in-process:
+# hot --for-agent calls through CLI__Fast_Path, everything else through typer.
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import sys
+
+from issues_fs_cli.cli.CLI__Daemon__Client                                      import CLI__Daemon__Client
+from issues_fs_cli.cli.CLI__Fast_Path                                           import CLI__Fast_Path
+
+
+def main():                                                                      # Console script entry point
+    exit_code = CLI__Daemon__Client.forward(sys.argv[1:])
+    if exit_code is None:
+        exit_code = CLI__Fast_Path.run(sys.argv[1:])                             # No typer for hot agent calls
+    if exit_code is not None:
+        sys.exit(exit_code)
+
+    from issues_fs_cli.cli.cli__main import main as run_in_process               # typer + lazy command registry
+    run_in_process()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI Export Command - Stream nodes, links and comments to JSON/NDJSON/markdown
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import json
+import typer
+
+from typing                                                                     import Optional
+from issues_fs_cli.cli.CLI__Context                                             import CLI__Context
+from issues_fs_cli.cli.CLI__Export                                              import CLI__Export, EXPORT__FORMATS, EXPORT__STDOUT
+from issues_fs_cli.cli.CLI__Node__Filter                                        import CLI__Node__Filter
+from issues_fs_cli.cli.CLI__Output                                              import CLI__Output
+
+
+def export(output    : str           = typer.Option(EXPORT__STDOUT, "--output", "-o"  , help="File to write ('-' for stdout)"         ),
+           format    : Optional[str] = typer.Option(None          , "--format", "-f"  , help="json, ndjson or markdown (default: json)"),
+           node_type : Optional[str] = typer.Option(None          , "--type", "-t"    , help="Only nodes of this type"                ),
+           status    : Optional[str] = typer.Option(None          , "--status", "-s"  , help="Only nodes with this status"            ),
+           query     : Optional[str] = typer.Option(None          , "--query", "-q"   , help='Filter, e.g. "status:open AND priority:P0"'),
+           compress  : bool          = typer.Option(False         , "--gzip", "-z"    , help="Gzip the output (implied by a .gz file)"),
+           jobs      : Optional[int] = typer.Option(None          , "--jobs", "-j"    , min=1, help="Parallel reads for the index refresh"),
+           for_agent : bool          = typer.Option(False         , "--for-agent"     , help="Agent-optimized output"                 )
+      ) -> None:                                                                 # Export nodes (streamed)
+    compress = compress or output.endswith('.gz')
+    format   = format or export_format(output)
+    if format not in EXPORT__FORMATS:
+        CLI__Output.error(f"Unknown export format: {format} (expected {', '.join(EXPORT__FORMATS)})", for_agent)
+        raise typer.Exit(code=1)
+
+    try:
+        node_filter = CLI__Node__Filter.from_query(query or '')
+    except ValueError as e:
+        CLI__Output.error(str(e), for_agent)
+        raise typer.Exit(code=1)
+    if node_type:                                                                # Explicit options win over --query
+        node_filter.node_type = node_type.lower()
+    if status:
+        node_filter.status = status
+
+    try:
+        context = CLI__Context()
+    except FileNotFoundError as e:
+        CLI__Output.error(str(e), for_agent)
+        raise typer.Exit(code=1)
+
+    exporter = CLI__Export(repository = context.repository       ,
+                           index      = context.load_index(jobs) )
+    try:
+        with CLI__Export.open_output(output, compress) as out:
+            count = exporter.export(out, format, node_filter)
+    except OSError as e:
+        if output == EXPORT__STDOUT:                                             # e.g. piped into head: same as list
+            raise
+        CLI__Output.error(f"Cannot write {output}: {e}", for_agent)
+        raise typer.Exit(code=1)
+
+    if output == EXPORT__STDOUT:                                                 # The export itself went to stdout
+        return
+    if for_agent:
+        print(json.dumps({"success": True, "message": "Nodes exported", "nodes": count, "output": output, "format": format}))
+    else:
+        CLI__Output.success(f"Exported {count} nodes to {output}")
+
+
+def export_format(output: str) -> str:                                           # Format implied by the file name
+    name = output[:-3] if output.endswith('.gz') else output
+    if name.endswith('.md'):
+        return 'markdown'
+    if name.endswith('.ndjson') or name.endswith('.jsonl'):
+        return 'ndjson'
+    return 'json'
@@ -0,0 +1,34 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI Fsck Command - Validate node files, links and indexes; --repair indexes
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import typer
+
+from issues_fs_cli.cli.CLI__Context                                             import CLI__Context
+from issues_fs_cli.cli.CLI__Fsck                                                import CLI__Fsck, FSCK__JOBS
+from issues_fs_cli.cli.CLI__Index                                               import CLI__Index
+from issues_fs_cli.cli.CLI__Output                                              import CLI__Output
+
+
+def fsck(repair    : bool = typer.Option(False     , "--repair"             , help="Regenerate the type, global and label indexes"),
+         jobs      : int  = typer.Option(FSCK__JOBS, "--jobs", "-j", min=1  , help="Validation processes"                          ),
+         output    : str  = typer.Option("table"   , "--output", "-o"      , help="Output format (table, json)"                   ),
+         for_agent : bool = typer.Option(False     , "--for-agent"          , help="Agent-optimized output"                        )
+    ) -> None:                                                                   # Check everything, exit 1 on problems
+    try:
+        context = CLI__Context()
+    except FileNotFoundError as e:
+        CLI__Output.error(str(e), for_agent)
+        raise typer.Exit(code=1)
+
+    checker = CLI__Fsck(repository = context.repository                          ,
+                        index      = CLI__Index(repository = context.repository) ,  # As saved: a warm one is refreshed
+                        jobs       = jobs                                       )
+    stats   = checker.run()
+    if repair:
+        stats = checker.repair()
+        context.index_fresh = False                                              # Daemon: reload the rebuilt index
+
+    CLI__Output.render_fsck(stats, checker.problems, format = output, for_agent = for_agent)
+    if checker.problems:
+        raise typer.Exit(code=1)
@@ -0,0 +1,49 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI Import Command - Bulk-restore nodes from an export file (JSON or NDJSON)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import json
+import typer
+
+from typing                                                                     import Optional
+from issues_fs_cli.cli.CLI__Context                                             import CLI__Context
+from issues_fs_cli.cli.CLI__Import                                              import CLI__Import, CLI__Import__Error
+from issues_fs_cli.cli.CLI__Index                                               import INDEX__READ_JOBS
+from issues_fs_cli.cli.CLI__Output                                              import CLI__Output
+
+
+def import_nodes(source    : str           = typer.Argument("-"                                , help="Export file (.json, .ndjson, optionally gzipped); '-' for stdin"),
+                 dry_run   : bool          = typer.Option(False, "--dry-run"                   , help="Validate only, write nothing"                                   ),
+                 overwrite : bool          = typer.Option(False, "--overwrite"                 , help="Replace nodes whose label already exists (default: skip them)" ),
+                 jobs      : Optional[int] = typer.Option(None , "--jobs", "-j"       , min=1  , help="Parallel file writes"                                           ),
+                 for_agent : bool          = typer.Option(False, "--for-agent"                 , help="Agent-optimized output"                                         )
+            ) -> None:                                                           # Import nodes, reindex once
+    try:
+        context = CLI__Context()
+    except FileNotFoundError as e:
+        CLI__Output.error(str(e), for_agent)
+        raise typer.Exit(code=1)
+
+    importer = CLI__Import(repository = context.repository        ,
+                           index      = context.load_index(jobs)  ,
+                           overwrite  = overwrite                 ,
+                           dry_run    = dry_run                   ,
+                           jobs       = jobs or INDEX__READ_JOBS  )
+    try:
+        with CLI__Import.open_input(source) as stream:
+            stats = importer.run(CLI__Import.read_nodes(stream))
+    except (OSError, CLI__Import__Error) as e:                                   # Nodes before the error are kept
+        CLI__Output.error(f"Cannot import {source}: {e}", for_agent)
+        raise typer.Exit(code=1)
+
+    if for_agent:
+        print(json.dumps({"success": not importer.errors, **stats,
+                          "errors": [{"position": p, "label": l, "error": m} for p, l, m in importer.errors]}))
+    else:
+        for position, label, message in importer.errors:
+            CLI__Output.error(f"node {position}{f' ({label})' if label else ''}: {message}")
+        verb = "Would import" if dry_run else "Imported"
+        CLI__Output.success(f"{verb} {stats['imported']} nodes ({stats['skipped']} existing skipped, {stats['failed']} failed)")
+
+    if importer.errors:
+        raise typer.Exit(code=1)
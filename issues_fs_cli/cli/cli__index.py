@@ -0,0 +1,60 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI Index Commands - Inspect and rebuild the local label index
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import json
+import typer
+
+from issues_fs_cli.cli.CLI__Context                                             import CLI__Context
+from issues_fs_cli.cli.CLI__Index                                               import CLI__Index, INDEX__READ_JOBS
+from issues_fs_cli.cli.CLI__Output                                              import CLI__Output
+from issues_fs_cli.cli.CLI__Search__Index                                       import CLI__Search__Index, SEARCH__PATH
+
+
+index_app = typer.Typer(name            = "index"                               ,
+                        help            = "Manage the local label index"        ,
+                        no_args_is_help = True                                  )
+
+
+@index_app.command("rebuild")
+def index_rebuild(jobs      : int  = typer.Option(INDEX__READ_JOBS, "--jobs", "-j", min=1, help="Parallel file reads"),
+                  for_agent : bool = typer.Option(False, "--for-agent", help="Agent-optimized output")
+             ) -> None:                                                          # Re-index every node file
+    try:
+        context = CLI__Context()
+    except FileNotFoundError as e:
+        CLI__Output.error(str(e), for_agent)
+        raise typer.Exit(code=1)
+
+    index = CLI__Index(repository = context.repository, jobs = jobs)             # Skip the refresh, start from scratch
+    stats = index.rebuild().stats()
+    if context.repository.storage_fs.file__exists(SEARCH__PATH):                 # Search index only once `search` built it
+        CLI__Search__Index(repository = context.repository, jobs = jobs).rebuild()
+
+    if for_agent:
+        print(json.dumps({"success": True, "message": "Index rebuilt", **stats}))
+    else:
+        CLI__Output.success(f"Index rebuilt: {stats['nodes']} nodes in {stats['files']} files")
+
+
+@index_app.command("status")
+def index_status(output    : str  = typer.Option("table", "--output", "-o", help="Output format")      ,
+                 for_agent : bool = typer.Option(False, "--for-agent", help="Agent-optimized output")
+            ) -> None:                                                           # Show index counts
+    try:
+        context = CLI__Context()
+    except FileNotFoundError as e:
+        CLI__Output.error(str(e), for_agent)
+        raise typer.Exit(code=1)
+
+    stats = context.load_index().stats()
+
+    if for_agent or output == "json":
+        print(json.dumps({"success": True, **stats}, indent=2))
+        return
+
+    print(f"{'Index':<15} {stats['index_path']}")
+    print(f"{'Files':<15} {stats['files']}")
+    print(f"{'Nodes':<15} {stats['nodes']}")
+    for node_type, count in stats['type_counts'].items():
+        print(f"  {node_type:<13} {count}")
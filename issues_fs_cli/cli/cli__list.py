@@ -4,41 +4,78 @@
 
 import typer
 from typing                                                                     import Optional
+from issues_fs_cli.cli.CLI__Commands                                            import CLI__Commands
 from issues_fs_cli.cli.CLI__Context                                             import CLI__Context
+from issues_fs_cli.cli.CLI__Node__Filter                                        import CLI__Node__Filter
 from issues_fs_cli.cli.CLI__Output                                              import CLI__Output
-from issues_fs.schemas.graph.Safe_Str__Graph_Types                              import Safe_Str__Node_Type
+from issues_fs_cli.cli.CLI__Watch                                               import CLI__Watch
+from issues_fs_cli.cli.CLI__Workspace                                           import CLI__Workspace
 
-def list_issues(node_type : Optional[str] = typer.Option(None   , "--type", "-t"    , help="Filter by node type"    ),
-                status    : Optional[str] = typer.Option(None   , "--status", "-s"  , help="Filter by status"       ),
-                output    : str           = typer.Option("table", "--output", "-o"  , help="Output format"          ),
-                for_agent : bool          = typer.Option(False  , "--for-agent"     , help="Agent-optimized output" )
+def list_issues(node_type : Optional[str] = typer.Option(None   , "--type", "-t"    ,        help="Filter by node type"                    ),
+                status    : Optional[str] = typer.Option(None   , "--status", "-s"  ,        help="Filter by status"                       ),
+                priority  : Optional[str] = typer.Option(None   , "--priority", "-p",        help="Filter by priority (e.g. P1)"           ),
+                tags      : Optional[str] = typer.Option(None   , "--tags"          ,        help="Comma-separated tags (all must match)"  ),
+                repos     : Optional[str] = typer.Option(None   , "--repos"         ,        help="Glob or manifest of repos to query"     ),
+                output    : str           = typer.Option("table", "--output", "-o"  ,        help="Output format (table, json, ndjson)"    ),
+                jobs      : Optional[int] = typer.Option(None   , "--jobs", "-j"    , min=1, help="Parallel reads (files, or repos)"       ),
+                sort      : Optional[str] = typer.Option(None   , "--sort"          ,        help="Sort fields, e.g. priority,-title"      ),
+                limit     : Optional[int] = typer.Option(None   , "--limit", "-n"   , min=1, help="Show at most N nodes"                   ),
+                offset    : int           = typer.Option(0      , "--offset"        , min=0, help="Skip the first N nodes"                 ),
+                cursor    : Optional[str] = typer.Option(None   , "--cursor"        ,        help="Continue after a previous page"         ),
+                fields    : Optional[str] = typer.Option(None   , "--fields"        ,        help="Fields to show, e.g. label,status,title"),
+                watch     : bool          = typer.Option(False  , "--watch", "-w"   ,        help="Re-render whenever nodes change"        ),
+                for_agent : bool          = typer.Option(False  , "--for-agent"     ,        help="Agent-optimized output"                 )
            ) -> None:                                                            # List all issues
+    query = CLI__Commands.list_query(node_type, status, priority, tags, sort, limit, offset, cursor, fields, for_agent)
+    if query is None:
+        raise typer.Exit(code=1)
+
+    if watch and (repos or output == "ndjson"):
+        CLI__Output.error("--watch works with table and json output of the local repo", for_agent)
+        raise typer.Exit(code=1)
+
+    if repos and (query['paged'] or query['projection'].names):
+        CLI__Output.error("--sort, --limit, --offset, --cursor and --fields work on the local repo only", for_agent)
+        raise typer.Exit(code=1)
+
+    if repos:                                                                    # Federated: no local .issues/ needed
+        list_workspace(repos, query['node_filter'], output, jobs, for_agent)
+        return
+
     try:
         context = CLI__Context()
     except FileNotFoundError as e:
         CLI__Output.error(str(e), for_agent)
         raise typer.Exit(code=1)
 
-    safe_node_type = None
-    if node_type:
-        try:
-            safe_node_type = Safe_Str__Node_Type(node_type.lower())
-        except Exception:
-            CLI__Output.error(f"Invalid node type: {node_type}", for_agent)
-            raise typer.Exit(code=1)
+    index = context.load_index(jobs = jobs)                                      # Filters run on the index, no node file is read
 
-    response = context.node_service.list_nodes(node_type = safe_node_type)
+    if watch:
+        render = lambda: CLI__Commands.list_render(index, query, output, for_agent)
+        CLI__Watch.run(context.repository, render, index = index, diff = output == "table" and not for_agent)
+        return
 
-    if response.success is False:
-        CLI__Output.error(response.message, for_agent)
+    if CLI__Commands.list_render(index, query, output, for_agent) is False:
         raise typer.Exit(code=1)
 
-    # Filter by status if specified
-    if status and response.nodes:
-        filtered_nodes = [n for n in response.nodes if str(n.status) == status]
-        response.nodes = filtered_nodes
-        response.total = len(filtered_nodes)
 
-    CLI__Output.render_list(response                ,
-                            format    = output      ,
-                            for_agent = for_agent   )
+def list_workspace(repos       : str               ,                            # list --repos: fan out over roots
+                   node_filter : CLI__Node__Filter ,
+                   output      : str               ,
+                   jobs        : Optional[int]     ,
+                   for_agent   : bool
+              ) -> None:
+    try:
+        workspace = CLI__Workspace.from_spec(repos, jobs = jobs)
+    except FileNotFoundError as e:
+        CLI__Output.error(str(e), for_agent)
+        raise typer.Exit(code=1)
+
+    CLI__Output.render_federated_list(workspace.list_nodes(node_filter) ,
+                                      format    = output                ,
+                                      for_agent = for_agent             )
+
+    for root_name, message in workspace.errors:                                 # Other roots were still listed
+        CLI__Output.error(f"{root_name}: {message}", for_agent)
+    if workspace.errors:
+        raise typer.Exit(code=1)
@@ -1,60 +1,116 @@
 # ═══════════════════════════════════════════════════════════════════════════════
 # CLI Main - Typer app definition and command registration
+#
+# Commands are registered by module path and imported only when invoked, so a
+# call only pays the import cost of the command it runs (see CLI__Lazy_Group).
+# The installed `issues-fs` script starts in cli__entry, which first tries to
+# forward the call to a running `issues-fs serve` daemon.
 # ═══════════════════════════════════════════════════════════════════════════════
 
 import typer
 
-from issues_fs_cli.cli.cli__create      import create
-from issues_fs_cli.cli.cli__show        import show
-from issues_fs_cli.cli.cli__list        import list_issues
-from issues_fs_cli.cli.cli__update      import update
-from issues_fs_cli.cli.cli__delete      import delete
-from issues_fs_cli.cli.cli__link        import link, unlink, links
-from issues_fs_cli.cli.cli__comment     import comment, comments
-from issues_fs_cli.cli.cli__types       import types_app, link_types_app
-from issues_fs_cli.cli.cli__init        import init
+from typing                                                                     import Optional
+from issues_fs_cli.cli.CLI__Lazy_Group                                          import CLI__Lazy_Group
+from issues_fs_cli.cli.CLI__Profiler                                            import CLI__Profiler
 
 
-app = typer.Typer(name            = "issues-fs"                                 ,
-                  help            = "Git-native graph-based issue tracking"     ,
-                  no_args_is_help = True                                        )
+CLI_PACKAGE = 'issues_fs_cli.cli'
 
+LAZY_COMMANDS = {
 
-# ═══════════════════════════════════════════════════════════════════════════════
-# Core Node Commands
-# ═══════════════════════════════════════════════════════════════════════════════
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Core Node Commands
+    # ═══════════════════════════════════════════════════════════════════════════════
 
-app.command("init"    )(init       )
-app.command("create"  )(create     )
-app.command("show"    )(show       )
-app.command("list"    )(list_issues)
-app.command("update"  )(update     )
-app.command("delete"  )(delete     )
+    "init"         : (f"{CLI_PACKAGE}.cli__init"         , "init"          , "Initialize new .issues/ repository"  ),
+    "create"       : (f"{CLI_PACKAGE}.cli__create"       , "create"        , "Create a new issue node"             ),
+    "show"         : (f"{CLI_PACKAGE}.cli__show"         , "show"          , "Display node details"                ),
+    "list"         : (f"{CLI_PACKAGE}.cli__list"         , "list_issues"   , "List all issues"                     ),
+    "search"       : (f"{CLI_PACKAGE}.cli__search"       , "search"        , "Full-text search (ranked)"           ),
+    "update"       : (f"{CLI_PACKAGE}.cli__update"       , "update"        , "Update an existing node"             ),
+    "delete"       : (f"{CLI_PACKAGE}.cli__delete"       , "delete"        , "Delete a node"                       ),
 
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Link Commands
+    # ═══════════════════════════════════════════════════════════════════════════════
 
-# ═══════════════════════════════════════════════════════════════════════════════
-# Link Commands
-# ═══════════════════════════════════════════════════════════════════════════════
+    "link"         : (f"{CLI_PACKAGE}.cli__link"         , "link"          , "Create link between nodes"           ),
+    "unlink"       : (f"{CLI_PACKAGE}.cli__link"         , "unlink"        , "Remove link between nodes"           ),
+    "links"        : (f"{CLI_PACKAGE}.cli__link"         , "links"         , "List links for a node"               ),
 
-app.command("link"    )(link       )
-app.command("unlink"  )(unlink     )
-app.command("links"   )(links      )
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Graph Queries
+    # ═══════════════════════════════════════════════════════════════════════════════
 
+    "path"         : (f"{CLI_PACKAGE}.cli__path"         , "path"          , "Shortest link paths between nodes"   ),
+    "critical-path": (f"{CLI_PACKAGE}.cli__critical_path", "critical_path" , "Longest blocking chain to a node"    ),
+    "check"        : (f"{CLI_PACKAGE}.cli__check"        , "check_app"     , "Check the repository for problems"   ),
 
-# ═══════════════════════════════════════════════════════════════════════════════
-# Comment Commands
-# ═══════════════════════════════════════════════════════════════════════════════
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Comment Commands
+    # ═══════════════════════════════════════════════════════════════════════════════
 
-app.command("comment" )(comment    )
-app.command("comments")(comments   )
+    "comment"      : (f"{CLI_PACKAGE}.cli__comment"      , "comment"       , "Add a comment to a node"             ),
+    "comments"     : (f"{CLI_PACKAGE}.cli__comment"      , "comments"      , "List all comments on a node"         ),
 
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Bulk Commands
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    "batch"        : (f"{CLI_PACKAGE}.cli__batch"        , "batch"         , "Run NDJSON operations from stdin"    ),
+
+    "export"       : (f"{CLI_PACKAGE}.cli__export"       , "export"        , "Export nodes to JSON/NDJSON/markdown"),
+    "import"       : (f"{CLI_PACKAGE}.cli__import"       , "import_nodes"  , "Import nodes from an export file"    ),
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Type Management Subcommands
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    "types"        : (f"{CLI_PACKAGE}.cli__types"        , "types_app"     , "Manage node and link types"          ),
+    "link-types"   : (f"{CLI_PACKAGE}.cli__types"        , "link_types_app", "Manage link types"                   ),
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Index and Pack Management
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    "index"        : (f"{CLI_PACKAGE}.cli__index"        , "index_app"     , "Manage the local label index"        ),
+    "pack"         : (f"{CLI_PACKAGE}.cli__pack"         , "pack"          , "Pack node files into one mmap file"  ),
+    "fsck"         : (f"{CLI_PACKAGE}.cli__fsck"         , "fsck"          , "Validate node files and indexes"     ),
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Daemon and Agent Sessions
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    "serve"        : (f"{CLI_PACKAGE}.cli__serve"        , "serve"         , "Run the warm daemon (Unix socket)"   ),
+    "session"      : (f"{CLI_PACKAGE}.cli__session"      , "session"       , "JSON-RPC session over stdin/stdout"  ),
+}
+
+
+class CLI__Main__Group(CLI__Lazy_Group):                                         # Root group of the issues-fs app
+    lazy_commands = LAZY_COMMANDS
+
+    def invoke(self, ctx):                                                       # Profile around command load + run
+        command  = (ctx._protected_args or [''])[0]
+        profiler = CLI__Profiler.from_options(command                             ,
+                                              ctx.params.get('profile')           ,
+                                              ctx.params.get('profile_output')    )
+        if profiler is None:
+            return super().invoke(ctx)
+        with profiler:
+            return super().invoke(ctx)
+
+
+app = typer.Typer(name            = "issues-fs"                                 ,
+                  help            = "Git-native graph-based issue tracking"     ,
+                  cls             = CLI__Main__Group                            ,
+                  no_args_is_help = True                                        )
 
-# ═══════════════════════════════════════════════════════════════════════════════
-# Type Management Subcommands
-# ═══════════════════════════════════════════════════════════════════════════════
 
-app.add_typer(types_app     , name = "types"     )
-app.add_typer(link_types_app, name = "link-types")
+@app.callback()
+def root(profile        : bool          = typer.Option(False, "--profile"       , help="Print a per-phase timing breakdown to stderr"),
+         profile_output : Optional[str] = typer.Option(None , "--profile-output", help="Write the profile to a .json (Chrome trace) or .prof (cProfile) file")
+    ) -> None:                                                                   # Options are read in CLI__Main__Group.invoke
+    pass
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
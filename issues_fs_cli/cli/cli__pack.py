@@ -0,0 +1,37 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI Pack Command - Compact node files into a single memory-mapped pack
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import json
+import typer
+
+from issues_fs_cli.cli.CLI__Context                                             import CLI__Context
+from issues_fs_cli.cli.CLI__Output                                              import CLI__Output
+from issues_fs_cli.cli.CLI__Pack__Storage                                       import CLI__Pack__Storage, PACK__PATH
+
+
+def pack(keep_loose : bool = typer.Option(False, "--keep-loose", help="Keep the loose issue.json files")  ,
+         unpack     : bool = typer.Option(False, "--unpack"    , help="Write packed nodes back as files") ,
+         for_agent  : bool = typer.Option(False, "--for-agent" , help="Agent-optimized output")
+    ) -> None:                                                                   # Pack (or unpack) node files
+    try:
+        context = CLI__Context()
+    except FileNotFoundError as e:
+        CLI__Output.error(str(e), for_agent)
+        raise typer.Exit(code=1)
+
+    if unpack:
+        written = CLI__Pack__Storage.unpack_repository(context.root_path)
+        if for_agent:
+            print(json.dumps({"success": True, "message": "Pack unpacked", "nodes": written}))
+        else:
+            CLI__Output.success(f"Unpacked {written} nodes from {PACK__PATH}")
+        return
+
+    stats = CLI__Pack__Storage.pack_repository(context.root_path, keep_loose = keep_loose)
+
+    if for_agent:
+        print(json.dumps({"success": True, "message": "Repository packed", **stats}))
+    else:
+        CLI__Output.success(f"Packed {stats['nodes']} nodes into {stats['pack_path']} "
+                            f"({stats['pack_bytes'] / 1024:.0f} KB, {stats['loose']} loose files removed)")
@@ -0,0 +1,43 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI Path Command - Shortest (or k shortest) link paths between two nodes
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import typer
+
+from typing                                                                     import Optional
+from issues_fs_cli.cli.CLI__Context                                             import CLI__Context
+from issues_fs_cli.cli.CLI__Graph                                               import CLI__Graph, GRAPH__MAX_PATHS
+from issues_fs_cli.cli.CLI__Output                                              import CLI__Output
+
+
+def path(source    : str           = typer.Argument(...                                   , help="Start label (e.g. Bug-1)"                     ),
+         target    : str           = typer.Argument(...                                   , help="End label (e.g. Feature-3)"                   ),
+         via       : Optional[str] = typer.Option(None   , "--via"                        , help="Comma-separated verbs to follow (default: all)"),
+         max_hops  : Optional[int] = typer.Option(None   , "--max-hops"          , min=1  , help="Longest path to consider"                     ),
+         paths     : int           = typer.Option(1      , "--paths", "-k"       , min=1, max=GRAPH__MAX_PATHS, help="Number of shortest paths"),
+         output    : str           = typer.Option("table", "--output", "-o"               , help="Output format (table, json)"                  ),
+         for_agent : bool          = typer.Option(False  , "--for-agent"                  , help="Agent-optimized output"                       )
+    ) -> None:                                                                   # Paths between two nodes
+    try:
+        context = CLI__Context()
+    except FileNotFoundError as e:
+        CLI__Output.error(str(e), for_agent)
+        raise typer.Exit(code=1)
+
+    index = context.load_index()
+    for label in (source, target):
+        if index.entry(label) is None:
+            CLI__Output.error(f"Node not found: {label}", for_agent)
+            raise typer.Exit(code=1)
+
+    graph = CLI__Graph(index = index                                                     ,
+                       via   = [verb.strip() for verb in (via or '').split(',') if verb.strip()])
+    found = graph.k_shortest_paths(source, target, k = paths, max_hops = max_hops)
+    if not found:
+        limit = f" within {max_hops} hops" if max_hops else ""
+        CLI__Output.error(f"No path from {source} to {target}{limit}", for_agent)
+        raise typer.Exit(code=1)
+
+    CLI__Output.render_paths(source, target, [CLI__Graph.path_json(p) for p in found],
+                             format    = output    ,
+                             for_agent = for_agent )
@@ -0,0 +1,40 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI Search Command - Ranked full-text search over the search index
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import typer
+from typing                                                                     import Optional
+from issues_fs_cli.cli.CLI__Context                                             import CLI__Context
+from issues_fs_cli.cli.CLI__Index                                               import CLI__Index
+from issues_fs_cli.cli.CLI__Node__Filter                                        import CLI__Node__Filter
+from issues_fs_cli.cli.CLI__Output                                              import CLI__Output
+
+
+def search(query     : str           = typer.Argument(...    ,                          help='Words, "a phrase" or prefix*'        ),
+           node_type : Optional[str] = typer.Option(None     , "--type", "-t"    ,        help="Filter by node type"                 ),
+           status    : Optional[str] = typer.Option(None     , "--status", "-s"  ,        help="Filter by status"                    ),
+           limit     : int           = typer.Option(20       , "--limit", "-n"   , min=1, help="Maximum results"                     ),
+           output    : str           = typer.Option("table"  , "--output", "-o"  ,        help="Output format (table, json, ndjson)" ),
+           jobs      : Optional[int] = typer.Option(None     , "--jobs", "-j"    , min=1, help="Parallel file reads"                 ),
+           for_agent : bool          = typer.Option(False    , "--for-agent"     ,        help="Agent-optimized output"              )
+      ) -> None:                                                                 # Search titles, descriptions, tags, comments
+    try:
+        context = CLI__Context()
+    except FileNotFoundError as e:
+        CLI__Output.error(str(e), for_agent)
+        raise typer.Exit(code=1)
+
+    index = context.load_search_index(jobs = jobs)
+    if not index.parse_query(query):
+        CLI__Output.error(f"Nothing to search for in: {query!r}", for_agent)
+        raise typer.Exit(code=1)
+
+    node_filter = CLI__Node__Filter(node_type = node_type.lower() if node_type else None,
+                                    status    = status                                  )
+    rows        = [dict(CLI__Index.summary_json(entry), score = score)
+                   for entry, score in index.search(query, node_filter = node_filter, limit = limit)]
+
+    CLI__Output.render_search_results(query                 ,
+                                      rows                  ,
+                                      format    = output    ,
+                                      for_agent = for_agent )
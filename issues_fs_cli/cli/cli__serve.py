@@ -0,0 +1,28 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI Serve Command - Run the warm daemon that other invocations forward to
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import signal
+import sys
+import typer
+
+from issues_fs_cli.cli.CLI__Daemon                                              import CLI__Daemon
+from issues_fs_cli.cli.CLI__Daemon__Client                                      import CLI__Daemon__Client
+from issues_fs_cli.cli.CLI__Output                                              import CLI__Output
+
+
+def serve(socket_path : str = typer.Option(None, "--socket", "-s", help="Unix socket path (default: per-user runtime dir)")
+     ) -> None:                                                                  # Serve until Ctrl-C
+    daemon = CLI__Daemon(socket_path = socket_path or CLI__Daemon__Client.socket_path())
+    try:
+        daemon.start()
+    except (RuntimeError, OSError) as e:
+        CLI__Output.error(str(e))
+        raise typer.Exit(code=1)
+
+    CLI__Output.success(f"Serving issues-fs on {daemon.socket_path} (Ctrl-C to stop)")
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))             # `kill` also removes the socket
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
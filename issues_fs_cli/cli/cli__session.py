@@ -0,0 +1,22 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI Session Command - JSON-RPC over stdin/stdout against one warm context
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import sys
+import typer
+
+from issues_fs_cli.cli.CLI__Context                                             import CLI__Context
+from issues_fs_cli.cli.CLI__Output                                              import CLI__Output
+from issues_fs_cli.cli.CLI__Session                                             import CLI__Session
+
+
+def session() -> None:                                                           # Serve JSON-RPC requests until stdin closes
+    try:
+        context = CLI__Context()
+    except FileNotFoundError as e:
+        CLI__Output.error(str(e), for_agent=True)
+        raise typer.Exit(code=1)
+
+    for response in CLI__Session(context = context).start().run(sys.stdin):
+        sys.stdout.write(response + '\n')
+        sys.stdout.flush()                                                       # The caller waits for each answer
@@ -4,46 +4,72 @@
 
 import typer
 
+from typing                                                                     import Optional
+from issues_fs_cli.cli.CLI__Commands                                            import CLI__Commands
 from issues_fs_cli.cli.CLI__Context                                             import CLI__Context
 from issues_fs_cli.cli.CLI__Output                                              import CLI__Output
+from issues_fs_cli.cli.CLI__Watch                                               import CLI__Watch
 from issues_fs_cli.cli.CLI__Label_Parser                                        import CLI__Label_Parser
+from issues_fs_cli.cli.CLI__Workspace                                           import CLI__Workspace
 
 
-def show(label     : str  = typer.Argument(..., help="Node label (e.g. Task-23)")                      ,
-         depth     : int  = typer.Option(0, "--depth", "-D", help="Traversal depth for graph view")    ,
-         output    : str  = typer.Option("table", "--output", "-o", help="Output format")              ,
-         for_agent : bool = typer.Option(False, "--for-agent", help="Agent-optimized output")
+def show(label     : str           = typer.Argument(..., help="Node label (e.g. Task-23)")                      ,
+         depth     : int           = typer.Option(0, "--depth", "-D", help="Traversal depth for graph view")    ,
+         output    : str           = typer.Option("table", "--output", "-o", help="Output format")              ,
+         repos     : Optional[str] = typer.Option(None, "--repos", help="Glob or manifest of repos to search")  ,
+         watch     : bool          = typer.Option(False, "--watch", "-w", help="Re-render whenever nodes change"),
+         for_agent : bool          = typer.Option(False, "--for-agent", help="Agent-optimized output")
     ) -> None:                                                                   # Display node details
+    if watch and repos:
+        CLI__Output.error("--watch works with the local repo only", for_agent)
+        raise typer.Exit(code=1)
+
+    if repos:                                                                    # Same label in every matching repo
+        show_workspace(label, repos, output, for_agent)
+        return
+
     try:
         context = CLI__Context()
     except FileNotFoundError as e:
         CLI__Output.error(str(e), for_agent)
         raise typer.Exit(code=1)
 
-    node_type, node_label = CLI__Label_Parser.parse(label)
+    if watch:                                                                    # Errors (e.g. node deleted) go to stderr
+        if CLI__Commands.parse_label(label, for_agent) is None:
+            raise typer.Exit(code=1)
+        index = context.load_index()
+        CLI__Watch.run(context.repository                                                                      ,
+                       lambda: CLI__Commands.show(context, label, depth, output, for_agent, index = index)     ,
+                       index = index                                                                           ,
+                       diff  = output == "table" and not for_agent                                             )
+        return
+
+    if CLI__Commands.show(context, label, depth, output, for_agent) is False:
+        raise typer.Exit(code=1)
+
 
-    if node_type is None:
+def show_workspace(label     : str  ,                                           # show --repos: node from each root
+                   repos     : str  ,
+                   output    : str  ,
+                   for_agent : bool
+              ) -> None:
+    if CLI__Label_Parser.parse_type(label) is None:
         CLI__Output.error(f"Invalid label format: {label}. Expected format: Type-123", for_agent)
         raise typer.Exit(code=1)
 
-    if depth > 0:
-        response = context.node_service.get_node_graph(node_type = node_type  ,
-                                                       label     = node_label ,
-                                                       depth     = depth      )
-        if response.success is False:
-            CLI__Output.error(response.message, for_agent)
-            raise typer.Exit(code=1)
+    try:
+        workspace = CLI__Workspace.from_spec(repos)
+    except FileNotFoundError as e:
+        CLI__Output.error(str(e), for_agent)
+        raise typer.Exit(code=1)
 
-        CLI__Output.render_graph(response                  ,
-                                 format    = output        ,
-                                 for_agent = for_agent     )
-    else:
-        node = context.node_service.get_node(node_type = node_type  ,
-                                             label     = node_label )
-        if node is None:
-            CLI__Output.error(f"Node not found: {label}", for_agent)
-            raise typer.Exit(code=1)
+    found = CLI__Output.render_federated_nodes(workspace.find_nodes(label) ,
+                                               format    = output          ,
+                                               for_agent = for_agent       )
 
-        CLI__Output.render_node(node                       ,
-                                format    = output         ,
-                                for_agent = for_agent      )
+    for root_name, message in workspace.errors:
+        CLI__Output.error(f"{root_name}: {message}", for_agent)
+    if found == 0 and not workspace.errors:
+        CLI__Output.error(f"Node not found in any repo: {label}", for_agent)
+    if found == 0 or workspace.errors:
+        raise typer.Exit(code=1)
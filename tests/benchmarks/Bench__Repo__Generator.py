@@ -0,0 +1,162 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Bench__Repo__Generator - Reproducible synthetic .issues/ repositories
+#
+# Builds a repository on local disk with the same layout Node__Service writes
+# (config/, data/<type>/<Label>/issue.json, per-type and global indexes), but
+# writes node files directly: creating 1M nodes through the service would take
+# hours. Links are written on both ends (verb + inverse verb) as Link__Service
+# does. The same seed always produces the same nodes, links and content (only
+# the link type ids, created by Type__Service, differ between repositories).
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import json
+import os
+import random
+
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from osbot_utils.type_safe.primitives.core.Safe_UInt                            import Safe_UInt
+from issues_fs.issues.graph_services.Graph__Repository__Factory                 import Graph__Repository__Factory
+from issues_fs.issues.graph_services.Node__Service                              import Node__Service
+from issues_fs.issues.graph_services.Type__Service                              import Type__Service
+from issues_fs.schemas.graph.Schema__Type__Index                                import Schema__Type__Index
+from issues_fs.schemas.graph.Safe_Str__Graph_Types                              import Safe_Str__Node_Type
+
+
+BENCH__SIZES      = {'1k': 1_000, '10k': 10_000, '100k': 100_000, '1m': 1_000_000}
+BENCH__TYPE_MIX   = {'bug': 3, 'task': 5, 'feature': 2}                          # Relative weights
+BENCH__PRIORITIES = ['P1', 'P2', 'P3', 'P4']
+BENCH__TAGS       = ['ui', 'api', 'storage', 'cli', 'docs', 'perf', 'security', 'infra']
+BENCH__TIMESTAMP  = 1_700_000_000_000                                            # Fixed base for created_at
+BENCH__VERBS      = [('blocks'    , {'bug', 'task'}           , {'task', 'feature'}),   # (verb, sources, targets)
+                     ('depends-on', {'task', 'feature'}       , {'task', 'feature'}),
+                     ('relates-to', {'bug', 'task', 'feature'}, {'bug', 'task', 'feature'})]
+
+
+class Bench__Repo__Generator(Type_Safe):                                         # Synthetic repository builder
+    root_path        : str   = None                                              # Folder that receives .issues/
+    nodes            : int   = 1_000                                             # Total nodes across all types
+    link_density     : float = 1.0                                               # Average outgoing links per node
+    comments         : int   = 1                                                 # Average comments per node
+    description_size : int   = 200                                               # Characters per description
+    seed             : int   = 42
+
+    def generate(self) -> dict:                                                  # Write the repository, return counts
+        issues_dir = os.path.join(self.root_path, '.issues')
+        os.makedirs(issues_dir, exist_ok=True)
+        repository = Graph__Repository__Factory.create_local_disk(root_path = issues_dir)
+        Type__Service(repository = repository).initialize_default_types()
+
+        rng        = random.Random(self.seed)
+        link_types = {str(lt.verb): lt for lt in repository.link_types_load()}
+        types      = self.node_types(rng)
+        labels     = self.labels(types)
+        links      = self.links(rng, types, labels, link_types)
+
+        counts = {}
+        for i, node_type in enumerate(types):
+            counts[node_type] = counts.get(node_type, 0) + 1
+            path = os.path.join(issues_dir, 'data', node_type, labels[i], 'issue.json')
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as f:
+                f.write(json.dumps(self.node_data(rng, i, node_type, labels[i], links[i]), indent=2))
+
+        for node_type, count in counts.items():                                  # Indexes as Node__Service leaves them
+            repository.type_index_save(Schema__Type__Index(node_type  = Safe_Str__Node_Type(node_type) ,
+                                                           next_index = Safe_UInt(count + 1)           ,
+                                                           count      = Safe_UInt(count)               ))
+        Node__Service(repository = repository).update_global_index()
+
+        return {'nodes': len(types), 'links': sum(len(l) for l in links) // 2, 'type_counts': counts}
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Graph Shape
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def node_types(self, rng: random.Random) -> list:                            # Type of each node, by weight
+        names   = list(BENCH__TYPE_MIX)
+        weights = list(BENCH__TYPE_MIX.values())
+        return rng.choices(names, weights=weights, k=self.nodes)
+
+    @staticmethod
+    def labels(types: list) -> list:                                             # Bug-1, Task-1, Bug-2, ...
+        next_index = {}
+        labels     = []
+        for node_type in types:
+            next_index[node_type] = next_index.get(node_type, 0) + 1
+            labels.append(f'{node_type.capitalize()}-{next_index[node_type]}')
+        return labels
+
+    def links(self, rng: random.Random, types: list, labels: list, link_types: dict) -> list:
+        links = [[] for _ in types]                                              # Per node: (verb, target index, label, type id)
+        if len(types) < 2:
+            return links
+        total = int(len(types) * self.link_density)
+        seen  = set()
+        for _ in range(total):
+            source = rng.randrange(len(types))
+            target = rng.randrange(len(types))
+            if source == target or (source, target) in seen or (target, source) in seen:
+                continue
+            verbs = [v for v, sources, targets in BENCH__VERBS
+                     if types[source] in sources and types[target] in targets]
+            verb  = rng.choice(verbs)
+            link  = link_types[verb]
+            seen.add((source, target))
+            links[source].append((verb                  , target, labels[target], str(link.link_type_id)))
+            links[target].append((str(link.inverse_verb), source, labels[source], str(link.link_type_id)))
+        return links
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Node Content
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def node_data(self, rng: random.Random, i: int, node_type: str, label: str, links: list) -> dict:
+        created_at = BENCH__TIMESTAMP + i
+        properties = {'priority': rng.choice(BENCH__PRIORITIES)}
+        comments   = self.comment_count(rng)
+        if comments:
+            properties['comments'] = [{'id'        : f'{i:06x}{c:02x}'                  ,
+                                       'author'    : 'bench'                            ,
+                                       'text'      : f'Comment {c + 1} on {label}'      ,
+                                       'created_at': created_at                         ,
+                                       'updated_at': created_at                         } for c in range(comments)]
+        return {'node_id'    : self.node_id(i)                                          ,
+                'node_type'  : node_type                                                ,
+                'node_index' : int(label.rsplit('-', 1)[1])                             ,
+                'label'      : label                                                    ,
+                'title'      : f'{node_type.capitalize()} {i}'                          ,
+                'description': self.description(rng)                                    ,
+                'status'     : rng.choice(self.statuses(node_type))                     ,
+                'created_at' : created_at                                               ,
+                'updated_at' : created_at                                               ,
+                'created_by' : 'be0c0000'                                               ,
+                'tags'       : sorted(rng.sample(BENCH__TAGS, rng.randint(0, 2)))       ,
+                'links'      : [{'link_type_id': link_type_id                           ,
+                                 'verb'        : verb                                   ,
+                                 'target_id'   : self.node_id(target)                   ,
+                                 'target_label': target_label                           ,
+                                 'created_at'  : created_at                             }
+                                for verb, target, target_label, link_type_id in links]  ,
+                'properties' : properties                                               }
+
+    def comment_count(self, rng: random.Random) -> int:                          # 0 .. 2 * average
+        return rng.randint(0, 2 * self.comments) if self.comments else 0
+
+    def description(self, rng: random.Random) -> str:
+        words = []
+        size  = 0
+        while size < self.description_size:
+            word  = rng.choice(BENCH__TAGS)
+            size += len(word) + 1
+            words.append(word)
+        return ' '.join(words)[:self.description_size]
+
+    @staticmethod
+    def statuses(node_type: str) -> list:                                        # Mostly closed, like a real backlog
+        return {'bug'    : ['closed'  ] * 6 + ['backlog' , 'confirmed', 'in-progress', 'resolved'],
+                'task'   : ['done'    ] * 6 + ['backlog' , 'todo'     , 'in-progress', 'review'  ],
+                'feature': ['released'] * 6 + ['proposed', 'approved' , 'in-progress'            ]}[node_type]
+
+    @staticmethod
+    def node_id(i: int) -> str:
+        return f'{i:08x}'
@@ -0,0 +1,124 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Bench__Runner - Time CLI commands against generated repositories
+#
+# Each run is a fresh `python -c "...cli__main import app; app()" <argv>`
+# process (the real Typer app, daemon forwarding disabled), so wall time
+# includes start-up and peak RSS is the child's own ru_maxrss (os.wait4).
+# Results are compared against a stored baseline; a scenario regresses when it
+# is slower/larger than the baseline by more than the tolerance AND by more
+# than a small absolute floor, so noise on sub-100ms commands isn't flagged.
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from tests.benchmarks.Bench__Repo__Generator                                    import Bench__Repo__Generator
+
+
+BENCH__APP_CODE       = 'from issues_fs_cli.cli.cli__main import app; app()'
+BENCH__REPO_ROOT      = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+BENCH__TIME_TOLERANCE = 0.25                                                     # +25% wall time
+BENCH__RSS_TOLERANCE  = 0.25                                                     # +25% peak RSS
+BENCH__MIN_SECONDS    = 0.05                                                     # Ignore smaller time deltas
+BENCH__MIN_RSS_MB     = 5.0                                                      # Ignore smaller RSS deltas
+BENCH__SCENARIOS      = [                                                        # (name, argv, drop index cache first)
+    ('list (cold index)'     , ['list']                                                    , True ),
+    ('list'                  , ['list']                                                    , False),
+    ('list --status'         , ['list', '--type', 'bug', '--status', 'confirmed']          , False),
+    ('list --priority --tags', ['list', '--priority', 'P1', '--tags', 'ui']                , False),
+    ('show'                  , ['show', 'Task-1']                                          , False),
+    ('show --depth 1'        , ['show', 'Task-1', '--depth', '1']                          , False),
+    ('show --depth 2'        , ['show', 'Task-1', '--depth', '2']                          , False),
+    ('show --depth 3'        , ['show', 'Task-1', '--depth', '3']                          , False),
+    ('links'                 , ['links', 'Task-1']                                         , False),
+    ('comments'              , ['comments', 'Task-1']                                      , False),
+    ('search'                , ['search', 'storage api', '--limit', '20']                  , False),
+    ('search "phrase"'       , ['search', '"api docs"', '--limit', '20']                   , False),
+    ('create'                , ['create', 'bug', 'Benchmark bug']                          , False)]   # Last: adds nodes
+
+
+class Bench__Runner(Type_Safe):                                                  # Command benchmark suite
+    repeat           : int   = 3                                                 # Runs per scenario (median time)
+    link_density     : float = 1.0
+    comments         : int   = 1
+    description_size : int   = 200
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Running
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def run_size(self, nodes: int) -> dict:                                      # scenario → {seconds, peak_rss_mb}
+        work_dir = tempfile.mkdtemp(prefix='issues-fs-bench-')
+        try:
+            results         = {'init': self.measure(os.path.join(work_dir, 'init'), ['init'], fresh=True)}
+            repo_dir        = os.path.join(work_dir, 'repo')
+            generator       = Bench__Repo__Generator(root_path        = repo_dir              ,
+                                                     nodes            = nodes                 ,
+                                                     link_density     = self.link_density     ,
+                                                     comments         = self.comments         ,
+                                                     description_size = self.description_size )
+            generator.generate()
+            for name, argv, cold in BENCH__SCENARIOS:
+                results[name] = self.measure(repo_dir, argv, cold=cold)
+            return results
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    def measure(self, cwd: str, argv: list, cold: bool = False, fresh: bool = False) -> dict:
+        times = []
+        peaks = []
+        for _ in range(self.repeat):
+            if fresh:                                                            # `init` needs an empty folder
+                shutil.rmtree(cwd, ignore_errors=True)
+                os.makedirs(cwd)
+            if cold:
+                shutil.rmtree(os.path.join(cwd, '.issues', '.cache'), ignore_errors=True)
+            seconds, peak_rss_mb = self.run_command(cwd, argv)
+            times.append(seconds)
+            peaks.append(peak_rss_mb)
+        return {'seconds'    : round(statistics.median(times), 4) ,
+                'peak_rss_mb': round(max(peaks), 1)               }
+
+    @staticmethod
+    def run_command(cwd: str, argv: list) -> tuple:                              # (wall seconds, peak RSS MB) of one run
+        env = dict(os.environ, ISSUES_FS_NO_DAEMON='1',
+                   PYTHONPATH=os.pathsep.join(filter(None, [BENCH__REPO_ROOT, os.environ.get('PYTHONPATH')])))
+        start   = time.perf_counter()
+        process = subprocess.Popen([sys.executable, '-c', BENCH__APP_CODE, *argv], cwd=cwd, env=env,
+                                   stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        stderr             = process.stderr.read()
+        _, status, rusage  = os.wait4(process.pid, 0)
+        seconds            = time.perf_counter() - start
+        process.returncode = os.waitstatus_to_exitcode(status)
+        process.stderr.close()
+        if process.returncode != 0:
+            raise RuntimeError(f"issues-fs {' '.join(argv)} failed ({process.returncode}): {stderr.decode()[-500:]}")
+        scale = 1024 * 1024 if sys.platform == 'darwin' else 1024                # ru_maxrss: bytes on macOS, KB on Linux
+        return seconds, rusage.ru_maxrss / scale
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Baseline Comparison
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    @staticmethod
+    def compare(results: dict, baseline: dict) -> list:                          # Regression messages (empty: none)
+        regressions = []
+        for size, scenarios in results.items():
+            for name, current in scenarios.items():
+                previous = baseline.get(size, {}).get(name)
+                if previous is None:                                             # New size/scenario: nothing to compare
+                    continue
+                checks = [('seconds'    , BENCH__TIME_TOLERANCE, BENCH__MIN_SECONDS, 's' ),
+                          ('peak_rss_mb', BENCH__RSS_TOLERANCE , BENCH__MIN_RSS_MB , 'MB')]
+                for key, tolerance, floor, unit in checks:
+                    before, after = previous[key], current[key]
+                    if after > before * (1 + tolerance) and after - before > floor:
+                        regressions.append(f'{size} {name}: {key} {before}{unit} → {after}{unit} '
+                                           f'(+{(after / before - 1) * 100:.0f}%)')
+        return regressions
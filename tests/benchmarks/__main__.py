@@ -0,0 +1,98 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Benchmark suite entry point
+#
+#   python -m tests.benchmarks                       # 1k + 10k, compare to baseline
+#   python -m tests.benchmarks --sizes 100k,1m       # larger repositories
+#   python -m tests.benchmarks --save-baseline       # record a new baseline
+#
+# Exits 1 when any scenario regresses against the stored baseline.
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import argparse
+import json
+import os
+import platform
+import sys
+
+from tests.benchmarks.Bench__Repo__Generator                                    import BENCH__SIZES
+from tests.benchmarks.Bench__Runner                                             import Bench__Runner
+
+
+BENCH__BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog='python -m tests.benchmarks', description='Issues-FS CLI benchmarks')
+    parser.add_argument('--sizes'           , default='1k,10k'       , help=f"Comma-separated: {', '.join(BENCH__SIZES)}")
+    parser.add_argument('--repeat'          , type=int  , default=3  , help='Runs per scenario (median wall time)')
+    parser.add_argument('--link-density'    , type=float, default=1.0, help='Average outgoing links per node')
+    parser.add_argument('--comments'        , type=int  , default=1  , help='Average comments per node')
+    parser.add_argument('--description-size', type=int  , default=200, help='Characters per description')
+    parser.add_argument('--baseline'        , default=BENCH__BASELINE, help='Baseline JSON to compare against')
+    parser.add_argument('--save-baseline'   , action='store_true'    , help='Write results as the new baseline')
+    parser.add_argument('--output'          , default=None           , help='Also write results JSON here')
+    return parser.parse_args(argv)
+
+
+def print_results(size: str, results: dict, baseline: dict) -> None:
+    print(f"\n{size}")
+    print(f"  {'Scenario':<26} {'Time (s)':>9} {'Baseline':>9} {'RSS (MB)':>9} {'Baseline':>9}")
+    for name, current in results.items():
+        previous = baseline.get(size, {}).get(name, {})
+        print(f"  {name:<26} {current['seconds']:>9.3f} {previous.get('seconds', ''):>9} "
+              f"{current['peak_rss_mb']:>9.1f} {previous.get('peak_rss_mb', ''):>9}")
+
+
+def main(argv=None) -> int:
+    args  = parse_args(argv)
+    sizes = [s.strip().lower() for s in args.sizes.split(',') if s.strip()]
+    for size in sizes:
+        if size not in BENCH__SIZES:
+            print(f"Unknown size: {size} (expected one of: {', '.join(BENCH__SIZES)})", file=sys.stderr)
+            return 2
+
+    stored   = {}
+    if os.path.isfile(args.baseline):
+        with open(args.baseline) as f:
+            stored = json.load(f)
+    baseline = stored.get('results', {})
+
+    runner  = Bench__Runner(repeat           = args.repeat           ,
+                            link_density     = args.link_density     ,
+                            comments         = args.comments         ,
+                            description_size = args.description_size )
+    results = {}
+    for size in sizes:
+        results[size] = runner.run_size(BENCH__SIZES[size])
+        print_results(size, results[size], baseline)
+
+    report = {'machine': {'python': platform.python_version(), 'platform': platform.platform(),
+                          'cpus'  : os.cpu_count()},
+              'params' : {'repeat'          : args.repeat          , 'link_density': args.link_density,
+                          'comments'        : args.comments        ,
+                          'description_size': args.description_size},
+              'results': results}
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if args.save_baseline:
+        report['results'] = {**baseline, **results}                              # Keep sizes not re-run
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+        print(f"\nBaseline saved to {args.baseline}")
+        return 0
+
+    regressions = Bench__Runner.compare(results, baseline)
+    if regressions:
+        print("\nRegressions against baseline:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    print("\nNo regressions against baseline." if baseline else "\nNo baseline stored (use --save-baseline).")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
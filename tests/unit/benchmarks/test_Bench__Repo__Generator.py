@@ -0,0 +1,65 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Test Bench__Repo__Generator - Synthetic repositories readable by the services
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import json
+import os
+import shutil
+import tempfile
+
+from unittest                                                                   import TestCase
+
+from tests.benchmarks.Bench__Repo__Generator                                    import Bench__Repo__Generator
+from issues_fs_cli.cli.CLI__Index                                               import CLI__Index
+from issues_fs.issues.graph_services.Graph__Repository__Factory                 import Graph__Repository__Factory
+from issues_fs.issues.graph_services.Node__Service                              import Node__Service
+from issues_fs.schemas.graph.Safe_Str__Graph_Types                              import Safe_Str__Node_Type, Safe_Str__Node_Label
+
+
+class test_Bench__Repo__Generator(TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def generate(self, folder, **kwargs) -> tuple:                               # (counts, repository)
+        root_path  = os.path.join(self.temp_dir, folder)
+        counts     = Bench__Repo__Generator(root_path = root_path, **kwargs).generate()
+        repository = Graph__Repository__Factory.create_local_disk(root_path = os.path.join(root_path, '.issues'))
+        return counts, repository
+
+    def test_generate__readable_by_services(self):                               # Same layout Node__Service writes
+        counts, repository = self.generate('repo', nodes = 60, link_density = 2.0, comments = 2)
+        node_service       = Node__Service(repository = repository)
+
+        assert counts['nodes']                                    == 60
+        assert sum(counts['type_counts'].values())                == 60
+        assert node_service.list_nodes().total                    == 60
+        assert int(repository.global_index_load().total_nodes)    == 60
+        for node_type, count in counts['type_counts'].items():
+            assert int(repository.type_index_load(Safe_Str__Node_Type(node_type)).next_index) == count + 1
+
+        index = CLI__Index(repository = repository).refresh()                    # Every link has its inverse
+        for entry in index.entries():
+            for _, target in entry['links']:
+                assert entry['label'] in [t for _, t in index.entry(target)['links']]
+        assert sum(len(e['links']) for e in index.entries())      == 2 * counts['links']
+
+        task = node_service.get_node(Safe_Str__Node_Type('task'), Safe_Str__Node_Label('Task-1'))
+        assert len(task.description)                              == 200
+
+    def test_generate__reproducible(self):                                       # Same seed, same nodes
+        self.generate('one', nodes = 30)
+        self.generate('two', nodes = 30)
+
+        def load(folder):                                                        # Link type ids come from `init`
+            with open(os.path.join(self.temp_dir, folder, '.issues', 'data', 'task', 'Task-2', 'issue.json')) as f:
+                data = json.load(f)
+            for link in data['links']:
+                del link['link_type_id']
+            return data
+
+        assert load('one') == load('two')
+        assert load('one')['links']                               != []
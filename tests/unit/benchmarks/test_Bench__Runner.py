@@ -0,0 +1,37 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Test Bench__Runner - Baseline comparison and single-command measurement
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import shutil
+import tempfile
+
+from unittest                                                                   import TestCase
+
+from tests.benchmarks.Bench__Runner                                             import Bench__Runner
+
+
+class test_Bench__Runner(TestCase):
+
+    def test_compare(self):                                                      # Relative tolerance + absolute floor
+        baseline = {'1k': {'list': {'seconds': 0.20, 'peak_rss_mb': 30.0},
+                           'show': {'seconds': 0.02, 'peak_rss_mb': 30.0}}}
+        results  = {'1k': {'list': {'seconds': 0.40, 'peak_rss_mb': 31.0},     # 2x slower: regression
+                           'show': {'seconds': 0.04, 'peak_rss_mb': 50.0},     # +20ms is noise, +20MB is not
+                           'new' : {'seconds': 9.00, 'peak_rss_mb': 99.0}},    # Not in baseline
+                    '1m': {'list': {'seconds': 9.00, 'peak_rss_mb': 99.0}}}
+
+        regressions = Bench__Runner.compare(results, baseline)
+
+        assert len(regressions) == 2
+        assert regressions[0].startswith('1k list: seconds 0.2s → 0.4s')
+        assert regressions[1].startswith('1k show: peak_rss_mb 30.0MB → 50.0MB')
+        assert Bench__Runner.compare(baseline, baseline) == []
+
+    def test_measure__init(self):                                                # Real subprocess through the Typer app
+        work_dir = tempfile.mkdtemp()
+        try:
+            result = Bench__Runner(repeat = 1).measure(f'{work_dir}/init', ['init'], fresh = True)
+        finally:
+            shutil.rmtree(work_dir)
+        assert result['seconds']     > 0
+        assert result['peak_rss_mb'] > 1
@@ -0,0 +1,155 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Test CLI__Batch - NDJSON batch execution with deferred writes
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import json
+
+from unittest                                                                   import TestCase
+
+from issues_fs_cli.cli.CLI__Batch                                               import CLI__Batch
+from issues_fs_cli.cli.CLI__Context                                             import CLI__Context
+from issues_fs.issues.graph_services.Graph__Repository__Factory                 import Graph__Repository__Factory
+from issues_fs.issues.graph_services.Type__Service                              import Type__Service
+from issues_fs.schemas.graph.Safe_Str__Graph_Types                              import Safe_Str__Node_Type, Safe_Str__Node_Label
+
+
+def ndjson(*operations) -> list:                                                 # Operations → input lines
+    return [json.dumps(op) if isinstance(op, dict) else op for op in operations]
+
+
+class test_CLI__Batch(TestCase):
+
+    def setUp(self):                                                             # Fresh in-memory repository
+        self.repository = Graph__Repository__Factory.create_memory()
+        Type__Service(repository = self.repository).initialize_default_types()
+        self.context    = CLI__Context(repository = self.repository)
+
+    def run_batch(self, *operations, **kwargs) -> list:
+        batch = CLI__Batch.from_context(self.context, **kwargs)
+        return list(batch.run(ndjson(*operations)))
+
+    def load(self, label):                                                       # Node as stored (not the batch cache)
+        node_type = label.split('-')[0].lower()
+        return self.repository.node_load(Safe_Str__Node_Type(node_type), Safe_Str__Node_Label(label))
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Tests for operations
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test_run__create_link_with_refs(self):                                   # "$ref" resolves to created label
+        results = self.run_batch({'op': 'create', 'type': 'task', 'title': 'Parent', 'ref': 'parent'},
+                                 {'op': 'create', 'type': 'bug' , 'title': 'Child' , 'ref': 'child' , 'tags': 'a, b'},
+                                 {'op': 'link'  , 'source': '$child', 'verb': 'blocks', 'target': '$parent'})
+
+        assert results == [{'line': 1, 'op': 'create', 'ref': 'parent', 'label': 'Task-1', 'success': True},
+                           {'line': 2, 'op': 'create', 'ref': 'child' , 'label': 'Bug-1' , 'success': True},
+                           {'line': 3, 'op': 'link'  , 'source': 'Bug-1', 'verb': 'blocks', 'target': 'Task-1', 'success': True}]
+        assert [str(t) for t in self.load('Bug-1').tags]                 == ['a', 'b']
+        assert [str(l.target_label) for l in self.load('Task-1').links]  == ['Bug-1']
+
+    def test_run__update_comment_unlink_delete(self):
+        results = self.run_batch({'op': 'create' , 'type': 'bug', 'title': 'One'},
+                                 {'op': 'create' , 'type': 'task', 'title': 'Two'},
+                                 {'op': 'link'   , 'source': 'Bug-1', 'verb': 'blocks', 'target': 'Task-1'},
+                                 {'op': 'update' , 'label': 'Bug-1', 'status': 'confirmed', 'priority': 'P1'},
+                                 {'op': 'comment', 'label': 'Bug-1', 'text': 'Looked into it'},
+                                 {'op': 'unlink' , 'source': 'Bug-1', 'target': 'Task-1'},
+                                 {'op': 'delete' , 'label': 'Task-1'})
+
+        assert [r['success'] for r in results] == [True] * 7
+        bug = self.load('Bug-1')
+        assert str(bug.status)                             == 'confirmed'
+        assert bug.properties['priority']                  == 'P1'
+        assert bug.properties['comments'][0]['text']       == 'Looked into it'
+        assert list(bug.links)                             == []
+        assert self.load('Task-1')                         is None
+
+    def test_run__errors_are_reported_per_line(self):                           # Failures don't stop the batch
+        results = self.run_batch('not json'                                           ,
+                                 '[1, 2]'                                             ,
+                                 {'op': 'fly'}                                        ,
+                                 {'op': 'create', 'type': 'bug'}                      ,
+                                 {'op': 'update', 'label': '$missing', 'status': 'x'} ,
+                                 {'op': 'show'  , 'label': 'Bug-1'}                   ,
+                                 {'op': 'delete', 'label': 'Bug-9'}                   ,
+                                 ''                                                   ,
+                                 {'op': 'create', 'type': 'bug', 'title': 'Still runs'})
+
+        assert [r['success'] for r in results]  == [False] * 7 + [True]
+        assert results[0]['error'].startswith('Invalid JSON')
+        assert results[1]['error']              == 'Operation must be a JSON object'
+        assert results[3]['error']              == 'Missing field: title'
+        assert results[4]['error']              == 'Unknown ref: $missing'
+        assert results[6]['error']              == 'Node not found: Bug-9'
+        assert results[7]['line']               == 9                             # Blank lines keep numbering
+
+    def test_run__stop_on_error(self):
+        results = self.run_batch({'op': 'delete', 'label': 'Bug-9'},
+                                 {'op': 'create', 'type': 'bug', 'title': 'Never runs'},
+                                 stop_on_error = True)
+
+        assert len(results)       == 1
+        assert self.load('Bug-1') is None
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Tests for deferred writes
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test_run__writes_each_file_once(self):                                   # Indexes + hub node coalesced
+        saved    = []
+        original = self.repository.storage_fs.file__save
+        self.repository.storage_fs.file__save = lambda path, data: saved.append(str(path)) or original(path, data)
+
+        operations = [{'op': 'create', 'type': 'task', 'title': 'Hub', 'ref': 'hub'}]
+        for i in range(20):
+            operations.append({'op': 'create', 'type': 'bug', 'title': f'Bug {i}', 'ref': f'b{i}'})
+            operations.append({'op': 'link'  , 'source': f'$b{i}', 'verb': 'blocks', 'target': '$hub'})
+        results = self.run_batch(*operations, flush_every = 0)
+
+        assert all(r['success'] for r in results)
+        assert len(saved)      == len(set(saved))                                # No file written twice
+        assert len(saved)      == 21 + 2 + 1                                     # Nodes + 2 type indexes + global
+        assert len(self.load('Task-1').links) == 20
+
+    def test_run__flush_every(self):                                             # Checkpoints during the batch
+        batch   = CLI__Batch.from_context(self.context, flush_every = 2)
+        results = batch.run(ndjson({'op': 'create', 'type': 'bug', 'title': 'One'},
+                                   {'op': 'create', 'type': 'bug', 'title': 'Two'},
+                                   {'op': 'create', 'type': 'bug', 'title': 'Three'}))
+        next(results)
+        assert self.load('Bug-1') is None                                        # Not yet flushed
+        next(results)
+        assert self.load('Bug-2') is not None                                    # Flushed after 2 operations
+        assert int(self.repository.type_index_load(Safe_Str__Node_Type('bug')).count) == 2
+        list(results)
+        assert int(self.repository.type_index_load(Safe_Str__Node_Type('bug')).count) == 3
+        assert int(self.repository.global_index_load().total_nodes)                     == 3
+
+    def test_run__delete_before_flush(self):                                     # Created and deleted in one batch
+        results = self.run_batch({'op': 'create', 'type': 'bug', 'title': 'Short-lived'},
+                                 {'op': 'delete', 'label': 'Bug-1'},
+                                 flush_every = 0)
+
+        assert [r['success'] for r in results] == [True, True]
+        assert self.load('Bug-1')              is None
+
+    def test_run__failed_op_is_rolled_back(self):                                # Half-applied edits never flushed
+        batch   = CLI__Batch.from_context(self.context, flush_every = 0)
+        service = batch.context.node_service
+        def half_update(*args, **kwargs):                                        # Edits a pending node, then fails
+            node       = service.repository.node_load(Safe_Str__Node_Type('bug'), Safe_Str__Node_Label('Bug-1'))
+            node.title = 'Half applied'
+            node.tags.append('half')
+            service.repository.type_index_load(Safe_Str__Node_Type('bug')).count = 99
+            raise ValueError('disk full')
+        service.update_node = half_update
+
+        results = list(batch.run(ndjson({'op': 'create', 'type': 'bug', 'title': 'Original'},
+                                        {'op': 'update', 'label': 'Bug-1', 'status': 'confirmed'},
+                                        {'op': 'create', 'type': 'bug', 'title': 'After'})))
+
+        assert [r['success'] for r in results]                                          == [True, False, True]
+        assert results[1]['error']                                                      == 'disk full'
+        assert str(self.load('Bug-1').title)                                            == 'Original'
+        assert list(self.load('Bug-1').tags)                                            == []
+        assert int(self.repository.type_index_load(Safe_Str__Node_Type('bug')).count)   == 2
@@ -0,0 +1,113 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Test CLI__Cycles - Strongly connected components of the link graph
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import random
+
+from unittest                                                                   import TestCase
+
+from issues_fs_cli.cli.CLI__Cycles                                              import CLI__Cycles
+from issues_fs_cli.cli.CLI__Index                                               import CLI__Index
+
+INVERSE = {'blocks'    : 'blocked-by'   , 'blocked-by'    : 'blocks'     ,
+           'depends-on': 'dependency-of', 'dependency-of' : 'depends-on' ,
+           'contains'  : 'contained-by' , 'contained-by'  : 'contains'   ,
+           'relates-to': 'relates-to'   }
+
+
+def cycles(links: list, **kwargs) -> CLI__Cycles:                                 # Links stored both ways, as Link__Service does
+    index          = CLI__Index()
+    index.by_label = {}
+    for source, verb, target in links:
+        for label in (source, target):
+            index.by_label.setdefault(label, {'label': label, 'links': []})
+        index.by_label[source]['links'].append([verb, target])
+        if source != target:
+            index.by_label[target]['links'].append([INVERSE[verb], source])
+    return CLI__Cycles(index = index, inverses = INVERSE, **kwargs)
+
+
+class test_CLI__Cycles(TestCase):
+
+    def test_build(self):                                                        # Mixed verbs, both sides → one edge each
+        checker = cycles([('A', 'blocks', 'B'), ('C', 'depends-on', 'B'), ('C', 'relates-to', 'A')]).build()
+
+        assert checker.edges        == {'A': {}, 'B': {'A': ('blocks', False)}, 'C': {'B': ('depends-on', True)}}
+        assert checker.edge_count() == 2
+        assert checker.cycles()     == []
+
+    def test_cycles(self):                                                       # One entry per component, shortest loop
+        checker = cycles([('A', 'blocks', 'B'), ('B', 'blocks', 'C'), ('C', 'blocks', 'B'),           # B ↔ C
+                          ('X', 'depends-on', 'Y'), ('Y', 'depends-on', 'Z'), ('Z', 'depends-on', 'X'),
+                          ('Y', 'depends-on', 'X'), ('S', 'blocks', 'S')])
+        found   = checker.cycles()
+
+        assert [f['nodes'] for f in found] == [['B', 'C'], ['X', 'Y', 'Z'], ['S']]
+        assert found[0]['cycle']           == {'nodes': ['B', 'C', 'B'], 'verbs': ['blocks', 'blocks']        , 'reversed': [False, False]}
+        assert found[1]['cycle']           == {'nodes': ['X', 'Y', 'X'], 'verbs': ['depends-on', 'depends-on'], 'reversed': [False, False]}
+        assert found[2]['cycle']           == {'nodes': ['S', 'S']     , 'verbs': ['blocks']                  , 'reversed': [False]       }
+
+    def test_cycles__reported_as_asked(self):                                    # Walked along the verb asked for
+        links = [('A', 'blocks', 'B'), ('B', 'blocks', 'C'), ('C', 'blocks', 'A')]
+        assert cycles(links).cycles()[0]['cycle']                            == {'nodes'   : ['A', 'B', 'C', 'A']           ,
+                                                                                 'verbs'   : ['blocks'] * 3                  ,
+                                                                                 'reversed': [False] * 3                     }
+        assert cycles(links, verbs = ['blocked-by']).cycles()[0]['cycle']    == {'nodes'   : ['A', 'C', 'B', 'A']           ,
+                                                                                 'verbs'   : ['blocked-by'] * 3              ,
+                                                                                 'reversed': [False] * 3                     }
+        mixed = cycles([('A', 'blocks', 'B'), ('A', 'depends-on', 'B')]).cycles()[0]['cycle']   # A waits on B, B waits on A
+        assert mixed == {'nodes': ['A', 'B', 'A'], 'verbs': ['depends-on', 'blocks'], 'reversed': [False, True]}
+
+    def test_cycles__one_sided_links(self):                                      # Only one side stored (what fsck reports)
+        for verb in ('blocks', 'blocked-by'):                                    # A ↔ B, never with the inverse side
+            checker = cycles([])
+            checker.index.by_label = {'A': {'label': 'A', 'links': [[verb, 'B']]},
+                                      'B': {'label': 'B', 'links': [[verb, 'A']]}}
+            found   = checker.cycles()
+            assert [f['nodes'] for f in found] == [['A', 'B']]         , verb
+            assert found[0]['cycle']['verbs']  == ['blocks', 'blocks'] , verb
+
+    def test_cycles__consistent_mixed_verbs(self):                               # "A blocks B" + "B depends-on A": same edge
+        assert cycles([('A', 'blocks', 'B'), ('B', 'depends-on', 'A')]).cycles() == []
+
+    def test_cycles__verbs(self):                                                # Only the requested link types count
+        links = [('A', 'contains', 'B'), ('B', 'contains', 'A'), ('A', 'blocks', 'B')]
+        assert cycles(links).cycles()                                        == []
+        assert [f['nodes'] for f in cycles(links, verbs = ['contains'    ]).cycles()] == [['A', 'B']]
+        assert [f['nodes'] for f in cycles(links, verbs = ['contained-by']).cycles()] == [['A', 'B']]
+        with self.assertRaises(ValueError):
+            cycles(links, verbs = ['relates-to']).cycles()
+
+    def test_cycles__long_chain(self):                                           # No recursion limit on deep graphs
+        size    = 50_000
+        links   = [(f'N{i}', 'blocks', f'N{i + 1}') for i in range(size)]
+        assert cycles(links).cycles() == []
+
+        found   = cycles(links + [(f'N{size}', 'blocks', 'N0')]).cycles()
+        assert len(found)                      == 1
+        assert found[0]['size']                == size + 1
+        assert len(found[0]['cycle']['nodes']) == size + 2
+
+    def test_components__random_graphs(self):                                    # Same components as reachability both ways
+        rng = random.Random(5)
+        for _ in range(20):
+            labels  = [f'N{i}' for i in range(25)]
+            links   = [(a, 'depends-on', b) for a in labels for b in labels if a != b and rng.random() < 0.06]
+            checker = cycles(links)
+            edges   = checker.build().edges
+            reach   = {}
+            for label in edges:
+                seen, stack = {label}, [label]
+                while stack:
+                    for target in edges[stack.pop()]:
+                        if target not in seen:
+                            seen.add(target)
+                            stack.append(target)
+                reach[label] = seen
+            for component in checker.components():
+                for label in component:
+                    assert {other for other in reach[label] if label in reach[other]} == set(component)
+            for found in checker.cycles():
+                loop = found['cycle']['nodes']
+                assert loop[0] == loop[-1] and len(loop) > 2
+                assert all(b in edges[a] for a, b in zip(loop, loop[1:]))
@@ -0,0 +1,206 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Test CLI__Daemon - Warm daemon and thin client over a Unix socket
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import contextlib
+import gzip
+import importlib
+import inspect
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+
+from unittest                                                                   import TestCase
+
+from issues_fs_cli.cli.CLI__Context                                             import CLI__Context, WARM_CONTEXTS
+from issues_fs_cli.cli.CLI__Pack__Storage                                       import CLI__Pack__Storage
+from issues_fs_cli.cli.CLI__Daemon                                              import CLI__Daemon
+from issues_fs_cli.cli.CLI__Daemon__Client                                      import CLI__Daemon__Client, DAEMON__ENV_SOCKET, DAEMON__LOCAL_COMMANDS
+from issues_fs_cli.cli.cli__main                                                import LAZY_COMMANDS
+from issues_fs.issues.graph_services.Graph__Repository__Factory                 import Graph__Repository__Factory
+from issues_fs.issues.graph_services.Node__Service                              import Node__Service
+from issues_fs.issues.graph_services.Type__Service                              import Type__Service
+from issues_fs.schemas.graph.Schema__Node__Create__Request                      import Schema__Node__Create__Request
+from issues_fs.schemas.graph.Safe_Str__Graph_Types                              import Safe_Str__Node_Type
+
+
+class test_CLI__Daemon(TestCase):
+
+    def setUp(self):                                                             # Repository + daemon on a private socket
+        self.temp_dir   = tempfile.mkdtemp()
+        self.issues_dir = os.path.join(self.temp_dir, '.issues')
+        os.makedirs(self.issues_dir)
+        Type__Service(repository = Graph__Repository__Factory.create_local_disk(root_path = self.issues_dir)).initialize_default_types()
+
+        self.socket_path  = os.path.join(self.temp_dir, 'run', 'd.sock')
+        self.original_cwd = os.getcwd()
+        self.original_env = os.environ.get(DAEMON__ENV_SOCKET)
+        os.environ[DAEMON__ENV_SOCKET] = self.socket_path
+        os.chdir(self.temp_dir)
+
+        self.daemon = CLI__Daemon(socket_path = self.socket_path).start()
+        self.thread = threading.Thread(target = self.daemon.server.serve_forever, daemon = True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.daemon.server.shutdown()
+        self.daemon.stop()
+        self.thread.join()
+        WARM_CONTEXTS.clear()
+        os.chdir(self.original_cwd)
+        if self.original_env is None:
+            del os.environ[DAEMON__ENV_SOCKET]
+        else:
+            os.environ[DAEMON__ENV_SOCKET] = self.original_env
+        shutil.rmtree(self.temp_dir)
+
+    def run_entry(self, *argv, stdin: bytes = b''):                              # (exit code, stdout) via the console script
+        env    = dict(os.environ, PYTHONPATH = os.pathsep.join(sys.path))
+        result = subprocess.run([sys.executable, '-m', 'issues_fs_cli.cli.cli__entry', *argv],
+                                input = stdin, capture_output = True, cwd = self.temp_dir, env = env)
+        return result.returncode, result.stdout
+
+    def forward(self, *argv):                                                    # (exit code, stdout) via the socket
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            exit_code = CLI__Daemon__Client.forward(list(argv))
+        return exit_code, stdout.getvalue()
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Tests for the client
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test_forwardable(self):                                                  # Only non-interactive commands
+        assert CLI__Daemon__Client.forwardable(['list'])                       is True
+        assert CLI__Daemon__Client.forwardable(['delete', 'Bug-1', '--force']) is True
+        assert CLI__Daemon__Client.forwardable(['delete', 'Bug-1'])            is False
+        assert CLI__Daemon__Client.forwardable(['serve'])                      is False
+        assert CLI__Daemon__Client.forwardable(['--help'])                     is False
+        assert CLI__Daemon__Client.forwardable([])                             is False
+
+    def test_local_commands__cover_stdio(self):                                  # The daemon has neither our stdin nor a binary stdout
+        streams = set()
+        for command, (module_name, function_name, _) in LAZY_COMMANDS.items():
+            module   = importlib.import_module(module_name)
+            function = getattr(module, function_name)
+            dashes   = [name for name, param in inspect.signature(function).parameters.items()
+                        if getattr(param.default, 'default', None) == '-'] if inspect.isfunction(function) else []
+            if dashes or 'sys.stdin' in inspect.getsource(module):               # '-' path (stdin/stdout), or reads stdin
+                streams.add(command)
+        assert {'batch', 'export', 'import', 'session'} <= streams               # The checks above find the known ones
+        assert streams - DAEMON__LOCAL_COMMANDS         == set()
+
+    def test_forward__import_reads_callers_stdin(self):                          # Runs here, not on the daemon's stdin
+        assert CLI__Daemon__Client.forwardable(['import']) is False
+        self.forward('create', 'bug', 'Piped', '--for-agent')
+        _, exported = self.run_entry('export', '--format', 'ndjson')
+
+        exit_code, output = self.run_entry('import', '--overwrite', '--for-agent', stdin = exported)
+        assert exit_code                        == 0
+        assert json.loads(output)['imported']   == 1
+
+    def test_forward__export_streams_to_callers_stdout(self):                    # Binary, unbuffered: never via the daemon
+        assert CLI__Daemon__Client.forwardable(['export', '-z']) is False
+        self.forward('create', 'bug', 'Zipped', '--for-agent')
+
+        exit_code, output = self.run_entry('export', '-z', '--format', 'ndjson')
+        assert exit_code == 0
+        assert [json.loads(line)['label'] for line in gzip.decompress(output).splitlines()] == ['Bug-1']
+
+    def test_forward__no_daemon(self):                                           # Falls back to in-process
+        os.environ[DAEMON__ENV_SOCKET] = os.path.join(self.temp_dir, 'missing.sock')
+        assert CLI__Daemon__Client.forward(['list']) is None
+
+    def test_forward__untrusted_socket(self):                                    # Shared or foreign folder: never forwarded
+        assert CLI__Daemon__Client.trusted(self.socket_path) is True
+        folder = os.path.dirname(self.socket_path)
+        os.chmod(folder, 0o755)                                                  # Others may plant a socket in it
+        assert CLI__Daemon__Client.trusted(self.socket_path) is False
+        assert CLI__Daemon__Client.forward(['list'])         is None
+        os.chmod(folder, 0o700)
+
+        link = os.path.join(self.temp_dir, 'link')                               # Symlinked folder
+        os.symlink(folder, link)
+        assert CLI__Daemon__Client.trusted(os.path.join(link, 'd.sock')) is False
+        with self.assertRaises(RuntimeError):
+            CLI__Daemon(socket_path = os.path.join(link, 'other.sock')).start()
+
+        not_a_socket = os.path.join(folder, 'plain')
+        open(not_a_socket, 'w').close()
+        assert CLI__Daemon__Client.trusted(not_a_socket) is False
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Tests for the daemon
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test_start__socket_is_private(self):                                     # Owner-only socket
+        assert self.daemon.is_running() is True
+        assert os.stat(self.socket_path).st_mode & 0o777 == 0o600
+        with self.assertRaises(RuntimeError):                                    # Second daemon refuses to start
+            CLI__Daemon(socket_path = self.socket_path).start()
+
+    def test_forward__round_trip(self):                                          # Commands run in the daemon
+        exit_code, output = self.forward('create', 'bug', 'Warm bug', '--for-agent')
+        assert exit_code                             == 0
+        assert json.loads(output)['node']['label']   == 'Bug-1'
+
+        exit_code, output = self.forward('show', 'Bug-99', '--for-agent')
+        assert exit_code                             == 1
+        assert json.loads(output)['success']         is False
+        assert self.daemon.requests                  == 2
+
+    def test_forward__reuses_warm_context(self):                                 # One context per root, index in memory
+        self.forward('create', 'task', 'First', '--for-agent')
+        warm = WARM_CONTEXTS[self.issues_dir]
+        assert warm.index.loaded is True
+
+        context = CLI__Context()                                                 # Same process as the daemon here
+        assert context.repository   is warm.repository
+        assert context.node_service is warm.node_service
+        assert context.index        is warm.index
+
+    def test_forward__sees_edits_made_outside(self):                             # Index refreshed on every request
+        self.forward('list', '--for-agent')                                      # Warm the context first
+        repository = Graph__Repository__Factory.create_local_disk(root_path = self.issues_dir)
+        request    = Schema__Node__Create__Request(node_type = Safe_Str__Node_Type('bug'), title = 'Outside')
+        Node__Service(repository = repository).create_node(request)
+
+        exit_code, output = self.forward('list', '--for-agent')
+        assert exit_code == 0
+        assert [n['label'] for n in json.loads(output)['nodes']] == ['Bug-1']
+
+    def test_forward__reuses_warm_search_index(self):                           # Loaded once, kept current by edits
+        self.forward('create', 'bug', 'Login timeout', '--for-agent')
+        self.forward('search', 'login', '--for-agent')
+        search_index = WARM_CONTEXTS[self.issues_dir].search_index
+        assert search_index is not None
+
+        self.forward('create', 'bug', 'Login page broken', '--for-agent')        # Written through index_updated
+        exit_code, output = self.forward('search', 'login', '--output', 'json')
+        assert exit_code                                   == 0
+        assert WARM_CONTEXTS[self.issues_dir].search_index is search_index
+        assert 'Bug-2' in output
+
+    def test_forward__reopens_after_pack(self):                                  # Packed outside: warm context replaced
+        self.forward('create', 'bug', 'Packed', '--for-agent')
+        warm = WARM_CONTEXTS[self.issues_dir]
+        CLI__Pack__Storage.pack_repository(self.issues_dir)
+
+        exit_code, output = self.forward('show', 'Bug-1', '--output', 'json')
+        assert exit_code                        == 0
+        assert json.loads(output)['title']      == 'Packed'
+        assert WARM_CONTEXTS[self.issues_dir]   is not warm
+        assert isinstance(WARM_CONTEXTS[self.issues_dir].repository.storage_fs, CLI__Pack__Storage)
+
+    def test_stop__removes_socket(self):                                         # Clean shutdown
+        self.daemon.server.shutdown()
+        self.daemon.stop()
+        assert os.path.exists(self.socket_path) is False
+        self.daemon = CLI__Daemon(socket_path = self.socket_path).start()        # Restart for tearDown
+        self.thread = threading.Thread(target = self.daemon.server.serve_forever, daemon = True)
+        self.thread.start()
@@ -0,0 +1,80 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Test CLI__Dependencies - Dependency DAG, topological order, critical paths
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import random
+
+from unittest                                                                   import TestCase
+
+from issues_fs_cli.cli.CLI__Dependencies                                        import CLI__Dependencies
+from issues_fs_cli.cli.CLI__Index                                               import CLI__Index
+
+INVERSE = {'blocks': 'blocked-by', 'depends-on': 'dependency-of', 'relates-to': 'relates-to'}
+
+
+def dependencies(links: list, done: tuple = (), **kwargs) -> CLI__Dependencies:  # Links stored both ways, as Link__Service does
+    index          = CLI__Index()
+    index.by_label = {}
+    for source, verb, target in links:
+        for label in (source, target):
+            index.by_label.setdefault(label, {'label': label, 'status': 'done' if label in done else 'todo', 'links': []})
+        index.by_label[source]['links'].append([verb         , target])
+        index.by_label[target]['links'].append([INVERSE[verb], source])
+    return CLI__Dependencies(index = index, **kwargs)
+
+
+class test_CLI__Dependencies(TestCase):
+
+    def test_build(self):                                                        # Both verbs and inverses → one edge each
+        deps = dependencies([('A', 'blocks', 'B'), ('C', 'depends-on', 'B'), ('C', 'relates-to', 'A')]).build()
+
+        assert deps.prerequisites == {'A': {}, 'B': {'A': True}, 'C': {'B': True}}
+        assert deps.dependents    == {'A': {'B': True}, 'B': {'C': True}, 'C': {}}
+
+    def test_critical_path(self):                                                # Longest branch wins, blocking set in order
+        deps   = dependencies([('A', 'blocks', 'B'), ('B', 'blocks', 'D'), ('C', 'blocks', 'D'),
+                               ('X', 'blocks', 'A'), ('D', 'blocks', 'E')])
+        result = deps.critical_path('D')
+
+        assert result['chain']    == ['X', 'A', 'B', 'D']
+        assert result['blocking'] == ['C', 'X', 'A', 'B']
+        assert result['cyclic']   == []
+        assert deps.critical_path('A')['chain'] == ['X', 'A']
+        assert deps.critical_path_all()['chain'] == ['X', 'A', 'B', 'D', 'E']
+
+    def test_critical_path__done_nodes(self):                                    # Finished prerequisites no longer block
+        links = [('A', 'blocks', 'B'), ('B', 'blocks', 'C')]
+        assert dependencies(links, done = ('A',)).critical_path('C')['chain']                       == ['B', 'C']
+        assert dependencies(links, done = ('A',), include_done = True).critical_path('C')['chain'] == ['A', 'B', 'C']
+        assert dependencies(links, done = ('C',)).contains('C')                                    is False
+
+    def test_critical_path__memoised(self):                                      # Repeated queries do no graph work
+        deps  = dependencies([('A', 'blocks', 'B'), ('B', 'blocks', 'C')])
+        first = deps.critical_path('C')
+        deps.ancestors = None                                                    # Would fail if called again
+
+        assert deps.critical_path('C') is first
+        assert deps.chain('B')         == ['A', 'B']                             # Sub-chains came for free
+
+    def test_cycles(self):                                                       # Cycle members and their dependents skipped
+        deps          = dependencies([('X', 'blocks', 'Y'), ('Y', 'blocks', 'X'), ('Y', 'blocks', 'Z'), ('A', 'blocks', 'B')])
+        order, cyclic = deps.topological_order()
+
+        assert order                       == ['A', 'B']
+        assert cyclic                      == ['X', 'Y', 'Z']
+        assert deps.critical_path('Z')     == {'target': 'Z', 'chain': [], 'blocking': [], 'cyclic': ['X', 'Y', 'Z']}
+        assert deps.critical_path_all()['chain'] == ['A', 'B']
+
+    def test_critical_path_all__random_dags(self):                               # Same length as brute force DP
+        rng = random.Random(3)
+        for _ in range(20):
+            labels = [f'N{i}' for i in range(30)]
+            links  = [(labels[a], 'blocks', labels[b]) for a in range(30) for b in range(a + 1, 30) if rng.random() < 0.08]
+            deps   = dependencies(links)
+            longest = {}
+            for b in range(30):                                                  # labels are already in topological order
+                longest[labels[b]] = 1 + max([longest[s] for s, _, t in links if t == labels[b]] or [0])
+            chain = deps.critical_path_all()['chain']
+            assert len(chain) == max(longest[l] for l in deps.prerequisites)
+            for prerequisite, dependent in zip(chain, chain[1:]):
+                assert prerequisite in deps.prerequisites[dependent]
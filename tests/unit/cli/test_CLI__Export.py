@@ -0,0 +1,109 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Test CLI__Export - Streaming export of nodes, links and comments
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import gzip
+import io
+import json
+import os
+import shutil
+import tempfile
+
+from unittest                                                                   import TestCase
+from typer.testing                                                              import CliRunner
+
+from issues_fs_cli.cli.CLI__Export                                              import CLI__Export
+from issues_fs_cli.cli.CLI__Index                                               import CLI__Index
+from issues_fs_cli.cli.CLI__Node__Filter                                        import CLI__Node__Filter
+from issues_fs_cli.cli.cli__main                                                import app
+from issues_fs.issues.graph_services.Comments__Service                          import Comments__Service
+from issues_fs.issues.graph_services.Graph__Repository__Factory                 import Graph__Repository__Factory
+from issues_fs.issues.graph_services.Link__Service                              import Link__Service
+from issues_fs.issues.graph_services.Node__Service                              import Node__Service
+from issues_fs.issues.graph_services.Type__Service                              import Type__Service
+from issues_fs.schemas.graph.Schema__Link__Create__Request                      import Schema__Link__Create__Request
+from issues_fs.schemas.graph.Schema__Node__Create__Request                      import Schema__Node__Create__Request
+from issues_fs.schemas.graph.Safe_Str__Graph_Types                              import Safe_Str__Node_Type, Safe_Str__Node_Label
+from issues_fs.schemas.issues.Schema__Comment                                   import Schema__Comment__Create__Request
+
+
+class test_CLI__Export(TestCase):
+
+    def setUp(self):                                                             # Two bugs and a task, linked, one comment
+        self.temp_dir   = tempfile.mkdtemp()
+        self.issues_dir = os.path.join(self.temp_dir, '.issues')
+        os.makedirs(self.issues_dir)
+        self.repository = Graph__Repository__Factory.create_local_disk(root_path = self.issues_dir)
+        Type__Service(repository = self.repository).initialize_default_types()
+        service         = Node__Service(repository = self.repository)
+        for node_type, title in [('bug', 'First bug'), ('bug', 'Second bug'), ('task', 'A task')]:
+            service.create_node(Schema__Node__Create__Request(node_type = Safe_Str__Node_Type(node_type), title = title))
+        Link__Service(repository = self.repository).create_link(Safe_Str__Node_Type('bug'), Safe_Str__Node_Label('Bug-1'),
+                                                                Schema__Link__Create__Request(verb = 'blocks', target_label = 'Task-1'))
+        Comments__Service(repository = self.repository).create_comment(
+            node_type = Safe_Str__Node_Type('bug'), label = Safe_Str__Node_Label('Bug-2'),
+            request   = Schema__Comment__Create__Request(author = 'dinis', text = 'Seen on staging'))
+        self.exporter   = CLI__Export(repository = self.repository                                 ,
+                                      index      = CLI__Index(repository = self.repository).refresh())
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def export(self, format: str, node_filter: CLI__Node__Filter = None) -> str:
+        out = io.StringIO()
+        self.exporter.export(out, format, node_filter)
+        return out.getvalue()
+
+    def test_export__json(self):                                                 # Nodes as stored, links and comments included
+        data = json.loads(self.export('json'))
+
+        assert data['total']                                         == 3
+        assert [n['label'] for n in data['nodes']]                   == ['Bug-1', 'Bug-2', 'Task-1']
+        assert data['nodes'][0]['links'][0]['target_label']          == 'Task-1'
+        assert data['nodes'][1]['properties']['comments'][0]['text'] == 'Seen on staging'
+        assert data['nodes'][2]['links'][0]['verb']                  == 'blocked-by'
+        assert json.loads(self.export('json', CLI__Node__Filter(node_type = 'task'))) == {'nodes': [data['nodes'][2]], 'total': 1}
+
+    def test_export__ndjson(self):
+        lines = self.export('ndjson').splitlines()
+        assert [json.loads(line)['label'] for line in lines] == ['Bug-1', 'Bug-2', 'Task-1']
+        assert self.export('ndjson', CLI__Node__Filter(status = 'no-such-status')) == ''
+
+    def test_export__markdown(self):
+        text = self.export('markdown')
+
+        assert text.startswith('# Bug-1: First bug\n')
+        assert text.count('\n---\n')   == 2
+        assert '- **blocks** → Task-1'  in text
+        assert '- **dinis:** Seen on staging' in text
+
+    def test_export__unknown_format(self):
+        with self.assertRaises(ValueError):
+            self.export('xml')
+
+    def test_nodes__streamed(self):                                              # One node read per item pulled
+        read  = []
+        nodes = self.exporter.nodes()
+        self.exporter.read_node = lambda entry: read.append(entry['label']) or {'label': entry['label']}
+
+        assert next(nodes) == {'label': 'Bug-1'}
+        assert read        == ['Bug-1']
+
+    def test_cli__export(self):                                                  # File output, gzip and --query
+        cwd = os.getcwd()
+        os.chdir(self.temp_dir)
+        try:
+            runner = CliRunner()
+            result = runner.invoke(app, ['export', '-o', 'backup.ndjson.gz', '--query', 'type:bug AND status:backlog'])
+            assert result.exit_code == 0
+            assert 'Exported 2 nodes to backup.ndjson.gz' in result.stdout
+            with gzip.open('backup.ndjson.gz', 'rt') as f:
+                assert [json.loads(line)['label'] for line in f] == ['Bug-1', 'Bug-2']
+
+            result = runner.invoke(app, ['export', '--type', 'task', '--format', 'markdown'])
+            assert result.stdout.startswith('# Task-1: A task')
+
+            result = runner.invoke(app, ['export', '--query', 'owner:me'])
+            assert result.exit_code == 1
+        finally:
+            os.chdir(cwd)
@@ -0,0 +1,123 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Test CLI__Fast_Path - argv dispatcher for --for-agent calls, parity with typer
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import contextlib
+import importlib
+import inspect
+import io
+import os
+import re
+import shutil
+import tempfile
+
+from unittest                                                                   import TestCase
+from typer.testing                                                              import CliRunner
+
+from issues_fs_cli.cli.CLI__Commands                                            import CLI__Commands
+from issues_fs_cli.cli.CLI__Fast_Path                                           import CLI__Fast_Path, FAST_PATH__COMMANDS
+from issues_fs_cli.cli.cli__main                                                import app, LAZY_COMMANDS
+from issues_fs.issues.graph_services.Graph__Repository__Factory                 import Graph__Repository__Factory
+from issues_fs.issues.graph_services.Type__Service                              import Type__Service
+
+TYPER_ONLY = {'for_agent', 'repos', 'watch'}                                     # Never taken by the fast path
+
+PARITY_CALLS = [['create' , 'bug' , 'Crash on save', '-p', 'P1', '--tags', 'ui, api', '--for-agent'],
+                ['create' , 'task', 'Fix it', '--for-agent', '--description=Soon', '-s', 'todo'    ],
+                ['create' , 'no such type!', 'X', '--for-agent'                                      ],
+                ['link'   , 'Bug-1', 'blocks', 'Task-1', '--for-agent'                              ],
+                ['link'   , 'Bug-1', 'BLOCKS', 'Task-9', '--for-agent'                              ],
+                ['link'   , 'nolabel', 'blocks', 'Task-1', '--for-agent'                            ],
+                ['comment', 'Bug-1', 'Seen on v0.3', '-a', 'qa', '--for-agent'                      ],
+                ['comment', 'Bug-9', 'Missing', '--for-agent'                                        ],
+                ['comments', 'Bug-1', '--for-agent'                                                  ],
+                ['comments', 'Bug-9', '--for-agent'                                                  ],
+                ['update' , 'Bug-1', '--status', 'confirmed', '-T', 'Crash on save (all files)', '--for-agent'],
+                ['update' , 'Task-1', '-t', 'x,y', '-p', 'P2', '--for-agent'                       ],
+                ['update' , 'Bug-7', '-s', 'done', '--for-agent'                                     ],
+                ['show'   , 'Bug-1', '--for-agent'                                                   ],
+                ['show'   , 'Task-1', '--for-agent', '--depth', '2'                                  ],
+                ['show'   , 'Bug-42', '--for-agent'                                                  ],
+                ['show'   , 'Bug1', '--for-agent'                                                    ],
+                ['list'   , '--for-agent'                                                            ],
+                ['list'   , '--for-agent', '-t', 'bug', '--status', 'confirmed', '-p', 'P1'         ],
+                ['list'   , '--for-agent', '--tags', 'y', '-o', 'ndjson'                             ],
+                ['list'   , '--for-agent', '--type', 'Bad Type!'                                     ],
+                ['list'   , '--for-agent', '--sort', '-priority,title', '-n', '1'                   ],
+                ['list'   , '--for-agent', '--sort', 'title', '--offset', '1', '-o', 'ndjson'       ],
+                ['list'   , '--for-agent', '--sort', 'body'                                          ],
+                ['list'   , '--for-agent', '--cursor', 'nope'                                        ],
+                ['list'   , '--for-agent', '--fields', 'label,priority,tags,links'                   ],
+                ['list'   , '--for-agent', '--fields', 'title', '--sort', 'title', '-n', '1'        ],
+                ['list'   , '--for-agent', '--fields', 'type,status', '-o', 'ndjson'                 ],
+                ['list'   , '--for-agent', '--fields', 'body'                                        ]]
+
+
+def normalise(output: str) -> str:                                               # Ids and timestamps differ per repo
+    output = re.sub(r'"[0-9a-f]{8}"', '"<id>"'  , output)
+    return   re.sub(r'\b\d{13}\b'    , '<time>'  , output)
+
+
+class test_CLI__Fast_Path(TestCase):
+
+    def setUp(self):
+        self.temp_dir     = tempfile.mkdtemp()
+        self.original_cwd = os.getcwd()
+        for name in ('typer', 'fast'):                                           # Two identical repositories
+            issues_dir = os.path.join(self.temp_dir, name, '.issues')
+            os.makedirs(issues_dir)
+            Type__Service(repository = Graph__Repository__Factory.create_local_disk(root_path = issues_dir)).initialize_default_types()
+
+    def tearDown(self):
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.temp_dir)
+
+    def run_typer(self, argv: list) -> tuple:
+        os.chdir(os.path.join(self.temp_dir, 'typer'))
+        result = CliRunner().invoke(app, argv)
+        return result.exit_code, result.stdout
+
+    def run_fast(self, argv: list) -> tuple:
+        os.chdir(os.path.join(self.temp_dir, 'fast'))
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            exit_code = CLI__Fast_Path.run(argv)
+        assert exit_code is not None, f'not taken by the fast path: {argv}'
+        return exit_code, stdout.getvalue()
+
+    def test_parity(self):                                                       # Same exit code and output as typer
+        for argv in PARITY_CALLS:
+            typer_code, typer_output = self.run_typer(argv)
+            fast_code , fast_output  = self.run_fast (argv)
+            assert (fast_code, normalise(fast_output)) == (typer_code, normalise(typer_output)), argv
+            assert fast_output != ''
+
+    def test_options_match_typer(self):                                          # Tables follow the typer signatures
+        for command, (positionals, options) in FAST_PATH__COMMANDS.items():
+            module, name, _ = LAZY_COMMANDS[command]
+            typer_params    = inspect.signature(getattr(importlib.import_module(module), name)).parameters
+            handler_params  = inspect.signature(getattr(CLI__Commands, command)).parameters
+            arguments       = [n for n, p in typer_params.items() if type(p.default).__name__ == 'ArgumentInfo']
+            typer_options   = {n: p.default for n, p in typer_params.items() if n not in arguments and n not in TYPER_ONLY}
+
+            assert tuple(arguments) == positionals, command
+            assert {name: flags for flags, name, _ in options} == {n: o.param_decls for n, o in typer_options.items()}, command
+            for option_name, option in typer_options.items():
+                assert handler_params[option_name].default == option.default, (command, option_name)
+
+    def test_parse__falls_back_to_typer(self):                                   # Anything unusual: None
+        assert CLI__Fast_Path.parse(['show', 'Bug-1', '--depth', '2', '--for-agent']) == ('show', {'label': 'Bug-1', 'depth': 2})
+        assert CLI__Fast_Path.parse(['list', '-s', 'a', '--status=b', '--for-agent']) == ('list', {'status': 'b'})
+        for argv in (['show', 'Bug-1'],                                          # Not an agent call
+                     ['show', 'Bug-1', '--for-agent', '--help'],
+                     ['show', 'Bug-1', '--for-agent', '--watch'],
+                     ['list', '--for-agent', '--repos', '*'],
+                     ['list', '--for-agent', '--jobs', '0'],
+                     ['show', 'Bug-1', '--for-agent', '--depth', 'two'],
+                     ['show', '--for-agent'],
+                     ['link', 'Bug-1', 'blocks', '--for-agent'],
+                     ['comment', 'Bug-1', '--', '-1 from me', '--for-agent'],
+                     ['create', 'bug', 'T', '--for-agent', '-p'],
+                     ['delete', 'Bug-1', '--for-agent'],
+                     ['--profile', 'list', '--for-agent']):
+            assert CLI__Fast_Path.parse(argv) is None, argv
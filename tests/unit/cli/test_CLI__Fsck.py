@@ -0,0 +1,148 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Test CLI__Fsck - Node file validation, link and index cross-checks, repair
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import json
+import os
+import shutil
+import tempfile
+
+from unittest                                                                   import TestCase
+from unittest.mock                                                              import patch
+from typer.testing                                                              import CliRunner
+
+from issues_fs_cli.cli                                                          import CLI__Fsck as fsck_module
+from issues_fs_cli.cli.CLI__Fsck                                                import CLI__Fsck
+from issues_fs_cli.cli.CLI__Index                                               import CLI__Index
+from issues_fs_cli.cli.cli__main                                                import app
+from issues_fs.issues.graph_services.Graph__Repository__Factory                 import Graph__Repository__Factory
+from issues_fs.issues.graph_services.Link__Service                              import Link__Service
+from issues_fs.issues.graph_services.Node__Service                              import Node__Service
+from issues_fs.issues.graph_services.Type__Service                              import Type__Service
+from issues_fs.schemas.graph.Schema__Link__Create__Request                      import Schema__Link__Create__Request
+from issues_fs.schemas.graph.Schema__Node__Create__Request                      import Schema__Node__Create__Request
+from issues_fs.schemas.graph.Safe_Str__Graph_Types                              import Safe_Str__Node_Type, Safe_Str__Node_Label
+
+
+class test_CLI__Fsck(TestCase):
+
+    def setUp(self):                                                             # Two bugs, a task, Bug-2 blocks Task-1
+        self.temp_dir   = tempfile.mkdtemp()
+        self.issues_dir = os.path.join(self.temp_dir, '.issues')
+        os.makedirs(self.issues_dir)
+        self.repository = Graph__Repository__Factory.create_local_disk(root_path = self.issues_dir)
+        Type__Service(repository = self.repository).initialize_default_types()
+        service         = Node__Service(repository = self.repository)
+        for node_type, title in [('bug', 'First bug'), ('bug', 'Second bug'), ('task', 'A task')]:
+            service.create_node(Schema__Node__Create__Request(node_type = Safe_Str__Node_Type(node_type), title = title))
+        Link__Service(repository = self.repository).create_link(Safe_Str__Node_Type('bug'), Safe_Str__Node_Label('Bug-2'),
+                                                                Schema__Link__Create__Request(verb = 'blocks', target_label = 'Task-1'))
+        CLI__Index(repository = self.repository).refresh()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def fsck(self, **kwargs) -> CLI__Fsck:
+        checker = CLI__Fsck(repository = self.repository, index = CLI__Index(repository = self.repository), **kwargs)
+        checker.run()
+        return checker
+
+    def edit_json(self, path: str, **changes) -> None:                           # Rewrite a file under .issues/
+        full_path = os.path.join(self.issues_dir, path)
+        with open(full_path) as f:
+            data = json.load(f)
+        data.update(changes)
+        with open(full_path, 'w') as f:
+            json.dump(data, f)
+
+    def test_run__clean(self):
+        checker = self.fsck()
+        assert checker.problems == []
+        assert checker.stats()  == {'files': 3, 'nodes': 3, 'problems': 0, 'repaired': []}
+
+    def test_run__problems(self):                                                # One of each check
+        self.edit_json('data/bug/_index.json', count = 7, next_index = 2)
+        self.edit_json('data/bug/Bug-1/issue.json', links = [{'verb': 'blocks', 'target_label': 'Task-9'}])
+        self.edit_json('data/task/Task-1/issue.json', links = [])
+        os.makedirs(os.path.join(self.issues_dir, 'data/task/Task-2'))
+        with open(os.path.join(self.issues_dir, 'data/task/Task-2/issue.json'), 'w') as f:
+            f.write('{"label": "Task-1"')
+
+        problems = [(p['check'], p['path'], p['message']) for p in self.fsck().problems]
+        assert problems == [('node-file'     , 'data/task/Task-2/issue.json', "Invalid JSON: Expecting ',' delimiter: line 1 column 19 (char 18)"),
+                            ('dangling-link' , 'data/bug/Bug-1/issue.json'  , 'Bug-1 blocks Task-9: no such node'                               ),
+                            ('one-sided-link', 'data/bug/Bug-2/issue.json'  , 'Bug-2 blocks Task-1, but Task-1 has no blocked-by Bug-2'         ),
+                            ('type-index'    , 'data/bug/_index.json'       , 'count is 7, 2 nodes found'                                       ),
+                            ('type-index'    , 'data/bug/_index.json'       , 'next_index is 2, must be at least 3'                             )]
+
+    def test_run__labels(self):                                                  # Duplicates and label/folder/index mismatches
+        shutil.copytree(os.path.join(self.issues_dir, 'data/bug/Bug-1'), os.path.join(self.issues_dir, 'data/bug/Bug-7'))
+        self.edit_json('data/task/Task-1/issue.json', node_index = 4)
+
+        problems = [(p['check'], p['label'], p['message']) for p in self.fsck().problems]
+        assert ('node-file'      , 'Bug-1' , "Label 'Bug-1' does not match folder 'Bug-7'")                          in problems
+        assert ('duplicate-label', 'Bug-1' , 'Bug-1 is in 2 files: data/bug/Bug-1/issue.json, data/bug/Bug-7/issue.json') in problems
+        assert ('node-file'      , 'Task-1', 'Label Task-1 does not match node_index 4')                             in problems
+
+    def test_run__stale_label_index(self):                                       # Content changed, (mtime, size) did not
+        path  = os.path.join(self.issues_dir, 'data/bug/Bug-1/issue.json')
+        stat  = os.stat(path)
+        with open(path) as f:
+            content = f.read()
+        with open(path, 'w') as f:
+            f.write(content.replace('First bug', 'Fixed bug'))
+        os.utime(path, ns = (stat.st_atime_ns, stat.st_mtime_ns))
+
+        checker = self.fsck()
+        assert [(p['check'], p['path']) for p in checker.problems] == [('label-index', 'data/bug/Bug-1/issue.json')]
+
+        assert checker.repair() == {'files': 3, 'nodes': 3, 'problems': 0, 'repaired': ['label-index']}
+        assert CLI__Index(repository = self.repository).refresh().entry('Bug-1')['title'] == 'Fixed bug'
+
+    def test_repair(self):                                                       # Indexes regenerated, next_index never lowered
+        self.edit_json('data/bug/_index.json' , count = 7, next_index = 9)
+        self.edit_json('data/task/_index.json', count = 0, next_index = 1)
+        with open(os.path.join(self.issues_dir, '_index.json'), 'w') as f:
+            f.write('not json')
+
+        checker = self.fsck()
+        assert {p['check'] for p in checker.problems} == {'type-index', 'global-index'}
+        assert checker.repair()['repaired']            == ['global-index', 'type-index']
+        assert checker.problems                        == []
+
+        assert (int(self.repository.type_index_load('bug' ).count), int(self.repository.type_index_load('bug' ).next_index)) == (2, 9)
+        assert (int(self.repository.type_index_load('task').count), int(self.repository.type_index_load('task').next_index)) == (1, 2)
+        assert int(self.repository.global_index_load().total_nodes) == 3
+        assert self.fsck().problems                                 == []
+
+    def test_validate__process_pool(self):                                       # Same results as in-process
+        expected = self.fsck(jobs = 1).nodes
+        with patch.object(fsck_module, 'FSCK__PARALLEL_MIN', 0), patch.object(fsck_module, 'FSCK__CHUNK_SIZE', 1):
+            checker = self.fsck(jobs = 2)
+        assert checker.nodes    == expected
+        assert checker.problems == []
+
+    def test_tasks(self):                                                        # Grouped by type, big groups chunked
+        paths = [f'data/bug/Bug-{i}/issue.json' for i in range(5)] + ['data/task/Task-1/issue.json', 'notes.issues']
+        with patch.object(fsck_module, 'FSCK__CHUNK_SIZE', 3):
+            assert CLI__Fsck.tasks(paths) == [paths[0:3], paths[3:5], paths[5:6], paths[6:7]]
+
+    def test_cli__fsck(self):                                                    # Exit 1 until repaired
+        self.edit_json('data/bug/_index.json', count = 7)
+        cwd = os.getcwd()
+        os.chdir(self.temp_dir)
+        try:
+            runner = CliRunner()
+            result = runner.invoke(app, ['fsck'])
+            assert result.exit_code == 1
+            assert 'count is 7, 2 nodes found' in result.stdout
+
+            result = runner.invoke(app, ['fsck', '--repair', '--for-agent'])
+            assert result.exit_code == 0
+            assert json.loads(result.stdout)['repaired'] == ['type-index']
+
+            result = runner.invoke(app, ['fsck'])
+            assert result.exit_code == 0
+            assert 'No problems (3 files, 3 nodes checked)' in result.stdout
+        finally:
+            os.chdir(cwd)
@@ -0,0 +1,75 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Test CLI__Git - HEAD, dirty paths and commit diffs under .issues/
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import os
+import shutil
+import subprocess
+import tempfile
+
+from unittest                                                                   import TestCase, skipUnless
+from unittest.mock                                                              import patch
+
+from issues_fs_cli.cli.CLI__Git                                                 import CLI__Git, GIT__ENV_OFF
+
+
+def git(root: str, *args: str) -> str:                                           # Run git in a test work tree
+    env = dict(os.environ, GIT_AUTHOR_NAME='t', GIT_AUTHOR_EMAIL='t@t', GIT_COMMITTER_NAME='t', GIT_COMMITTER_EMAIL='t@t')
+    return subprocess.run(['git', '-C', root, *args], check=True, capture_output=True, env=env).stdout.decode()
+
+
+def write(path: str, content: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(content)
+
+
+@skipUnless(shutil.which('git'), 'git not installed')
+class test_CLI__Git(TestCase):
+
+    def setUp(self):                                                             # Work tree with .issues/ one level down
+        self.temp_dir   = tempfile.mkdtemp()
+        self.issues_dir = os.path.join(self.temp_dir, '.issues')
+        git(self.temp_dir, 'init', '-q')
+        write(os.path.join(self.issues_dir, 'data/bug/Bug-1/issue.json'), '{}')
+        write(os.path.join(self.temp_dir  , 'README.md'), 'outside .issues')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_status(self):                                                       # HEAD + paths under .issues/ only
+        assert CLI__Git.status(self.issues_dir) is None                          # No commit yet
+        git(self.temp_dir, 'add', '-A')
+        git(self.temp_dir, 'commit', '-q', '-m', 'first')
+        head = git(self.temp_dir, 'rev-parse', 'HEAD').strip()
+        assert CLI__Git.status(self.issues_dir) == {'head': head, 'dirty': []}
+
+        write(os.path.join(self.issues_dir, 'data/bug/Bug-1/issue.json'), '{"a": 1}')
+        write(os.path.join(self.issues_dir, 'data/bug/Bug-2/issue.json'), '{}')
+        write(os.path.join(self.issues_dir, '.cache/.gitignore'), '*\n')
+        write(os.path.join(self.temp_dir  , 'README.md'), 'changed')
+        assert CLI__Git.status(self.issues_dir) == {'head' : head,
+                                                    'dirty': ['.cache/.gitignore', 'data/bug/Bug-1/issue.json', 'data/bug/Bug-2/issue.json']}
+
+        with patch.dict(os.environ, {GIT__ENV_OFF: '1'}):
+            assert CLI__Git.status(self.issues_dir) is None
+
+    def test_status__not_a_checkout(self):
+        shutil.rmtree(os.path.join(self.temp_dir, '.git'))
+        assert CLI__Git.top_level(self.issues_dir) is None
+        assert CLI__Git.status   (self.issues_dir) is None
+
+    def test_changed_paths(self):                                                # Relative to .issues/, deletions included
+        git(self.temp_dir, 'add', '-A')
+        git(self.temp_dir, 'commit', '-q', '-m', 'first')
+        first = git(self.temp_dir, 'rev-parse', 'HEAD').strip()
+        os.remove(os.path.join(self.issues_dir, 'data/bug/Bug-1/issue.json'))
+        write(os.path.join(self.issues_dir, 'data/bug/Bug-2/issue.json'), '{}')
+        write(os.path.join(self.temp_dir  , 'README.md'), 'changed')
+        git(self.temp_dir, 'add', '-A')
+        git(self.temp_dir, 'commit', '-q', '-m', 'second')
+        second = git(self.temp_dir, 'rev-parse', 'HEAD').strip()
+
+        assert CLI__Git.changed_paths(self.issues_dir, first, second) == ['data/bug/Bug-1/issue.json', 'data/bug/Bug-2/issue.json']
+        assert CLI__Git.changed_paths(self.issues_dir, second, second) == []
+        assert CLI__Git.changed_paths(self.issues_dir, '0' * 40, second) is None   # Unknown commit: caller walks
@@ -0,0 +1,157 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Test CLI__Graph - Index-backed graph traversal
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import itertools
+import random
+
+from unittest                                                                   import TestCase
+
+from issues_fs_cli.cli.CLI__Graph                                               import CLI__Graph, GRAPH__MAX_DEPTH
+from issues_fs_cli.cli.CLI__Index                                               import CLI__Index
+from issues_fs.issues.graph_services.Graph__Repository__Factory                 import Graph__Repository__Factory
+from issues_fs.issues.graph_services.Link__Service                              import Link__Service
+from issues_fs.issues.graph_services.Node__Service                              import Node__Service
+from issues_fs.issues.graph_services.Type__Service                              import Type__Service
+from issues_fs.schemas.graph.Schema__Link__Create__Request                      import Schema__Link__Create__Request
+from issues_fs.schemas.graph.Schema__Node__Create__Request                      import Schema__Node__Create__Request
+from issues_fs.schemas.graph.Safe_Str__Graph_Types                              import Safe_Str__Node_Type, Safe_Str__Node_Label
+
+
+class test_CLI__Graph(TestCase):
+
+    @classmethod
+    def setUpClass(cls):                                                         # Bug-1 blocks Task-1, Task-2 depends-on Task-1
+        cls.repository   = Graph__Repository__Factory.create_memory()
+        cls.node_service = Node__Service(repository = cls.repository)
+        cls.link_service = Link__Service(repository = cls.repository)
+        Type__Service(repository = cls.repository).initialize_default_types()
+
+        for node_type, title in [('bug', 'Root bug'), ('task', 'First task'), ('task', 'Second task'), ('task', 'Loner')]:
+            cls.node_service.create_node(Schema__Node__Create__Request(node_type = Safe_Str__Node_Type(node_type), title = title))
+
+        cls.link('Bug-1' , 'blocks'    , 'Task-1')
+        cls.link('Task-2', 'depends-on', 'Task-1')
+
+    @classmethod
+    def link(cls, source, verb, target):
+        request  = Schema__Link__Create__Request(verb = verb, target_label = Safe_Str__Node_Label(target))
+        response = cls.link_service.create_link(source_type  = Safe_Str__Node_Type(source.split('-')[0].lower()),
+                                                source_label = Safe_Str__Node_Label(source)                     ,
+                                                request      = request                                          )
+        assert response.success is True
+
+    def graph(self):
+        return CLI__Graph(index = CLI__Index(repository = self.repository).refresh())
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Tests for node_graph
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test_node_graph__same_as_node_service(self):                             # Parity with the scanning traversal
+        for label, node_type in [('Bug-1', 'bug'), ('Task-1', 'task'), ('Task-2', 'task')]:
+            for depth in (0, 1, 2, 3):
+                expected = self.node_service.get_node_graph(node_type = Safe_Str__Node_Type(node_type) ,
+                                                            label     = Safe_Str__Node_Label(label)    ,
+                                                            depth     = depth                          )
+                actual   = self.graph().node_graph(label = label, depth = depth)
+                assert actual.json() == expected.json()
+
+    def test_node_graph__not_found(self):                                        # Missing root
+        response = self.graph().node_graph(label = 'Bug-99', depth = 1)
+        assert response.success is False
+        assert 'Node not found: Bug-99' in str(response.message)
+
+    def test_node_graph__depth_cap(self):                                        # Deeper than the service allows
+        response = self.graph().node_graph(label = 'Bug-1', depth = 50)
+        assert int(response.depth) == GRAPH__MAX_DEPTH
+
+    def test_node_graph__isolated_node(self):                                    # No edges
+        response = self.graph().node_graph(label = 'Task-3', depth = 2)
+        assert [str(n.label) for n in response.nodes] == ['Task-3']
+        assert response.links                         == []
+
+    def test_incoming_links__maintained_on_refresh_nodes(self):                  # Write-through keeps reverse edges current
+        repository   = Graph__Repository__Factory.create_memory()
+        Type__Service(repository = repository).initialize_default_types()
+        node_service = Node__Service(repository = repository)
+        for title in ('A', 'B'):
+            node_service.create_node(Schema__Node__Create__Request(node_type = Safe_Str__Node_Type('task'), title = title))
+
+        index = CLI__Index(repository = repository).refresh()
+        assert index.incoming_links('Task-2') == {}
+
+        Link__Service(repository = repository).create_link(source_type  = Safe_Str__Node_Type('task')    ,
+                                                           source_label = Safe_Str__Node_Label('Task-1') ,
+                                                           request      = Schema__Link__Create__Request(verb = 'blocks', target_label = Safe_Str__Node_Label('Task-2')))
+        index.refresh_nodes([(Safe_Str__Node_Type('task'), Safe_Str__Node_Label('Task-1')),
+                             (Safe_Str__Node_Type('task'), Safe_Str__Node_Label('Task-2'))])
+        assert index.incoming_links('Task-2') == {'Task-1': 'blocks'    }
+        assert index.incoming_links('Task-1') == {'Task-2': 'blocked-by'}
+
+        node_service.delete_node(Safe_Str__Node_Type('task'), Safe_Str__Node_Label('Task-1'))
+        index.refresh_nodes([(Safe_Str__Node_Type('task'), Safe_Str__Node_Label('Task-1'))])
+        assert index.incoming_links('Task-2') == {}
+        assert index.entry('Task-1')          is None
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Tests for paths
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    @staticmethod
+    def paths_graph(edges: list, **kwargs) -> CLI__Graph:                         # Graph over hand-made index entries
+        index          = CLI__Index()
+        index.by_label = {}
+        for source, verb, target in edges:
+            for label in (source, target):
+                index.by_label.setdefault(label, {'label': label, 'links': []})
+            index.by_label[source]['links'].append([verb, target])
+        return CLI__Graph(index = index, **kwargs)
+
+    def test_shortest_path(self):                                                # Follows stored links, both directions
+        graph = self.graph()
+        assert graph.shortest_path('Bug-1', 'Task-2') == (('Bug-1', 'Task-1', 'Task-2'), ('blocks', 'dependency-of'))
+        assert graph.shortest_path('Task-2', 'Bug-1') == (('Task-2', 'Task-1', 'Bug-1'), ('depends-on', 'blocked-by'))
+        assert graph.shortest_path('Bug-1', 'Bug-1')  == (('Bug-1',), ())
+        assert graph.shortest_path('Bug-1', 'Task-3') is None
+        assert graph.shortest_path('Bug-1', 'Task-2', max_hops = 1) is None
+
+    def test_shortest_path__via(self):                                           # Only the given verbs
+        assert self.graph().shortest_path('Bug-1', 'Task-2')                                           is not None
+        assert CLI__Graph(index = self.graph().index, via = ['blocks']).shortest_path('Bug-1', 'Task-2') is None
+        assert CLI__Graph(index = self.graph().index, via = ['blocks']).shortest_path('Bug-1', 'Task-1') is not None
+
+    def test_k_shortest_paths(self):                                             # Ordered by length, simple, no repeats
+        graph = self.paths_graph([('A', 'x', 'B'), ('B', 'x', 'D'), ('A', 'y', 'C'), ('C', 'x', 'D'),
+                                  ('A', 'x', 'D'), ('A', 'z', 'D'), ('C', 'x', 'B')])
+        paths = graph.k_shortest_paths('A', 'D', k = 10)
+        assert paths == [(('A', 'D'), ('x',)), (('A', 'D'), ('z',)),
+                         (('A', 'B', 'D'), ('x', 'x')), (('A', 'C', 'D'), ('y', 'x')),
+                         (('A', 'C', 'B', 'D'), ('y', 'x', 'x'))]
+        assert graph.k_shortest_paths('A', 'D', k = 10, max_hops = 2)[-1] == (('A', 'C', 'D'), ('y', 'x'))
+        assert CLI__Graph.path_json(paths[2]) == {'hops' : 2, 'nodes': ['A', 'B', 'D'],
+                                                  'links': [{'source': 'A', 'verb': 'x', 'target': 'B'},
+                                                            {'source': 'B', 'verb': 'x', 'target': 'D'}]}
+
+    def test_k_shortest_paths__random_graphs(self):                              # Same lengths as brute force enumeration
+        rng = random.Random(7)
+        for _ in range(30):
+            nodes = [f'N{i}' for i in range(7)]
+            edges = {(a, rng.choice('uv'), b) for a, b in itertools.permutations(nodes, 2) if rng.random() < 0.25}
+            graph = self.paths_graph(sorted(edges))
+            graph.index.by_label.update({n: {'label': n, 'links': []} for n in nodes if n not in graph.index.by_label})
+
+            def simple_paths(label, seen):                                       # Every simple path N0 → N6, by hops
+                if label == 'N6':
+                    yield 0
+                    return
+                for verb, target in graph.index.by_label[label]['links']:
+                    if target not in seen:
+                        yield from (hops + 1 for hops in simple_paths(target, seen | {target}))
+
+            expected = sorted(simple_paths('N0', {'N0'}))[:5]
+            actual   = graph.k_shortest_paths('N0', 'N6', k = 5)
+            assert [len(verbs) for _, verbs in actual] == expected
+            assert len(set(actual)) == len(actual)
+            for labels, verbs in actual:
+                assert len(set(labels)) == len(labels)
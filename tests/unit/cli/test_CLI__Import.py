@@ -0,0 +1,142 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Test CLI__Import - Streaming bulk import of exported nodes
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import gzip
+import io
+import json
+import os
+import shutil
+import tempfile
+
+from unittest                                                                   import TestCase
+from typer.testing                                                              import CliRunner
+
+from issues_fs_cli.cli.CLI__Export                                              import CLI__Export
+from issues_fs_cli.cli.CLI__Import                                              import CLI__Import, CLI__Import__Error
+from issues_fs_cli.cli.CLI__Index                                               import CLI__Index
+from issues_fs_cli.cli.cli__main                                                import app
+from issues_fs.issues.graph_services.Graph__Repository__Factory                 import Graph__Repository__Factory
+from issues_fs.issues.graph_services.Link__Service                              import Link__Service
+from issues_fs.issues.graph_services.Node__Service                              import Node__Service
+from issues_fs.issues.graph_services.Type__Service                              import Type__Service
+from issues_fs.schemas.graph.Schema__Link__Create__Request                      import Schema__Link__Create__Request
+from issues_fs.schemas.graph.Schema__Node__Create__Request                      import Schema__Node__Create__Request
+from issues_fs.schemas.graph.Safe_Str__Graph_Types                              import Safe_Str__Node_Type, Safe_Str__Node_Label
+
+
+def new_repository(root: str):                                                   # Empty repository with default types
+    issues_dir = os.path.join(root, '.issues')
+    os.makedirs(issues_dir)
+    repository = Graph__Repository__Factory.create_local_disk(root_path = issues_dir)
+    Type__Service(repository = repository).initialize_default_types()
+    return repository
+
+
+class test_CLI__Import(TestCase):
+
+    def setUp(self):                                                             # Source repo exported to NDJSON
+        self.temp_dir = tempfile.mkdtemp()
+        source        = new_repository(os.path.join(self.temp_dir, 'source'))
+        service       = Node__Service(repository = source)
+        for node_type, title in [('bug', 'First bug'), ('bug', 'Second bug'), ('task', 'A task')]:
+            service.create_node(Schema__Node__Create__Request(node_type = Safe_Str__Node_Type(node_type), title = title))
+        Link__Service(repository = source).create_link(Safe_Str__Node_Type('bug'), Safe_Str__Node_Label('Bug-2'),
+                                                       Schema__Link__Create__Request(verb = 'blocks', target_label = 'Task-1'))
+        exporter      = CLI__Export(repository = source, index = CLI__Index(repository = source).refresh())
+        self.nodes    = list(exporter.nodes())
+        self.target   = new_repository(os.path.join(self.temp_dir, 'target'))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def importer(self, **kwargs) -> CLI__Import:
+        return CLI__Import(repository = self.target                                  ,
+                           index      = CLI__Index(repository = self.target).refresh() ,
+                           **kwargs)
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Tests for read_nodes
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test_read_nodes__formats(self):                                          # Export json, array, NDJSON, tiny chunks
+        nodes    = [{'label': f'Bug-{i}', 'title': 'a "quoted" ] title {'} for i in range(1, 6)]
+        document = '{"nodes":[\n' + ',\n'.join(json.dumps(n) for n in nodes) + '\n],"total":5}\n'
+        for text in (document, json.dumps(nodes, indent=2), ''.join(json.dumps(n) + '\n' for n in nodes)):
+            for chunk_size in (3, 64, 1 << 16):
+                assert list(CLI__Import.read_nodes(io.StringIO(text), chunk_size)) == nodes
+        assert list(CLI__Import.read_nodes(io.StringIO('  \n'))) == []
+        assert list(CLI__Import.read_nodes(io.StringIO('{"nodes": []}'))) == []
+
+    def test_read_nodes__invalid(self):
+        for text in ('{"nodes":[{"label": "Bug-1"}', '[{"label": ', 'nodes'):
+            with self.assertRaises(CLI__Import__Error):
+                list(CLI__Import.read_nodes(io.StringIO(text), 4))
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Tests for run
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test_run(self):                                                          # Labels, links kept; indexes rebuilt once
+        importer = self.importer()
+        assert importer.run(iter(self.nodes)) == {'imported': 3, 'skipped': 0, 'failed': 0, 'dry_run': False}
+
+        service = Node__Service(repository = self.target)
+        assert service.get_node(Safe_Str__Node_Type('bug'), Safe_Str__Node_Label('Bug-2')).json() == self.nodes[1]
+        assert int(self.target.type_index_load('bug').count)      == 2
+        assert int(self.target.global_index_load().total_nodes)   == 3
+        assert importer.index.incoming_links('Task-1')            == {'Bug-2': 'blocks'}
+        assert CLI__Index(repository = self.target).refresh().stats()['nodes'] == 3   # Saved index matches storage
+
+        created = service.create_node(Schema__Node__Create__Request(node_type = Safe_Str__Node_Type('bug'), title = 'After import'))
+        assert str(created.node.label) == 'Bug-3'                               # next_index continues after imported ones
+
+    def test_run__existing_labels(self):                                         # Skipped by default, replaced with overwrite
+        self.importer().run(iter(self.nodes))
+        edited = [dict(self.nodes[0], title = 'Edited')]
+
+        assert self.importer().run(iter(edited))['skipped']                       == 1
+        assert self.importer(overwrite = True).run(iter(edited))['imported']      == 1
+        node = Node__Service(repository = self.target).get_node(Safe_Str__Node_Type('bug'), Safe_Str__Node_Label('Bug-1'))
+        assert str(node.title)                                                    == 'Edited'
+        assert int(self.target.type_index_load('bug').count)                      == 2
+
+    def test_run__dry_run_and_errors(self):                                      # Bad nodes reported, nothing written
+        bad      = [dict(self.nodes[0], node_type = 'epic-x')                      ,
+                    dict(self.nodes[0], label     = 'Task-9')                      ,
+                    dict(self.nodes[0], title     = '  ')                          ,
+                    'not a node'                                                   ,
+                    self.nodes[0]                                                  ]
+        importer = self.importer(dry_run = True)
+        stats    = importer.run(iter(self.nodes + bad))
+
+        assert stats == {'imported': 3, 'skipped': 0, 'failed': 5, 'dry_run': True}
+        assert [position for position, _, _ in importer.errors] == [4, 5, 6, 7, 8]
+        assert importer.errors[4][2]                            == 'Duplicate label in input: Bug-1'
+        assert os.path.exists(os.path.join(str(self.target.storage_fs.root_path), 'data', 'bug')) is False
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Tests for the import command
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test_cli__import(self):                                                  # Gzipped export file, then stdin
+        path = os.path.join(self.temp_dir, 'backup.ndjson.gz')
+        with gzip.open(path, 'wt') as f:
+            CLI__Export.write_ndjson(f.write, iter(self.nodes))
+
+        cwd = os.getcwd()
+        os.chdir(os.path.join(self.temp_dir, 'target'))
+        try:
+            runner = CliRunner()
+            result = runner.invoke(app, ['import', path, '--dry-run'])
+            assert result.exit_code == 0
+            assert 'Would import 3 nodes' in result.stdout
+
+            result = runner.invoke(app, ['import', path, '--for-agent'])
+            assert json.loads(result.stdout)['imported'] == 3
+
+            result = runner.invoke(app, ['import'], input = '{"nodes": [{"label": "Bug-1"}, {"label": "Bug-9", "node_type": "bug", "title": "New"}]}')
+            assert result.exit_code == 1                                         # Bug-1 exists; the invalid copy is reported
+            assert 'Imported 1 nodes (0 existing skipped, 1 failed)' in result.stdout
+        finally:
+            os.chdir(cwd)
@@ -0,0 +1,293 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Test CLI__Index - Persistent label/summary index
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+
+from unittest                                                                   import TestCase, skipUnless
+
+from issues_fs_cli.cli.CLI__Index                                               import CLI__Index, INDEX__PATH, INDEX__GITIGNORE, INDEX__PARALLEL_MIN
+from issues_fs_cli.cli.CLI__Node__Filter                                        import CLI__Node__Filter
+from issues_fs_cli.cli.CLI__Node__Sort                                          import CLI__Node__Sort
+from issues_fs.issues.graph_services.Graph__Repository__Factory                 import Graph__Repository__Factory
+from issues_fs.issues.graph_services.Node__Service                              import Node__Service
+from issues_fs.issues.graph_services.Type__Service                              import Type__Service
+from issues_fs.schemas.graph.Schema__Node__Create__Request                      import Schema__Node__Create__Request
+from issues_fs.schemas.graph.Schema__Node__Update__Request                      import Schema__Node__Update__Request
+from issues_fs.schemas.graph.Safe_Str__Graph_Types                              import Safe_Str__Node_Type, Safe_Str__Node_Label
+
+
+class test_CLI__Index(TestCase):
+
+    def setUp(self):                                                             # Fresh local-disk repository per test
+        self.temp_dir   = tempfile.mkdtemp()
+        self.issues_dir = os.path.join(self.temp_dir, '.issues')
+        os.makedirs(self.issues_dir)
+        self.repository   = Graph__Repository__Factory.create_local_disk(root_path = self.issues_dir)
+        self.node_service = Node__Service(repository = self.repository)
+        Type__Service(repository = self.repository).initialize_default_types()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def create(self, node_type, title, **kwargs):                                # Create node via the service layer
+        request = Schema__Node__Create__Request(node_type = Safe_Str__Node_Type(node_type), title = title, **kwargs)
+        return self.node_service.create_node(request).node
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Tests for git-aware refresh
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def git(self, *args: str) -> str:                                            # Run git in the test work tree
+        env = dict(os.environ, GIT_AUTHOR_NAME='t', GIT_AUTHOR_EMAIL='t@t', GIT_COMMITTER_NAME='t', GIT_COMMITTER_EMAIL='t@t')
+        return subprocess.run(['git', '-C', self.temp_dir, *args], check=True, capture_output=True, env=env).stdout.decode()
+
+    def git_index(self) -> tuple:                                                # Fresh index that records the files it reads
+        index    = CLI__Index(repository = self.repository)
+        read     = []
+        original = index.read_nodes
+        index.read_nodes        = lambda path: read.append(path) or original(path)
+        index.scan_fingerprints = lambda: self.fail('full walk')                 # Only used when git cannot answer
+        return index, read
+
+    @skipUnless(shutil.which('git'), 'git not installed')
+    def test_refresh__git_changes_only(self):                                    # Commits + dirty files, no walk
+        for title in ('Bug one', 'Bug two', 'Bug three'):
+            self.create('bug', title)
+        self.git('init', '-q')
+        self.git('add', '-A')
+        self.git('commit', '-q', '-m', 'nodes')
+        index = CLI__Index(repository = self.repository).refresh()               # Full walk, records HEAD
+        assert index.git == {'head': self.git('rev-parse', 'HEAD').strip(), 'dirty': []}
+
+        self.node_service.update_node(node_type = Safe_Str__Node_Type('bug')    ,   # "Pulled": committed elsewhere
+                                      label     = Safe_Str__Node_Label('Bug-2') ,
+                                      request   = Schema__Node__Update__Request(status = 'confirmed'))
+        shutil.rmtree(os.path.join(self.issues_dir, 'data', 'bug', 'Bug-3'))
+        self.git('add', '-A')
+        self.git('commit', '-q', '-m', 'pull')
+        self.create('task', 'Local task')                                        # Untracked
+
+        index, read = self.git_index()
+        index.refresh()
+        assert sorted(read) == ['data/bug/Bug-2/issue.json', 'data/task/Task-1/issue.json']
+        assert {e['label']: e['status'] for e in index.entries()}['Bug-2'] == 'confirmed'
+        assert [e['label'] for e in index.entries()] == ['Bug-1', 'Bug-2', 'Task-1']
+        assert index.list_nodes().json() == self.node_service.list_nodes().json()
+
+    @skipUnless(shutil.which('git'), 'git not installed')
+    def test_refresh__git_reverted_file(self):                                   # Dirty at save time, clean again later
+        self.create('bug', 'Bug one')
+        self.git('init', '-q')
+        self.git('add', '-A')
+        self.git('commit', '-q', '-m', 'nodes')
+        path = os.path.join(self.issues_dir, 'data', 'bug', 'Bug-1', 'issue.json')
+        with open(path) as f:
+            content = f.read()
+        with open(path, 'w') as f:
+            f.write(content.replace('Bug one', 'Edited bug'))
+        CLI__Index(repository = self.repository).refresh()
+        self.git('checkout', '--', '.')
+
+        index, read = self.git_index()
+        assert index.refresh().entry('Bug-1')['title'] == 'Bug one'
+        assert read                                    == ['data/bug/Bug-1/issue.json']
+
+    @skipUnless(shutil.which('git'), 'git not installed')
+    def test_refresh__git_unknown_commit(self):                                  # Recorded HEAD gone: full walk
+        self.create('bug', 'Bug one')
+        self.git('init', '-q')
+        self.git('add', '-A')
+        self.git('commit', '-q', '-m', 'nodes')
+        index = CLI__Index(repository = self.repository).refresh()
+        index.git['head'] = '0' * 40
+        index.dirty       = True
+        index.save()
+
+        index    = CLI__Index(repository = self.repository)
+        walks    = []
+        original = index.scan_fingerprints
+        index.scan_fingerprints = lambda: walks.append(1) or original()
+        index.refresh()
+        assert walks             == [1]
+        assert index.git['head'] == self.git('rev-parse', 'HEAD').strip()
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Tests for refresh
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test_refresh__matches_list_nodes(self):                                  # Same result as the service scan
+        self.create('task', 'Second task')
+        self.create('bug' , 'First bug'  )
+        self.create('task', 'Third task' )
+
+        index    = CLI__Index(repository = self.repository).refresh()
+        expected = self.node_service.list_nodes()
+
+        assert index.list_nodes().json()               == expected.json()
+        assert index.list_nodes('task').total          == 2
+        assert [str(n.label) for n in index.summaries('bug')] == ['Bug-1']
+
+    def test_refresh__persists_and_ignores_in_git(self):                         # Index file + .gitignore written
+        self.create('bug', 'Persisted bug')
+        CLI__Index(repository = self.repository).refresh()
+
+        assert os.path.isfile(os.path.join(self.issues_dir, INDEX__PATH))
+        with open(os.path.join(self.issues_dir, INDEX__GITIGNORE)) as f:
+            assert f.read().strip() == '*'
+
+        index = CLI__Index(repository = self.repository).load()                  # Reload without refresh
+        assert [e['label'] for e in index.entries()] == ['Bug-1']
+
+    def test_refresh__only_reads_changed_files(self):                            # Unchanged files are not re-read
+        self.create('bug', 'Bug one')
+        self.create('bug', 'Bug two')
+        CLI__Index(repository = self.repository).refresh()
+
+        self.node_service.update_node(node_type = Safe_Str__Node_Type('bug')    ,
+                                      label     = Safe_Str__Node_Label('Bug-2') ,
+                                      request   = Schema__Node__Update__Request(status = 'confirmed'))
+        os.utime(os.path.join(self.issues_dir, 'data', 'bug', 'Bug-2', 'issue.json'), ns=(1, 1))   # Force a distinct mtime
+
+        index    = CLI__Index(repository = self.repository)
+        read     = []
+        original = index.read_nodes
+        index.read_nodes = lambda path: read.append(path) or original(path)
+        index.refresh()
+
+        assert read == ['data/bug/Bug-2/issue.json']
+        assert {e['label']: e['status'] for e in index.entries()}['Bug-2'] == 'confirmed'
+
+    def test_refresh__parallel_reads(self):                                      # Thread pool, same index as serial
+        for i in range(INDEX__PARALLEL_MIN + 4):
+            self.create('bug' if i % 2 else 'task', f'Node {i}')
+
+        serial   = CLI__Index(repository = self.repository, jobs = 1).rebuild()
+        parallel = CLI__Index(repository = self.repository, jobs = 4)
+        threads  = set()
+        original = parallel.read_content
+        def read_content(path):
+            threads.add(threading.get_ident())
+            time.sleep(0.005)                                                    # Simulated per-file latency
+            return original(path)
+        parallel.read_content = read_content
+        parallel.rebuild()
+
+        assert len(threads)                   >  1
+        assert list(parallel.files)           == list(serial.files)              # Deterministic order
+        assert parallel.list_nodes().json()   == serial.list_nodes().json()
+
+    def test_refresh__drops_deleted_nodes(self):                                 # Removed files leave the index
+        self.create('bug', 'Short-lived bug')
+        index = CLI__Index(repository = self.repository).refresh()
+        assert index.list_nodes().total == 1
+
+        self.node_service.delete_node(Safe_Str__Node_Type('bug'), Safe_Str__Node_Label('Bug-1'))
+        assert index.refresh().list_nodes().total == 0
+
+    def test_refresh_paths(self):                                                # Only the given paths are looked at
+        self.create('bug', 'Kept')
+        self.create('bug', 'Edited')
+        self.create('bug', 'Removed')
+        index = CLI__Index(repository = self.repository).refresh()
+        self.node_service.update_node(node_type = Safe_Str__Node_Type('bug')    ,
+                                      label     = Safe_Str__Node_Label('Bug-2') ,
+                                      request   = Schema__Node__Update__Request(status = 'confirmed'))
+        shutil.rmtree(os.path.join(self.issues_dir, 'data', 'bug', 'Bug-3'))
+        self.create('bug', 'Added')
+
+        read             = []
+        original         = index.read_nodes
+        index.read_nodes = lambda path: read.append(path) or original(path)
+        index.refresh_paths(['data/bug/Bug-2/issue.json', 'data/bug/Bug-3', 'data/bug/Bug-4/issue.json', 'config/x.txt'])
+
+        assert read                                            == ['data/bug/Bug-2/issue.json', 'data/bug/Bug-4/issue.json']
+        assert [(e['label'], e['status']) for e in index.entries()][1:] == [('Bug-2', 'confirmed'), ('Bug-4', 'backlog')]
+
+    def test_refresh__memory_backend(self):                                      # Content hashes for non-disk storage
+        repository = Graph__Repository__Factory.create_memory()
+        Type__Service(repository = repository).initialize_default_types()
+        Node__Service(repository = repository).create_node(
+            Schema__Node__Create__Request(node_type = Safe_Str__Node_Type('task'), title = 'In memory'))
+
+        index = CLI__Index(repository = repository).refresh()
+        assert [e['label'] for e in index.entries()] == ['Task-1']
+        assert len(list(index.files.values())[0]['fingerprint']) == 40          # sha1 hex digest
+
+    def test_list_nodes__filter_reads_no_files(self):                            # Predicates run on index entries
+        self.create('bug' , 'Open P1'  , tags = ['ui'], properties = {'priority': 'P1'})
+        self.create('bug' , 'Open P2'  , tags = ['ui'], properties = {'priority': 'P2'})
+        self.create('task', 'Task P1'  ,                properties = {'priority': 'P1'})
+        index = CLI__Index(repository = self.repository).refresh()
+
+        read = []
+        index.read_nodes = lambda path: read.append(path)
+        self.repository.node_load = lambda *args: read.append(args)
+
+        response = index.list_nodes(node_filter = CLI__Node__Filter(node_type = 'bug', priority = 'P1', tags = ['ui']))
+        assert [str(n.label) for n in response.nodes]                                     == ['Bug-1']
+        assert response.total                                                             == 1
+        assert [e['label'] for e in index.select(CLI__Node__Filter(priority = 'P1'))]   == ['Bug-1', 'Task-1']
+        assert read                                                                       == []
+
+    def test_page(self):                                                         # Top-k by sort key, keyset cursor
+        for priority, title in (('P2', 'b'), ('P10', 'c'), ('P1', 'd'), ('P1', 'a'), (None, 'e')):
+            self.create('bug', title, properties = {'priority': priority} if priority else {})
+        index = CLI__Index(repository = self.repository).refresh()
+        built = []
+        summary = index.summary
+        index.summary = lambda entry: built.append(entry['label']) or summary(entry)
+        order = CLI__Node__Sort.from_spec('priority,title')
+
+        entries, total, cursor = index.page(CLI__Node__Filter(), order = order, limit = 2)
+        assert [e['label'] for e in entries] == ['Bug-4', 'Bug-3']                     # P1 a, P1 d
+        assert total                         == 5
+        self.create('bug', 'aa', properties = {'priority': 'P0'})                      # Sorts before the cursor
+        index.refresh()
+        entries, total, cursor = index.page(CLI__Node__Filter(), order = order, limit = 2, cursor = cursor)
+        assert [e['label'] for e in entries] == ['Bug-1', 'Bug-2']                     # P2, P10: not shifted
+        assert total                         == 6
+        entries, _, cursor = index.page(CLI__Node__Filter(), order = order, limit = 2, cursor = cursor)
+        assert [e['label'] for e in entries] == ['Bug-5']                              # No priority: last
+        assert cursor                        is None
+
+        response, _ = index.list_page(CLI__Node__Filter(), order = order, limit = 1, offset = 1)
+        assert [str(n.label) for n in response.nodes] == ['Bug-4']
+        assert response.total                         == 6
+        assert built                                  == ['Bug-4']                     # Schemas for the page only
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Tests for load / rebuild
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test_load__corrupt_index_is_rebuilt(self):                               # Bad JSON never breaks listing
+        self.create('bug', 'Recoverable')
+        os.makedirs(os.path.join(self.issues_dir, '.cache'))
+        with open(os.path.join(self.issues_dir, INDEX__PATH), 'w') as f:
+            f.write('{not json')
+
+        assert CLI__Index(repository = self.repository).refresh().list_nodes().total == 1
+
+    def test_rebuild(self):                                                      # Rebuild from scratch
+        self.create('feature', 'A feature')
+        stats = CLI__Index(repository = self.repository).rebuild().stats()
+
+        assert stats['nodes']       == 1
+        assert stats['type_counts'] == {'feature': 1}
+
+    def test_entry_from_data(self):                                              # Only queried fields are kept
+        data  = {'label': 'Bug-7', 'node_type': 'bug', 'title': 'T', 'status': 'open', 'node_index': 7,
+                 'tags' : ['a'], 'properties': {'priority': 'P1', 'comments': [{'text': 'x'}]},
+                 'links': [{'verb': 'blocks', 'target_label': 'Task-1', 'target_id': 'abc'}]}
+        entry = CLI__Index().entry_from_data(data, 'data/bug/Bug-7/issue.json')
+
+        assert entry == {'path'      : 'data/bug/Bug-7', 'label': 'Bug-7', 'node_type': 'bug', 'node_index': 7,
+                         'title'     : 'T'             , 'status': 'open', 'priority' : 'P1' , 'tags'      : ['a'],
+                         'links'     : [['blocks', 'Task-1']]}
+        assert json.loads(json.dumps(entry)) == entry
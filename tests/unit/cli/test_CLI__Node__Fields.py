@@ -0,0 +1,34 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Test CLI__Node__Fields - Field projection of index entries for list --fields
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import pytest
+
+from unittest                                                                   import TestCase
+
+from issues_fs_cli.cli.CLI__Node__Fields                                        import CLI__Node__Fields
+
+ENTRY = {'path': 'data/bug/Bug-3', 'label': 'Bug-3', 'node_type': 'bug', 'node_index': 3, 'title': 'Crash on save',
+         'status': 'open', 'priority': 'P1', 'tags': ['ui', 'api'], 'links': [['blocks', 'Task-1']]}
+
+
+class test_CLI__Node__Fields(TestCase):
+
+    def test_from_spec(self):                                                    # Aliases as in --sort, no duplicates
+        assert CLI__Node__Fields.from_spec('Label, type,status,label').names == ['label', 'node_type', 'status']
+        assert CLI__Node__Fields.from_spec(None).names                       == []
+        with pytest.raises(ValueError, match='Invalid field: description'):
+            CLI__Node__Fields.from_spec('title,description')
+
+    def test_row(self):                                                          # Tuples in field order, JSON by name
+        fields = CLI__Node__Fields.from_spec('priority,label,tags,links')
+        row    = fields.row(ENTRY)
+        assert row                  == ('P1', 'Bug-3', ['ui', 'api'], [{'verb': 'blocks', 'target_label': 'Task-1'}])
+        assert fields.row_json(row) == {'priority': 'P1', 'label': 'Bug-3', 'tags': ['ui', 'api'],
+                                        'links'   : [{'verb': 'blocks', 'target_label': 'Task-1'}]}
+        assert list(fields.rows([ENTRY, ENTRY])) == [row, row]
+
+    def test_cell(self):                                                         # Table text, cut to the column width
+        assert CLI__Node__Fields.cell(['ui', 'api'], 24)                                     == 'ui, api'
+        assert CLI__Node__Fields.cell([{'verb': 'blocks', 'target_label': 'Task-1'}], 30)    == 'blocks Task-1'
+        assert CLI__Node__Fields.cell('Crash on save', 5)                                    == 'Crash'
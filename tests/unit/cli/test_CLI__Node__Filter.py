@@ -0,0 +1,50 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Test CLI__Node__Filter - List filter spec evaluated against index entries
+# ═══════════════════════════════════════════════════════════════════════════════
+
+from unittest                                                                   import TestCase
+
+from issues_fs_cli.cli.CLI__Node__Filter                                        import CLI__Node__Filter
+
+
+def entry(**kwargs) -> dict:                                                     # Index entry with defaults
+    values = {'label': 'Bug-1', 'node_type': 'bug', 'status': 'backlog', 'priority': '', 'tags': []}
+    values.update(kwargs)
+    return values
+
+
+class test_CLI__Node__Filter(TestCase):
+
+    def test_matches__empty_filter(self):                                        # No predicates: everything matches
+        assert CLI__Node__Filter().matches(entry()) is True
+
+    def test_matches__type_and_status(self):
+        node_filter = CLI__Node__Filter(node_type = 'bug', status = 'confirmed')
+
+        assert node_filter.matches(entry(status = 'confirmed'))                    is True
+        assert node_filter.matches(entry(status = 'backlog'))                      is False
+        assert node_filter.matches(entry(node_type = 'task', status = 'confirmed')) is False
+
+    def test_matches__priority(self):                                            # Case-insensitive
+        node_filter = CLI__Node__Filter(priority = 'p1')
+
+        assert node_filter.matches(entry(priority = 'P1')) is True
+        assert node_filter.matches(entry(priority = 'P2')) is False
+        assert node_filter.matches(entry())                is False
+
+    def test_matches__tags(self):                                                # All tags must be present
+        node_filter = CLI__Node__Filter(tags = ['ui', 'urgent'])
+
+        assert node_filter.matches(entry(tags = ['urgent', 'ui', 'x'])) is True
+        assert node_filter.matches(entry(tags = ['ui']))                is False
+
+    def test_from_query(self):                                                   # export --query syntax
+        node_filter = CLI__Node__Filter.from_query('type:Bug AND status:open and priority:P0 tag:ui,urgent')
+
+        assert node_filter.node_type == 'bug'
+        assert node_filter.status    == 'open'
+        assert node_filter.priority  == 'P0'
+        assert node_filter.tags      == ['ui', 'urgent']
+        assert CLI__Node__Filter.from_query('').matches(entry()) is True
+        with self.assertRaises(ValueError):
+            CLI__Node__Filter.from_query('owner:me')
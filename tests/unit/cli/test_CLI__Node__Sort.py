@@ -0,0 +1,43 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Test CLI__Node__Sort - Sort spec and paging cursors over index entries
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import pytest
+
+from unittest                                                                   import TestCase
+
+from issues_fs_cli.cli.CLI__Node__Sort                                          import CLI__Node__Sort
+
+
+def entry(label, title='', status='', priority='', node_type='bug'):             # Index entry, as stored by CLI__Index
+    node_index = int(label.split('-')[1])
+    return {'path': f'data/{node_type}/{label}', 'label': label, 'node_type': node_type, 'node_index': node_index,
+            'title': title, 'status': status, 'priority': priority, 'tags': [], 'links': []}
+
+
+class test_CLI__Node__Sort(TestCase):
+
+    def test_from_spec(self):
+        assert CLI__Node__Sort.from_spec('Priority, -title').fields == [['priority', False], ['title', True]]
+        assert CLI__Node__Sort.from_spec('priority,-title').spec()  == 'priority,-title'
+        assert CLI__Node__Sort.from_spec(None).fields               == []
+        with pytest.raises(ValueError, match='Invalid sort field: body'):
+            CLI__Node__Sort.from_spec('title,body')
+
+    def test_entry_key(self):                                                    # Numeric priorities, missing values last
+        entries = [entry('Bug-1', priority='P10'), entry('Bug-2', priority='P2'), entry('Bug-3'),
+                   entry('Bug-4', priority='high'), entry('Bug-5', priority='P2')]
+        order   = CLI__Node__Sort.from_spec('priority')
+        assert [e['label'] for e in sorted(entries, key=order.entry_key)] == ['Bug-2', 'Bug-5', 'Bug-1', 'Bug-4', 'Bug-3']
+        order   = CLI__Node__Sort.from_spec('-priority')
+        assert [e['label'] for e in sorted(entries, key=order.entry_key)] == ['Bug-4', 'Bug-1', 'Bug-2', 'Bug-5', 'Bug-3']
+        order   = CLI__Node__Sort.from_spec('label')
+        assert [e['label'] for e in sorted([entry('Bug-10'), entry('Bug-9')], key=order.entry_key)] == ['Bug-9', 'Bug-10']
+
+    def test_cursor(self):                                                       # Round-trip, tied to the sort spec
+        order = CLI__Node__Sort.from_spec('-title,label')
+        last  = entry('Bug-3', title='Crash')
+        assert order.after(order.cursor(last)) == order.entry_key(last)
+        for cursor in ('not a cursor', CLI__Node__Sort.from_spec('title').cursor(last), ''):
+            with pytest.raises(ValueError, match=r"Invalid cursor for --sort '-title,label'"):
+                order.after(cursor)
@@ -176,6 +176,29 @@ class test_CLI__Output(TestCase):
         assert data["total"]   == 1
         assert len(data["nodes"]) == 1
 
+    def test_render_list__ndjson(self):                                          # Test list NDJSON rendering
+        nodes = [Schema__Node__Summary(node_type = Safe_Str__Node_Type("bug")          ,
+                                       label     = Safe_Str__Node_Label(f"Bug-{i}")    ,
+                                       title     = f"Bug {i}"                          ,
+                                       status    = Safe_Str__Status("backlog")         ) for i in (1, 2)]
+
+        response = Schema__Node__List__Response(success = True  ,
+                                                nodes   = nodes ,
+                                                total   = 2     )
+
+        CLI__Output.render_list(response, format="ndjson", for_agent=True)       # ndjson wins over --for-agent
+        lines = self.get_stdout().splitlines()
+
+        assert len(lines)                    == 2
+        assert lines[0]                      == json.dumps(nodes[0].json(), separators=(',', ':'))
+        assert json.loads(lines[1])['label'] == 'Bug-2'
+
+    def test_render_ndjson(self):                                                # Test one compact object per line
+        count = CLI__Output.render_ndjson(iter([{'a': 1}, {'b': [1, 2]}]))
+
+        assert count             == 2
+        assert self.get_stdout() == '{"a":1}\n{"b":[1,2]}\n'
+
     # ═══════════════════════════════════════════════════════════════════════════════
     # Tests for render_create_response
     # ═══════════════════════════════════════════════════════════════════════════════
@@ -0,0 +1,64 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Test CLI__Pack - Memory-mapped pack file format
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import os
+import shutil
+import tempfile
+
+from unittest                                                                   import TestCase
+
+from issues_fs_cli.cli.CLI__Pack                                                import CLI__Pack
+
+
+class test_CLI__Pack(TestCase):
+
+    def setUp(self):
+        self.temp_dir  = tempfile.mkdtemp()
+        self.pack_path = os.path.join(self.temp_dir, '.pack', 'nodes.pack')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_write_and_read(self):                                               # Every name found, others not
+        files = [(f'data/bug/Bug-{i}/issue.json', f'{{"label": "Bug-{i}"}}'.encode()) for i in range(1, 301)]
+        files.append(('data/task/Täsk-1/issue.json', b''))                       # Non-ascii name, empty content
+
+        assert CLI__Pack.write(self.pack_path, reversed(files)) == 301
+        pack = CLI__Pack.open(self.pack_path)
+
+        assert len(pack)    == 301
+        assert pack.names() == sorted(name for name, _ in files)
+        for name, content in files:
+            assert pack.get(name) == content
+        assert pack.get('data/bug/Bug-301/issue.json') is None
+        assert 'data/bug/Bug-7/issue.json' in pack
+        assert 'data/bug/Bug-7'            not in pack
+        pack.close()
+
+    def test_rewrite__replaces_atomically(self):                                 # Reader keeps its own mapping
+        CLI__Pack.write(self.pack_path, [('a', b'first')])
+        old = CLI__Pack.open(self.pack_path)
+        CLI__Pack.write(self.pack_path, [('a', b'second'), ('b', b'new')])
+        new = CLI__Pack.open(self.pack_path)
+
+        assert old.get('a')                         == b'first'
+        assert new.get('a')                         == b'second'
+        assert new.stamp                            != old.stamp
+        assert os.listdir(os.path.dirname(self.pack_path)) == ['nodes.pack']   # No temp file left
+        old.close()
+        new.close()
+
+    def test_empty_and_missing(self):
+        assert CLI__Pack.open(self.pack_path) is None
+        CLI__Pack.write(self.pack_path, [])
+        pack = CLI__Pack.open(self.pack_path)
+        assert pack.names()   == []
+        assert pack.get('a')  is None
+        pack.close()
+
+    def test_open__not_a_pack(self):
+        with open(os.path.join(self.temp_dir, 'other'), 'wb') as f:
+            f.write(b'x' * 64)
+        with self.assertRaises(ValueError):
+            CLI__Pack.open(os.path.join(self.temp_dir, 'other'))
@@ -0,0 +1,147 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Test CLI__Pack__Storage - Loose files overlaid on a pack (issues-fs pack)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import json
+import os
+import shutil
+import tempfile
+
+from unittest                                                                   import TestCase
+from typer.testing                                                              import CliRunner
+
+from issues_fs_cli.cli.CLI__Index                                               import CLI__Index
+from issues_fs_cli.cli.CLI__Pack__Storage                                       import CLI__Pack__Storage, PACK__PATH, PACK__REMOVED
+from issues_fs_cli.cli.cli__main                                                import app
+from issues_fs.issues.graph_services.Graph__Repository__Factory                 import Graph__Repository__Factory
+from issues_fs.issues.graph_services.Link__Service                              import Link__Service
+from issues_fs.issues.graph_services.Node__Service                              import Node__Service
+from issues_fs.issues.graph_services.Type__Service                              import Type__Service
+from issues_fs.schemas.graph.Schema__Link__Create__Request                      import Schema__Link__Create__Request
+from issues_fs.schemas.graph.Schema__Node__Create__Request                      import Schema__Node__Create__Request
+from issues_fs.schemas.graph.Schema__Node__Update__Request                      import Schema__Node__Update__Request
+from issues_fs.schemas.graph.Safe_Str__Graph_Types                              import Safe_Str__Node_Type, Safe_Str__Node_Label
+
+
+class test_CLI__Pack__Storage(TestCase):
+
+    def setUp(self):                                                             # Two bugs and a task, linked
+        self.temp_dir   = tempfile.mkdtemp()
+        self.issues_dir = os.path.join(self.temp_dir, '.issues')
+        os.makedirs(self.issues_dir)
+        repository = Graph__Repository__Factory.create_local_disk(root_path = self.issues_dir)
+        Type__Service(repository = repository).initialize_default_types()
+        service    = Node__Service(repository = repository)
+        for node_type, title in [('bug', 'First bug'), ('bug', 'Second bug'), ('task', 'A task')]:
+            service.create_node(Schema__Node__Create__Request(node_type = Safe_Str__Node_Type(node_type), title = title))
+        Link__Service(repository = repository).create_link(Safe_Str__Node_Type('bug'), Safe_Str__Node_Label('Bug-1'),
+                                                           Schema__Link__Create__Request(verb = 'blocks', target_label = 'Task-1'))
+        self.before = self.snapshot(repository)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def repository(self):
+        return CLI__Pack__Storage.create_repository(self.issues_dir)
+
+    def snapshot(self, repository):                                              # Everything list/show would print
+        service = Node__Service(repository = repository)
+        return {'list' : service.list_nodes().json(),
+                'nodes': [service.get_node(Safe_Str__Node_Type(t), Safe_Str__Node_Label(l)).json()
+                          for t, l in [('bug', 'Bug-1'), ('bug', 'Bug-2'), ('task', 'Task-1')]]}
+
+    def loose_nodes(self):
+        return sorted(os.path.relpath(os.path.join(folder, name), self.issues_dir)
+                      for folder, _, names in os.walk(self.issues_dir) for name in names if name == 'issue.json')
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Tests for pack / unpack
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test_pack_repository(self):                                              # Same data, read from the pack
+        stats = CLI__Pack__Storage.pack_repository(self.issues_dir)
+
+        assert stats['nodes']      == 3
+        assert stats['loose']      == 3
+        assert self.loose_nodes()  == []
+        assert os.path.isdir(os.path.join(self.issues_dir, 'data', 'bug', 'Bug-1')) is False   # Empty folders pruned
+        repository = self.repository()
+        assert isinstance(repository.storage_fs, CLI__Pack__Storage)
+        assert self.snapshot(repository) == self.before
+
+    def test_pack_repository__keep_loose(self):
+        stats = CLI__Pack__Storage.pack_repository(self.issues_dir, keep_loose = True)
+        assert stats['loose']            == 0
+        assert len(self.loose_nodes())   == 3
+        assert self.snapshot(self.repository()) == self.before
+
+    def test_unpack_repository(self):                                            # Back to plain local disk
+        CLI__Pack__Storage.pack_repository(self.issues_dir)
+
+        assert CLI__Pack__Storage.unpack_repository(self.issues_dir) == 3
+        assert len(self.loose_nodes()) == 3
+        assert os.path.exists(os.path.join(self.issues_dir, '.pack')) is False
+        repository = self.repository()
+        assert isinstance(repository.storage_fs, CLI__Pack__Storage) is False
+        assert self.snapshot(repository) == self.before
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Tests for the loose overlay
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test_overlay__writes_after_packing(self):                                # Update, create, delete on a packed repo
+        CLI__Pack__Storage.pack_repository(self.issues_dir)
+        service = Node__Service(repository = self.repository())
+        service.update_node(Safe_Str__Node_Type('bug'), Safe_Str__Node_Label('Bug-2'),
+                            Schema__Node__Update__Request(title = 'Second bug, edited'))
+        service.create_node(Schema__Node__Create__Request(node_type = Safe_Str__Node_Type('task'), title = 'Loose task'))
+        service.delete_node(Safe_Str__Node_Type('bug'), Safe_Str__Node_Label('Bug-1'))
+
+        assert self.loose_nodes() == ['data/bug/Bug-2/issue.json', 'data/task/Task-2/issue.json']
+        with open(os.path.join(self.issues_dir, PACK__REMOVED)) as f:
+            assert f.read() == 'data/bug/Bug-1/issue.json\n'
+
+        service = Node__Service(repository = self.repository())                  # Fresh process view
+        titles  = {str(n.label): str(n.title) for n in service.list_nodes().nodes}
+        assert titles == {'Bug-2': 'Second bug, edited', 'Task-1': 'A task', 'Task-2': 'Loose task'}
+
+        CLI__Pack__Storage.pack_repository(self.issues_dir)                      # Repack folds it all in
+        assert self.loose_nodes() == []
+        assert os.path.exists(os.path.join(self.issues_dir, PACK__REMOVED)) is False
+        titles  = {str(n.label): str(n.title) for n in Node__Service(repository = self.repository()).list_nodes().nodes}
+        assert titles == {'Bug-2': 'Second bug, edited', 'Task-1': 'A task', 'Task-2': 'Loose task'}
+
+    def test_index__reads_from_pack(self):                                       # Fingerprints without opening files
+        CLI__Pack__Storage.pack_repository(self.issues_dir)
+        index = CLI__Index(repository = self.repository())
+        loose = []
+        index.read_loose = lambda paths: loose.extend(paths) or []
+        index.refresh()
+
+        assert loose == []                                                       # Nothing opened from disk
+        assert [e['label'] for e in index.entries()] == ['Bug-1', 'Bug-2', 'Task-1']
+        assert index.incoming_links('Task-1') == {'Bug-1': 'blocks'}
+        assert all(CLI__Index.is_packed(f['fingerprint']) for f in index.files.values())
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Tests for the pack command
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test_cli__pack(self):
+        cwd = os.getcwd()
+        os.chdir(self.temp_dir)
+        try:
+            runner = CliRunner()
+            result = runner.invoke(app, ['pack', '--for-agent'])
+            assert result.exit_code == 0
+            assert json.loads(result.stdout)['nodes'] == 3
+            assert os.path.isfile(os.path.join(self.issues_dir, PACK__PATH))
+
+            result = runner.invoke(app, ['show', 'Bug-1', '--output', 'json'])
+            assert json.loads(result.stdout)['title'] == 'First bug'
+
+            result = runner.invoke(app, ['pack', '--unpack'])
+            assert result.exit_code == 0
+            assert 'Unpacked 3 nodes' in result.stdout
+        finally:
+            os.chdir(cwd)
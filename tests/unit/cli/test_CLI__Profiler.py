@@ -0,0 +1,109 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Test CLI__Profiler - Global --profile spans, trace and pstats output
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import json
+import os
+import pstats
+import shutil
+import tempfile
+
+from unittest                                                                   import TestCase
+from typer.testing                                                              import CliRunner
+
+from issues_fs_cli.cli.cli__main                                                import app
+from issues_fs_cli.cli.CLI__Context                                             import CLI__Context
+from issues_fs_cli.cli.CLI__Output                                              import CLI__Output
+from issues_fs_cli.cli.CLI__Profiler                                            import CLI__Profiler, PROFILE__ENV
+from issues_fs.issues.graph_services.Graph__Repository__Factory                 import Graph__Repository__Factory
+from issues_fs.issues.graph_services.Type__Service                              import Type__Service
+
+
+class test_CLI__Profiler(TestCase):
+
+    @classmethod
+    def setUpClass(cls):                                                         # Repository with one node
+        cls.runner     = CliRunner()
+        cls.temp_dir   = tempfile.mkdtemp()
+        cls.issues_dir = os.path.join(cls.temp_dir, '.issues')
+        os.makedirs(cls.issues_dir)
+        Type__Service(repository = Graph__Repository__Factory.create_local_disk(root_path = cls.issues_dir)).initialize_default_types()
+        cls.original_cwd = os.getcwd()
+        os.chdir(cls.temp_dir)
+        cls.runner.invoke(app, ["create", "bug", "Profiled bug"])
+
+    @classmethod
+    def tearDownClass(cls):
+        os.chdir(cls.original_cwd)
+        shutil.rmtree(cls.temp_dir)
+
+    def setUp(self):
+        self.original_env = os.environ.pop(PROFILE__ENV, None)
+
+    def tearDown(self):
+        os.environ.pop(PROFILE__ENV, None)
+        if self.original_env is not None:
+            os.environ[PROFILE__ENV] = self.original_env
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Tests for from_options
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test_from_options(self):                                                 # Flags first, then the env var
+        assert CLI__Profiler.from_options('list', False, None)                   is None
+        assert CLI__Profiler.from_options('list', True , None).output            is None
+        assert CLI__Profiler.from_options('list', False, 'out.json').output      == 'out.json'
+
+        os.environ[PROFILE__ENV] = '1'
+        assert CLI__Profiler.from_options('list', False, None).output            is None
+        os.environ[PROFILE__ENV] = 'trace.json'
+        assert CLI__Profiler.from_options('list', False, None).output            == 'trace.json'
+        os.environ[PROFILE__ENV] = 'off'
+        assert CLI__Profiler.from_options('list', False, None)                   is None
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Tests for output
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test_profile__summary_on_stderr(self):                                   # Span tree, stdout unchanged
+        plain  = self.runner.invoke(app, ["show", "Bug-1", "--for-agent"])
+        result = self.runner.invoke(app, ["--profile", "show", "Bug-1", "--for-agent"])
+
+        assert result.exit_code == 0
+        assert result.stdout    == plain.stdout
+        assert result.stderr.startswith('profile: issues-fs show (')
+        for span in ['imports', 'CLI__Context.__init__', 'CLI__Context.discover_issues_root',
+                     'Node__Service.get_node', 'Graph__Repository.node_load', 'Type_Safe.from_json',
+                     'CLI__Output.render_node', '(other']:
+            assert span in result.stderr, span
+
+    def test_profile__env_var_and_failure(self):                                 # Failed commands are profiled too
+        os.environ[PROFILE__ENV] = '1'
+        result = self.runner.invoke(app, ["show", "Bug-999"])
+
+        assert result.exit_code == 1
+        assert 'profile: issues-fs show' in result.stderr
+
+    def test_profile__chrome_trace(self):
+        path   = os.path.join(self.temp_dir, 'trace.json')
+        result = self.runner.invoke(app, ["--profile-output", path, "list"])
+
+        assert result.exit_code == 0
+        with open(path) as f:
+            events = json.load(f)['traceEvents']
+        assert events[0]['name']                           == 'list'
+        assert {e['ph'] for e in events}                   == {'X'}
+        assert 'CLI__Index.scan_fingerprints'              in [e['name'] for e in events]
+
+    def test_profile__pstats(self):
+        path   = os.path.join(self.temp_dir, 'list.prof')
+        result = self.runner.invoke(app, ["--profile-output", path, "list"])
+
+        assert result.exit_code == 0
+        assert pstats.Stats(path).total_calls > 0
+
+    def test_profile__restores_methods(self):                                    # Nothing stays wrapped afterwards
+        originals = (CLI__Context.__dict__['load_index'], CLI__Output.__dict__['render_list'])
+        self.runner.invoke(app, ["--profile", "list"])
+
+        assert (CLI__Context.__dict__['load_index'], CLI__Output.__dict__['render_list']) == originals
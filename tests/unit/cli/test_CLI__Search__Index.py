@@ -0,0 +1,116 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Test CLI__Search__Index - Persistent inverted index (search command)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import json
+import os
+import shutil
+import tempfile
+
+from unittest                                                                   import TestCase
+
+from issues_fs_cli.cli.CLI__Node__Filter                                        import CLI__Node__Filter
+from issues_fs_cli.cli.CLI__Search__Index                                       import CLI__Search__Index, SEARCH__PATH
+from issues_fs.issues.graph_services.Comments__Service                          import Comments__Service
+from issues_fs.issues.graph_services.Graph__Repository__Factory                 import Graph__Repository__Factory
+from issues_fs.issues.graph_services.Node__Service                              import Node__Service
+from issues_fs.issues.graph_services.Type__Service                              import Type__Service
+from issues_fs.schemas.graph.Schema__Node__Create__Request                      import Schema__Node__Create__Request
+from issues_fs.schemas.graph.Schema__Node__Update__Request                      import Schema__Node__Update__Request
+from issues_fs.schemas.graph.Safe_Str__Graph_Types                              import Safe_Str__Node_Type, Safe_Str__Node_Label
+from issues_fs.schemas.issues.Schema__Comment                                   import Schema__Comment__Create__Request
+
+
+class test_CLI__Search__Index(TestCase):
+
+    def setUp(self):                                                             # Fresh local-disk repository per test
+        self.temp_dir   = tempfile.mkdtemp()
+        self.issues_dir = os.path.join(self.temp_dir, '.issues')
+        os.makedirs(self.issues_dir)
+        self.repository   = Graph__Repository__Factory.create_local_disk(root_path = self.issues_dir)
+        self.node_service = Node__Service(repository = self.repository)
+        Type__Service(repository = self.repository).initialize_default_types()
+        self.create('bug'    , 'Login page times out', description = 'The login form hangs when the auth server is slow', tags = ['ui'])
+        self.create('task'   , 'Write auth docs'     , description = 'Document the token refresh flow')
+        self.create('feature', 'Dark mode'           , description = 'Theme toggle for every page')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def create(self, node_type, title, **kwargs):                                # Create node via the service layer
+        request = Schema__Node__Create__Request(node_type = Safe_Str__Node_Type(node_type), title = title, **kwargs)
+        return self.node_service.create_node(request).node
+
+    def search(self, query, **kwargs):                                           # Labels, best first, from a fresh load
+        index = CLI__Search__Index(repository = self.repository).refresh()
+        return [entry['label'] for entry, _ in index.search(query, **kwargs)]
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Tests for parse_query
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test_parse_query(self):
+        assert CLI__Search__Index.parse_query('Login "Auth  server" tok* null-pointer') == [
+                ('term'  , 'login'            ),
+                ('phrase', ['auth', 'server'] ),
+                ('prefix', 'tok'              ),
+                ('phrase', ['null', 'pointer'])]
+        assert CLI__Search__Index.parse_query('  "" * ') == []
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Tests for search
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test_search__terms_must_all_match(self):
+        assert self.search('auth'      ) == ['Task-1', 'Bug-1']                  # Title match ranks first
+        assert self.search('auth slow' ) == ['Bug-1']
+        assert self.search('auth theme') == []
+        assert self.search('UI'        ) == ['Bug-1']                            # Tags are searchable
+
+    def test_search__phrase_and_prefix(self):
+        assert self.search('"auth server"') == ['Bug-1']
+        assert self.search('"server auth"') == []
+        assert self.search('"docs document"') == []                              # Phrases never span fields
+        assert self.search('tok*'         ) == ['Task-1']
+        assert sorted(self.search('t*')   ) == ['Bug-1', 'Feature-1', 'Task-1']
+
+    def test_search__filter_and_limit(self):
+        assert self.search('page', node_filter = CLI__Node__Filter(node_type = 'feature')) == ['Feature-1']
+        assert len(self.search('the', limit = 1)) == 1
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Tests for incremental updates
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test_refresh__persists_postings(self):                                   # Second load reads no node file
+        CLI__Search__Index(repository = self.repository).refresh()
+        with open(os.path.join(self.issues_dir, SEARCH__PATH)) as f:
+            data = json.load(f)
+        assert data['postings']['login'] == {'1': '3|0,8'}                       # Title occurrence weighted up
+
+        index = CLI__Search__Index(repository = self.repository)
+        index.read_nodes = None                                                  # Would fail if called
+        assert [e['label'] for e, _ in index.refresh().search('dark')] == ['Feature-1']
+
+    def test_refresh__picks_up_edits(self):                                      # Update, comment, delete
+        index = CLI__Search__Index(repository = self.repository).refresh()
+        self.node_service.update_node(node_type = Safe_Str__Node_Type('task')     ,
+                                      label     = Safe_Str__Node_Label('Task-1')  ,
+                                      request   = Schema__Node__Update__Request(description = 'Explain the login flow'))
+        Comments__Service(repository = self.repository).create_comment(
+            node_type = Safe_Str__Node_Type('feature')                          ,
+            label     = Safe_Str__Node_Label('Feature-1')                       ,
+            request   = Schema__Comment__Create__Request(author = 'qa', text = 'Contrast on the login page'))
+        self.node_service.delete_node(node_type = Safe_Str__Node_Type('bug'), label = Safe_Str__Node_Label('Bug-1'))
+
+        assert sorted(e['label'] for e, _ in index.refresh().search('login')) == ['Feature-1', 'Task-1']
+        assert index.search('token') == []
+        assert 'slow' not in index.postings                                      # Deleted node unposted
+
+    def test_refresh_nodes__write_through(self):                                 # Used by commands on a loaded index
+        index = CLI__Search__Index(repository = self.repository).refresh()
+        node  = self.create('bug', 'Crash on upload')
+
+        assert index.search('upload') == []
+        index.refresh_nodes([('bug', str(node.label))])
+        assert [e['label'] for e, _ in index.search('upload')] == ['Bug-2']
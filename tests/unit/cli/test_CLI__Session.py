@@ -0,0 +1,102 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Test CLI__Session - JSON-RPC session on one warm context
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+from unittest                                                                   import TestCase
+
+from issues_fs_cli.cli.CLI__Context                                             import CLI__Context
+from issues_fs_cli.cli.CLI__Session                                             import CLI__Session, SESSION__ERROR_COMMAND, SESSION__ERROR_METHOD, SESSION__ERROR_PARAMS, SESSION__ERROR_PARSE, SESSION__ERROR_REQUEST
+from issues_fs.issues.graph_services.Graph__Repository__Factory                 import Graph__Repository__Factory
+from issues_fs.issues.graph_services.Node__Service                              import Node__Service
+from issues_fs.issues.graph_services.Type__Service                              import Type__Service
+from issues_fs.schemas.graph.Schema__Node__Create__Request                      import Schema__Node__Create__Request
+from issues_fs.schemas.graph.Safe_Str__Graph_Types                              import Safe_Str__Node_Type
+
+
+def request(request_id, method: str, **params) -> str:
+    return json.dumps({'jsonrpc': '2.0', 'id': request_id, 'method': method, 'params': params})
+
+
+class test_CLI__Session(TestCase):
+
+    def setUp(self):
+        self.temp_dir   = tempfile.mkdtemp()
+        self.issues_dir = os.path.join(self.temp_dir, '.issues')
+        os.makedirs(self.issues_dir)
+        self.repository = Graph__Repository__Factory.create_local_disk(root_path = self.issues_dir)
+        Type__Service(repository = self.repository).initialize_default_types()
+        self.session    = CLI__Session(context = CLI__Context(repository = self.repository)).start()
+
+    def tearDown(self):
+        self.session.close()
+        shutil.rmtree(self.temp_dir)
+
+    def results(self, *lines: str) -> list:
+        return [json.loads(response) for response in self.session.run(lines)]
+
+    def test_methods(self):                                                      # Same JSON as the --for-agent commands
+        responses = self.results(request(1, 'node.create'    , type = 'bug', title = 'Crash on save', priority = 'P1', tags = ['ui', 'api']),
+                                 request(2, 'node.create'    , type = 'task', title = 'Fix it'),
+                                 request(3, 'link.create'    , source = 'Bug-1', verb = 'blocks', target = 'Task-1'),
+                                 request(4, 'comments.create', label = 'Bug-1', text = 'Seen on v0.3', author = 'qa'),
+                                 request(5, 'node.update'    , label = 'Bug-1', status = 'confirmed'),
+                                 request(6, 'node.get'       , label = 'Bug-1'),
+                                 request(7, 'graph.get'      , label = 'Task-1'),
+                                 request(8, 'node.list'      , type = 'bug', status = 'confirmed'),
+                                 request(9, 'comments.list'  , label = 'Bug-1'))
+        results   = {response['id']: response['result'] for response in responses}
+
+        assert [response['jsonrpc'] for response in responses] == ['2.0'] * 9
+        assert results[1]['node']['tags']                       == ['ui', 'api']
+        assert results[3]['source_link']['target_label']        == 'Task-1'
+        assert results[6]['status']                             == 'confirmed'
+        assert results[6]['properties']['priority']             == 'P1'
+        assert [n['label'] for n in results[7]['nodes']]        == ['Task-1', 'Bug-1']
+        assert results[8]['nodes']                              == [{'label': 'Bug-1', 'node_type': 'bug', 'title': 'Crash on save', 'status': 'confirmed'}]
+        assert [c['author'] for c in results[9]['comments']]    == ['qa']
+
+    def test_errors(self):                                                       # Reported per request, session goes on
+        responses = self.results(request(1, 'node.get', label = 'Bug-9'),
+                                 request(2, 'node.delete', label = 'Bug-9'),
+                                 request(3, 'node.get', lable = 'Bug-9'),
+                                 request(4, 'graph.get', label = 'Bug-9', depth = '2'),
+                                 request(5, 'node.get'),
+                                 '{not json',
+                                 json.dumps({'id': 7, 'method': 'node.get'}),
+                                 json.dumps({'jsonrpc': '2.0', 'method': 'node.get', 'params': {'label': 'Bug-9'}}),   # Notification
+                                 request(9, 'node.list'))
+        errors    = [(r['id'], r['error']['code']) for r in responses if 'error' in r]
+
+        assert errors == [(1   , SESSION__ERROR_COMMAND), (2, SESSION__ERROR_METHOD), (3, SESSION__ERROR_PARAMS),
+                          (4   , SESSION__ERROR_PARAMS ), (5, SESSION__ERROR_PARAMS), (None, SESSION__ERROR_PARSE),
+                          (7   , SESSION__ERROR_REQUEST)]
+        assert responses[0]['error']['message'] == 'Node not found: Bug-9'
+        assert responses[-1]['result']['total'] == 0
+
+    def test_batch(self):                                                        # Array in, array out (notifications dropped)
+        batch = json.dumps([json.loads(request(1, 'node.create', type = 'bug', title = 'One')),
+                            {'jsonrpc': '2.0', 'method': 'node.create', 'params': {'type': 'bug', 'title': 'Two'}},
+                            json.loads(request(3, 'node.list'))])
+        (responses,) = self.results(batch)
+
+        assert [r['id'] for r in responses]  == [1, 3]
+        assert responses[1]['result']['total'] == 2
+
+    def test_external_edits(self):                                               # Other processes' writes are seen
+        def lines():
+            yield request(1, 'node.list')
+            Node__Service(repository = Graph__Repository__Factory.create_local_disk(root_path = self.issues_dir)).create_node(
+                Schema__Node__Create__Request(node_type = Safe_Str__Node_Type('bug'), title = 'From elsewhere'))
+            yield request(2, 'node.list')
+        watched         = self.session.watcher is not None                       # inotify on Linux, refresh elsewhere
+        before, after   = [json.loads(response) for response in self.session.run(lines())]   # Lazily: edit between calls
+
+        assert before['result']['total']                       == 0
+        assert [n['title'] for n in after['result']['nodes']]  == ['From elsewhere']
+        assert watched                                         is sys.platform.startswith('linux')
@@ -0,0 +1,106 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Test CLI__Watch - Change detection (inotify / polling) and incremental re-render
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+from unittest                                                                   import TestCase, skipUnless
+
+from issues_fs_cli.cli.CLI__Index                                               import CLI__Index
+from issues_fs_cli.cli.CLI__Node__Filter                                        import CLI__Node__Filter
+from issues_fs_cli.cli.CLI__Output                                              import CLI__Output
+from issues_fs_cli.cli.CLI__Watch                                               import CLI__Watch, CLI__Watch__Inotify, CLI__Watch__Poll
+from issues_fs.issues.graph_services.Graph__Repository__Factory                 import Graph__Repository__Factory
+from issues_fs.issues.graph_services.Node__Service                              import Node__Service
+from issues_fs.issues.graph_services.Type__Service                              import Type__Service
+from issues_fs.schemas.graph.Schema__Node__Create__Request                      import Schema__Node__Create__Request
+from issues_fs.schemas.graph.Schema__Node__Update__Request                      import Schema__Node__Update__Request
+from issues_fs.schemas.graph.Safe_Str__Graph_Types                              import Safe_Str__Node_Type, Safe_Str__Node_Label
+
+
+class test_CLI__Watch(TestCase):
+
+    def setUp(self):
+        self.temp_dir   = tempfile.mkdtemp()
+        self.issues_dir = os.path.join(self.temp_dir, '.issues')
+        os.makedirs(self.issues_dir)
+        self.repository   = Graph__Repository__Factory.create_local_disk(root_path = self.issues_dir)
+        self.node_service = Node__Service(repository = self.repository)
+        Type__Service(repository = self.repository).initialize_default_types()
+        self.create('Bug one')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def create(self, title):
+        request = Schema__Node__Create__Request(node_type = Safe_Str__Node_Type('bug'), title = title)
+        return self.node_service.create_node(request).node
+
+    def update(self, label, status):
+        self.node_service.update_node(node_type = Safe_Str__Node_Type('bug')  ,
+                                      label     = Safe_Str__Node_Label(label) ,
+                                      request   = Schema__Node__Update__Request(status = status))
+
+    @skipUnless(sys.platform.startswith('linux'), 'inotify is Linux only')
+    def test_inotify(self):                                                      # Paths reported as soon as written
+        watcher = CLI__Watch__Inotify(self.issues_dir)
+        try:
+            assert watcher.wait(timeout = 0) == set()
+
+            start = time.monotonic()
+            self.update('Bug-1', 'confirmed')
+            assert 'data/bug/Bug-1/issue.json' in watcher.wait(timeout = 1)
+            assert time.monotonic() - start < 0.5                                # Debounce is 30ms; slack for slow CI
+
+            self.create('Bug two')                                               # New folder: watched, its file reported
+            assert 'data/bug/Bug-2/issue.json' in watcher.wait(timeout = 1)
+            self.update('Bug-2', 'confirmed')                                    # ...and later writes to it too
+            assert 'data/bug/Bug-2/issue.json' in watcher.wait(timeout = 1)
+
+            shutil.rmtree(os.path.join(self.issues_dir, 'data', 'bug', 'Bug-2'))
+            assert 'data/bug/Bug-2/issue.json' in watcher.wait(timeout = 1)
+        finally:
+            watcher.close()
+
+    def test_poll(self):                                                         # Fallback: fingerprint comparison
+        watcher = CLI__Watch__Poll(self.repository)
+        assert watcher.wait(timeout = 0) == set()
+        self.create('Bug two')
+        assert watcher.wait(timeout = 1) == {'data/bug/Bug-2/issue.json'}
+
+    def test_run(self):                                                          # Only changed files re-read, diff marked
+        index = CLI__Index(repository = self.repository).refresh()
+        read  = []
+        original         = index.read_nodes
+        index.read_nodes = lambda path: read.append(path) or original(path)
+        render           = lambda: CLI__Output.render_list(index.list_nodes(node_filter = CLI__Node__Filter()))
+        self.create('Bug two')
+        index.refresh()
+        writer = threading.Timer(0.2, self.update, ('Bug-1', 'confirmed'))
+        stdout = io.StringIO()
+        writer.start()
+        with contextlib.redirect_stdout(stdout):
+            CLI__Watch.run(self.repository, render, index = index, renders = 2)
+        writer.join()
+
+        output = stdout.getvalue()
+        assert read == ['data/bug/Bug-2/issue.json', 'data/bug/Bug-1/issue.json']   # Catch-up refresh, then only the event
+        assert '- ' in output and '+ ' in output
+        assert [line for line in output.splitlines() if line.startswith('+ ')][0].startswith('+ Bug-1')
+
+    def test_render_watch(self):                                                 # Unchanged lines kept, changes marked
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            CLI__Output.render_watch(['a', 'b', 'c'], ['a', 'x', 'c'])
+            CLI__Output.render_watch(['{"total": 1}'], ['{"total": 0}'], diff = False)
+        lines = stdout.getvalue().splitlines()
+
+        assert lines[1:5] == ['  a', '- x', '+ b', '  c']
+        assert lines[-1]  == '{"total": 1}'
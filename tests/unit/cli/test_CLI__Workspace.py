@@ -0,0 +1,141 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Test CLI__Workspace - Federated queries across many .issues/ roots
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import json
+import os
+import shutil
+import tempfile
+
+from unittest                                                                   import TestCase
+from typer.testing                                                              import CliRunner
+
+from issues_fs_cli.cli.CLI__Node__Filter                                        import CLI__Node__Filter
+from issues_fs_cli.cli.CLI__Workspace                                           import CLI__Workspace
+from issues_fs_cli.cli.cli__main                                                import app
+from issues_fs.issues.graph_services.Graph__Repository__Factory                 import Graph__Repository__Factory
+from issues_fs.issues.graph_services.Node__Service                              import Node__Service
+from issues_fs.issues.graph_services.Type__Service                              import Type__Service
+from issues_fs.schemas.graph.Schema__Node__Create__Request                      import Schema__Node__Create__Request
+from issues_fs.schemas.graph.Safe_Str__Graph_Types                              import Safe_Str__Node_Type
+
+
+def failing_root(root, name, argument):                                         # Worker that fails for the api repo
+    if name.endswith('api'):
+        return [], (name, 'api failed')
+    return [{'root': name}], None
+
+
+class test_CLI__Workspace(TestCase):
+
+    def setUp(self):                                                             # Three repos: api, web, docs (no .issues/)
+        self.temp_dir = tempfile.mkdtemp()
+        self.cwd      = os.getcwd()
+        os.chdir(self.temp_dir)
+        self.create_repo('services/api', [('bug', 'API bug'), ('task', 'API task')])
+        self.create_repo('services/web', [('bug', 'Web bug')])
+        os.makedirs(os.path.join(self.temp_dir, 'services', 'docs'))
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.temp_dir)
+
+    def create_repo(self, folder, nodes):
+        issues_dir   = os.path.join(self.temp_dir, folder, '.issues')
+        os.makedirs(issues_dir)
+        repository   = Graph__Repository__Factory.create_local_disk(root_path = issues_dir)
+        Type__Service(repository = repository).initialize_default_types()
+        node_service = Node__Service(repository = repository)
+        for node_type, title in nodes:
+            node_service.create_node(Schema__Node__Create__Request(node_type = Safe_Str__Node_Type(node_type), title = title))
+        return issues_dir
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Tests for from_spec
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test_from_spec__glob(self):                                              # Folders without .issues/ are skipped
+        workspace = CLI__Workspace.from_spec('services/*')
+
+        assert [workspace.root_name(root) for root in workspace.roots] == [os.path.join('services', 'api'),
+                                                                            os.path.join('services', 'web')]
+
+    def test_from_spec__manifest(self):                                          # Paths relative to the manifest, in manifest order
+        manifest = os.path.join(self.temp_dir, 'services', 'repos.txt')
+        with open(manifest, 'w') as f:
+            f.write('# web first\nweb\n\napi/.issues\nweb\n')
+        os.chdir(self.cwd)
+
+        workspace = CLI__Workspace.from_spec(manifest)
+
+        assert [os.path.basename(os.path.dirname(root)) for root in workspace.roots] == ['web', 'api']
+
+    def test_from_spec__no_match(self):
+        with self.assertRaises(FileNotFoundError) as context:
+            CLI__Workspace.from_spec('nothing/*')
+        assert 'nothing/*' in str(context.exception)
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Tests for queries
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test_list_nodes__inline_and_pool(self):                                  # Same rows, in root order, either way
+        results = []
+        for jobs in (1, 2):
+            workspace = CLI__Workspace.from_spec('services/*', jobs = jobs)
+            results.append(list(workspace.list_nodes(CLI__Node__Filter())))
+            assert workspace.errors == []
+
+        assert results[0] == results[1]
+        assert [(os.path.basename(row['root']), row['label']) for row in results[0]] == [('api', 'Bug-1'),
+                                                                                          ('api', 'Task-1'),
+                                                                                          ('web', 'Bug-1')]
+
+    def test_list_nodes__filter(self):
+        workspace = CLI__Workspace.from_spec('services/*', jobs = 1)
+        rows      = list(workspace.list_nodes(CLI__Node__Filter(node_type = 'bug')))
+
+        assert [row['title'] for row in rows] == ['API bug', 'Web bug']
+
+    def test_list_nodes__failed_root(self):                                      # Error recorded, other roots still answer
+        workspace = CLI__Workspace.from_spec('services/*', jobs = 1)
+        rows      = list(workspace.fan_out(failing_root, None))
+        assert [row['root'] for row in rows] == [os.path.join('services', 'web')]
+        assert workspace.errors              == [(os.path.join('services', 'api'), 'api failed')]
+
+    def test_find_nodes(self):                                                   # Same label, every repo that has it
+        workspace = CLI__Workspace.from_spec('services/*', jobs = 1)
+
+        bugs  = list(workspace.find_nodes('Bug-1'))
+        tasks = list(workspace.find_nodes('Task-1'))
+
+        assert [node['title'] for node in bugs]  == ['API bug', 'Web bug']
+        assert [node['title'] for node in tasks] == ['API task']
+        assert list(workspace.find_nodes('Bug-99')) == []
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Tests for --repos
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test_cli__list_and_show_repos(self):                                     # No .issues/ needed in the cwd
+        runner = CliRunner()
+
+        result = runner.invoke(app, ['list', '--repos', 'services/*', '--output', 'json', '--jobs', '1'])
+        data   = json.loads(result.stdout)
+        assert result.exit_code == 0
+        assert data['total']    == 3
+
+        result = runner.invoke(app, ['list', '--repos', 'services/*', '--type', 'bug'])
+        assert result.exit_code == 0
+        assert 'Web bug' in result.stdout
+        assert 'Total: 2' in result.stdout
+
+        result = runner.invoke(app, ['show', 'Bug-1', '--repos', 'services/*'])
+        assert result.exit_code == 0
+        assert 'API bug' in result.stdout and 'Web bug' in result.stdout
+
+        result = runner.invoke(app, ['show', 'Bug-99', '--repos', 'services/*'])
+        assert result.exit_code == 1
+
+        result = runner.invoke(app, ['list', '--repos', 'nowhere/*'])
+        assert result.exit_code == 1
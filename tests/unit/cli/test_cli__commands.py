@@ -2,6 +2,7 @@
 # Test CLI Commands - Integration tests for CLI commands using CliRunner
 # ═══════════════════════════════════════════════════════════════════════════════
 
+import json
 import os
 import tempfile
 import shutil
@@ -104,6 +105,83 @@ class test_cli__commands(TestCase):
         assert '"success":' in result.output
         assert '"nodes":'   in result.output
 
+    def test_list__ndjson_output(self):                                          # Test NDJSON matches JSON nodes
+        self.runner.invoke(app, ["create", "bug", "Bug for ndjson list"])
+
+        nodes  = json.loads(self.runner.invoke(app, ["list", "--output", "json"]).output)['nodes']
+        result = self.runner.invoke(app, ["list", "--output", "ndjson"])
+        assert result.exit_code == 0
+        assert [json.loads(line) for line in result.output.splitlines()] == nodes
+
+        result = self.runner.invoke(app, ["list", "--output", "ndjson", "--status", "no-such-status"])
+        assert result.exit_code == 0
+        assert result.output    == ''
+
+    def test_list__watch_rejects_streams(self):                                  # --watch needs a redrawable output
+        result = self.runner.invoke(app, ["list", "--watch", "--output", "ndjson"])
+        assert result.exit_code == 1
+        assert "--watch" in result.output
+
+    def test_list__sort_and_paging(self):                                        # Top-k page, then the cursor
+        for title, priority in (('Paged three', 'P3'), ('Paged one', 'P1'), ('Paged two', 'P2')):
+            self.runner.invoke(app, ["create", "feature", title, "--priority", priority, "--tags", "paged"])
+        query  = ["list", "--type", "feature", "--tags", "paged", "--sort", "priority"]
+
+        result = self.runner.invoke(app, query + ["--limit", "2", "--output", "json"])
+        page   = json.loads(result.output)
+        assert [n['title'] for n in page['nodes']] == ['Paged one', 'Paged two']
+        assert page['total']                       == 3
+        result = self.runner.invoke(app, query + ["--cursor", page['next_cursor'], "--output", "json"])
+        assert [n['title'] for n in json.loads(result.output)['nodes']] == ['Paged three']
+        assert 'next_cursor' not in json.loads(result.output)
+
+        result = self.runner.invoke(app, query + ["-n", "1", "--offset", "1"])
+        assert "Paged two" in result.output and "Showing 1 of 3" in result.output
+        for bad in (["--sort", "body"], ["--cursor", "nope"], ["--limit", "1", "--repos", "*"]):
+            assert self.runner.invoke(app, ["list"] + bad).exit_code == 1, bad
+
+    def test_list__fields(self):                                                 # Projected rows in every format
+        self.runner.invoke(app, ["create", "feature", "Projected feature", "--priority", "P2", "--tags", "projected"])
+        query  = ["list", "--tags", "projected", "--fields", "label,priority,title"]
+
+        result = self.runner.invoke(app, query + ["--output", "json"])
+        assert [list(n) for n in json.loads(result.output)['nodes']] == [['label', 'priority', 'title']]
+        assert json.loads(result.output)['nodes'][0]['priority']     == 'P2'
+        result = self.runner.invoke(app, query + ["--output", "ndjson"])
+        assert json.loads(result.output)['title']                    == 'Projected feature'
+        result = self.runner.invoke(app, query)
+        assert result.output.splitlines()[0].split() == ['Label', 'Priority', 'Title']
+        assert self.runner.invoke(app, ["list", "--fields", "description"]).exit_code == 1
+
+    def test_list__priority_and_tags_filter(self):                               # Test filters pushed to the index
+        self.runner.invoke(app, ["create", "feature", "Filtered feature", "--priority", "P1", "--tags", "ui,api"])
+        self.runner.invoke(app, ["create", "feature", "Other feature"   , "--priority", "P3", "--tags", "ui"    ])
+
+        result = self.runner.invoke(app, ["list", "--type", "feature", "--priority", "p1", "--tags", "api, ui", "--output", "json"])
+        assert result.exit_code == 0
+        assert [n['title'] for n in json.loads(result.output)['nodes']] == ['Filtered feature']
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Tests for search
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test_search(self):                                                       # Test ranked search, incl. comments
+        self.runner.invoke(app, ["create", "task", "Quarterly zebra audit", "-d", "Count the zebras"])
+        created = json.loads(self.runner.invoke(app, ["create", "bug", "Stripe rendering", "-o", "json"]).output)
+        label   = created['node']['label']
+        self.runner.invoke(app, ["comment", label, "Looks like a zebra pattern"])
+
+        result = self.runner.invoke(app, ["search", "zebra", "--output", "json"])
+        assert result.exit_code == 0
+        assert [r['title'] for r in json.loads(result.output)['results']] == ['Quarterly zebra audit', 'Stripe rendering']
+
+        result = self.runner.invoke(app, ["search", '"zebra pattern"'])
+        assert result.exit_code == 0
+        assert 'Stripe rendering' in result.output
+
+        result = self.runner.invoke(app, ["search", '""'])
+        assert result.exit_code == 1
+
     # ═══════════════════════════════════════════════════════════════════════════════
     # Tests for show
     # ═══════════════════════════════════════════════════════════════════════════════
@@ -185,10 +263,79 @@ class test_cli__commands(TestCase):
         result = self.runner.invoke(app, ["links", "Bug-1"])
         assert result.exit_code == 0
 
+    def test_links__ndjson_output(self):                                         # Test one link per line
+        result = self.runner.invoke(app, ["links", "Bug-1", "--output", "ndjson"])
+        assert result.exit_code == 0
+        for line in result.output.splitlines():
+            assert 'verb' in json.loads(line)
+
     def test_links__not_found(self):                                             # Test links for non-existent node
         result = self.runner.invoke(app, ["links", "Bug-9999"])
         assert result.exit_code == 1
 
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Tests for path
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test_path(self):                                                         # Shortest path, JSON and errors
+        labels = [json.loads(self.runner.invoke(app, ["create", "feature", f"Path {i}", "-o", "json"]).output)['node']['label']
+                  for i in range(3)]
+        self.runner.invoke(app, ["link", labels[0], "relates-to", labels[1]])
+        self.runner.invoke(app, ["link", labels[1], "relates-to", labels[2]])
+
+        result = self.runner.invoke(app, ["path", labels[0], labels[2], "--output", "json"])
+        assert result.exit_code == 0
+        assert json.loads(result.output)['paths'][0]['nodes'] == labels
+
+        result = self.runner.invoke(app, ["path", labels[0], labels[2], "--max-hops", "1"])
+        assert result.exit_code == 1
+        assert "No path" in result.stderr
+
+        result = self.runner.invoke(app, ["path", labels[0], "Feature-9999"])
+        assert result.exit_code == 1
+
+    def test_critical_path(self):                                                # Chain through blocks + depends-on
+        labels = [json.loads(self.runner.invoke(app, ["create", "task", f"Step {i}", "-o", "json"]).output)['node']['label']
+                  for i in range(3)]
+        self.runner.invoke(app, ["link", labels[0], "blocks"    , labels[1]])
+        self.runner.invoke(app, ["link", labels[2], "depends-on", labels[1]])
+
+        result = self.runner.invoke(app, ["critical-path", labels[2], "--output", "json"])
+        assert result.exit_code == 0
+        path = json.loads(result.output)['results'][0]
+        assert [node['label'] for node in path['chain']]    == labels
+        assert [node['label'] for node in path['blocking']] == labels[:2]
+
+        result = self.runner.invoke(app, ["critical-path", "--all"])
+        assert result.exit_code == 0
+        assert "Critical path to all nodes" in result.output
+
+        assert self.runner.invoke(app, ["critical-path"]).exit_code == 1
+
+    def test_check_cycles(self):                                                 # Exit 1 while a blocks cycle exists
+        labels = [json.loads(self.runner.invoke(app, ["create", "task", f"Loop {i}", "-o", "json"]).output)['node']['label']
+                  for i in range(3)]
+        self.runner.invoke(app, ["link", labels[0], "blocks", labels[1]])
+        self.runner.invoke(app, ["link", labels[1], "blocks", labels[2]])
+        assert self.runner.invoke(app, ["check", "cycles"]).exit_code == 0
+
+        self.runner.invoke(app, ["link", labels[2], "blocks", labels[0]])
+        try:
+            result = self.runner.invoke(app, ["check", "cycles", "--output", "json"])
+            assert result.exit_code == 1
+            cycle  = json.loads(result.output)['cycles'][0]['cycle']
+            assert set(cycle['nodes'])  == set(labels)
+            assert cycle['verbs']       == ['blocks'] * 3
+            assert all(labels.index(b) == (labels.index(a) + 1) % 3                   # Walked as "a blocks b"
+                       for a, b in zip(cycle['nodes'], cycle['nodes'][1:]))
+            result = self.runner.invoke(app, ["check", "cycles", "--verbs", "blocked-by"])
+            assert result.exit_code == 1
+            assert "Found 1 cycle " in result.output and "--blocked-by-->" in result.output
+            assert self.runner.invoke(app, ["check", "cycles", "--verbs", "has-task"]).exit_code == 0
+            assert self.runner.invoke(app, ["check", "cycles", "--verbs", "no-such-verb"]).exit_code == 1
+        finally:
+            self.runner.invoke(app, ["unlink", labels[2], labels[0]])
+
     # ═══════════════════════════════════════════════════════════════════════════════
     # Tests for comment
     # ═══════════════════════════════════════════════════════════════════════════════
@@ -231,6 +378,15 @@ class test_cli__commands(TestCase):
         assert result.exit_code == 0
         assert '"comments":' in result.output
 
+    def test_comments__ndjson_output(self):                                      # Test one comment per line
+        self.runner.invoke(app, ["create", "bug", "Bug for comments ndjson"])
+        self.runner.invoke(app, ["comment", "Bug-1", "First ndjson comment"])
+
+        result = self.runner.invoke(app, ["comments", "Bug-1", "--output", "ndjson"])
+        assert result.exit_code == 0
+        comments = [json.loads(line) for line in result.output.splitlines()]
+        assert 'First ndjson comment' in [c['text'] for c in comments]
+
     # ═══════════════════════════════════════════════════════════════════════════════
     # Tests for types
     # ═══════════════════════════════════════════════════════════════════════════════
@@ -312,3 +468,44 @@ class test_cli__commands(TestCase):
         result = self.runner.invoke(app, ["link-types", "list", "--output", "json"])
         assert result.exit_code == 0
         assert '"verb":' in result.output or '"name":' in result.output
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Tests for index
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test_index_rebuild(self):                                                # Test rebuilding the label index
+        result = self.runner.invoke(app, ["index", "rebuild"])
+        assert result.exit_code == 0
+        assert "Index rebuilt" in result.output
+
+    def test_index_status__json(self):                                           # Test index status JSON
+        result = self.runner.invoke(app, ["index", "status", "--output", "json"])
+        assert result.exit_code == 0
+        assert '"type_counts":' in result.output
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Tests for batch
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test_batch__stdin(self):                                                 # Test NDJSON in, NDJSON out
+        operations = ('{"op": "create", "type": "feature", "title": "Batch feature", "ref": "f"}\n'
+                      '{"op": "update", "label": "$f", "status": "proposed"}\n')
+        result = self.runner.invoke(app, ["batch"], input=operations)
+        assert result.exit_code == 0
+        lines = result.output.strip().splitlines()
+        assert len(lines) == 2
+        assert '"success": true' in lines[1]
+
+    def test_batch__failure_exit_code(self):                                     # Test failed op sets exit code
+        result = self.runner.invoke(app, ["batch"], input='{"op": "delete", "label": "Bug-999"}\n')
+        assert result.exit_code == 1
+        assert '"error": "Node not found: Bug-999"' in result.output
+
+    def test_session(self):                                                      # Test one JSON-RPC response per line
+        requests = ('{"jsonrpc": "2.0", "id": 1, "method": "node.create", "params": {"type": "task", "title": "Session task"}}\n'
+                    '{"jsonrpc": "2.0", "id": 2, "method": "node.get", "params": {"label": "Task-999"}}\n')
+        result   = self.runner.invoke(app, ["session"], input=requests)
+        assert result.exit_code == 0
+        created, missing = [json.loads(line) for line in result.output.splitlines()]
+        assert created['result']['node']['title'] == 'Session task'
+        assert missing['error']['message']        == 'Node not found: Task-999'
@@ -0,0 +1,80 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Test cli__main - Lazy command registry and cold-start import budget
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import importlib
+import subprocess
+import sys
+
+from unittest                                                                   import TestCase
+from typer.testing                                                              import CliRunner
+
+from issues_fs_cli.cli.cli__main                                                import app, LAZY_COMMANDS
+
+
+IMPORT_BUDGET__MS = 50                                                           # cli__main on top of typer itself
+MODULE__MAIN      = 'issues_fs_cli.cli.cli__main'
+MODULE__ENTRY     = 'issues_fs_cli.cli.cli__entry'
+MODULE__TYPER     = 'typer'
+
+
+def import_times(*statements) -> dict:                                           # module → cumulative µs (-X importtime)
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', '; '.join(statements)],
+                            capture_output = True, text = True, check = True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            _, cumulative, name = line.split('|')
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    return times
+
+
+class test_cli__main(TestCase):
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Tests for cold start
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test_import__loads_no_command_modules(self):                             # Only the registry is imported
+        times = import_times(f'import {MODULE__MAIN}')
+
+        assert MODULE__MAIN in times
+        assert [name for name in times if name.startswith('issues_fs.')]           == []
+        assert [name for name in times if name.startswith('issues_fs_cli.cli.cli__') and name != MODULE__MAIN] == []
+
+    def test_import__entry_is_stdlib_only(self):                                  # Daemon forwarding skips typer
+        times = import_times(f'import {MODULE__ENTRY}')
+
+        assert MODULE__ENTRY in times
+        assert MODULE__TYPER not in times
+        assert [name for name in times if name.startswith('issues_fs.')] == []
+
+    def test_import__within_budget(self):                                        # Fails if cold start regresses
+        times    = import_times(f'import {MODULE__MAIN}')
+        own_ms   = (times[MODULE__MAIN] - times.get(MODULE__TYPER, 0)) / 1000
+
+        assert own_ms < IMPORT_BUDGET__MS, f'cli__main import took {own_ms:.1f}ms (budget {IMPORT_BUDGET__MS}ms)'
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Tests for the lazy registry
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test_help__lists_all_commands(self):                                     # Listing from stubs, in order
+        result = CliRunner().invoke(app, ['--help'])
+
+        assert result.exit_code == 0
+        positions = [result.output.find(f' {name} ') for name in LAZY_COMMANDS]
+        assert -1 not in positions
+        assert positions == sorted(positions)
+
+    def test_registry__targets_resolve(self):                                    # Every entry points at real code
+        for name, (module_name, attribute, short_help) in LAZY_COMMANDS.items():
+            assert hasattr(importlib.import_module(module_name), attribute), name
+            assert short_help
+
+    def test_unknown_command__suggests(self):                                    # Typo suggestions still work
+        result = CliRunner().invoke(app, ['lst'])
+
+        assert result.exit_code != 0
+        assert "Did you mean 'list'" in result.output